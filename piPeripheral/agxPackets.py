@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	agxPackets.py
+# Purpose:	Encoding and parsing of the 4-byte packets by which yaAGC
+#		and yaAGS talk to their peripherals, for the Python
+#		peripherals (piDSKY2.py, piDEDA.py, piPeripheral.py, ...).
+#		The packet formats are those of FormIoPacket(),
+#		ParseIoPacket(), FormIoPacketAGS(), and ParseIoPacketAGS()
+#		in yaAGC/agc_utilities.c.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began, by merging the separate copies of
+#				the code from piDSKY2.py, piDEDA.py, and
+#				piPeripheral.py.
+#
+# For yaAGC, a packet is
+#	00utpppp 01pppddd 10dddddd 11dddddd
+# where ppppppp is the 7-bit channel number, ddd... the 15-bit value, and u
+# is set if the packet is a mask (rather than a value) for the channel.  For
+# yaAGS, it is
+#	00pppppp 11dddddd 10dddddd 01dddddd
+# where pppppp is the 6-bit channel number and ddd... the 18-bit value.  In
+# both cases, the server occasionally pings the client with a single 0xFF
+# byte (older versions) or with 4 of them (newer versions), which hold no
+# data and are ignored.
+#
+# The parsers work on a whole buffer at a time.  The usual case, a buffer of
+# nothing but well-formed packets, is checked all at once, by translating each
+# byte into its 2-bit signature with bytes.translate() and comparing the result
+# against the signatures expected, and then decoded with a single list
+# comprehension over slices of the buffer.  Only if that fails do we look for
+# the first bad packet, decode the packets preceding it, and realign past it
+# one byte at a time, after which the fast path is tried again.
+
+packetSize = 4
+
+# Tables for bytes.translate(), giving the signature of each byte as 0-3 in
+# its position within a packet, or 4 for a byte which can't appear in any
+# data packet.  The first byte of a yaAGC data packet must have its top 4
+# bits clear (the u bit would make it a mask packet, which servers don't
+# send), while for yaAGS only the top 2 bits are checked.
+agcSignatures = bytes([0 if b < 0x10 else 4 if b < 0x40 else b >> 6 for b in range(256)])
+agsSignatures = bytes([(0, 3, 2, 1)[b >> 6] for b in range(256)])
+expectedSignatures = bytes([0, 1, 2, 3]) * 1024
+
+def decodeAgc(view, i, count, packets):
+	end = i + count * packetSize
+	packets.extend([(((b0 & 0x0F) << 3) | ((b1 & 0x38) >> 3), ((b1 & 0x07) << 12) | ((b2 & 0x3F) << 6) | (b3 & 0x3F))
+		for b0, b1, b2, b3 in zip(view[i:end:4], view[i + 1:end:4], view[i + 2:end:4], view[i + 3:end:4])])
+
+def decodeAgs(view, i, count, packets):
+	end = i + count * packetSize
+	packets.extend([(b0 & 0x3F, ((b1 & 0x3F) << 12) | ((b2 & 0x3F) << 6) | (b3 & 0x3F))
+		for b0, b1, b2, b3 in zip(view[i:end:4], view[i + 1:end:4], view[i + 2:end:4], view[i + 3:end:4])])
+
+# The common parser for both.  signatures is one of the translation tables
+# above, and decode is decodeAgc or decodeAgs.
+def parsePackets(signatures, decode, buffer, start, end, packets, illegal):
+	view = memoryview(buffer)
+	i = start
+	while end - i >= packetSize:
+		# Find how many well-formed packets there are at i.  Everything
+		# from i on is tried at once, and if that fails, by bisection.
+		count = (end - i) // packetSize
+		while count * packetSize > len(expectedSignatures):
+			count = len(expectedSignatures) // packetSize
+		found = view[i:i + count * packetSize].tobytes().translate(signatures)
+		if found == expectedSignatures[:len(found)]:
+			good = count
+		else:
+			good = 0
+			bad = count
+			while bad - good > 1:
+				middle = (good + bad) // 2
+				if found[:middle * packetSize] == expectedSignatures[:middle * packetSize]:
+					good = middle
+				else:
+					bad = middle
+		if good > 0:
+			decode(view, i, good, packets)
+			i += good * packetSize
+			if good == count:
+				continue
+		# There's a bad packet at i.  Report it unless it's a ping, and
+		# realign at the next byte which could start a packet.
+		if buffer[i] != 0xFF:
+			if illegal == None:
+				print("Illegal packet: " + " ".join([hex(b) for b in buffer[i:i + packetSize]]))
+			else:
+				illegal.append(bytes(buffer[i:i + packetSize]))
+		i += 1
+		while i < end and signatures[buffer[i]] != 0:
+			i += 1
+	view.release()
+	return i
+
+# Parse all of the complete packets in buffer[start:end] (a bytearray or
+# bytes) received from yaAGC or yaAGS, appending them to the list packets
+# as (channel,value) tuples.  Returns the index of the first byte not yet
+# processed, which is the start of an incomplete packet (if any).  Pings are
+# skipped.  Other corrupted packets are printed, or are appended to the list
+# illegal if there is one.
+def parseAgcPackets(buffer, start, end, packets, illegal = None):
+	return parsePackets(agcSignatures, decodeAgc, buffer, start, end, packets, illegal)
+
+def parseAgsPackets(buffer, start, end, packets, illegal = None):
+	return parsePackets(agsSignatures, decodeAgs, buffer, start, end, packets, illegal)
+
+# Encoding of single packets into buffer[offset:offset+4], returning offset+4.
+def encodeAgcPacket(buffer, offset, channel, value, isMask = False):
+	if isMask:
+		buffer[offset] = 0x20 | ((channel >> 3) & 0x0F)
+	else:
+		buffer[offset] = 0x00 | ((channel >> 3) & 0x0F)
+	buffer[offset + 1] = 0x40 | ((channel << 3) & 0x38) | ((value >> 12) & 0x07)
+	buffer[offset + 2] = 0x80 | ((value >> 6) & 0x3F)
+	buffer[offset + 3] = 0xC0 | (value & 0x3F)
+	return offset + 4
+
+def encodeAgsPacket(buffer, offset, channel, value):
+	buffer[offset] = 0x00 | (channel & 0x3F)
+	buffer[offset + 1] = 0xC0 | ((value >> 12) & 0x3F)
+	buffer[offset + 2] = 0x80 | ((value >> 6) & 0x3F)
+	buffer[offset + 3] = 0x40 | (value & 0x3F)
+	return offset + 4
+
+# Encoding of lists of packets, returning a bytearray which can be sent with
+# a single send().  For yaAGC, each entry is a (channel,value,mask) tuple,
+# which becomes a mask packet followed by a value packet.  For yaAGS, each
+# is a (channel,value) tuple.
+def encodeAgcPackets(tuples):
+	buffer = bytearray(2 * packetSize * len(tuples))
+	offset = 0
+	for channel, value, mask in tuples:
+		offset = encodeAgcPacket(buffer, offset, channel, mask, True)
+		offset = encodeAgcPacket(buffer, offset, channel, value)
+	return buffer
+
+def encodeAgsPackets(tuples):
+	buffer = bytearray(packetSize * len(tuples))
+	offset = 0
+	for channel, value in tuples:
+		offset = encodeAgsPacket(buffer, offset, channel, value)
+	return buffer
@@ -0,0 +1,285 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	agxPeripheral.py
+# Purpose:	A framework, based on asyncio, for writing peripherals for
+#		yaAGC or yaAGS in Python.  It takes care of everything that
+#		piPeripheral.py leaves for each copy of the skeleton to
+#		carry along:  connecting to the server (and reconnecting,
+#		with backoff, if the connection is lost), framing of the
+#		packets, and timing.  Peripherals written with it are just
+#		objects with callbacks, so any number of them (a DSKY, a
+#		DEDA, sensors, ...) can share a single process and event
+#		loop, and even a single connection.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#		2026-10-19	Exceptions in a peripheral's callbacks, inputs(),
+#				or timers are now reported, and no longer affect
+#				the other peripherals.
+#
+# A peripheral is an object of a subclass of Peripheral, overriding whichever
+# of these it needs:
+#
+#	onOutput(channel, value)	Called for each output-channel write
+#					by the CPU.
+#	inputs()			An async generator, yielding tuples
+#					for the CPU's input channels, as
+#					(channel,value,mask) for yaAGC or
+#					(channel,value) for yaAGS.  It runs
+#					for as long as the program does,
+#					whether or not there's a connection.
+#	onConnect(), onDisconnect()	Called as the connection to the
+#					server comes and goes, for example
+#					to resend the current state of the
+#					peripheral's input channels.
+#
+# Peripheral.send() can also be used at any time to send input-channel tuples,
+# and the methods every() and after() set up timers.  Anything sent while
+# there's no connection is discarded.  For a peripheral like those made from
+# piPeripheral.py, whose inputsForAGx() is simply polled, inputs() can be
+# written as
+#
+#	async def inputs(self):
+#		while True:
+#			for tuple in inputsForAGx():
+#				yield tuple
+#			await asyncio.sleep(PULSE)
+#
+# Peripherals are attached to a Connection, and the Connections are run by
+# run().  For example,
+#
+#	connection = Connection("localhost", 19799)
+#	connection.add(MyDsky())
+#	connection.add(MySensors())
+#	run(connection)
+#
+# An exception raised by one of the callbacks is printed to stderr, and then
+# ignored, so that it affects neither the connection nor the other peripherals
+# sharing it.  Similarly for the functions called by every() and after(), 
+# which continue to be called.  If inputs() raises an exception, it's printed,
+# and the peripheral has no more inputs.
+#
+# Running this file directly runs a demo equivalent to piPeripheral.py --time,
+# with the clock and the printout of channels 043-050 as separate peripherals.
+
+import sys
+import traceback
+import asyncio
+import agxPackets
+
+# Prints an exception raised by a peripheral, with where it came from.
+def reportException(where):
+	sys.stderr.write("Exception in " + where + ":\n" + traceback.format_exc())
+
+# Creates an asyncio task and adds it to the set tasks, from which it is
+# removed when done, so that there's always a reference to it; asyncio itself
+# keeps only weak ones.  If the task ends with an exception, it's printed.
+def startTask(coroutine, tasks, where):
+	task = asyncio.get_running_loop().create_task(coroutine)
+	tasks.add(task)
+	def done(task):
+		tasks.discard(task)
+		if not task.cancelled() and task.exception() != None:
+			exception = task.exception()
+			sys.stderr.write("Exception in " + where + ":\n" + 
+				"".join(traceback.format_exception(type(exception), 
+				exception, exception.__traceback__)))
+	task.add_done_callback(done)
+	return task
+
+class Peripheral:
+	def __init__(self):
+		self.connection = None
+		self.tasks = set()
+	def onOutput(self, channel, value):
+		pass
+	def onConnect(self):
+		pass
+	def onDisconnect(self):
+		pass
+	# The default is a peripheral without inputs.
+	async def inputs(self):
+		return
+		yield
+	def send(self, tuples):
+		if self.connection != None:
+			self.connection.send(tuples)
+	# Calls function() every interval seconds, or just once after delay
+	# seconds, returning the asyncio task, which can be cancel()'d.  If
+	# function returns a list of tuples, they are sent.  Calls are made on
+	# a schedule, rather than interval seconds after the preceding call
+	# returns, so they don't drift.
+	def every(self, interval, function):
+		return startTask(self.timer(interval, function, True), self.tasks, 
+			type(self).__name__ + " timer")
+	def after(self, delay, function):
+		return startTask(self.timer(delay, function, False), self.tasks,
+			type(self).__name__ + " timer")
+	async def timer(self, interval, function, repeat):
+		loop = asyncio.get_running_loop()
+		due = loop.time() + interval
+		while True:
+			await asyncio.sleep(max(0.0, due - loop.time()))
+			try:
+				tuples = function()
+				if tuples:
+					self.send(tuples)
+			except Exception:
+				reportException(type(self).__name__ + " timer")
+			if not repeat:
+				return
+			due += interval
+			if due < loop.time():
+				due = loop.time() + interval
+
+# A connection to a single yaAGC or yaAGS server, shared by any number of
+# peripherals.  Output-channel writes from the server are given to all of them.
+class Connection:
+	def __init__(self, host = "localhost", port = 19799, ags = False, name = None,
+			minBackoff = 0.5, maxBackoff = 10.0):
+		self.host = host
+		self.port = port
+		self.ags = ags
+		if name == None:
+			if ags:
+				name = "AGS"
+			else:
+				name = "AGC"
+		self.name = name
+		self.minBackoff = minBackoff
+		self.maxBackoff = maxBackoff
+		self.peripherals = []
+		self.tasks = set()
+		self.writer = None
+		if ags:
+			self.parse = agxPackets.parseAgsPackets
+			self.encode = agxPackets.encodeAgsPackets
+		else:
+			self.parse = agxPackets.parseAgcPackets
+			self.encode = agxPackets.encodeAgcPackets
+	def add(self, peripheral):
+		peripheral.connection = self
+		self.peripherals.append(peripheral)
+		return peripheral
+	def connected(self):
+		return self.writer != None
+	def send(self, tuples):
+		if self.writer == None or len(tuples) == 0:
+			return
+		try:
+			self.writer.write(self.encode(tuples))
+		except Exception as e:
+			sys.stderr.write("Cannot send to " + self.name + ": " + str(e) + "\n")
+
+	# Feeds the tuples yielded by a peripheral's inputs() to the connection.
+	async def pump(self, peripheral):
+		async for tuple in peripheral.inputs():
+			self.send([ tuple ])
+
+	# Calls one of the callbacks (by name) of each of the peripherals.
+	def notify(self, name, *args):
+		for peripheral in self.peripherals:
+			try:
+				getattr(peripheral, name)(*args)
+			except Exception:
+				reportException(type(peripheral).__name__ + "." + name + "()")
+
+	# Connects (and reconnects) to the server for as long as the program
+	# runs, doubling the wait between attempts, up to maxBackoff, after each
+	# failure.
+	async def run(self):
+		for peripheral in self.peripherals:
+			startTask(self.pump(peripheral), self.tasks, 
+				type(peripheral).__name__ + ".inputs()")
+		backoff = self.minBackoff
+		while True:
+			try:
+				reader, writer = await asyncio.open_connection(self.host, self.port)
+			except OSError as e:
+				sys.stderr.write("Cannot connect to " + self.name + " " + self.host +
+					":" + str(self.port) + " (" + str(e) + "), retrying in " +
+					str(backoff) + " seconds\n")
+				await asyncio.sleep(backoff)
+				backoff = min(2 * backoff, self.maxBackoff)
+				continue
+			sys.stderr.write("Connected to " + self.name + " " + self.host + ":" + str(self.port) + "\n")
+			backoff = self.minBackoff
+			self.writer = writer
+			self.notify("onConnect")
+			try:
+				await self.receive(reader)
+			finally:
+				self.writer = None
+				writer.close()
+			sys.stderr.write("Disconnected from " + self.name + "\n")
+			self.notify("onDisconnect")
+
+	# Processes everything received from the server, until it disconnects.
+	async def receive(self, reader):
+		inputBuffer = bytearray()
+		while True:
+			try:
+				data = await reader.read(4096)
+			except OSError:
+				return
+			if len(data) == 0:
+				return
+			inputBuffer += data
+			packets = []
+			used = self.parse(inputBuffer, 0, len(inputBuffer), packets)
+			del inputBuffer[:used]
+			for channel, value in packets:
+				self.notify("onOutput", channel, value)
+
+# Runs all of the connections (and their peripherals) until interrupted.
+def run(*connections):
+	async def runAll():
+		await asyncio.gather(*[connection.run() for connection in connections])
+	try:
+		asyncio.run(runAll())
+	except KeyboardInterrupt:
+		pass
+
+# The demo.
+if __name__ == "__main__":
+	import argparse
+	import datetime
+	cli = argparse.ArgumentParser()
+	cli.add_argument("--host", help="Host address of yaAGC, defaulting to localhost.", default="localhost")
+	cli.add_argument("--port", help="Port for yaAGC, defaulting to 19799.", type=int, default=19799)
+	args = cli.parse_args()
+
+	# Supplies the current date/time to the AGC on input channels 040-042,
+	# as piPeripheral.py --time does, whenever the second changes, and
+	# all at once upon connection.
+	class Clock(Peripheral):
+		def __init__(self):
+			Peripheral.__init__(self)
+			self.lastSecond = -1
+		def channels(self, now):
+			minutesSeconds = (now.minute << 6) | (now.second)
+			monthsDaysHours = (now.month << 10) | (now.day << 5) | (now.hour)
+			return [ ( 0o42, now.year, 0o77777), ( 0o41, monthsDaysHours, 0o77777),
+				( 0o40, minutesSeconds, 0o77777) ]
+		def onConnect(self):
+			self.send(self.channels(datetime.datetime.now()))
+		async def inputs(self):
+			while True:
+				now = datetime.datetime.now()
+				if now.second != self.lastSecond:
+					self.lastSecond = now.second
+					for tuple in self.channels(now):
+						yield tuple
+				await asyncio.sleep(1.0 - now.microsecond / 1000000.0)
+
+	# Prints what the AGC outputs on channels 043-050.
+	class Printout(Peripheral):
+		def onOutput(self, channel, value):
+			if channel >= 0o43 and channel <= 0o50:
+				if channel == 0o43:
+					print("")
+				print("Channel " + oct(channel) + " = " + str(value))
+
+	connection = Connection(args.host, args.port)
+	connection.add(Clock())
+	connection.add(Printout())
+	run(connection)
@@ -0,0 +1,274 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	cannedScript.py
+# Purpose:	Reading and timed playback of the .canned scripts of DSKY
+#		activity used by piDSKY2.py --playback (and made by its
+#		--record, or by convertNasspLog.py).
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began, with the parsing moved from
+#				piDSKY2.py.
+#		2026-10-19	Added the binary form of the scripts, and
+#				the conversion to it.
+#
+# Each line of a .canned script is either
+#	DIFFERENTIAL CHANNEL VALUE
+# where DIFFERENTIAL is the time in milliseconds since the preceding event
+# (possibly fractional) and CHANNEL and VALUE are octal, or else
+#	DIFFERENTIAL COMMAND [PARAMETERS...]
+# for a shell command to be run in the background.  Anything from a field
+# beginning with '#' onward is a comment, and lines which are otherwise
+# ill-formed are ignored.
+#
+# Events are represented as tuples, either
+#	( True, TIME, CHANNEL, VALUE )
+# or
+#	( False, TIME, COMMAND )
+# where TIME is in milliseconds since the start of the script, rather than
+# differential as in the file.
+#
+# Since a text script can only be read from the beginning, there's also a
+# binary form of it, made by running this file as
+#	cannedScript.py [--interval=N] INPUT.canned OUTPUT
+# which can be started at any point without replaying what comes before.  It
+# has an index entry every N events (default 256), with a snapshot of the
+# DSKY's state at that point.  All numbers are little-endian, and the file
+# consists of:
+#	The header, 40 bytes:  the 8 characters "yaDSKYc1"; 32-bit counts of
+#		the events, of events per index entry, of index entries, and
+#		of commands; and 64-bit offsets in the file of the index and
+#		of the commands.
+#	The events, 8 bytes each:  32 bits for the TIME, rounded to the 
+#		nearest millisecond, then 16 bits each for the CHANNEL and 
+#		VALUE.  For a command, the CHANNEL is 0xFFFF and VALUE is the
+#		number of the COMMAND.
+#	The index entries, 20 bytes each:  32-bit numbers for the TIME of the
+#		event indexed, for that event, and for the
+#		number of (CHANNEL,VALUE) pairs in the snapshot, and the 64-bit
+#		offset of the snapshot in the file.
+#	The snapshots, 4 bytes per pair:  16 bits each for CHANNEL and VALUE.
+#	The commands, each a 16-bit length followed by the COMMAND in UTF-8.
+# A snapshot is the last value output on each of the DSKY's channels before
+# the event indexed, except that for channel 010 it's the last value for 
+# each of its relay words (bits 15-12), so that playing back the snapshot
+# sets up the display completely.  Keystroke channel 015 isn't included.
+
+import time
+import struct
+import bisect
+
+# A generator of the events in an open .canned file.  Lines are read only as
+# the events are needed, so even very large scripts can be started at once.
+def readCannedEvents(file):
+	eventTime = 0.0
+	for line in file:
+		line = line.strip().split()
+		# If we find a field that begins with the '#' character,
+		# we ignore all of the fields beyond it as constituting
+		# a comment.
+		for i in range(1, len(line)):
+			if line[i][:1] == '#':
+				line = line[:i]
+				break
+		# At minimum, we require there must be at least 2 fields in
+		# the line, that the first must be a float, and the
+		# second must not be empty.
+		if len(line) < 2 or len(line[1]) < 1:
+			continue
+		try:
+			differential = float(line[0])
+		except ValueError:
+			continue
+		eventTime += differential
+		# The line is an i/o-channel event if it has 3 fields consisting
+		# of a float (already verified) and two octals, and a command
+		# otherwise.
+		if len(line) == 3:
+			try:
+				yield ( True, eventTime, int(line[1], 8), int(line[2], 8) )
+				continue
+			except ValueError:
+				pass
+		yield ( False, eventTime, " ".join(line[1:]) )
+
+binaryMagic = b"yaDSKYc1"
+binaryHeader = struct.Struct("<8sIIIIQQ")
+binaryEvent = struct.Struct("<IHH")
+binaryIndex = struct.Struct("<IIIQ")
+binaryPair = struct.Struct("<HH")
+binaryCommand = 0xFFFF
+
+# The key under which an event is kept in a snapshot, or None if it isn't.
+def snapshotKey(event):
+	if not event[0] or event[2] == 0o15:
+		return None
+	if event[2] == 0o10:
+		return (0o10, (event[3] >> 11) & 0o17)
+	return event[2]
+
+# Writes the events from an iterator to an open binary file, in binary form.
+def writeCannedBinary(events, file, interval = 256):
+	file.write(bytes(binaryHeader.size))
+	state = {}
+	index = []
+	commands = []
+	count = 0
+	for event in events:
+		eventTime = round(event[1])
+		if count % interval == 0:
+			index.append((eventTime, count, list(state.values())))
+		if event[0]:
+			file.write(binaryEvent.pack(eventTime, event[2], event[3]))
+			key = snapshotKey(event)
+			if key != None:
+				state[key] = (event[2], event[3])
+		else:
+			file.write(binaryEvent.pack(eventTime, binaryCommand, len(commands)))
+			commands.append(event[2])
+		count += 1
+	snapshotOffsets = []
+	for entry in index:
+		snapshotOffsets.append(file.tell())
+		for pair in entry[2]:
+			file.write(binaryPair.pack(pair[0], pair[1]))
+	indexOffset = file.tell()
+	for i in range(len(index)):
+		file.write(binaryIndex.pack(index[i][0], index[i][1], len(index[i][2]), snapshotOffsets[i]))
+	commandsOffset = file.tell()
+	for command in commands:
+		command = command.encode("utf-8")
+		file.write(struct.pack("<H", len(command)) + command)
+	file.seek(0)
+	file.write(binaryHeader.pack(binaryMagic, count, interval, len(index), 
+		len(commands), indexOffset, commandsOffset))
+
+# An open binary script.  The index and the commands are read at once, but
+# the events only as they're needed.
+class CannedBinary:
+	def __init__(self, file):
+		self.file = file
+		file.seek(0)
+		magic, self.count, self.interval, indexCount, commandCount, indexOffset, \
+			commandsOffset = binaryHeader.unpack(file.read(binaryHeader.size))
+		if magic != binaryMagic:
+			raise ValueError("not a binary .canned script")
+		file.seek(indexOffset)
+		self.index = list(binaryIndex.iter_unpack(file.read(indexCount * binaryIndex.size)))
+		self.indexTimes = [entry[0] for entry in self.index]
+		file.seek(commandsOffset)
+		self.commands = []
+		for i in range(commandCount):
+			length = struct.unpack("<H", file.read(2))[0]
+			self.commands.append(file.read(length).decode("utf-8"))
+
+	# A generator of the events needed to play back from position (in
+	# milliseconds) onward:  the snapshot at the last index entry before
+	# position, followed by all of the events from that entry on.
+	def events(self, position = 0.0):
+		i = bisect.bisect_right(self.indexTimes, position) - 1
+		if i < 0:
+			first = 0
+		else:
+			entryTime, first, pairCount, snapshotOffset = self.index[i]
+			self.file.seek(snapshotOffset)
+			for channel, value in binaryPair.iter_unpack(self.file.read(pairCount * binaryPair.size)):
+				yield ( True, entryTime, channel, value )
+		offset = binaryHeader.size + first * binaryEvent.size
+		while first < self.count:
+			n = min(1024, self.count - first)
+			self.file.seek(offset)
+			data = self.file.read(n * binaryEvent.size)
+			offset += len(data)
+			first += n
+			for eventTime, channel, value in binaryEvent.iter_unpack(data):
+				if channel == binaryCommand:
+					yield ( False, eventTime, self.commands[value] )
+				else:
+					yield ( True, eventTime, channel, value )
+
+# Opens a script in either form, returning a function suitable as the
+# openEvents parameter of Playback.
+def openCanned(filename):
+	file = open(filename, "rb")
+	if file.read(len(binaryMagic)) == binaryMagic:
+		script = CannedBinary(file)
+		return script.events
+	file.close()
+	file = open(filename, "r")
+	def openText(position = 0.0):
+		file.seek(0)
+		return readCannedEvents(file)
+	return openText
+
+# Plays back a sequence of events on the monotonic clock, at speed times
+# real time, starting from seek milliseconds into the script.  openEvents is
+# a function like those returned by openCanned(), taking a position in the
+# script (in milliseconds) and returning an iterator of events from which 
+# playback from that position can be started:  either simply all of the 
+# events from the beginning, or (for binary scripts) a snapshot and the
+# events following it.  It's used again for every seek.  Events are fetched from
+# it one at a time, only as they come due.  The user of a Playback object
+# sleeps for timeToNext() seconds (or until something else wakes it up),
+# and then processes the events from dueEvents(); it's the same whether the
+# sleep ran long or short, since dueEvents() gives everything due by the time
+# it's called.  Each event from dueEvents() comes with a flag which is True
+# if it's from before the point last seeked to, meaning that it's being
+# played back only to bring things up to date, so that the user can skip
+# anything (like sounds) that's only meaningful in real time.
+class Playback:
+	def __init__(self, openEvents, speed = 1.0, seek = 0.0):
+		self.openEvents = openEvents
+		self.speed = speed
+		self.seek(seek)
+
+	# The position in the script (in milliseconds) corresponding to a time
+	# on the monotonic clock, and vice-versa.  They are anchored at the last
+	# seek or change of speed.
+	def position(self, now = None):
+		if now == None:
+			now = time.monotonic()
+		return self.anchorPosition + (now - self.anchorTime) * 1000.0 * self.speed
+	def timeOf(self, position):
+		return self.anchorTime + (position - self.anchorPosition) / (1000.0 * self.speed)
+
+	def seek(self, position):
+		self.events = iter(self.openEvents(position))
+		self.pending = next(self.events, None)
+		self.anchorTime = time.monotonic()
+		self.anchorPosition = position
+		self.catchUpTo = position
+
+	def setSpeed(self, speed):
+		now = time.monotonic()
+		self.anchorPosition = self.position(now)
+		self.anchorTime = now
+		self.speed = speed
+
+	def finished(self):
+		return self.pending == None
+
+	# Seconds until the next event is due, or None if there are no more.
+	def timeToNext(self):
+		if self.pending == None:
+			return None
+		return max(0.0, self.timeOf(self.pending[1]) - time.monotonic())
+
+	# A generator of ( EVENT, CATCHINGUP ) for all of the events now due.
+	def dueEvents(self):
+		position = self.position()
+		while self.pending != None and self.pending[1] <= position:
+			event = self.pending
+			self.pending = next(self.events, None)
+			yield event, event[1] < self.catchUpTo
+
+# Conversion of text scripts to binary.
+if __name__ == "__main__":
+	import argparse
+	cli = argparse.ArgumentParser(description="Converts a .canned script to binary form.")
+	cli.add_argument("--interval", help="Events per index entry (default 256).", type=int, default=256)
+	cli.add_argument("input", help="The .canned script.")
+	cli.add_argument("output", help="The binary file to create.")
+	args = cli.parse_args()
+	if args.interval < 1:
+		cli.error("--interval must be at least 1")
+	with open(args.input, "r") as input, open(args.output, "wb") as output:
+		writeCannedBinary(readCannedEvents(input), output, args.interval)
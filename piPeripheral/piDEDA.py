@@ -28,6 +28,10 @@
 #		Flight Program 6 (Apollo 11) or Flight Program 8 (Apollo 15-17). 
 # Reference:	http://www.ibiblio.org/apollo/developer.html
 # Mod history:	2017-12-04 RSB	Began.
+#		2026-10-19	Packets are now encoded and parsed by the
+#				shared module agxPackets.py, which also fixes
+#				the encoding of the upper 6 bits of values
+#				sent to yaAGS.
 #
 # This program is intended to be run using the runPiDEDA.sh script, so look
 # at that script for details as to how to start up the program. 
@@ -97,6 +101,7 @@ import termios
 import atexit
 import threading
 import os
+import agxPackets
 
 # Parse command-line arguments.
 cli = argparse.ArgumentParser()
@@ -355,18 +360,12 @@ connectToAGS()
 # Given a 2-tuple (channel,value) for yaAGS, creates packet data and sends it to yaAGS.
 def packetize(tuple):
 	print("Sending " + oct(tuple[0]) + " " + oct(tuple[1]))
-	outputBuffer = bytearray(4)
-	outputBuffer[0] = 0x00 | (tuple[0] & 0x3F)
-	outputBuffer[1] = 0xC0 | ((tuple[0] >> 12) & 0x3F)
-	outputBuffer[2] = 0x80 | ((tuple[1] >> 6) & 0x3F)
-	outputBuffer[3] = 0x40 | (tuple[1] & 0x3F)
-	s.send(outputBuffer)
+	s.send(agxPackets.encodeAgsPackets([ tuple ]))
 
 def eventLoop():
-	# Buffer for a packet received from yaAGS.
-	packetSize = 4
-	inputBuffer = bytearray(packetSize)
-	leftToRead = packetSize
+	# Buffer for packets received from yaAGS.
+	inputBuffer = bytearray(4096)
+	inputLength = 0
 	view = memoryview(inputBuffer)
 	didSomething = False
 	while True:
@@ -378,57 +377,21 @@ def eventLoop():
 		# While these packets are always exactly 4
 		# bytes long, since the socket is non-blocking, any individual read
 		# operation may yield less bytes than that, so the buffer may accumulate data
-		# over time until it fills.	
+		# over time.  All of the complete packets received are processed at once;
+		# see agxPackets.py for how pings and corrupted packets are handled.
 		try:
-			numNewBytes = s.recv_into(view, leftToRead)
+			numNewBytes = s.recv_into(view[inputLength:])
 		except:
 			numNewBytes = 0
 		if numNewBytes > 0:
-			view = view[numNewBytes:]
-			leftToRead -= numNewBytes
-			# print("Left to read: " + str(leftToRead))
-			if leftToRead == 0:
-				# Prepare for next read attempt.
-				view = memoryview(inputBuffer)
-				leftToRead = packetSize
-				# Parse the packet just read, and call outputFromAGS().
-				# Start with a sanity check.
-				ok = 1
-				if (inputBuffer[0] & 0xC0) != 0x00:
-					ok = 0
-				elif (inputBuffer[1] & 0xC0) != 0xC0:
-					ok = 0
-				elif (inputBuffer[2] & 0xC0) != 0x80:
-					ok = 0
-				elif (inputBuffer[3] & 0xC0) != 0x40:
-					ok = 0
-				# Packet has the various signatures we expect.
-				if ok == 0:
-					# Note that, depending on the yaAGS version, it occasionally
-					# sends either a 1-byte packet (just 0xFF, older versions)
-					# or a 4-byte packet (0xFF 0xFF 0xFF 0xFF, newer versions)
-					# just for pinging the client.  These packets hold no
-					# data and need to be ignored, but for other corrupted packets
-					# we print a message. And try to realign past the corrupted
-					# bytes.
-					if inputBuffer[0] != 0xff or inputBuffer[1] != 0xff or inputBuffer[2] != 0xff or inputBuffer[2] != 0xff:
-						if inputBuffer[0] != 0xff:
-							print("Illegal packet: " + hex(inputBuffer[0]) + " " + hex(inputBuffer[1]) + " " + hex(inputBuffer[2]) + " " + hex(inputBuffer[3]))
-						for i in range(1,packetSize):
-							if (inputBuffer[i] & 0xC0) == 0:
-								j = 0
-								for k in range(i,4):
-									inputBuffer[j] = inputBuffer[k]
-									j += 1
-								view = view[j:]
-								leftToRead = packetSize - j
-				else:
-					channel = (inputBuffer[0] & 0x3F)
-					value = (inputBuffer[1] & 0x3F) << 12
-					value |= (inputBuffer[2] & 0x3F) << 6
-					value |= (inputBuffer[3] & 0x3F)
-					outputFromAGS(channel, value)
-				didSomething = True
+			end = inputLength + numNewBytes
+			packets = []
+			used = agxPackets.parseAgsPackets(inputBuffer, 0, end, packets)
+			inputLength = end - used
+			inputBuffer[:inputLength] = inputBuffer[used:end]
+			for channel, value in packets:
+				outputFromAGS(channel, value)
+			didSomething = True
 		
 		# Check for locally-generated data for which we must generate messages
 		# to yaAGS over the socket.  In theory, the externalData list could contain
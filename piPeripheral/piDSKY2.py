@@ -134,6 +134,29 @@
 #		2018-01-06 MAS	Switched the TEMP light to use channel 163 instead
 #				of channel 11.
 #		2018-03-10 RSB	Added --gunmetal option.
+#		2026-10-19	The LCD graphics are now image items on a
+#				single canvas, which are merely given a new
+#				image when they change, rather than Labels
+#				which were destroyed and recreated.  Fixed
+#				the C-style "!useBacklights", which Python
+#				wouldn't compile.
+#		2026-10-19	The event loop now sleeps in select() until
+#				there's data from yaAGC, a keystroke, or a
+#				playback event due, rather than polling every
+#				PULSE seconds, and processes all available
+#				packets and keystrokes each time it wakes.
+#		2026-10-19	Packets are now encoded and parsed by the
+#				shared module agxPackets.py.
+#		2026-10-19	--playback scripts are now read as they're
+#				played rather than all at startup, and are
+#				timed by the monotonic clock.  Added --speed
+#				and --seek.  Commands in the scripts are run
+#				with subprocess rather than os.system().
+#		2026-10-19	--playback also accepts scripts converted to
+#				the indexed binary form by cannedScript.py.
+#		2026-10-19	inputsForAGC() is polled every PULSE seconds
+#				again if pollInputs is set, for versions of
+#				it which check inputs other than keystrokes.
 #
 # About the design of this program ... yes, a real Python developer would 
 # objectify it and have lots and lots of individual modules defining the objects.
@@ -201,12 +224,16 @@ import signal
 import sys
 import argparse
 import threading
-from tkinter import Tk, Label, PhotoImage
+from tkinter import Tk, Canvas, PhotoImage, NW
 import termios
 import fcntl
 from pyscreenshot import grab
 import psutil
 import socket
+import selectors
+import agxPackets
+import cannedScript
+import subprocess
 
 homeDir = os.path.expanduser("~")
 #print("Home = " + homeDir)
@@ -219,7 +246,9 @@ cli.add_argument("--window", help="Use window rather than full screen for LCD.")
 cli.add_argument("--slow", help="For use on really slow host systems.")
 cli.add_argument("--pigpio", help="Use PIGPIO rather than led-panel for lamp control. The value is a brightness-intensity setting, 0-15.", type=int)
 cli.add_argument("--record", help="Record all incoming i/o-channel data for later playback.")
-cli.add_argument("--playback", help="Play back recorded i/o-channel data from selected filename.")
+cli.add_argument("--playback", help="Play back recorded i/o-channel data from selected filename (text or binary).")
+cli.add_argument("--speed", help="Speed factor for --playback (default 1).", type=float, default=1.0)
+cli.add_argument("--seek", help="Start --playback this many seconds into the script (default 0).", type=float, default=0.0)
 cli.add_argument("--lamptest", help="Perform a lamp test and then exit.")
 cli.add_argument("--manual", help="Manually control the display.")
 cli.add_argument("--gunmetal", help="Use gunmetal versions of mounting posts and horizontal separator.")
@@ -270,10 +299,8 @@ if args.manual:
 
 # Responsiveness settings.
 if args.slow:
-	PULSE = 0.25
 	lampDeadtime = 0.25
 else:
-	PULSE = 0.05
 	lampDeadtime = 0.1
 
 # Characteristics of the host and port being used for yaAGC communications.  
@@ -290,61 +317,23 @@ if args.record:
 	lastRecordedTime = -1
 	recordingFile = open(homeDir + "/Desktop/piDSKY2-recorded.canned", "w", 1)
 
+# The --playback script is read only as its events come due (see 
+# cannedScript.py), so that even very long scripts start at once.  It can be
+# either a text script or one converted to binary form by cannedScript.py, 
+# which makes --seek immediate.
 if args.playback:
 	useBacklights = False
-	lastPlaybackTime = time.time()
-	playbackEvents = []
-	currentPlaybackIndex = 0
 	try:
-		playbackFile = open(args.playback, "r")
-		playbackGenerator = (line.strip().split() for line in playbackFile)
-		# Loop on the input-file's lines.
-		for line in playbackGenerator:
-			# If we find a field that begins with the '#' character,
-			# we ignore all of the fields beyond it as constituting
-			# a comment.
-			for i in range(1, len(line)):
-				if line[i][:1] == '#':
-					line = line[:i]
-					break
-			# At minimum, we require there must be at least 2 fields in 
-			# the line, that the first must be a float, and the 
-			# second must not be empty.
-			if len(line) < 2 or len(line[1]) < 1:
-				continue
-			try:
-				differential = float(line[0])
-			except:
-				continue
-			# There are two cases at this
-			# point.  First, the line could be an i/o-channel event, in
-			# which case it has 3 fields consisting of a float (already
-			# verified) and two octals.  In the second, it consists of
-			# a variable number of fields, of which the first is a float
-			# (already verified), the second is non-empty (and consists
-			# of the name of a program to be run), and the remainder (if
-			# any) are the command-line parameters for that program.
-			# When we append this to the event array, we distinguish by adding
-			# an extra field that is either True for the former case or
-			# False for the latter.
-			entry = ()
-			if len(line) == 3:			
-				try:
-					entry = ( True, differential, int(line[1], 8), int(line[2], 8)  )
-				except:
-					pass
-			if len(entry) == 0:
-				command = line[1];
-				for i in range(2, len(line)):
-					command += " " + line[i]
-				entry = ( False, differential, command )
-			playbackEvents.append( entry )
-			#print(str(playbackEvents[len(playbackEvents)-1]))
+		openPlaybackEvents = cannedScript.openCanned(args.playback)
 	except:
 		print("Problem with playback file: " + args.playback)
 		time.sleep(2)
-		echoOn(True)
 		os._exit(1)
+	if args.speed <= 0:
+		print("--speed must be positive")
+		time.sleep(2)
+		os._exit(1)
+	playback = cannedScript.Playback(openPlaybackEvents, args.speed, 1000.0 * args.seek)
 
 # Set up root viewport for tkinter graphics
 root = Tk()
@@ -355,6 +344,10 @@ else:
 	root.attributes('-fullscreen', True)
 	root.config(cursor="none")
 root.configure(background='black')
+# All of the graphics are drawn as image items on a single canvas covering
+# the entire LCD.
+screen = Canvas(root, background='black', borderwidth=0, highlightthickness=0)
+screen.place(x=0, y=0, relwidth=1, relheight=1)
 # Preload images to make it go faster later.
 imageDigitBlank = PhotoImage(file="piDSKY2-images/7Seg-0.gif")
 imageDigit0 = PhotoImage(file="piDSKY2-images/7Seg-21.gif")
@@ -383,21 +376,26 @@ else:
 	imageSeparatorOn = PhotoImage(file="piDSKY2-images/SeparatorOn-gunmetal.gif")
 	imageSeparatorOff = PhotoImage(file="piDSKY2-images/SeparatorOff-gunmetal.gif")
 	imageDot = PhotoImage(file="piDSKY2-images/Dot-gunmetal.gif")
-# Initial placement of all graphical objects on LCD panel.
+# Initial placement of all graphical objects on LCD panel.  The first time
+# something is displayed at a given position, an image item is created for
+# it on the canvas; after that, the same item is simply switched to the new
+# image, which is much cheaper than creating and placing a new widget, and
+# nothing at all is done if the image hasn't changed.  Since all positions
+# are displayed at startup, all of the items exist before yaAGC connects.
 widgetStates = {}
-widgetLabels = {}
+widgetItems = {}
 def displayGraphic(x, y, img):
-	global widgetStates, widgetLabels
-	key = str(x) + "," + str(y)
+	global widgetStates, widgetItems
+	key = (x, y)
 	if key in widgetStates:
 		if widgetStates[key] is img:
-			#print("skipping " + key)
+			#print("skipping " + str(key))
 			return
 	widgetStates[key] = img
-	if key in widgetLabels:
-		widgetLabels[key].destroy()
-	widgetLabels[key] = Label(root, image=img, borderwidth=0, highlightthickness=0)
-	widgetLabels[key].place(x=x, y=y)
+	if key in widgetItems:
+		screen.itemconfig(widgetItems[key], image=img)
+	else:
+		widgetItems[key] = screen.create_image(x, y, image=img, anchor=NW)
 topDot = 15
 dotSpacing = 92
 topProg = 36
@@ -503,19 +501,8 @@ if args.pigpio:
 def packetize(tuple):
 	if args.playback:
 		return
-	outputBuffer = bytearray(4)
-	# First, create and output the mask command.
-	outputBuffer[0] = 0x20 | ((tuple[0] >> 3) & 0x0F)
-	outputBuffer[1] = 0x40 | ((tuple[0] << 3) & 0x38) | ((tuple[2] >> 12) & 0x07)
-	outputBuffer[2] = 0x80 | ((tuple[2] >> 6) & 0x3F)
-	outputBuffer[3] = 0xC0 | (tuple[2] & 0x3F)
-	s.send(outputBuffer)
-	# Now, the actual data for the channel.
-	outputBuffer[0] = 0x00 | ((tuple[0] >> 3) & 0x0F)
-	outputBuffer[1] = 0x40 | ((tuple[0] << 3) & 0x38) | ((tuple[1] >> 12) & 0x07)
-	outputBuffer[2] = 0x80 | ((tuple[1] >> 6) & 0x3F)
-	outputBuffer[3] = 0xC0 | (tuple[1] & 0x3F)
-	s.send(outputBuffer)
+	# The mask packet and the data packet for the channel.
+	s.send(agxPackets.encodeAgcPackets([ tuple ]))
 	if args.record:
 		global lastRecordedTime, recordingFile, lastInputChannels
 		currentTime = time.time()
@@ -626,7 +613,7 @@ def echoOn(control):
 	new = termios.tcgetattr(fd)
 	if control:
 		print("Keyboard echo on")
-		new[3] |= termios.ECHO
+		new[3] |= termios.ECHO | termios.ICANON
 	else:
 		print("Keyboard echo off")
 		new[3] &= ~termios.ECHO
@@ -664,22 +651,44 @@ def get_char_keyboard_nonblock():
 # Hardware abstraction / User-defined functions.  Also, any other platform-specific
 # initialization.
 
-# This function is automatically called periodically by the event loop to check for 
+# This function is automatically called by the event loop to check for 
 # conditions that will result in sending messages to yaAGC that are interpreted
-# as changes to bits on its input channels.  For test purposes, it simply polls the
-# keyboard, and interprets various keystrokes as DSKY keys if present.  The return
+# as changes to bits on its input channels.  It's called whenever keystrokes are
+# queued, and, if pollInputs is True, also every PULSE seconds regardless, for
+# versions of it which check other inputs (such as a keypad or switches on GPIO
+# pins) that can't wake up the event loop themselves.  For test purposes, it 
+# simply takes the queued keystrokes, and interprets them as DSKY keys.  The return
 # value is supposed to be a list of 3-tuples of the form
 #	[ (channel0,value0,mask0), (channel1,value1,mask1), ...]
 # and may be en empty list.  The list guiKey is used to queue up keypresses (or
 # relevant key releases) from the graphics window, so that they can be properly
 # merged in with keystrokes from the console, without losing any of them.
+# Similarly, once the event loop is watching the console (consoleWatched), it
+# queues up the console's keystrokes in consoleKey.  Whenever something is 
+# added to guiKey, wakeEventLoop() has to be called, so that the event loop
+# notices.  (If the console can't be watched, because it isn't a terminal, it
+# can't be read one keystroke at a time either, so console keystrokes are then
+# simply not available.)
+pollInputs = False
+PULSE = 0.05
 guiKey = []
+consoleKey = []
+consoleWatched = False
+wakeupReceiver, wakeupSender = os.pipe()
+os.set_blocking(wakeupReceiver, False)
+def wakeEventLoop():
+	try:
+		os.write(wakeupSender, b"k")
+	except:
+		pass
 def getKey():
 	global guiKey
-	if len(guiKey) == 0:
-		ch = get_char_keyboard_nonblock()
-	else:
+	if len(guiKey) > 0:
 		ch = guiKey.pop(0)
+	elif len(consoleKey) > 0:
+		ch = consoleKey.pop(0)
+	else:
+		ch = ""
 	ch = ch.upper()
 	if ch == '_':
 		ch = '-'
@@ -743,12 +752,15 @@ def guiKeypress(event):
 	for i in range(0, len(guiKeyTranslations)):
 		if debugKey == guiKeyTranslations[i][0]:
 			guiKey.append(guiKeyTranslations[i][1])
+			wakeEventLoop()
 			return
 	guiKey.append(debugKey)
+	wakeEventLoop()
 def guiKeyrelease(event):
 	global guiKey
 	if event.keysym == 'p' or event.keysym == 'P' or event.keysym == "BackSpace":
 		guiKey.append("PR")
+		wakeEventLoop()
 root.bind_all('<KeyPress>', guiKeypress)
 root.bind_all('<KeyRelease>', guiKeyrelease)
 # The tab key isn't captured by the stuff above.
@@ -756,6 +768,7 @@ def tabKeypress(event):
 	global guiKey, debugKey
 	debugKey = "Tab"
 	guiKey.append("K")
+	wakeEventLoop()
 root.bind_all('<Tab>', tabKeypress)
 os.system("xset r off &")
 
@@ -860,25 +873,25 @@ lampStatuses = {
 	"ALT" : { "isLit" : False, "cliParameter" : "C", "spiParameters" : [ { "register":6, "mask":0x07 } ] },
 	"NO DAP" : { "isLit" : False, "cliParameter" : "F", "spiParameters" : [ { "register":7, "mask":0x70 } ] },
 	"VEL" : { "isLit" : False, "cliParameter" : "E", "spiParameters" : [ { "register":7, "mask":0x07 } ] },
-	"VERB KEY" : { "isLit" : !useBacklights, "cliParameter" : "G", "spiParameters" : [ { "register":1, "mask":0x08 } ] },
-	"NOUN KEY" : { "isLit" : !useBacklights, "cliParameter" : "H", "spiParameters" : [ { "register":1, "mask":0x80 } ] },
-	"+ KEY" : { "isLit" : !useBacklights, "cliParameter" : "I", "spiParameters" : [ { "register":2, "mask":0x08 } ] },
-	"- KEY" : { "isLit" : !useBacklights, "cliParameter" : "J", "spiParameters" : [ { "register":2, "mask":0x80 } ] },
-	"0 KEY" : { "isLit" : !useBacklights, "cliParameter" : "K", "spiParameters" : [ { "register":3, "mask":0x08 } ] },
-	"7 KEY" : { "isLit" : !useBacklights, "cliParameter" : "L", "spiParameters" : [ { "register":3, "mask":0x80 } ] },
-	"4 KEY" : { "isLit" : !useBacklights, "cliParameter" : "M", "spiParameters" : [ { "register":4, "mask":0x08 } ] },
-	"1 KEY" : { "isLit" : !useBacklights, "cliParameter" : "N", "spiParameters" : [ { "register":4, "mask":0x80 } ] },
-	"8 KEY" : { "isLit" : !useBacklights, "cliParameter" : "O", "spiParameters" : [ { "register":5, "mask":0x08 } ] },
-	"5 KEY" : { "isLit" : !useBacklights, "cliParameter" : "P", "spiParameters" : [ { "register":5, "mask":0x80 } ] },
-	"2 KEY" : { "isLit" : !useBacklights, "cliParameter" : "Q", "spiParameters" : [ { "register":6, "mask":0x08 } ] },
-	"9 KEY" : { "isLit" : !useBacklights, "cliParameter" : "R", "spiParameters" : [ { "register":6, "mask":0x80 } ] },
-	"6 KEY" : { "isLit" : !useBacklights, "cliParameter" : "S", "spiParameters" : [ { "register":7, "mask":0x08 } ] },
-	"3 KEY" : { "isLit" : !useBacklights, "cliParameter" : "T", "spiParameters" : [ { "register":7, "mask":0x80 } ] },
-	"CLR KEY" : { "isLit" : !useBacklights, "cliParameter" : "U", "spiParameters" : [ { "register":8, "mask":0x40 } ] },
-	"PRO KEY" : { "isLit" : !useBacklights, "cliParameter" : "V", "spiParameters" : [ { "register":8, "mask":0x20 } ] },
-	"KEY REL KEY" : { "isLit" : !useBacklights, "cliParameter" : "W", "spiParameters" : [ { "register":8, "mask":0x10 } ] },
-	"ENTR KEY" : { "isLit" : !useBacklights, "cliParameter" : "X", "spiParameters" : [ { "register":8, "mask":0x08 } ] },
-	"RSET KEY" : { "isLit" : !useBacklights, "cliParameter" : "Y", "spiParameters" : [ { "register":8, "mask":0x04 } ] },
+	"VERB KEY" : { "isLit" : not useBacklights, "cliParameter" : "G", "spiParameters" : [ { "register":1, "mask":0x08 } ] },
+	"NOUN KEY" : { "isLit" : not useBacklights, "cliParameter" : "H", "spiParameters" : [ { "register":1, "mask":0x80 } ] },
+	"+ KEY" : { "isLit" : not useBacklights, "cliParameter" : "I", "spiParameters" : [ { "register":2, "mask":0x08 } ] },
+	"- KEY" : { "isLit" : not useBacklights, "cliParameter" : "J", "spiParameters" : [ { "register":2, "mask":0x80 } ] },
+	"0 KEY" : { "isLit" : not useBacklights, "cliParameter" : "K", "spiParameters" : [ { "register":3, "mask":0x08 } ] },
+	"7 KEY" : { "isLit" : not useBacklights, "cliParameter" : "L", "spiParameters" : [ { "register":3, "mask":0x80 } ] },
+	"4 KEY" : { "isLit" : not useBacklights, "cliParameter" : "M", "spiParameters" : [ { "register":4, "mask":0x08 } ] },
+	"1 KEY" : { "isLit" : not useBacklights, "cliParameter" : "N", "spiParameters" : [ { "register":4, "mask":0x80 } ] },
+	"8 KEY" : { "isLit" : not useBacklights, "cliParameter" : "O", "spiParameters" : [ { "register":5, "mask":0x08 } ] },
+	"5 KEY" : { "isLit" : not useBacklights, "cliParameter" : "P", "spiParameters" : [ { "register":5, "mask":0x80 } ] },
+	"2 KEY" : { "isLit" : not useBacklights, "cliParameter" : "Q", "spiParameters" : [ { "register":6, "mask":0x08 } ] },
+	"9 KEY" : { "isLit" : not useBacklights, "cliParameter" : "R", "spiParameters" : [ { "register":6, "mask":0x80 } ] },
+	"6 KEY" : { "isLit" : not useBacklights, "cliParameter" : "S", "spiParameters" : [ { "register":7, "mask":0x08 } ] },
+	"3 KEY" : { "isLit" : not useBacklights, "cliParameter" : "T", "spiParameters" : [ { "register":7, "mask":0x80 } ] },
+	"CLR KEY" : { "isLit" : not useBacklights, "cliParameter" : "U", "spiParameters" : [ { "register":8, "mask":0x40 } ] },
+	"PRO KEY" : { "isLit" : not useBacklights, "cliParameter" : "V", "spiParameters" : [ { "register":8, "mask":0x20 } ] },
+	"KEY REL KEY" : { "isLit" : not useBacklights, "cliParameter" : "W", "spiParameters" : [ { "register":8, "mask":0x10 } ] },
+	"ENTR KEY" : { "isLit" : not useBacklights, "cliParameter" : "X", "spiParameters" : [ { "register":8, "mask":0x08 } ] },
+	"RSET KEY" : { "isLit" : not useBacklights, "cliParameter" : "Y", "spiParameters" : [ { "register":8, "mask":0x04 } ] },
 	"VNCSERVERUI" : { "isLit" : False, "cliParameter" : "Z", "spiParameters" : [ { "register":8, "mask":0x02 } ] },
 	"TBD1" : { "isLit" : False, "cliParameter" : "a", "spiParameters" : [ { "register":8, "mask":0x01 } ] },
 	"TBD2" : { "isLit" : False, "cliParameter" : "b", "spiParameters" : [ { "register":8, "mask":0x80 } ] }
@@ -1634,142 +1647,149 @@ keyNames = [
 	"KEY REL KEY", "+ KEY", "- KEY", "ENTR KEY", "none",
 	"CLR KEY", "NOUN KEY"
 ]
+# Plays back all of the events from the --playback script which have come due.
+# Returns False if the script has asked for the program to exit (by 5 RSETs in 
+# a row), and True otherwise.  Events from before the --seek point are played
+# back only for their effect on the display, so keystrokes and commands among 
+# them are skipped.
+cannedRsetCount = 0
+def playbackDueEvents():
+	global cannedRsetCount
+	for event, catchingUp in playback.dueEvents():
+		#print(event)
+		if event[0]:
+			# Channels 015 and 032 are AGC INPUT channels (hence
+			# are outputs from the DSKY rather than inputs to it).
+			# They indicate keypresses.  We won't do anything with
+			# them other than possibly to flash backlights on the
+			# associated keys.
+			channel = event[2]
+			value = event[3]
+			if channel == 0o15:
+				if catchingUp:
+					continue
+				#print("Playback keystroke event " + oct(channel) + " " + oct(value))
+				name = keyNames[value & 0o37]
+				if name == "RSET KEY":
+					cannedRsetCount += 1
+					if cannedRsetCount >= 5:
+						return False
+				else:
+					cannedRsetCount = 0
+				updateLampStatusesAndLamps(name, False)
+				t = threading.Timer(0.32, updateLampStatusesAndLamps, (name, True))
+				t.start()
+			elif channel == 0o32:
+				if (value & 0o20000) != 0:
+					updateLampStatusesAndLamps("PRO KEY", True)
+				else:
+					updateLampStatusesAndLamps("PRO KEY", False)
+			else:
+				outputFromAGC(channel, value)
+		elif not catchingUp:
+			sys.stderr.write("Command = \"" + event[2] + "\"\n")
+			subprocess.Popen(event[2], shell=True)
+	return True
+
+# The number of seconds until the next event from the --playback script is 
+# due, or None if there isn't one.
+def timeToNextPlaybackEvent():
+	if not args.playback:
+		return None
+	return playback.timeToNext()
+
+# The event loop sleeps (in select()) until there's something for it to do: data 
+# from yaAGC, a keystroke on the console, a keystroke in the LCD window (of which
+# the GUI thread tells us by writing to wakeupSender), or the next event of a 
+# --playback script coming due, or, if pollInputs is set, PULSE seconds passing.
+# The other timed activities (flashing of VERB/NOUN,
+# flushing of lamp changes, and so on) are run by threading.Timer and don't involve
+# the event loop at all.  Whatever woke it up, the event loop processes all of the
+# data available, such as all of the complete packets from yaAGC and all of the 
+# queued keystrokes, before going back to sleep.  For the console to be watched in
+# this way, it has to be in non-canonical mode (so that keystrokes don't wait for
+# ENTER), which echoOn(True) undoes at exit.
 def eventLoop():
-	global debugKey
-	# Buffer for a packet received from yaAGC.
-	packetSize = 4
-	inputBuffer = bytearray(packetSize)
-	leftToRead = packetSize
+	global debugKey, consoleWatched
+	# Buffer for packets received from yaAGC.
+	inputBuffer = bytearray(4096)
+	inputLength = 0
 	view = memoryview(inputBuffer)
-	cannedRsetCount = 0
 	
-	didSomething = False
+	selector = selectors.DefaultSelector()
+	selector.register(wakeupReceiver, selectors.EVENT_READ, "gui")
+	try:
+		fd = sys.stdin.fileno()
+		attributes = termios.tcgetattr(fd)
+		attributes[3] &= ~termios.ICANON
+		termios.tcsetattr(fd, termios.TCSANOW, attributes)
+		selector.register(fd, selectors.EVENT_READ, "console")
+		consoleWatched = True
+	except:
+		pass
+	if not args.playback:
+		selector.register(s, selectors.EVENT_READ, "agc")
+	
 	while True:
-		if not didSomething:
-			time.sleep(PULSE)
-		didSomething = False
-		
-		# Check for packet data received from yaAGC and process it.
-		# While these packets are always exactly 4
-		# bytes long, since the socket is non-blocking, any individual read
-		# operation may yield less bytes than that, so the buffer may accumulate data
-		# over time until it fills.
-		if args.playback:
-			global currentPlaybackIndex, playbackEvents, lastPlaybackTime
-			# Get data from playback file.
-			if currentPlaybackIndex < len(playbackEvents):
-				#print(currentPlaybackIndex)
-				timeNow = time.time()
-				desiredTime = lastPlaybackTime + playbackEvents[currentPlaybackIndex][1] / 1000.0
-				if timeNow >= desiredTime:
-					lastPlaybackTime = desiredTime
-					#print(playbackEvents[currentPlaybackIndex])
-					if playbackEvents[currentPlaybackIndex][0]:
-						# Channels 015 and 032 are AGC INPUT channels (hence
-						# are outputs from the DSKY rather than inputs to it).
-						# They indicate keypresses.  We won't do anything with
-						# them other than possibly to flash backlights on the
-						# associated keys.
-						channel = playbackEvents[currentPlaybackIndex][2]
-						value = playbackEvents[currentPlaybackIndex][3]
-						if channel == 0o15:
-							#print("Playback keystroke event " + oct(channel) + " " + oct(value))
-							name = keyNames[value & 0o37]
-							if name == "RSET KEY":
-								cannedRsetCount += 1
-								if cannedRsetCount >= 5:
-									echoOn(True)
-									timersStop()
-									root.destroy()
-									shutdownGPIO()
-									os.system("xset r on &")
-									return	
-							else:
-								cannedRsetCount == 0
-							updateLampStatusesAndLamps(name, False)
-							t = threading.Timer(0.32, updateLampStatusesAndLamps, (name, True))
-							t.start()
-						elif channel == 0o32:
-							if (value & 0o20000) != 0:
-								updateLampStatusesAndLamps("PRO KEY", True)
-							else:
-								updateLampStatusesAndLamps("PRO KEY", False)
-						else:
-							outputFromAGC(channel, value)
-					else:
-						sys.stderr.write("Command = \"" + playbackEvents[currentPlaybackIndex][2] + "\"\n")
-						os.system(playbackEvents[currentPlaybackIndex][2] + ' &')
-					currentPlaybackIndex += 1
-					didSomething = True
-		else:
-			# Get input from socket to AGC.
-			try:
-				numNewBytes = s.recv_into(view, leftToRead)
-			except:
-				numNewBytes = 0
-			if numNewBytes > 0:
-				view = view[numNewBytes:]
-				leftToRead -= numNewBytes
-				if leftToRead == 0:
-					# Prepare for next read attempt.
-					view = memoryview(inputBuffer)
-					leftToRead = packetSize
-					# Parse the packet just read, and call outputFromAGC().
-					# Start with a sanity check.
-					ok = 1
-					if (inputBuffer[0] & 0xF0) != 0x00:
-						ok = 0
-					elif (inputBuffer[1] & 0xC0) != 0x40:
-						ok = 0
-					elif (inputBuffer[2] & 0xC0) != 0x80:
-						ok = 0
-					elif (inputBuffer[3] & 0xC0) != 0xC0:
-						ok = 0
-					# Packet has the various signatures we expect.
-					if ok == 0:
-						# Note that, depending on the yaAGC version, it occasionally
-						# sends either a 1-byte packet (just 0xFF, older versions)
-						# or a 4-byte packet (0xFF 0xFF 0xFF 0xFF, newer versions)
-						# just for pinging the client.  These packets hold no
-						# data and need to be ignored, but for other corrupted packets
-						# we print a message. And try to realign past the corrupted
-						# bytes.
-						if inputBuffer[0] != 0xff or inputBuffer[1] != 0xff or inputBuffer[2] != 0xff or inputBuffer[2] != 0xff:
-							if inputBuffer[0] != 0xff:
-								print("Illegal packet: " + hex(inputBuffer[0]) + " " + hex(inputBuffer[1]) + " " + hex(inputBuffer[2]) + " " + hex(inputBuffer[3]))
-							for i in range(1,packetSize):
-								if (inputBuffer[i] & 0xF0) == 0:
-									j = 0
-									for k in range(i,4):
-										inputBuffer[j] = inputBuffer[k]
-										j += 1
-									view = view[j:]
-									leftToRead = packetSize - j
-					else:
-						channel = (inputBuffer[0] & 0x0F) << 3
-						channel |= (inputBuffer[1] & 0x38) >> 3
-						value = (inputBuffer[1] & 0x07) << 12
-						value |= (inputBuffer[2] & 0x3F) << 6
-						value |= (inputBuffer[3] & 0x3F)
-						outputFromAGC(channel, value)
-					didSomething = True
+		timeout = timeToNextPlaybackEvent()
+		if pollInputs and (timeout == None or timeout > PULSE):
+			timeout = PULSE
+		for key, events in selector.select(timeout):
+			if key.data == "agc":
+				# Get input from socket to AGC, and process all complete
+				# packets.  Since the socket is non-blocking, any individual
+				# read may yield only part of a packet, so the buffer may
+				# accumulate data over time.  See agxPackets.py for how 
+				# pings and corrupted packets are handled.
+				try:
+					numNewBytes = s.recv_into(view[inputLength:])
+				except BlockingIOError:
+					continue
+				except:
+					numNewBytes = 0
+				if numNewBytes == 0:
+					sys.stderr.write("Disconnected from AGC.\n")
+					selector.unregister(s)
+					continue
+				end = inputLength + numNewBytes
+				packets = []
+				used = agxPackets.parseAgcPackets(inputBuffer, 0, end, packets)
+				inputLength = end - used
+				inputBuffer[:inputLength] = inputBuffer[used:end]
+				for channel, value in packets:
+					outputFromAGC(channel, value)
+			elif key.data == "console":
+				consoleKey.extend(os.read(key.fd, 256).decode("utf-8", "ignore"))
+			else:
+				os.read(wakeupReceiver, 256)
 		
-		# Check for locally-generated data for which we must generate messages
-		# to yaAGC over the socket.  In theory, the externalData list could contain
-		# any number of channel operations, but in practice (at least for something
-		# like a DSKY implementation) it will actually contain only 0 or 1 operations.
-		externalData = inputsForAGC()
-		if externalData == "":
+		if args.playback and not playbackDueEvents():
 			echoOn(True)
 			timersStop()
-			screenshot(homeDir + "/lastscrn.png")
 			root.destroy()
 			shutdownGPIO()
 			os.system("xset r on &")
 			return
-		for i in range(0, len(externalData)):
-			packetize(externalData[i])
-			didSomething = True
+		
+		# Check for locally-generated data for which we must generate messages
+		# to yaAGC over the socket.  In theory, the externalData list could contain
+		# any number of channel operations, but in practice (at least for something
+		# like a DSKY implementation) it will actually contain only 0 or 1 operations
+		# per keystroke.  When polling, it's called at least once.
+		poll = pollInputs
+		while poll or len(guiKey) > 0 or len(consoleKey) > 0:
+			poll = False
+			externalData = inputsForAGC()
+			if externalData == "":
+				echoOn(True)
+				timersStop()
+				screenshot(homeDir + "/lastscrn.png")
+				root.destroy()
+				shutdownGPIO()
+				os.system("xset r on &")
+				return
+			for i in range(0, len(externalData)):
+				packetize(externalData[i])
 		if debugKey != "":
 			print("GUI key = " + debugKey)
 			debugKey = ""
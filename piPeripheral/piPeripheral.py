@@ -21,6 +21,10 @@
 #				Made the contents of channels 042-050 display-mode dependent.
 #		2017-12-28 RSB	Added some code that hopefully enforces shutdown of 
 #				GPIO on exit.  Probably unnecessary.
+#		2026-10-19	Packets are now encoded and parsed by the
+#				shared module agxPackets.py, which also fixes
+#				the encoding of the upper 6 bits of values
+#				sent to yaAGS.
 #
 # The parts which need to be modified to be target-system specific are the 
 # outputFromAGx() and inputsForAGx() functions.
@@ -362,6 +366,7 @@ def outputFromAGx(channel, value):
 
 import time
 import socket
+import agxPackets
 
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 s.setblocking(0)
@@ -397,31 +402,14 @@ connectToAGC()
 # Given a 3-tuple (channel,value,mask) for yaAGC, creates packet data and sends it to yaAGC.
 # Or, given a 2-tuple (channel,value) for yaAGS, creates packet data and sends it to yaAGS.
 def packetize(tuple):
-	outputBuffer = bytearray(4)
 	if args.ags:
-		outputBuffer[0] = 0x00 | (tuple[0] & 0x3F)
-		outputBuffer[1] = 0xC0 | ((tuple[0] >> 12) & 0x3F)
-		outputBuffer[2] = 0x80 | ((tuple[1] >> 6) & 0x3F)
-		outputBuffer[3] = 0x40 | (tuple[1] & 0x3F)
-		s.send(outputBuffer)
+		s.send(agxPackets.encodeAgsPackets([ tuple ]))
 	else:
-		# First, create and output the mask command.
-		outputBuffer[0] = 0x20 | ((tuple[0] >> 3) & 0x0F)
-		outputBuffer[1] = 0x40 | ((tuple[0] << 3) & 0x38) | ((tuple[2] >> 12) & 0x07)
-		outputBuffer[2] = 0x80 | ((tuple[2] >> 6) & 0x3F)
-		outputBuffer[3] = 0xC0 | (tuple[2] & 0x3F)
-		s.send(outputBuffer)
-		# Now, the actual data for the channel.
-		outputBuffer[0] = 0x00 | ((tuple[0] >> 3) & 0x0F)
-		outputBuffer[1] = 0x40 | ((tuple[0] << 3) & 0x38) | ((tuple[1] >> 12) & 0x07)
-		outputBuffer[2] = 0x80 | ((tuple[1] >> 6) & 0x3F)
-		outputBuffer[3] = 0xC0 | (tuple[1] & 0x3F)
-		s.send(outputBuffer)
+		s.send(agxPackets.encodeAgcPackets([ tuple ]))
 
-# Buffer for a packet received from yaAGC/yaAGS.
-packetSize = 4
-inputBuffer = bytearray(packetSize)
-leftToRead = packetSize
+# Buffer for packets received from yaAGC/yaAGS.
+inputBuffer = bytearray(4096)
+inputLength = 0
 view = memoryview(inputBuffer)
 
 didSomething = False
@@ -434,73 +422,24 @@ while True:
 	# While these packets are always exactly 4
 	# bytes long, since the socket is non-blocking, any individual read
 	# operation may yield less bytes than that, so the buffer may accumulate data
-	# over time until it fills.	
+	# over time.  All of the complete packets received are processed at once; 
+	# see agxPackets.py for how pings and corrupted packets are handled.
 	try:
-		numNewBytes = s.recv_into(view, leftToRead)
+		numNewBytes = s.recv_into(view[inputLength:])
 	except:
 		numNewBytes = 0
 	if numNewBytes > 0:
-		view = view[numNewBytes:]
-		leftToRead -= numNewBytes
-		if leftToRead == 0:
-			# Prepare for next read attempt.
-			view = memoryview(inputBuffer)
-			leftToRead = packetSize
-			# Parse the packet just read, and call outputFromAGx().
-			# Start with a sanity check.
-			ok = 1
-			if args.ags:
-				if (inputBuffer[0] & 0xC0) != 0x00:
-					ok = 0
-				elif (inputBuffer[1] & 0xC0) != 0xC0:
-					ok = 0
-				elif (inputBuffer[2] & 0xC0) != 0x80:
-					ok = 0
-				elif (inputBuffer[3] & 0xC0) != 0x40:
-					ok = 0
-			else:
-				if (inputBuffer[0] & 0xF0) != 0x00:
-					ok = 0
-				elif (inputBuffer[1] & 0xC0) != 0x40:
-					ok = 0
-				elif (inputBuffer[2] & 0xC0) != 0x80:
-					ok = 0
-				elif (inputBuffer[3] & 0xC0) != 0xC0:
-					ok = 0
-			# Packet has the various signatures we expect.
-			if ok == 0:
-				# Note that, depending on the yaAGC/yaAGS version, it occasionally
-				# sends either a 1-byte packet (just 0xFF, older versions)
-				# or a 4-byte packet (0xFF 0xFF 0xFF 0xFF, newer versions)
-				# just for pinging the client.  These packets hold no
-				# data and need to be ignored, but for other corrupted packets
-				# we print a message. And try to realign past the corrupted
-				# bytes.
-				if inputBuffer[0] != 0xff or inputBuffer[1] != 0xff or inputBuffer[2] != 0xff or inputBuffer[2] != 0xff:
-					if inputBuffer[0] != 0xff:
-						print("Illegal packet: " + hex(inputBuffer[0]) + " " + hex(inputBuffer[1]) + " " + hex(inputBuffer[2]) + " " + hex(inputBuffer[3]))
-					for i in range(1,packetSize):
-						if (inputBuffer[i] & 0xC0) == 0:
-							j = 0
-							for k in range(i,4):
-								inputBuffer[j] = inputBuffer[k]
-								j += 1
-							view = view[j:]
-							leftToRead = packetSize - j
-			elif args.ags:
-				channel = (inputBuffer[0] & 0x3F)
-				value = (inputBuffer[1] & 0x3F) << 12
-				value |= (inputBuffer[2] & 0x3F) << 6
-				value |= (inputBuffer[3] & 0x3F)
-				outputFromAGx(channel, value)
-			else:
-				channel = (inputBuffer[0] & 0x0F) << 3
-				channel |= (inputBuffer[1] & 0x38) >> 3
-				value = (inputBuffer[1] & 0x07) << 12
-				value |= (inputBuffer[2] & 0x3F) << 6
-				value |= (inputBuffer[3] & 0x3F)
-				outputFromAGx(channel, value)
-			didSomething = True
+		end = inputLength + numNewBytes
+		packets = []
+		if args.ags:
+			used = agxPackets.parseAgsPackets(inputBuffer, 0, end, packets)
+		else:
+			used = agxPackets.parseAgcPackets(inputBuffer, 0, end, packets)
+		inputLength = end - used
+		inputBuffer[:inputLength] = inputBuffer[used:end]
+		for channel, value in packets:
+			outputFromAGx(channel, value)
+		didSomething = True
 	
 	# Check for locally-generated data for which we must generate messages
 	# to yaAGC over the socket.  In theory, the externalData list could contain
@@ -22,6 +22,8 @@
 #		processor.
 # Reference:   	http://www.ibibio.org/apollo
 # Mods:        	2019-07-10 RSB  Began playing around with the concept.
+#		2026-10-19	Added a cache of tokenized expressions, with
+#				hit/miss counters for yaASM.py --profile.
 
 # My attempt at a minimal arithmetical expression parser for use
 # in assembling LVDC code with yaASM.py.  I don't know that it's bug-free,
@@ -269,12 +271,28 @@ def yaShuntingYard(tokens):
 #	value,error
 # where value is what the string evaluates to numerically in the form of 
 # a number/scale dictionary, and error is a hopefully-empty error message.
+# The same expression strings (macro arguments, operands of repeated
+# constructs, and so on) tend to be evaluated over and over, so the
+# tokenizations are cached.  The cached token lists are never modified
+# (the constant-substitution step below works on a copy), but since 
+# the values of constants can change between calls, only the tokenization
+# and not the final value is cached.  The hit/miss counts are just for
+# yaASM.py's --profile report.
+tokenCache = {}
+tokenCacheStats = { "hits":0, "misses":0 }
 def yaEvaluate(string, constants):
 	value = { "number":0 }
 	# Let's tokenize the string.
-	tokens,error = yaTokenize(string)
+	if string in tokenCache:
+		tokenCacheStats["hits"] += 1
+		tokens,error = tokenCache[string]
+	else:
+		tokenCacheStats["misses"] += 1
+		tokens,error = yaTokenize(string)
+		tokenCache[string] = (tokens, error)
 	if error != "":
 		return value,error
+	tokens = tokens[:]
 	# Let's replace all constant symbols by their numerical values.
 	for n in range(0, len(tokens)):
 		if type(tokens[n]) != type({}) and tokens[n] in constants:
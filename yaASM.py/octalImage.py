@@ -0,0 +1,381 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename:    	octalImage.py
+# Purpose:     	Reading and writing of LVDC/PTC octal listings (the
+#		yaASM.tsv format, and the PTC transcription format), and
+#		of a binary equivalent, for use by yaASM.py and other tools.
+# Reference:   	http://www.ibibio.org/apollo
+# Mods:        	2026-10-19	Split off from yaASM.py, which formerly
+#				had its own inline parser and writer.
+#
+# An "image" of LVDC memory (8 modules of 16 sectors of 256 words) is held in
+# flat arrays, indexed by (module * 16 + sector) * 256 + location:
+#
+#	values[0], values[1]	Syllables 0 and 1, in the positions the yaASM.tsv
+#				file shows them (i.e., already shifted left by 1 and
+#				2 bits respectively).
+#	values[2]		The data word, for locations holding data.
+#	valid[0..2]		Nonzero if the corresponding values[] entry is
+#				meaningful.  (This is what yaASM.py represents
+#				as None vs not-None.)
+#	used[0], used[1]	Nonzero if syllable 0 or 1 has been allocated,
+#				regardless of whether its value is known.
+#
+# As a command-line program, converts between formats:
+#
+#	octalImage.py [--ptc] INPUT OUTPUT
+#
+# The format of each file is determined by its name:  ".tsv" files are octal
+# listings, while anything else is treated as a binary image.  With --ptc,
+# .tsv files are in the PTC transcription format rather than the yaASM.tsv
+# format.
+
+import sys
+from array import array
+
+NUM_WORDS = 8 * 16 * 256
+BINARY_MAGIC = b"LVDCIMG1"
+
+# Exception used for all problems found in parsing an octal listing.  The
+# module, sector, and offset are of the last position processed, for
+# error messages.
+class OctalListingError(Exception):
+	def __init__(self, msg, module = -1, sector = -1, offset = -1):
+		Exception.__init__(self, msg)
+		self.module = module
+		self.sector = sector
+		self.offset = offset
+
+class OctalImage:
+	def __init__(self):
+		self.values = [array("i", bytes(4 * NUM_WORDS)) for plane in range(3)]
+		self.valid = [bytearray(NUM_WORDS) for plane in range(3)]
+		self.used = [bytearray(NUM_WORDS) for syllable in range(2)]
+
+	# Create an image from yaASM.py's octals[module][sector][plane][location]
+	# (with None for unknown values) and used[module][sector][syllable][location].
+	@staticmethod
+	def fromNested(octals, used):
+		image = OctalImage()
+		index = 0
+		for module in range(8):
+			for sector in range(16):
+				for plane in range(3):
+					values = image.values[plane]
+					valid = image.valid[plane]
+					i = index
+					for value in octals[module][sector][plane]:
+						if value != None:
+							values[i] = value
+							valid[i] = 1
+						i += 1
+				for syllable in range(2):
+					image.used[syllable][index:index + 256] = bytes(used[module][sector][syllable])
+				index += 256
+		return image
+
+	# The inverse of fromNested(), except that just octals[][][][] is returned.
+	def toNested(self):
+		nested = []
+		for module in range(8):
+			nested.append([])
+			for sector in range(16):
+				index = (module * 16 + sector) * 256
+				planes = []
+				for plane in range(3):
+					values = self.values[plane][index:index + 256]
+					valid = self.valid[plane][index:index + 256]
+					planes.append([values[i] if valid[i] else None for i in range(256)])
+				nested[module].append(planes)
+		return nested
+
+	def sectorUsed(self, module, sector):
+		index = (module * 16 + sector) * 256
+		return any(self.used[0][index:index + 256]) or any(self.used[1][index:index + 256])
+
+	# Returns the 32 rows of a sector as yaASM.tsv presents them, each row
+	# being a tuple of the starting offset followed by 8 pairs of (word, flag)
+	# strings.  yaASM.py also uses these for the octal listing it prints.
+	def sectorRows(self, module, sector):
+		index = (module * 16 + sector) * 256
+		used0 = self.used[0][index:index + 256]
+		used1 = self.used[1][index:index + 256]
+		syl0 = self.values[0][index:index + 256]
+		syl1 = self.values[1][index:index + 256]
+		data = self.values[2][index:index + 256]
+		valid0 = self.valid[0][index:index + 256]
+		valid1 = self.valid[1][index:index + 256]
+		valid2 = self.valid[2][index:index + 256]
+		cells = []
+		for loc in range(256):
+			if not (used0[loc] or used1[loc]):
+				cells.append("           ")
+				cells.append(" ")
+				continue
+			if valid2[loc]:
+				cells.append(" %09o " % data[loc])
+			else:
+				if not used1[loc]:
+					col = "      "
+				elif valid1[loc]:
+					col = "%05o " % syl1[loc]
+				else:
+					col = "----- "
+				if not used0[loc]:
+					col += "     "
+				elif valid0[loc]:
+					col += "%05o" % syl0[loc]
+				else:
+					col += "-----"
+				cells.append(col)
+			cells.append("D")
+		return [tuple([row] + cells[2 * row:2 * row + 16]) for row in range(0, 256, 8)]
+
+	# Same as sectorRows(), but in the PTC transcription format, in which each
+	# word is a 12-digit octal number, with the data word (or the two syllables
+	# combined) in the upper 9 digits and validity bits for the syllables in
+	# the lower 3 digits.  Unused words are empty.
+	def sectorRowsPTC(self, module, sector):
+		index = (module * 16 + sector) * 256
+		cells = []
+		for i in range(index, index + 256):
+			v0 = self.valid[0][i]
+			v1 = self.valid[1][i]
+			if self.valid[2][i]:
+				cells.append("%012o" % ((self.values[2][i] << 9) | 3))
+			elif v0 or v1:
+				value = 0
+				if v1:
+					value |= self.values[1][i] << 12
+				if v0:
+					value |= self.values[0][i]
+				cells.append("%012o" % ((value << 9) | (v1 << 1) | v0))
+			else:
+				cells.append("")
+		return [tuple([row] + cells[row:row + 8]) for row in range(0, 256, 8)]
+
+#----------------------------------------------------------------------------
+#	Octal listings
+#----------------------------------------------------------------------------
+
+def _parseNumber(string, base, msg, module, sector, offset):
+	try:
+		return int(string, base)
+	except ValueError:
+		raise OctalListingError(msg, module, sector, offset)
+
+# Parse the text of an octal listing.  The PTC and yaASM.tsv formats differ in
+# the data lines, but not in comments or the SECTOR lines.  Unfortunately, the
+# PTC octal format cannot distinguish between data areas vs instruction areas
+# as the LVDC octal format can, so the PTC octals are stored as both.  (If both
+# syl0 and syl1 are valid, we can't tell if that's one data value or two
+# instructions; the checking logic in yaASM.py takes that into account.)
+def parseTsv(text, ptc = False):
+	image = OctalImage()
+	values0, values1, values2 = image.values
+	valid0, valid1, valid2 = image.valid
+	used0, used1 = image.used
+	module = -1
+	sector = -1
+	offset = -1
+	base = -1
+	for rawLine in text.split("\n"):
+		line = rawLine.strip()
+		if line[:1] == "#" or len(line) == 0:
+			continue
+		fields = line.split("\t")
+		if fields[0] == "SECTOR":
+			if len(fields) < 3:
+				raise OctalListingError("Wrong number of fields in SECTOR line", module, sector, offset)
+			module = _parseNumber(fields[1], 8, "Corrupted module number", module, sector, offset)
+			sector = _parseNumber(fields[2], 8, "Corrupted sector number", module, sector, offset)
+			if module > 7 or sector > 15 or module < 0 or sector < 0:
+				raise OctalListingError("Module or sector out of range", module, sector, offset)
+			base = (module * 16 + sector) * 256
+			continue
+		if base < 0:
+			raise OctalListingError("Data precedes first SECTOR line", module, sector, offset)
+		offset = _parseNumber(fields[0], 8, "Corrupted offset", module, sector, offset)
+		if ptc:
+			# Unlike the yaASM.tsv format, empty entries at the ends of 
+			# lines are still delimited by tabs, so they can't be stripped.
+			fields = rawLine.rstrip("\r\n ").split("\t")
+			if len(fields) != 9:
+				raise OctalListingError("Wrong number of fields (%d, must be 9)" % len(fields), module, sector, offset)
+			if offset + 8 > 256:
+				raise OctalListingError("Offset out of range", module, sector, offset)
+			for n in range(1, 9):
+				entry = fields[n].strip()
+				if entry != "":
+					if len(entry) != 12 or not entry.isdigit():
+						raise OctalListingError("Octal value is corrupted (%s)" % entry, module, sector, offset)
+					value = _parseNumber(entry, 8, "Octal value is corrupted (%s)" % entry, module, sector, offset)
+					valid = value & 0o777
+					value = value >> 9
+					if valid > 3:
+						raise OctalListingError("Validity bits incorrect", module, sector, offset)
+					i = base + offset
+					if valid == 3:
+						values2[i] = value
+						valid2[i] = 1
+					syl1 = (value >> 12) & 0o77774
+					syl0 = value & 0o37776
+					if (valid & 2) == 0:
+						if syl1 != 0:
+							raise OctalListingError("Syllable 2 should be 0", module, sector, offset)
+					else:
+						values1[i] = syl1
+						valid1[i] = 1
+						used1[i] = 1
+					if (valid & 1) == 0:
+						if syl0 != 0:
+							raise OctalListingError("Syllable 1 should be 0", module, sector, offset)
+					else:
+						values0[i] = syl0
+						valid0[i] = 1
+						used0[i] = 1
+				offset += 1
+		else:
+			if offset + (len(fields) - 1) // 2 > 256:
+				raise OctalListingError("Offset out of range", module, sector, offset)
+			ptr = 1
+			for count in range((len(fields) - 1) // 2):
+				word = fields[ptr]
+				flag = fields[ptr + 1]
+				i = base + offset
+				if len(word) != 11:
+					raise OctalListingError("Wrong field length", module, sector, offset)
+				elif word.isspace() and flag.strip() == "":
+					# An unused word.
+					pass
+				elif flag == "D" and word[0] == " " and word[-1] == " " and word[1:-2].isdigit():
+					# A data word.
+					values2[i] = _parseNumber(word.strip(), 8, "Corrupted data word", module, sector, offset)
+					valid2[i] = 1
+					used0[i] = 1
+					used1[i] = 1
+				elif flag == "D" and word[5] == " ":
+					# An instruction-pair word.  Each syllable is either
+					# blank (unused), dashes (used but unknown), or octal.
+					for syl,string,values,valid,used in [(1, word[:5], values1, valid1, used1),
+									(0, word[6:], values0, valid0, used0)]:
+						if string == "     ":
+							continue
+						used[i] = 1
+						if string == "-----":
+							continue
+						if not string.isdigit():
+							raise OctalListingError("Unrecognized format: " + line, module, sector, offset)
+						values[i] = _parseNumber(string, 8, "Corrupted syllable", module, sector, offset)
+						valid[i] = 1
+				else:
+					raise OctalListingError("Unrecognized format: " + line, module, sector, offset)
+				ptr += 2
+				offset += 1
+	return image
+
+def readTsv(filename, ptc = False):
+	f = open(filename, "r")
+	text = f.read()
+	f.close()
+	return parseTsv(text, ptc)
+
+# Format an image as an octal listing, with only the sectors actually used.
+def formatTsv(image, ptc = False):
+	lines = []
+	if ptc:
+		formatFileLine = "%o" + "\t%s" * 8
+	else:
+		formatFileLine = "%03o" + "\t%s\t%s" * 8
+	for module in range(8):
+		for sector in range(16):
+			if not image.sectorUsed(module, sector):
+				continue
+			if ptc:
+				lines.append("SECTOR\t%o\t%o" % (module, sector))
+				rows = image.sectorRowsPTC(module, sector)
+			else:
+				lines.append("SECTOR\t%o\t%02o" % (module, sector))
+				rows = image.sectorRows(module, sector)
+			for row in rows:
+				lines.append(formatFileLine % row)
+	lines.append("")
+	return "\n".join(lines)
+
+def writeTsv(image, filename, ptc = False):
+	f = open(filename, "w")
+	f.write(formatTsv(image, ptc))
+	f.close()
+
+#----------------------------------------------------------------------------
+#	Binary images
+#----------------------------------------------------------------------------
+# The binary format is the 8-byte magic string, followed by the used[] and
+# valid[] masks (one byte per word each), followed by the 3 values[] planes
+# as little-endian 32-bit integers.
+
+def writeBinary(image, filename):
+	f = open(filename, "wb")
+	f.write(BINARY_MAGIC)
+	for mask in image.used + image.valid:
+		f.write(mask)
+	for plane in image.values:
+		if sys.byteorder != "little":
+			plane = array("i", plane)
+			plane.byteswap()
+		f.write(plane.tobytes())
+	f.close()
+
+def readBinary(filename):
+	f = open(filename, "rb")
+	contents = f.read()
+	f.close()
+	if contents[:len(BINARY_MAGIC)] != BINARY_MAGIC or len(contents) != len(BINARY_MAGIC) + 5 * NUM_WORDS + 3 * 4 * NUM_WORDS:
+		raise OctalListingError("Not a binary octal image: " + filename)
+	image = OctalImage()
+	index = len(BINARY_MAGIC)
+	for mask in image.used + image.valid:
+		mask[:] = contents[index:index + NUM_WORDS]
+		index += NUM_WORDS
+	for plane in image.values:
+		plane[:] = array("i", contents[index:index + 4 * NUM_WORDS])
+		if sys.byteorder != "little":
+			plane.byteswap()
+		index += 4 * NUM_WORDS
+	return image
+
+def readImage(filename, ptc = False):
+	if filename[-4:].lower() == ".tsv":
+		return readTsv(filename, ptc)
+	return readBinary(filename)
+
+def writeImage(image, filename, ptc = False):
+	if filename[-4:].lower() == ".tsv":
+		writeTsv(image, filename, ptc)
+	else:
+		writeBinary(image, filename)
+
+if __name__ == "__main__":
+	ptc = False
+	filenames = []
+	for arg in sys.argv[1:]:
+		if arg == "--ptc":
+			ptc = True
+		elif arg == "--help" or arg[:2] == "--":
+			print("Usage:", file=sys.stderr)
+			print("\toctalImage.py [--ptc] INPUT OUTPUT", file=sys.stderr)
+			print("Converts between .tsv octal listings and binary images (any", file=sys.stderr)
+			print("other filename).  With --ptc, .tsv files are in the PTC", file=sys.stderr)
+			print("transcription format rather than the yaASM.tsv format.", file=sys.stderr)
+			sys.exit(arg != "--help")
+		else:
+			filenames.append(arg)
+	if len(filenames) != 2:
+		print("Exactly 2 filenames are required", file=sys.stderr)
+		sys.exit(1)
+	try:
+		image = readImage(filenames[0], ptc)
+	except OctalListingError as e:
+		print("Error (%o %02o %03o): %s" % (e.module, e.sector, e.offset, str(e)), file=sys.stderr)
+		sys.exit(1)
+	writeImage(image, filenames[1], ptc)
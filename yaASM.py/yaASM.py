@@ -37,6 +37,13 @@
 #				detecting locations which have been changed by
 #				self-modifying code, and hence whose original
 #				source lines are no longer applicable.
+#		2026-10-19	Added --profile, and caching of converted
+#				numeric literals.
+#		2026-10-19	Added --cache=DIR, for reusing the results of
+#				the preprocessor pass on unchanged input.
+#		2026-10-19	Added --analysis, which produces yaASM.analysis.
+#		2026-10-19	Moved parsing of the octal-comparison file and
+#				writing of yaASM.tsv into octalImage.py.
 #
 # Regardless of whether or not the assembly is successful, the following
 # additional files are produced at the end of the assembly process:
@@ -80,8 +87,12 @@
 # an LVDC simulator.
 
 import sys
+import os
+import hashlib
+import json
 # The next line imports expression.py.
 from expression import *
+import octalImage
 
 #----------------------------------------------------------------------------
 #	Definitions of global variables.
@@ -219,6 +230,9 @@ checkFilename = ""
 ptc = False
 pastBugs = False
 ignoreResiduals = False
+profiling = False
+cacheDirectory = ""
+analysis = False
 for arg in sys.argv[1:]:
 	if arg[:2] == "--":
 		if arg == "--ptc":
@@ -227,6 +241,12 @@ for arg in sys.argv[1:]:
 			pastBugs = True
 		elif arg == "--ignore-residuals":
 			ignoreResiduals = True
+		elif arg == "--profile":
+			profiling = True
+		elif arg == "--analysis":
+			analysis = True
+		elif arg[:8] == "--cache=":
+			cacheDirectory = arg[8:]
 		elif arg == "--help":
 			print("Usage:", file=sys.stderr)
 			print("\tyaASM.py [OPTIONS] [OCTALS.tsv] <INPUT.lvdc >OUTPUT.listing", file=sys.stderr)
@@ -235,108 +255,34 @@ for arg in sys.argv[1:]:
 			print("\t--ptc -- to use PTC source/octal input rather than the default LVDC.", file=sys.stderr)
 			print("\t--past-bugs -- only with --ptc, reproduces some original assembler bugs.", file=sys.stderr)
 			print("\t--ignore-residuals -- (debug) for --ptc octal checks, ignore residual flag.", file=sys.stderr)
+			print("\t--profile -- (debug) append call counts, timing, and cache statistics", file=sys.stderr)
+			print("\t             for the assembler's most-used functions to the listing.", file=sys.stderr)
+			print("\t--cache=DIR -- reuse (or save) the results of the preprocessor pass from", file=sys.stderr)
+			print("\t             (or to) directory DIR, which may be shared by several users.", file=sys.stderr)
+			print("\t--analysis -- also produce yaASM.analysis (see below).", file=sys.stderr)
 			print("Files produced by the assembly are:", file=sys.stderr)
 			print("\tyaASM.tsv\tAn octal-listing file.", file=sys.stderr)
 			print("\tyaASM.sym\tA symbol file.", file=sys.stderr)
 			print("\tyaASM.src\tA source file.", file=sys.stderr)
+			print("\tyaASM.analysis\tSector usage and timing estimates (--analysis only).", file=sys.stderr)
 			sys.exit(0)
 		else:
 			print("Unknown command-line option " + arg, file=sys.stderr)
 			sys.exit(1)
 	else:
+		# Note that the format of the data lines from the input file differs
+		# depending on whether the file is based on the PAST program listing
+		# (PTC) or the AS206-RAM Flight Program listing (LVDC).  The parsing
+		# is done by octalImage.py.
 		try:
 			checkFilename = arg
-			f = open(checkFilename, "r")
-			module = -1
-			sector = -1
-			offset = -1
-			for line in f:
-				line = line.strip()
-				if line[:1] == "#" or len(line) == 0:
-					continue
-				fields = line.split("\t")
-				if len(fields) == 0:
-					continue
-				if fields[0] == "SECTOR":
-					module = int(fields[1], 8)
-					sector = int(fields[2], 8)
-					if module > 7 or sector > 15:
-						raise("Warning: module or sector out of range (%o %02o)" % (module, sector))
-					continue
-				offset = int(fields[0], 8)
-				# Note that the format of the data lines from the input file differs
-				# depending on whether the file is based on the PAST program listing
-				# (PTC) or the AS206-RAM Flight Program listing (LVDC).
-				if ptc:
-					if len(fields) != 9:
-						raise("Warning: wrong number of fields (%d, must be 9)" % len(fields))
-					for n in range(1, 9):
-						entry = fields[n].strip()
-						if entry == "":
-							continue
-						if len(entry) != 12 or not entry.isdigit():
-							raise("Warning: octal value is corrupted (%s)" % entry)
-						value = int(entry, 8)
-						valid = value & 0o777
-						value = value >> 9
-						if valid > 3:
-							raise("Validity bits incorrect")
-						# Unfortunately, the PTC octal format cannot distinguish between
-						# data areas vs instruction areas as the LVDC octal format can,
-						# so we have to treat the octals as both.  While we can correctly
-						# deduce _some_ of that, we can't correctly deduce all of it, so
-						# we just have to rely on some fancier test logic farther down
-						# in the process.  (Specifically, if both syl0 and syl1 are valid,
-						# we can't tell if that's one data value or two instructions. I
-						# think all other cases are distinguishable.)
-						if valid != 3:
-							octalsForChecking[module][sector][2][offset] = None
-						else:
-							octalsForChecking[module][sector][2][offset] = value
-						syl1 = (value >> 12) & 0o77774
-						syl0 = value & 0o37776
-						if (valid & 2) == 0:
-							if syl1 != 0:
-								raise("Warning: syllable 2 should be 0 (%o %02o %03o)" % (module, sector, offset))
-							syl1 = None
-						if (valid & 1) == 0:
-							if syl0 != 0:
-								raise("Warning: syllable 1 should be 0 (%o %02o %03o)" % (module, sector, offset))
-							syl0 = None
-						octalsForChecking[module][sector][1][offset] = syl1
-						octalsForChecking[module][sector][0][offset] = syl0
-						offset += 1
-				else:
-					ptr = 1
-					for count in range((len(fields) - 1) // 2):
-						if len(fields[ptr]) != 11:
-							raise("Warning: wrong field length")
-						elif fields[ptr].strip() == "" and fields[ptr + 1].strip() == "":
-							# An unused word.
-							pass
-						elif fields[ptr + 1] == "D" and fields[ptr][0] == " " and fields[ptr][-1] == " " and fields[ptr][1:-2].isdigit():
-							# A data word.
-							value = int(fields[ptr].strip(), 8)
-							octalsForChecking[module][sector][2][offset] = value
-						elif fields[ptr + 1] == "D" and (fields[ptr][:5] == "     " or fields[ptr][:5].isdigit()) \
-							and fields[ptr][5] == " " and (fields[ptr][6:] == "     " or fields[ptr][6:].isdigit()):
-							# An instruction-pair word.
-							syl1 = fields[ptr][:5]
-							syl0 = fields[ptr][6:]
-							if syl1.strip() != "":
-								value = int(syl1, 8)
-								octalsForChecking[module][sector][1][offset] = value
-							if syl0.strip() != "":
-								value = int(syl0, 8)
-								octalsForChecking[module][sector][0][offset] = value
-						else:
-							raise("Warning: unrecognized format: " + line)	
-						ptr += 2
-						offset += 1
-			f.close()
+			octalsForChecking = octalImage.readTsv(checkFilename, ptc).toNested()
 			checkTheOctals = True
-		except:
+		except Exception as e:
 			countWarnings += 1
+			module = getattr(e, "module", -1)
+			sector = getattr(e, "sector", -1)
+			offset = getattr(e, "offset", -1)
 			print("Warning (%o %02o %03o): Cannot open octal-comparison file %s or file is corrupted" % (module, sector, offset, checkFilename))
 			checkFilename = ""
 #print(octalsForChecking)
@@ -501,7 +447,22 @@ def getRoof(imod, isec, syl, extra):
 #	if isOctal == True:
 #		octal digits
 # Returns a string of 9 octal digits, or else "" if error.
+# The same literals tend to recur many times in a program, so the successful
+# conversions are cached.  (Unsuccessful ones aren't, so that any diagnostic
+# output is the same as it would be without the cache.)
+literalCache = {}
+literalCacheStats = { "hits":0, "misses":0 }
 def convertNumericLiteral(n, isOctal = False):
+	key = (n, isOctal)
+	if key in literalCache:
+		literalCacheStats["hits"] += 1
+		return literalCache[key]
+	literalCacheStats["misses"] += 1
+	constantString = convertNumericLiteralUncached(n, isOctal)
+	if constantString != "":
+		literalCache[key] = constantString
+	return constantString
+def convertNumericLiteralUncached(n, isOctal = False):
 	if isOctal or n[:1] == "O":
 		if isOctal:
 			constantString = n[0:]
@@ -562,15 +523,19 @@ def convertNumericLiteral(n, isOctal = False):
 # variables are supposed to go into have already been allocated.  Fortunately,
 # there's no code here that needs to be backed out.
 allocationRecords = []	# For debugging ordering of named and nameless allocationis.
+namelessStats = { "hits":0, "misses":0 }	# For --profile.
 def allocateNameless(lineNumber, constantString, useResidual = True):
 	global nameless, allocationRecords
 	value = "%o_%02o_%s" % (DM, DS, constantString)
 	if value in nameless:
+		namelessStats["hits"] += 1
 		return nameless[value],0
 	if useResidual and DS != 0o17:
 		valueR = "%o_17_%s" % (DM, constantString)
 		if valueR in nameless:
+			namelessStats["hits"] += 1
 			return nameless[valueR],1
+	namelessStats["misses"] += 1
 	start = 0
 	for loc in range(start, 256):
 		if not used[DM][DS][0][loc] and not used[DM][DS][1][loc]:
@@ -806,6 +771,42 @@ def formConstantHOP(hop):
 	hopConstant |= (hop["IM"] & 6) >> 1
 	return hopConstant << 1
 
+# For --profile.  Each of the functions in the list below is replaced by a 
+# wrapper that counts its calls and accumulates the time spent in it, both 
+# overall and broken down by the pass (preprocessor, discovery, assembly) and
+# the operator or pseudo-op of the source line being processed at the time.
+# The loops of the various passes keep profilePass and profileConstruct up to
+# date, regardless of whether --profile was used or not, since that's cheaper
+# than testing for it.  The report is printed at the very end of the listing.
+profilePass = ""
+profileConstruct = ""
+profileStats = {}
+def profileWrapper(name, function):
+	stats = { "calls":0, "time":0.0, "constructs":{} }
+	profileStats[name] = stats
+	def wrapper(*args, **kwargs):
+		start = time.perf_counter()
+		try:
+			return function(*args, **kwargs)
+		finally:
+			elapsed = time.perf_counter() - start
+			stats["calls"] += 1
+			stats["time"] += elapsed
+			key = (profilePass, profileConstruct)
+			if key not in stats["constructs"]:
+				stats["constructs"][key] = [0, 0.0]
+			stats["constructs"][key][0] += 1
+			stats["constructs"][key][1] += elapsed
+	return wrapper
+if profiling:
+	import time
+	profileStartTime = time.perf_counter()
+	convertNumericLiteral = profileWrapper("convertNumericLiteral", convertNumericLiteral)
+	yaEvaluate = profileWrapper("yaEvaluate", yaEvaluate)
+	allocateNameless = profileWrapper("allocateNameless", allocateNameless)
+	checkLOC = profileWrapper("checkLOC", checkLOC)
+	storeAssembled = profileWrapper("storeAssembled", storeAssembled)
+
 #----------------------------------------------------------------------------
 #	Preprocessor pass
 #----------------------------------------------------------------------------
@@ -826,7 +827,47 @@ def formConstantHOP(hop):
 # expands to line1, line2, and line3.  Then expandedLines[n] will be [line1,line2,line3].
 # The errors[] array is also in a similar 1-to-1 relationship, and errors[n] contains 
 # an array (hopefully usually empty) of error/warning messages for lines[n].
-for n in range(0, len(lines)):
+#
+# With --cache=DIR, the results of this pass (which depend only on the source
+# text, on --ptc, and on the assembler's own code) are saved in DIR in a file 
+# named by a hash of all those things.  If such a file already exists, its 
+# contents are used instead, and the loop below is simply skipped.  The file 
+# is written under a temporary name and then renamed, so it's safe for several
+# assemblies to share the same cache directory simultaneously.
+preprocessorRange = range(0, len(lines))
+preprocessorCounts = [countInfos, countWarnings, countErrors, countMismatches, countOthers]
+cacheFilename = ""
+cacheHit = False
+if cacheDirectory != "":
+	hasher = hashlib.sha256()
+	for filename in ["yaASM.py", "expression.py"]:
+		f = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), filename), "rb")
+		hasher.update(f.read())
+		f.close()
+	hasher.update(("ptc=%d\n" % ptc).encode("utf-8"))
+	hasher.update("\n".join(lines).encode("utf-8"))
+	cacheFilename = os.path.join(cacheDirectory, hasher.hexdigest() + ".json")
+	try:
+		f = open(cacheFilename, "r")
+		cached = json.load(f)
+		f.close()
+		expandedLines = cached["expandedLines"]
+		errors = cached["errors"]
+		constants = cached["constants"]
+		macros = cached["macros"]
+		inMacro = cached["inMacro"]
+		inFalseIf = cached["inFalseIf"]
+		countInfos += cached["counts"][0]
+		countWarnings += cached["counts"][1]
+		countErrors += cached["counts"][2]
+		countMismatches += cached["counts"][3]
+		countOthers += cached["counts"][4]
+		preprocessorRange = []
+		cacheHit = True
+	except:
+		pass
+profilePass = "preprocessor"
+for n in preprocessorRange:
 	line = lines[n]
 	errors.append([])
 	expandedLines.append([line])
@@ -841,6 +882,9 @@ for n in range(0, len(lines)):
 	if len(fields) > 0 and fields[0] == "@":
 		fields[0] = ""
 		line = line[1:]
+	profileConstruct = ""
+	if len(fields) >= 2:
+		profileConstruct = fields[1]
 
 	# Most expansions of (EXPRESSION) are handled later, and I don't want to
 	# override that here, but there is one case that the later code can't
@@ -1022,6 +1066,22 @@ for n in range(0, len(lines)):
 		if constant["number"] != value["number"] or ("scale" in value and constant["scale"] != value["scale"]):
 			inFalseIf = True
 
+if cacheFilename != "" and not cacheHit:
+	counts = [countInfos, countWarnings, countErrors, countMismatches, countOthers]
+	for i in range(len(counts)):
+		counts[i] -= preprocessorCounts[i]
+	tempFilename = "%s.%d.tmp" % (cacheFilename, os.getpid())
+	try:
+		os.makedirs(cacheDirectory, exist_ok=True)
+		f = open(tempFilename, "w")
+		json.dump({ "expandedLines": expandedLines, "errors": errors, 
+			"constants": constants, "macros": macros, "inMacro": inMacro,
+			"inFalseIf": inFalseIf, "counts": counts }, f)
+		f.close()
+		os.replace(tempFilename, cacheFilename)
+	except:
+		print("Warning: Cannot write preprocessor cache " + cacheFilename, file=sys.stderr)
+
 if False:
 	# Just print out some results from the preprocessor and then exit.
 	print("Constants:")		
@@ -1064,6 +1124,7 @@ useDat = False
 udDM = 0
 udDS = 0
 tempSymbols = []
+profilePass = "discovery"
 for lineNumber in range(0, len(expandedLines)):
 	for line in expandedLines[lineNumber]:
 		if ptc:
@@ -1085,6 +1146,9 @@ for lineNumber in range(0, len(expandedLines)):
 		# Remove comments.
 		if inputLine["raw"][:1] in ["*", "#"]:
 			fields = []
+		profileConstruct = ""
+		if len(fields) >= 2:
+			profileConstruct = fields[1]
 		
 		if len(fields) >= 2 and fields[1] == "VEC":
 			while DLOC < 256:
@@ -1520,10 +1584,28 @@ def residualBit(dm, ds):
 			return 1 
 	return 0
 
+# For --analysis.  Keeps track of instructions the assembler inserts on its
+# own, namely TRAs or HOPs at automatic sector rollovers, TRAs converted to 
+# HOPs because the target is in a different sector, and HOPs placed at the
+# tops of sectors for TMI/TNZ targets outside the sector.  The counts are
+# kept per instruction sector (the sector the inserted instruction occupies,
+# or for TRA->HOP, the sector of the converted TRA), and the kinds are also
+# attached to the inputLine[] responsible, for attributing them to routines.
+autoHops = {}
+def recordAutoHop(inputLine, kind, module, sector):
+	key = (module, sector)
+	if key not in autoHops:
+		autoHops[key] = { "rollover":0, "TRA->HOP":0, "roof":0 }
+	autoHops[key][kind] += 1
+	if "autoHops" not in inputLine:
+		inputLine["autoHops"] = []
+	inputLine["autoHops"].append(kind)
+
 useDat = False
 errorsPrinted = []
 lastLineNumber = -1
 expansionMarker = " "
+profilePass = "assembly"
 for entry in inputFile:
 	#print(entry)
 	lineNumber = entry["lineNumber"]
@@ -1557,6 +1639,8 @@ for entry in inputFile:
 	if "switchSectorAt" in inputLine:
 		switch = inputLine["switchSectorAt"]
 		countRollovers += 1
+		profileConstruct = "(rollover)"
+		recordAutoHop(inputLine, "rollover", switch[0], switch[1])
 		im0 = switch[0]
 		is0 = switch[1]
 		s0 = switch[2]
@@ -1609,6 +1693,7 @@ for entry in inputFile:
 	operator = ""
 	if "operator" in inputLine:
 		operator = inputLine["operator"]
+	profileConstruct = operator
 	operand = ""
 	operandModifierOperation = ""
 	operandModifier = 0
@@ -1940,6 +2025,7 @@ for entry in inputFile:
 				# The target location exists, but is not in this IM/IS/DM/DS.
 				# We must therefore substitute a HOP instruction instead,
 				# and allocate a HOP constant nameless variable.
+				recordAutoHop(inputLine, "TRA->HOP", IM, IS)
 				hopConstant = formConstantHOP(symbols[operand])
 				constantString = "%09o" % hopConstant
 				#print("C1: allocateNameless " + constantString + " " + operand)
@@ -1975,6 +2061,7 @@ for entry in inputFile:
 				# is alway skipped), 0o373, etc.
 				star = True
 				residual = 1
+				inputLine["viaRoof"] = True
 				hopConstant2 = formConstantHOP(symbols[operand])
 				constantString = "%09o" % hopConstant2
 				if operand in roofed[IM][IS]:
@@ -1992,6 +2079,7 @@ for entry in inputFile:
 					if loc <= 0o375:
 						loc -= 1
 					roofed[IM][IS].append(operand)
+					recordAutoHop(inputLine, "roof", IM, IS)
 					loc2,residual2 = allocateNameless(lineNumber, constantString, False)
 					ds = DS
 					if residual2 != 0:
@@ -2316,29 +2404,17 @@ f.close()
 #----------------------------------------------------------------------------
 #   	Print octal listing and save as a .tsv file too
 #----------------------------------------------------------------------------
-f = open("yaASM.tsv", "w")
 formatLine = "%03o"
 for n in range(8):
 	formatLine += "   %s %1s"
-formatFileLine = "%03o"
-for n in range(8):
-	formatFileLine += "\t%s\t%s"
 heading = "     "
 for n in range(8):
 	heading += "      %o         " % n
+image = octalImage.OctalImage.fromNested(octals, used)
 for module in range(8):
 	for sector in range(16):
-		sectorUsed = False
-		for syllable in range(2):
-			if sectorUsed:
-				break
-			for loc in range(256):
-				if used[module][sector][syllable][loc]:
-					sectorUsed = True
-					break
-		if not sectorUsed:
+		if not image.sectorUsed(module, sector):
 			continue
-		print("SECTOR\t%o\t%02o" % (module, sector), file=f)
 		print("")
 		print("")
 		print("%56sMODULE %o      SECTOR %02o" % ("", module, sector))
@@ -2346,37 +2422,9 @@ for module in range(8):
 		print("")
 		print(heading)
 		print("")
-		for row in range(0, 256, 8):
-			rowList = [row]
-			for loc in range(row, row + 8):
-				if not (used[module][sector][0][loc] or used[module][sector][1][loc]):
-					rowList.append("           ")
-					rowList.append(" ")
-				elif octals[module][sector][2][loc] != None:
-					rowList.append(" %09o " % octals[module][sector][2][loc])
-					rowList.append("D")
-				else:
-					col = ""
-					usedEntry = False
-					for syl in [1, 0]:
-						if syl == 0:
-							col += " "
-						if not used[module][sector][syl][loc]:
-							col += "     "
-						elif octals[module][sector][syl][loc] == None:
-							col += "-----"
-							usedEntry = True
-						else:
-							col += "%05o" % octals[module][sector][syl][loc]
-							usedEntry = True
-					rowList.append(col)
-					if usedEntry:
-						rowList.append("D")
-					else:
-						rowList.append(" ")
-			print(formatLine % tuple(rowList))
-			print(formatFileLine % tuple(rowList), file=f)
-f.close()
+		for rowList in image.sectorRows(module, sector):
+			print(formatLine % rowList)
+octalImage.writeTsv(image, "yaASM.tsv")
 
 # Prints out some debugging stuff about the order in which symbols are allocated.
 # It may be useful for figuring out where the assembly process stuff starts 
@@ -2394,4 +2442,167 @@ if False:
 		LOC = record["LOC"]
 		raw = inputLine["raw"]
 		print("PAGE=%-3d LINE=%-5d SYMBOL=%-15s DM=%o DS=%02o LOC=%03o:  %s" % (page, lineNumber, symbol, DM, DS, LOC, raw))
-	
\ No newline at end of file
+	
+#----------------------------------------------------------------------------
+#   	Static analysis report (--analysis), saved as yaASM.analysis
+#----------------------------------------------------------------------------
+# Instruction timings, in computer cycles (of about 82 microseconds each),
+# are those used by the yaLVDC emulator (see runOneInstruction.c):  every
+# instruction takes 1 cycle, except for MPH (LVDC only), which takes 5 since
+# it waits for the product, and EXM, which takes 1 cycle plus the time of the
+# instruction it executes.  Since the latter can't be known statically, it's
+# taken to be 1 cycle.  (MPY and DIV also take 1 cycle, though their results
+# don't appear until 4 and 8 cycles later, respectively.)  
+#
+# A "routine" is just the sequence of instructions from one label in 
+# instruction memory to the next, and its cycle count is for executing each 
+# of its instructions (plus any TRA/HOP inserted at sector rollovers) once, 
+# straight through.  Separately reported is the number of TMI/TNZ in the
+# routine which must go through a HOP at the top of the sector, and 
+# therefore take 1 extra cycle when the branch is taken.
+secondsPerCycle = 168.0 / 2048000
+cyclesPerInstruction = { "EXM": 2 }
+if not ptc:
+	cyclesPerInstruction["MPH"] = 5
+if analysis:
+	f = open("yaASM.analysis", "w")
+	
+	print("Sector usage:", file=f)
+	print("", file=f)
+	print("\tMOD SEC  SYL1  SYL0  DATA  FREE  FILL  AUTO-ROLLOVER  AUTO-TRA->HOP  AUTO-ROOF", file=f)
+	for module in range(8):
+		for sector in range(16):
+			countSyl = [0, 0]
+			countData = 0
+			countFree = 0
+			for loc in range(256):
+				for syl in range(2):
+					if used[module][sector][syl][loc]:
+						countSyl[syl] += 1
+				if not (used[module][sector][0][loc] or used[module][sector][1][loc]):
+					countFree += 1
+				elif octals[module][sector][2][loc] != None:
+					countData += 1
+			if countFree == 256:
+				continue
+			fill = 100.0 * (countSyl[0] + countSyl[1]) / 512
+			flag = ""
+			if fill >= 95.0:
+				flag = " (nearly full)"
+			hops = { "rollover":0, "TRA->HOP":0, "roof":0 }
+			if (module, sector) in autoHops:
+				hops = autoHops[(module, sector)]
+			print("\t%3o %3o  %4d  %4d  %4d  %4d  %3.0f%%  %13d  %13d  %9d%s" % (module, sector, 
+				countSyl[1], countSyl[0], countData, countFree, fill, hops["rollover"], 
+				hops["TRA->HOP"], hops["roof"], flag), file=f)
+	
+	print("", file=f)
+	print("Residual-sector pressure:", file=f)
+	print("", file=f)
+	print("\tMOD  WORDS USED  FREE  NAMELESS  SPILLED-FROM-OTHER-SECTORS  NAMED-VARIABLES", file=f)
+	for module in range(8):
+		countUsed = 0
+		for loc in range(256):
+			if used[module][0o17][0][loc] or used[module][0o17][1][loc]:
+				countUsed += 1
+		countNameless = 0
+		for key in nameless:
+			if key[:5] == "%o_17_" % module:
+				countNameless += 1
+		countSpilled = 0
+		for record in allocationRecords:
+			if record["symbol"][:5] == "%o_17_" % module and record["DS"] != 0o17:
+				countSpilled += 1
+		countNamed = 0
+		for key in symbols:
+			hop = symbols[key]
+			if "inDataMemory" in hop and hop["inDataMemory"] and hop["DM"] == module and hop["DS"] == 0o17:
+				countNamed += 1
+		if countUsed == 0 and countNamed == 0:
+			continue
+		print("\t%3o  %10d  %4d  %8d  %26d  %15d" % (module, countUsed, 256 - countUsed, 
+			countNameless, countSpilled, countNamed), file=f)
+	
+	routines = []
+	routine = None
+	for entry in inputFile:
+		inputLine = entry["expandedLine"]
+		if inputLine["inDataMemory"] or "operator" not in inputLine or inputLine["operator"] not in operators:
+			continue
+		if "lhs" in inputLine or routine == None:
+			routine = { "name": "(unlabeled)", "lineNumber": entry["lineNumber"], 
+				"instructions": 0, "cycles": 0, "inserted": 0, "roofBranches": 0 }
+			if "lhs" in inputLine:
+				routine["name"] = inputLine["lhs"]
+			if "hop" in inputLine:
+				routine["hop"] = inputLine["hop"]
+			routines.append(routine)
+		operator = inputLine["operator"]
+		routine["instructions"] += 1
+		if operator in cyclesPerInstruction:
+			routine["cycles"] += cyclesPerInstruction[operator]
+		else:
+			routine["cycles"] += 1
+		if "autoHops" in inputLine:
+			for kind in inputLine["autoHops"]:
+				if kind == "rollover":
+					routine["inserted"] += 1
+					routine["cycles"] += 1
+		if "viaRoof" in inputLine:
+			routine["roofBranches"] += 1
+	print("", file=f)
+	print("Estimated timing of routines (straight-line, %.1f us per cycle), slowest first:" % (1000000 * secondsPerCycle), file=f)
+	print("", file=f)
+	print("\t%-8s  %-11s  %5s  %6s  %6s  %8s  %8s  %s" % ("ROUTINE", "IM IS S LOC", 
+		"LINE", "INSTR", "CYCLES", "USEC", "INSERTED", "ROOF-BRANCHES"), file=f)
+	routines.sort(key=lambda r: (-r["cycles"], r["lineNumber"]))
+	for routine in routines:
+		where = ""
+		if "hop" in routine:
+			hop = routine["hop"]
+			where = "%o %02o %o %03o" % (hop["IM"], hop["IS"], hop["S"], hop["LOC"])
+		print("\t%-8s  %-11s  %5d  %6d  %6d  %8.0f  %8d  %d" % (routine["name"], where,
+			routine["lineNumber"] + 1, routine["instructions"], routine["cycles"],
+			1000000 * secondsPerCycle * routine["cycles"], routine["inserted"],
+			routine["roofBranches"]), file=f)
+	f.close()
+
+# Report for --profile.
+if profiling:
+	profileTotal = time.perf_counter() - profileStartTime
+	print("\f")
+	print("Profile (total elapsed %.3f seconds after setup):" % profileTotal)
+	print("")
+	print("\t%-22s %8s %10s %10s" % ("Function", "Calls", "Total ms", "Mean us"))
+	for name in profileStats:
+		stats = profileStats[name]
+		mean = 0
+		if stats["calls"] > 0:
+			mean = 1000000.0 * stats["time"] / stats["calls"]
+		print("\t%-22s %8d %10.1f %10.1f" % (name, stats["calls"], 
+			1000.0 * stats["time"], mean))
+	print("")
+	print("Cache statistics:")
+	print("")
+	for name,stats in [("convertNumericLiteral", literalCacheStats), 
+			("yaEvaluate tokens", tokenCacheStats),
+			("allocateNameless", namelessStats)]:
+		lookups = stats["hits"] + stats["misses"]
+		rate = 0
+		if lookups > 0:
+			rate = 100.0 * stats["hits"] / lookups
+		print("\t%-22s %8d lookups %8d hits %6.1f%%" % (name, lookups, 
+			stats["hits"], rate))
+	print("")
+	print("Most expensive constructs (by total time in the functions above):")
+	print("")
+	print("\t%-22s %-13s %-8s %8s %10s" % ("Function", "Pass", "Construct", "Calls", "Total ms"))
+	rows = []
+	for name in profileStats:
+		constructs = profileStats[name]["constructs"]
+		for key in constructs:
+			rows.append((constructs[key][1], constructs[key][0], name, key[0], key[1]))
+	rows.sort(reverse=True)
+	for row in rows[:25]:
+		print("\t%-22s %-13s %-8s %8d %10.1f" % (row[2], row[3], row[4], row[1], 
+			1000.0 * row[0]))
@@ -1,6 +1,8 @@
 #! /usr/bin/env python
 #  -*- coding: utf-8 -*-
 #
+# The lamp canvases have been removed by ptcPanelLayout.py --strip.
+#
 # GUI module generated by PAGE version 5.2
 #  in conjunction with Tcl version 8.6
 #    May 21, 2020 03:39:12 PM CDT  platform: Linux
@@ -103,438 +105,6 @@ class topProcessorDisplayPanel:
     self.Label9.configure(font="-family {DejaVu Sans} -size 12")
     self.Label9.configure(text='''PROCESSOR DISPLAY PANEL''')
 
-    self.pdpDM1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDM1.place(relx=0.709, rely=0.892, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDM1.configure(background="black")
-    self.pdpDM1.configure(borderwidth="2")
-    self.pdpDM1.configure(relief="ridge")
-    self.pdpDM1.configure(selectbackground="#c4c4c4")
-    self.pdpDM1.configure(takefocus="0")
-
-    self.pdpDM0 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDM0.place(relx=0.709, rely=0.809, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDM0.configure(background="black")
-    self.pdpDM0.configure(borderwidth="2")
-    self.pdpDM0.configure(relief="ridge")
-    self.pdpDM0.configure(selectbackground="#c4c4c4")
-    self.pdpDM0.configure(takefocus="0")
-
-    self.pdpIM1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIM1.place(relx=0.709, rely=0.726, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIM1.configure(background="black")
-    self.pdpIM1.configure(borderwidth="2")
-    self.pdpIM1.configure(relief="ridge")
-    self.pdpIM1.configure(selectbackground="#c4c4c4")
-    self.pdpIM1.configure(takefocus="0")
-
-    self.pdpIM0 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIM0.place(relx=0.709, rely=0.643, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIM0.configure(background="black")
-    self.pdpIM0.configure(borderwidth="2")
-    self.pdpIM0.configure(relief="ridge")
-    self.pdpIM0.configure(selectbackground="#c4c4c4")
-    self.pdpIM0.configure(takefocus="0")
-
-    self.pdpA2 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA2.place(relx=0.526, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA2.configure(background="black")
-    self.pdpA2.configure(borderwidth="2")
-    self.pdpA2.configure(relief="ridge")
-    self.pdpA2.configure(selectbackground="#c4c4c4")
-    self.pdpA2.configure(takefocus="0")
-
-    self.pdpA9 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA9.place(relx=0.046, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA9.configure(background="black")
-    self.pdpA9.configure(borderwidth="2")
-    self.pdpA9.configure(relief="ridge")
-    self.pdpA9.configure(selectbackground="#c4c4c4")
-    self.pdpA9.configure(takefocus="0")
-
-    self.pdpA8 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA8.place(relx=0.114, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA8.configure(background="black")
-    self.pdpA8.configure(borderwidth="2")
-    self.pdpA8.configure(relief="ridge")
-    self.pdpA8.configure(selectbackground="#c4c4c4")
-    self.pdpA8.configure(takefocus="0")
-
-    self.pdpA7 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA7.place(relx=0.183, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA7.configure(background="black")
-    self.pdpA7.configure(borderwidth="2")
-    self.pdpA7.configure(relief="ridge")
-    self.pdpA7.configure(selectbackground="#c4c4c4")
-    self.pdpA7.configure(takefocus="0")
-
-    self.pdpA6 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA6.place(relx=0.252, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA6.configure(background="black")
-    self.pdpA6.configure(borderwidth="2")
-    self.pdpA6.configure(relief="ridge")
-    self.pdpA6.configure(selectbackground="#c4c4c4")
-    self.pdpA6.configure(takefocus="0")
-
-    self.pdpA5 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA5.place(relx=0.32, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA5.configure(background="black")
-    self.pdpA5.configure(borderwidth="2")
-    self.pdpA5.configure(relief="ridge")
-    self.pdpA5.configure(selectbackground="#c4c4c4")
-    self.pdpA5.configure(takefocus="0")
-
-    self.pdpA4 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA4.place(relx=0.389, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA4.configure(background="black")
-    self.pdpA4.configure(borderwidth="2")
-    self.pdpA4.configure(relief="ridge")
-    self.pdpA4.configure(selectbackground="#c4c4c4")
-    self.pdpA4.configure(takefocus="0")
-
-    self.pdpA3 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA3.place(relx=0.458, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA3.configure(background="black")
-    self.pdpA3.configure(borderwidth="2")
-    self.pdpA3.configure(relief="ridge")
-    self.pdpA3.configure(selectbackground="#c4c4c4")
-    self.pdpA3.configure(takefocus="0")
-
-    self.pdpA1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpA1.place(relx=0.595, rely=0.581, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpA1.configure(background="black")
-    self.pdpA1.configure(borderwidth="2")
-    self.pdpA1.configure(relief="ridge")
-    self.pdpA1.configure(selectbackground="#c4c4c4")
-    self.pdpA1.configure(takefocus="0")
-
-    self.pdp13 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp13.place(relx=0.87, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp13.configure(background="black")
-    self.pdp13.configure(borderwidth="2")
-    self.pdp13.configure(relief="ridge")
-    self.pdp13.configure(selectbackground="#c4c4c4")
-    self.pdp13.configure(takefocus="0")
-
-    self.pdpOP1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpOP1.place(relx=0.87, rely=0.29, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpOP1.configure(background="black")
-    self.pdpOP1.configure(borderwidth="2")
-    self.pdpOP1.configure(relief="ridge")
-    self.pdpOP1.configure(selectbackground="#c4c4c4")
-    self.pdpOP1.configure(takefocus="0")
-
-    self.pdp12 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp12.place(relx=0.801, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp12.configure(background="black")
-    self.pdp12.configure(borderwidth="2")
-    self.pdp12.configure(relief="ridge")
-    self.pdp12.configure(selectbackground="#c4c4c4")
-    self.pdp12.configure(takefocus="0")
-
-    self.pdp11 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp11.place(relx=0.732, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp11.configure(background="black")
-    self.pdp11.configure(borderwidth="2")
-    self.pdp11.configure(relief="ridge")
-    self.pdp11.configure(selectbackground="#c4c4c4")
-    self.pdp11.configure(takefocus="0")
-
-    self.pdp10 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp10.place(relx=0.664, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp10.configure(background="black")
-    self.pdp10.configure(borderwidth="2")
-    self.pdp10.configure(relief="ridge")
-    self.pdp10.configure(selectbackground="#c4c4c4")
-    self.pdp10.configure(takefocus="0")
-
-    self.pdp9 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp9.place(relx=0.595, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp9.configure(background="black")
-    self.pdp9.configure(borderwidth="2")
-    self.pdp9.configure(relief="ridge")
-    self.pdp9.configure(selectbackground="#c4c4c4")
-    self.pdp9.configure(takefocus="0")
-
-    self.pdp8 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp8.place(relx=0.526, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp8.configure(background="black")
-    self.pdp8.configure(borderwidth="2")
-    self.pdp8.configure(relief="ridge")
-    self.pdp8.configure(selectbackground="#c4c4c4")
-    self.pdp8.configure(takefocus="0")
-
-    self.pdp7 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp7.place(relx=0.458, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp7.configure(background="black")
-    self.pdp7.configure(borderwidth="2")
-    self.pdp7.configure(relief="ridge")
-    self.pdp7.configure(selectbackground="#c4c4c4")
-    self.pdp7.configure(takefocus="0")
-
-    self.pdp6 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp6.place(relx=0.389, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp6.configure(background="black")
-    self.pdp6.configure(borderwidth="2")
-    self.pdp6.configure(relief="ridge")
-    self.pdp6.configure(selectbackground="#c4c4c4")
-    self.pdp6.configure(takefocus="0")
-
-    self.pdp5 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp5.place(relx=0.32, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp5.configure(background="black")
-    self.pdp5.configure(borderwidth="2")
-    self.pdp5.configure(relief="ridge")
-    self.pdp5.configure(selectbackground="#c4c4c4")
-    self.pdp5.configure(takefocus="0")
-
-    self.pdp4 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp4.place(relx=0.252, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp4.configure(background="black")
-    self.pdp4.configure(borderwidth="2")
-    self.pdp4.configure(relief="ridge")
-    self.pdp4.configure(selectbackground="#c4c4c4")
-    self.pdp4.configure(takefocus="0")
-
-    self.pdp3 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp3.place(relx=0.183, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp3.configure(background="black")
-    self.pdp3.configure(borderwidth="2")
-    self.pdp3.configure(relief="ridge")
-    self.pdp3.configure(selectbackground="#c4c4c4")
-    self.pdp3.configure(takefocus="0")
-
-    self.pdp2 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp2.place(relx=0.114, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp2.configure(background="black")
-    self.pdp2.configure(borderwidth="2")
-    self.pdp2.configure(relief="ridge")
-    self.pdp2.configure(selectbackground="#c4c4c4")
-    self.pdp2.configure(takefocus="0")
-
-    self.pdp1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdp1.place(relx=0.046, rely=0.062, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdp1.configure(background="black")
-    self.pdp1.configure(borderwidth="2")
-    self.pdp1.configure(relief="ridge")
-    self.pdp1.configure(selectbackground="#c4c4c4")
-    self.pdp1.configure(takefocus="0")
-
-    self.pdpHOPSAVE_REG = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpHOPSAVE_REG.place(relx=0.847, rely=0.602, relheight=0.17
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpHOPSAVE_REG.configure(background="black")
-    self.pdpHOPSAVE_REG.configure(borderwidth="2")
-    self.pdpHOPSAVE_REG.configure(relief="ridge")
-    self.pdpHOPSAVE_REG.configure(selectbackground="#c4c4c4")
-    self.pdpHOPSAVE_REG.configure(takefocus="0")
-
-    self.pdpMEM_ADD_REG = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpMEM_ADD_REG.place(relx=0.847, rely=0.436, relheight=0.17
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpMEM_ADD_REG.configure(background="black")
-    self.pdpMEM_ADD_REG.configure(borderwidth="2")
-    self.pdpMEM_ADD_REG.configure(relief="ridge")
-    self.pdpMEM_ADD_REG.configure(selectbackground="#c4c4c4")
-    self.pdpMEM_ADD_REG.configure(takefocus="0")
-
-    self.pdpSYL0 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpSYL0.place(relx=0.046, rely=0.747, relheight=0.17, relwidth=0.092
-        , bordermode='ignore')
-    self.pdpSYL0.configure(background="black")
-    self.pdpSYL0.configure(borderwidth="2")
-    self.pdpSYL0.configure(relief="ridge")
-    self.pdpSYL0.configure(selectbackground="#c4c4c4")
-    self.pdpSYL0.configure(takefocus="0")
-
-    self.pdpSYL1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpSYL1.place(relx=0.137, rely=0.747, relheight=0.17, relwidth=0.092
-        , bordermode='ignore')
-    self.pdpSYL1.configure(background="black")
-    self.pdpSYL1.configure(borderwidth="2")
-    self.pdpSYL1.configure(relief="ridge")
-    self.pdpSYL1.configure(selectbackground="#c4c4c4")
-    self.pdpSYL1.configure(takefocus="0")
-
-    self.pdpDS4 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDS4.place(relx=0.263, rely=0.83, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDS4.configure(background="black")
-    self.pdpDS4.configure(borderwidth="2")
-    self.pdpDS4.configure(relief="ridge")
-    self.pdpDS4.configure(selectbackground="#c4c4c4")
-    self.pdpDS4.configure(takefocus="0")
-
-    self.pdpIS4 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIS4.place(relx=0.263, rely=0.747, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIS4.configure(background="black")
-    self.pdpIS4.configure(borderwidth="2")
-    self.pdpIS4.configure(relief="ridge")
-    self.pdpIS4.configure(selectbackground="#c4c4c4")
-    self.pdpIS4.configure(takefocus="0")
-
-    self.pdpDS1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDS1.place(relx=0.572, rely=0.83, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDS1.configure(background="black")
-    self.pdpDS1.configure(borderwidth="2")
-    self.pdpDS1.configure(relief="ridge")
-    self.pdpDS1.configure(selectbackground="#c4c4c4")
-    self.pdpDS1.configure(takefocus="0")
-
-    self.pdpDS2 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDS2.place(relx=0.481, rely=0.83, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDS2.configure(background="black")
-    self.pdpDS2.configure(borderwidth="2")
-    self.pdpDS2.configure(relief="ridge")
-    self.pdpDS2.configure(selectbackground="#c4c4c4")
-    self.pdpDS2.configure(takefocus="0")
-
-    self.pdpDS3 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpDS3.place(relx=0.389, rely=0.83, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpDS3.configure(background="black")
-    self.pdpDS3.configure(borderwidth="2")
-    self.pdpDS3.configure(relief="ridge")
-    self.pdpDS3.configure(selectbackground="#c4c4c4")
-    self.pdpDS3.configure(takefocus="0")
-
-    self.pdpIS3 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIS3.place(relx=0.389, rely=0.747, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIS3.configure(background="black")
-    self.pdpIS3.configure(borderwidth="2")
-    self.pdpIS3.configure(relief="ridge")
-    self.pdpIS3.configure(selectbackground="#c4c4c4")
-    self.pdpIS3.configure(takefocus="0")
-
-    self.pdpIS2 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIS2.place(relx=0.481, rely=0.747, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIS2.configure(background="black")
-    self.pdpIS2.configure(borderwidth="2")
-    self.pdpIS2.configure(relief="ridge")
-    self.pdpIS2.configure(selectbackground="#c4c4c4")
-    self.pdpIS2.configure(takefocus="0")
-
-    self.pdpIS1 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpIS1.place(relx=0.572, rely=0.747, relheight=0.087, relwidth=0.094
-        , bordermode='ignore')
-    self.pdpIS1.configure(background="black")
-    self.pdpIS1.configure(borderwidth="2")
-    self.pdpIS1.configure(relief="ridge")
-    self.pdpIS1.configure(selectbackground="#c4c4c4")
-    self.pdpIS1.configure(takefocus="0")
-
-    self.pdpOP2 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpOP2.place(relx=0.801, rely=0.29, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpOP2.configure(background="black")
-    self.pdpOP2.configure(borderwidth="2")
-    self.pdpOP2.configure(relief="ridge")
-    self.pdpOP2.configure(selectbackground="#c4c4c4")
-    self.pdpOP2.configure(takefocus="0")
-
-    self.pdpOP3 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpOP3.place(relx=0.732, rely=0.29, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpOP3.configure(background="black")
-    self.pdpOP3.configure(borderwidth="2")
-    self.pdpOP3.configure(relief="ridge")
-    self.pdpOP3.configure(selectbackground="#c4c4c4")
-    self.pdpOP3.configure(takefocus="0")
-
-    self.pdpOP4 = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpOP4.place(relx=0.664, rely=0.29, relheight=0.129, relwidth=0.069
-        , bordermode='ignore')
-    self.pdpOP4.configure(background="black")
-    self.pdpOP4.configure(borderwidth="2")
-    self.pdpOP4.configure(relief="ridge")
-    self.pdpOP4.configure(selectbackground="#c4c4c4")
-    self.pdpOP4.configure(takefocus="0")
-
-    self.pdpTRANS_REG = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpTRANS_REG.place(relx=0.538, rely=0.29, relheight=0.17, relwidth=0.092
-        , bordermode='ignore')
-    self.pdpTRANS_REG.configure(background="black")
-    self.pdpTRANS_REG.configure(borderwidth="2")
-    self.pdpTRANS_REG.configure(relief="ridge")
-    self.pdpTRANS_REG.configure(selectbackground="#c4c4c4")
-    self.pdpTRANS_REG.configure(takefocus="0")
-
-    self.pdpMEM_BUFFER_REG = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpMEM_BUFFER_REG.place(relx=0.412, rely=0.29, relheight=0.17
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpMEM_BUFFER_REG.configure(background="black")
-    self.pdpMEM_BUFFER_REG.configure(borderwidth="2")
-    self.pdpMEM_BUFFER_REG.configure(relief="ridge")
-    self.pdpMEM_BUFFER_REG.configure(selectbackground="#c4c4c4")
-    self.pdpMEM_BUFFER_REG.configure(takefocus="0")
-
-    self.pdpMEM_BUFFER_PARITY = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpMEM_BUFFER_PARITY.place(relx=0.286, rely=0.29, relheight=0.17
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpMEM_BUFFER_PARITY.configure(background="black")
-    self.pdpMEM_BUFFER_PARITY.configure(borderwidth="2")
-    self.pdpMEM_BUFFER_PARITY.configure(relief="ridge")
-    self.pdpMEM_BUFFER_PARITY.configure(selectbackground="#c4c4c4")
-    self.pdpMEM_BUFFER_PARITY.configure(takefocus="0")
-
-    self.pdpERROR_RESET = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpERROR_RESET.place(relx=0.034, rely=0.29, relheight=0.17
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpERROR_RESET.configure(background="black")
-    self.pdpERROR_RESET.configure(borderwidth="2")
-    self.pdpERROR_RESET.configure(relief="ridge")
-    self.pdpERROR_RESET.configure(selectbackground="#c4c4c4")
-    self.pdpERROR_RESET.configure(takefocus="0")
-
-    self.pdpPARITY_ERROR = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpPARITY_ERROR.place(relx=0.16, rely=0.29, relheight=0.087
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpPARITY_ERROR.configure(background="black")
-    self.pdpPARITY_ERROR.configure(borderwidth="2")
-    self.pdpPARITY_ERROR.configure(relief="ridge")
-    self.pdpPARITY_ERROR.configure(selectbackground="#c4c4c4")
-    self.pdpPARITY_ERROR.configure(takefocus="0")
-
-    self.pdpERROR_HOLD = tk.Canvas(self.paneProcessorDisplayPanel_p1)
-    self.pdpERROR_HOLD.place(relx=0.16, rely=0.373, relheight=0.087
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpERROR_HOLD.configure(background="black")
-    self.pdpERROR_HOLD.configure(borderwidth="2")
-    self.pdpERROR_HOLD.configure(relief="ridge")
-    self.pdpERROR_HOLD.configure(selectbackground="#c4c4c4")
-    self.pdpERROR_HOLD.configure(takefocus="0")
-
     self.Label13 = tk.Label(self.paneProcessorDisplayPanel_p1)
     self.Label13.place(relx=0.675, rely=0.249, height=8, width=109
         , bordermode='ignore')
@@ -768,321 +338,6 @@ class topProcessorDisplayPanel:
     self.Label14_19.configure(font="-family {DejaVu Sans} -size 12")
     self.Label14_19.configure(text='''→''')
 
-    self.PROG_ERR = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.PROG_ERR.place(relx=0.847, rely=0.591, relheight=0.191, relwidth=0.117
-        , bordermode='ignore')
-    self.PROG_ERR.configure(background="black")
-    self.PROG_ERR.configure(borderwidth="2")
-    self.PROG_ERR.configure(relief="ridge")
-    self.PROG_ERR.configure(selectbackground="#c4c4c4")
-    self.PROG_ERR.configure(takefocus="0")
-
-    self.SYNC_ERR = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.SYNC_ERR.place(relx=0.847, rely=0.773, relheight=0.191, relwidth=0.117
-        , bordermode='ignore')
-    self.SYNC_ERR.configure(background="black")
-    self.SYNC_ERR.configure(borderwidth="2")
-    self.SYNC_ERR.configure(relief="ridge")
-    self.SYNC_ERR.configure(selectbackground="#c4c4c4")
-    self.SYNC_ERR.configure(takefocus="0")
-
-    self.INHIBIT_CTRL = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.INHIBIT_CTRL.place(relx=0.847, rely=0.136, relheight=0.373
-        , relwidth=0.117, bordermode='ignore')
-    self.INHIBIT_CTRL.configure(background="black")
-    self.INHIBIT_CTRL.configure(borderwidth="2")
-    self.INHIBIT_CTRL.configure(relief="ridge")
-    self.INHIBIT_CTRL.configure(selectbackground="#c4c4c4")
-    self.INHIBIT_CTRL.configure(takefocus="0")
-
-    self.iI6 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI6.place(relx=0.503, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI6.configure(background="black")
-    self.iI6.configure(borderwidth="2")
-    self.iI6.configure(relief="ridge")
-    self.iI6.configure(selectbackground="#c4c4c4")
-    self.iI6.configure(takefocus="0")
-
-    self.iI7 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI7.place(relx=0.595, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI7.configure(background="black")
-    self.iI7.configure(borderwidth="2")
-    self.iI7.configure(relief="ridge")
-    self.iI7.configure(selectbackground="#c4c4c4")
-    self.iI7.configure(takefocus="0")
-
-    self.iI8 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI8.place(relx=0.686, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI8.configure(background="black")
-    self.iI8.configure(borderwidth="2")
-    self.iI8.configure(relief="ridge")
-    self.iI8.configure(selectbackground="#c4c4c4")
-    self.iI8.configure(takefocus="0")
-
-    self.iI5 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI5.place(relx=0.412, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI5.configure(background="black")
-    self.iI5.configure(borderwidth="2")
-    self.iI5.configure(relief="ridge")
-    self.iI5.configure(selectbackground="#c4c4c4")
-    self.iI5.configure(takefocus="0")
-
-    self.iI4 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI4.place(relx=0.32, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI4.configure(background="black")
-    self.iI4.configure(borderwidth="2")
-    self.iI4.configure(relief="ridge")
-    self.iI4.configure(selectbackground="#c4c4c4")
-    self.iI4.configure(takefocus="0")
-
-    self.iI3 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI3.place(relx=0.229, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI3.configure(background="black")
-    self.iI3.configure(borderwidth="2")
-    self.iI3.configure(relief="ridge")
-    self.iI3.configure(selectbackground="#c4c4c4")
-    self.iI3.configure(takefocus="0")
-
-    self.iI2 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI2.place(relx=0.137, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI2.configure(background="black")
-    self.iI2.configure(borderwidth="2")
-    self.iI2.configure(relief="ridge")
-    self.iI2.configure(selectbackground="#c4c4c4")
-    self.iI2.configure(takefocus="0")
-
-    self.iI1 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI1.place(relx=0.046, rely=0.136, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI1.configure(background="black")
-    self.iI1.configure(borderwidth="2")
-    self.iI1.configure(relief="ridge")
-    self.iI1.configure(selectbackground="#c4c4c4")
-    self.iI1.configure(takefocus="0")
-
-    self.iB8 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB8.place(relx=0.686, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB8.configure(background="black")
-    self.iB8.configure(borderwidth="2")
-    self.iB8.configure(relief="ridge")
-    self.iB8.configure(selectbackground="#c4c4c4")
-    self.iB8.configure(takefocus="0")
-
-    self.iB7 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB7.place(relx=0.595, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB7.configure(background="black")
-    self.iB7.configure(borderwidth="2")
-    self.iB7.configure(relief="ridge")
-    self.iB7.configure(selectbackground="#c4c4c4")
-    self.iB7.configure(takefocus="0")
-
-    self.iB6 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB6.place(relx=0.503, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB6.configure(background="black")
-    self.iB6.configure(borderwidth="2")
-    self.iB6.configure(relief="ridge")
-    self.iB6.configure(selectbackground="#c4c4c4")
-    self.iB6.configure(takefocus="0")
-
-    self.iB5 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB5.place(relx=0.412, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB5.configure(background="black")
-    self.iB5.configure(borderwidth="2")
-    self.iB5.configure(relief="ridge")
-    self.iB5.configure(selectbackground="#c4c4c4")
-    self.iB5.configure(takefocus="0")
-
-    self.iB4 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB4.place(relx=0.32, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB4.configure(background="black")
-    self.iB4.configure(borderwidth="2")
-    self.iB4.configure(relief="ridge")
-    self.iB4.configure(selectbackground="#c4c4c4")
-    self.iB4.configure(takefocus="0")
-
-    self.iB3 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB3.place(relx=0.229, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB3.configure(background="black")
-    self.iB3.configure(borderwidth="2")
-    self.iB3.configure(relief="ridge")
-    self.iB3.configure(selectbackground="#c4c4c4")
-    self.iB3.configure(takefocus="0")
-
-    self.iB2 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB2.place(relx=0.137, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB2.configure(background="black")
-    self.iB2.configure(borderwidth="2")
-    self.iB2.configure(relief="ridge")
-    self.iB2.configure(selectbackground="#c4c4c4")
-    self.iB2.configure(takefocus="0")
-
-    self.iB1 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB1.place(relx=0.046, rely=0.318, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB1.configure(background="black")
-    self.iB1.configure(borderwidth="2")
-    self.iB1.configure(relief="ridge")
-    self.iB1.configure(selectbackground="#c4c4c4")
-    self.iB1.configure(takefocus="0")
-
-    self.iI16 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI16.place(relx=0.686, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI16.configure(background="black")
-    self.iI16.configure(borderwidth="2")
-    self.iI16.configure(relief="ridge")
-    self.iI16.configure(selectbackground="#c4c4c4")
-    self.iI16.configure(takefocus="0")
-
-    self.iB16 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB16.place(relx=0.686, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB16.configure(background="black")
-    self.iB16.configure(borderwidth="2")
-    self.iB16.configure(relief="ridge")
-    self.iB16.configure(selectbackground="#c4c4c4")
-    self.iB16.configure(takefocus="0")
-
-    self.iI15 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI15.place(relx=0.595, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI15.configure(background="black")
-    self.iI15.configure(borderwidth="2")
-    self.iI15.configure(relief="ridge")
-    self.iI15.configure(selectbackground="#c4c4c4")
-    self.iI15.configure(takefocus="0")
-
-    self.iB15 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB15.place(relx=0.595, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB15.configure(background="black")
-    self.iB15.configure(borderwidth="2")
-    self.iB15.configure(relief="ridge")
-    self.iB15.configure(selectbackground="#c4c4c4")
-    self.iB15.configure(takefocus="0")
-
-    self.iI14 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI14.place(relx=0.503, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI14.configure(background="black")
-    self.iI14.configure(borderwidth="2")
-    self.iI14.configure(relief="ridge")
-    self.iI14.configure(selectbackground="#c4c4c4")
-    self.iI14.configure(takefocus="0")
-
-    self.iB14 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB14.place(relx=0.503, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB14.configure(background="black")
-    self.iB14.configure(borderwidth="2")
-    self.iB14.configure(relief="ridge")
-    self.iB14.configure(selectbackground="#c4c4c4")
-    self.iB14.configure(takefocus="0")
-
-    self.iI13 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI13.place(relx=0.412, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI13.configure(background="black")
-    self.iI13.configure(borderwidth="2")
-    self.iI13.configure(relief="ridge")
-    self.iI13.configure(selectbackground="#c4c4c4")
-    self.iI13.configure(takefocus="0")
-
-    self.iB13 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB13.place(relx=0.412, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB13.configure(background="black")
-    self.iB13.configure(borderwidth="2")
-    self.iB13.configure(relief="ridge")
-    self.iB13.configure(selectbackground="#c4c4c4")
-    self.iB13.configure(takefocus="0")
-
-    self.iI12 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI12.place(relx=0.32, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI12.configure(background="black")
-    self.iI12.configure(borderwidth="2")
-    self.iI12.configure(relief="ridge")
-    self.iI12.configure(selectbackground="#c4c4c4")
-    self.iI12.configure(takefocus="0")
-
-    self.iB12 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB12.place(relx=0.32, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB12.configure(background="black")
-    self.iB12.configure(borderwidth="2")
-    self.iB12.configure(relief="ridge")
-    self.iB12.configure(selectbackground="#c4c4c4")
-    self.iB12.configure(takefocus="0")
-
-    self.iI11 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI11.place(relx=0.229, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI11.configure(background="black")
-    self.iI11.configure(borderwidth="2")
-    self.iI11.configure(relief="ridge")
-    self.iI11.configure(selectbackground="#c4c4c4")
-    self.iI11.configure(takefocus="0")
-
-    self.iB11 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB11.place(relx=0.229, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB11.configure(background="black")
-    self.iB11.configure(borderwidth="2")
-    self.iB11.configure(relief="ridge")
-    self.iB11.configure(selectbackground="#c4c4c4")
-    self.iB11.configure(takefocus="0")
-
-    self.iI10 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI10.place(relx=0.137, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI10.configure(background="black")
-    self.iI10.configure(borderwidth="2")
-    self.iI10.configure(relief="ridge")
-    self.iI10.configure(selectbackground="#c4c4c4")
-    self.iI10.configure(takefocus="0")
-
-    self.iB10 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB10.place(relx=0.137, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB10.configure(background="black")
-    self.iB10.configure(borderwidth="2")
-    self.iB10.configure(relief="ridge")
-    self.iB10.configure(selectbackground="#c4c4c4")
-    self.iB10.configure(takefocus="0")
-
-    self.iI9 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iI9.place(relx=0.046, rely=0.591, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iI9.configure(background="black")
-    self.iI9.configure(borderwidth="2")
-    self.iI9.configure(relief="ridge")
-    self.iI9.configure(selectbackground="#c4c4c4")
-    self.iI9.configure(takefocus="0")
-
-    self.iB9 = tk.Canvas(self.paneProcessorDisplayPanel_p2)
-    self.iB9.place(relx=0.046, rely=0.773, relheight=0.191, relwidth=0.094
-        , bordermode='ignore')
-    self.iB9.configure(background="black")
-    self.iB9.configure(borderwidth="2")
-    self.iB9.configure(relief="ridge")
-    self.iB9.configure(selectbackground="#c4c4c4")
-    self.iB9.configure(takefocus="0")
-
     self.TPanedwindow1 = ttk.Panedwindow(self.paneProcessorDisplayPanel_p3
         , orient="vertical")
     self.TPanedwindow1.place(relx=0.023, rely=0.092, relheight=0.862
@@ -1096,159 +351,6 @@ class topProcessorDisplayPanel:
     self.TPanedwindow1.add(self.paneProgRegB, weight=0)
     self.__funcid1 = self.TPanedwindow1.bind('<Map>', self.__adjust_sash1)
 
-    self.P10 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P10.place(relx=0.42, rely=0.25, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.P10.configure(background="black")
-    self.P10.configure(borderwidth="2")
-    self.P10.configure(relief="ridge")
-    self.P10.configure(selectbackground="#c4c4c4")
-    self.P10.configure(takefocus="0")
-
-    self.P4 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P4.place(relx=0.492, rely=0.25, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.P4.configure(background="black")
-    self.P4.configure(borderwidth="2")
-    self.P4.configure(relief="ridge")
-    self.P4.configure(selectbackground="#c4c4c4")
-    self.P4.configure(takefocus="0")
-
-    self.D4 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D4.place(relx=0.42, rely=0.583, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.D4.configure(background="black")
-    self.D4.configure(borderwidth="2")
-    self.D4.configure(relief="ridge")
-    self.D4.configure(selectbackground="#c4c4c4")
-    self.D4.configure(takefocus="0")
-
-    self.D3 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D3.place(relx=0.492, rely=0.583, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.D3.configure(background="black")
-    self.D3.configure(borderwidth="2")
-    self.D3.configure(relief="ridge")
-    self.D3.configure(selectbackground="#c4c4c4")
-    self.D3.configure(takefocus="0")
-
-    self.P2 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P2.place(relx=0.564, rely=0.25, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.P2.configure(background="black")
-    self.P2.configure(borderwidth="2")
-    self.P2.configure(relief="ridge")
-    self.P2.configure(selectbackground="#c4c4c4")
-    self.P2.configure(takefocus="0")
-
-    self.P1 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P1.place(relx=0.635, rely=0.25, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.P1.configure(background="black")
-    self.P1.configure(borderwidth="2")
-    self.P1.configure(relief="ridge")
-    self.P1.configure(selectbackground="#c4c4c4")
-    self.P1.configure(takefocus="0")
-
-    self.D2 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D2.place(relx=0.564, rely=0.583, relheight=0.35, relwidth=0.074
-        , bordermode='ignore')
-    self.D2.configure(background="black")
-    self.D2.configure(borderwidth="2")
-    self.D2.configure(relief="ridge")
-    self.D2.configure(selectbackground="#c4c4c4")
-    self.D2.configure(takefocus="0")
-
-    self.D1 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D1.place(relx=0.635, rely=0.583, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.D1.configure(background="black")
-    self.D1.configure(borderwidth="2")
-    self.D1.configure(relief="ridge")
-    self.D1.configure(selectbackground="#c4c4c4")
-    self.D1.configure(takefocus="0")
-
-    self.P20 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P20.place(relx=0.348, rely=0.25, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.P20.configure(background="black")
-    self.P20.configure(borderwidth="2")
-    self.P20.configure(relief="ridge")
-    self.P20.configure(selectbackground="#c4c4c4")
-    self.P20.configure(takefocus="0")
-
-    self.D5 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D5.place(relx=0.348, rely=0.583, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.D5.configure(background="black")
-    self.D5.configure(borderwidth="2")
-    self.D5.configure(relief="ridge")
-    self.D5.configure(selectbackground="#c4c4c4")
-    self.D5.configure(takefocus="0")
-
-    self.P40 = tk.Canvas(self.TPanedwindow1_p1)
-    self.P40.place(relx=0.276, rely=0.25, relheight=0.35, relwidth=0.074
-        , bordermode='ignore')
-    self.P40.configure(background="#000000")
-    self.P40.configure(borderwidth="2")
-    self.P40.configure(relief="ridge")
-    self.P40.configure(selectbackground="#c4c4c4")
-    self.P40.configure(takefocus="0")
-
-    self.D6 = tk.Canvas(self.TPanedwindow1_p1)
-    self.D6.place(relx=0.276, rely=0.583, relheight=0.35, relwidth=0.072
-        , bordermode='ignore')
-    self.D6.configure(background="black")
-    self.D6.configure(borderwidth="2")
-    self.D6.configure(relief="ridge")
-    self.D6.configure(selectbackground="#c4c4c4")
-    self.D6.configure(takefocus="0")
-
-    self.HALT = tk.Canvas(self.TPanedwindow1_p1)
-    self.HALT.place(relx=0.863, rely=0.25, relheight=0.683, relwidth=0.122
-        , bordermode='ignore')
-    self.HALT.configure(background="black")
-    self.HALT.configure(borderwidth="2")
-    self.HALT.configure(relief="ridge")
-    self.HALT.configure(selectbackground="#c4c4c4")
-    self.HALT.configure(takefocus="0")
-
-    self.RESET_MACHINE = tk.Canvas(self.TPanedwindow1_p1)
-    self.RESET_MACHINE.place(relx=0.755, rely=0.25, relheight=0.683
-        , relwidth=0.11, bordermode='ignore')
-    self.RESET_MACHINE.configure(background="black")
-    self.RESET_MACHINE.configure(borderwidth="2")
-    self.RESET_MACHINE.configure(relief="ridge")
-    self.RESET_MACHINE.configure(selectbackground="#c4c4c4")
-    self.RESET_MACHINE.configure(takefocus="0")
-
-    self.MAN_CST = tk.Canvas(self.TPanedwindow1_p1)
-    self.MAN_CST.place(relx=0.012, rely=0.583, relheight=0.35, relwidth=0.122
-        , bordermode='ignore')
-    self.MAN_CST.configure(background="black")
-    self.MAN_CST.configure(borderwidth="2")
-    self.MAN_CST.configure(relief="ridge")
-    self.MAN_CST.configure(selectbackground="#c4c4c4")
-    self.MAN_CST.configure(takefocus="0")
-
-    self.CST = tk.Canvas(self.TPanedwindow1_p1)
-    self.CST.place(relx=0.012, rely=0.25, relheight=0.35, relwidth=0.122
-        , bordermode='ignore')
-    self.CST.configure(background="black")
-    self.CST.configure(borderwidth="2")
-    self.CST.configure(relief="ridge")
-    self.CST.configure(selectbackground="#c4c4c4")
-    self.CST.configure(takefocus="0")
-
-    self.ADVANCE = tk.Canvas(self.TPanedwindow1_p1)
-    self.ADVANCE.place(relx=0.132, rely=0.25, relheight=0.683, relwidth=0.11
-        , bordermode='ignore')
-    self.ADVANCE.configure(background="black")
-    self.ADVANCE.configure(borderwidth="2")
-    self.ADVANCE.configure(relief="ridge")
-    self.ADVANCE.configure(selectbackground="#c4c4c4")
-    self.ADVANCE.configure(takefocus="0")
-
     self.PRA1 = tk.Checkbutton(self.paneProgRegA)
     self.PRA1.place(relx=0.096, rely=0.293, relheight=0.31, relwidth=0.084
         , bordermode='ignore')
@@ -1773,51 +875,6 @@ class topProcessorDisplayPanel:
     self.Label8.configure(font="-family {DejaVu Sans} -size 6")
     self.Label8.configure(text='''25''')
 
-    self.pdpLAMP_TEST = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.pdpLAMP_TEST.place(relx=0.126, rely=0.472, relheight=0.387
-        , relwidth=0.092, bordermode='ignore')
-    self.pdpLAMP_TEST.configure(background="black")
-    self.pdpLAMP_TEST.configure(borderwidth="2")
-    self.pdpLAMP_TEST.configure(relief="ridge")
-    self.pdpLAMP_TEST.configure(selectbackground="#c4c4c4")
-    self.pdpLAMP_TEST.configure(takefocus="0")
-
-    self.trmcERROR_DEVICES_TEST = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.trmcERROR_DEVICES_TEST.place(relx=0.767, rely=0.472, relheight=0.387
-        , relwidth=0.117, bordermode='ignore')
-    self.trmcERROR_DEVICES_TEST.configure(background="black")
-    self.trmcERROR_DEVICES_TEST.configure(borderwidth="2")
-    self.trmcERROR_DEVICES_TEST.configure(relief="ridge")
-    self.trmcERROR_DEVICES_TEST.configure(selectbackground="#c4c4c4")
-    self.trmcERROR_DEVICES_TEST.configure(takefocus="0")
-
-    self.trmcDD = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.trmcDD.place(relx=0.652, rely=0.66, relheight=0.198, relwidth=0.117
-        , bordermode='ignore')
-    self.trmcDD.configure(background="black")
-    self.trmcDD.configure(borderwidth="2")
-    self.trmcDD.configure(relief="ridge")
-    self.trmcDD.configure(selectbackground="#c4c4c4")
-    self.trmcDD.configure(takefocus="0")
-
-    self.trmcML = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.trmcML.place(relx=0.652, rely=0.472, relheight=0.198, relwidth=0.117
-        , bordermode='ignore')
-    self.trmcML.configure(background="black")
-    self.trmcML.configure(borderwidth="2")
-    self.trmcML.configure(relief="ridge")
-    self.trmcML.configure(selectbackground="#c4c4c4")
-    self.trmcML.configure(takefocus="0")
-
-    self.trmcMANUAL = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.trmcMANUAL.place(relx=0.538, rely=0.66, relheight=0.198, relwidth=0.117
-        , bordermode='ignore')
-    self.trmcMANUAL.configure(background="black")
-    self.trmcMANUAL.configure(borderwidth="2")
-    self.trmcMANUAL.configure(relief="ridge")
-    self.trmcMANUAL.configure(selectbackground="#c4c4c4")
-    self.trmcMANUAL.configure(takefocus="0")
-
     self.Label12_4 = tk.Label(self.paneProcessorDisplayPanel_p4)
     self.Label12_4.place(relx=0.549, rely=0.33, height=12, width=142
         , bordermode='ignore')
@@ -1844,15 +901,6 @@ class topProcessorDisplayPanel:
         , bordermode='ignore')
     self.TSeparator1.configure(orient="vertical")
 
-    self.trmcAUTO = tk.Canvas(self.paneProcessorDisplayPanel_p4)
-    self.trmcAUTO.place(relx=0.538, rely=0.472, relheight=0.198, relwidth=0.117
-        , bordermode='ignore')
-    self.trmcAUTO.configure(background="black")
-    self.trmcAUTO.configure(borderwidth="2")
-    self.trmcAUTO.configure(relief="ridge")
-    self.trmcAUTO.configure(selectbackground="#c4c4c4")
-    self.trmcAUTO.configure(takefocus="0")
-
     self.menubar = tk.Menu(top,font=font40,bg=_bgcolor,fg=_fgcolor)
     top.configure(menu = self.menubar)
 
@@ -1888,15 +936,6 @@ class topProcessorDisplayPanel:
     self.Label10.configure(font="-family {DejaVu Sans} -size 12")
     self.Label10.configure(text='''MEMORY LOAD AND DATA DISPLAY''')
 
-    self.iaComputerIS4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerIS4.place(relx=0.561, rely=0.222, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerIS4.configure(background="black")
-    self.iaComputerIS4.configure(borderwidth="2")
-    self.iaComputerIS4.configure(relief="ridge")
-    self.iaComputerIS4.configure(selectbackground="#c4c4c4")
-    self.iaComputerIS4.configure(takefocus="0")
-
     self.Label13_12 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p2)
     self.Label13_12.place(relx=0.572, rely=0.111, height=16, width=150
         , bordermode='ignore')
@@ -1904,15 +943,6 @@ class topProcessorDisplayPanel:
     self.Label13_12.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_12.configure(text='''--------------------SECTOR--------------------''')
 
-    self.iaCommandIS4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandIS4.place(relx=0.561, rely=0.37, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandIS4.configure(background="black")
-    self.iaCommandIS4.configure(borderwidth="2")
-    self.iaCommandIS4.configure(relief="ridge")
-    self.iaCommandIS4.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS4.configure(takefocus="0")
-
     self.Label13_13 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p2)
     self.Label13_13.place(relx=0.206, rely=0.556, height=16, width=310
         , bordermode='ignore')
@@ -1920,159 +950,6 @@ class topProcessorDisplayPanel:
     self.Label13_13.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_13.configure(text='''-----------------------------------ADDRESS-----------------------------------''')
 
-    self.iaComputerA8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA8.place(relx=0.195, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA8.configure(background="black")
-    self.iaComputerA8.configure(borderwidth="2")
-    self.iaComputerA8.configure(relief="ridge")
-    self.iaComputerA8.configure(selectbackground="#c4c4c4")
-    self.iaComputerA8.configure(takefocus="0")
-
-    self.iaCommandA6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA6.place(relx=0.378, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA6.configure(background="black")
-    self.iaCommandA6.configure(borderwidth="2")
-    self.iaCommandA6.configure(relief="ridge")
-    self.iaCommandA6.configure(selectbackground="#c4c4c4")
-    self.iaCommandA6.configure(takefocus="0")
-
-    self.iaCommandA7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA7.place(relx=0.286, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA7.configure(background="black")
-    self.iaCommandA7.configure(borderwidth="2")
-    self.iaCommandA7.configure(relief="ridge")
-    self.iaCommandA7.configure(selectbackground="#c4c4c4")
-    self.iaCommandA7.configure(takefocus="0")
-
-    self.iaComputerIS3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerIS3.place(relx=0.652, rely=0.222, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerIS3.configure(background="black")
-    self.iaComputerIS3.configure(borderwidth="2")
-    self.iaComputerIS3.configure(relief="ridge")
-    self.iaComputerIS3.configure(selectbackground="#c4c4c4")
-    self.iaComputerIS3.configure(takefocus="0")
-
-    self.iaCommandA8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA8.place(relx=0.195, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA8.configure(background="black")
-    self.iaCommandA8.configure(borderwidth="2")
-    self.iaCommandA8.configure(relief="ridge")
-    self.iaCommandA8.configure(selectbackground="#c4c4c4")
-    self.iaCommandA8.configure(takefocus="0")
-
-    self.iaCommandA5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA5.place(relx=0.469, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA5.configure(background="black")
-    self.iaCommandA5.configure(borderwidth="2")
-    self.iaCommandA5.configure(relief="ridge")
-    self.iaCommandA5.configure(selectbackground="#c4c4c4")
-    self.iaCommandA5.configure(takefocus="0")
-
-    self.iaCommandA4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA4.place(relx=0.561, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA4.configure(background="black")
-    self.iaCommandA4.configure(borderwidth="2")
-    self.iaCommandA4.configure(relief="ridge")
-    self.iaCommandA4.configure(selectbackground="#c4c4c4")
-    self.iaCommandA4.configure(takefocus="0")
-
-    self.iaCommandA3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA3.place(relx=0.652, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA3.configure(background="black")
-    self.iaCommandA3.configure(borderwidth="2")
-    self.iaCommandA3.configure(relief="ridge")
-    self.iaCommandA3.configure(selectbackground="#c4c4c4")
-    self.iaCommandA3.configure(takefocus="0")
-
-    self.iaCommandA2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA2.place(relx=0.744, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA2.configure(background="black")
-    self.iaCommandA2.configure(borderwidth="2")
-    self.iaCommandA2.configure(relief="ridge")
-    self.iaCommandA2.configure(selectbackground="#c4c4c4")
-    self.iaCommandA2.configure(takefocus="0")
-
-    self.iaCommandA1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandA1.place(relx=0.835, rely=0.815, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandA1.configure(background="black")
-    self.iaCommandA1.configure(borderwidth="2")
-    self.iaCommandA1.configure(relief="ridge")
-    self.iaCommandA1.configure(selectbackground="#c4c4c4")
-    self.iaCommandA1.configure(takefocus="0")
-
-    self.iaComputerA7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA7.place(relx=0.286, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA7.configure(background="black")
-    self.iaComputerA7.configure(borderwidth="2")
-    self.iaComputerA7.configure(relief="ridge")
-    self.iaComputerA7.configure(selectbackground="#c4c4c4")
-    self.iaComputerA7.configure(takefocus="0")
-
-    self.iaComputerA6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA6.place(relx=0.378, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA6.configure(background="black")
-    self.iaComputerA6.configure(borderwidth="2")
-    self.iaComputerA6.configure(relief="ridge")
-    self.iaComputerA6.configure(selectbackground="#c4c4c4")
-    self.iaComputerA6.configure(takefocus="0")
-
-    self.iaComputerA5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA5.place(relx=0.469, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA5.configure(background="black")
-    self.iaComputerA5.configure(borderwidth="2")
-    self.iaComputerA5.configure(relief="ridge")
-    self.iaComputerA5.configure(selectbackground="#c4c4c4")
-    self.iaComputerA5.configure(takefocus="0")
-
-    self.iaComputerA4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA4.place(relx=0.561, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA4.configure(background="black")
-    self.iaComputerA4.configure(borderwidth="2")
-    self.iaComputerA4.configure(relief="ridge")
-    self.iaComputerA4.configure(selectbackground="#c4c4c4")
-    self.iaComputerA4.configure(takefocus="0")
-
-    self.iaComputerA3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA3.place(relx=0.652, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA3.configure(background="black")
-    self.iaComputerA3.configure(borderwidth="2")
-    self.iaComputerA3.configure(relief="ridge")
-    self.iaComputerA3.configure(selectbackground="#c4c4c4")
-    self.iaComputerA3.configure(takefocus="0")
-
-    self.iaComputerA2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA2.place(relx=0.744, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA2.configure(background="black")
-    self.iaComputerA2.configure(borderwidth="2")
-    self.iaComputerA2.configure(relief="ridge")
-    self.iaComputerA2.configure(selectbackground="#c4c4c4")
-    self.iaComputerA2.configure(takefocus="0")
-
-    self.iaComputerA1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerA1.place(relx=0.835, rely=0.667, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerA1.configure(background="black")
-    self.iaComputerA1.configure(borderwidth="2")
-    self.iaComputerA1.configure(relief="ridge")
-    self.iaComputerA1.configure(selectbackground="#c4c4c4")
-    self.iaComputerA1.configure(takefocus="0")
-
     self.Label12_4 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p2)
     self.Label12_4.place(relx=0.011, rely=0.667, height=23, width=77
         , bordermode='ignore')
@@ -2089,95 +966,6 @@ class topProcessorDisplayPanel:
     self.Label12_8.configure(font="-family {DejaVu Sans} -size 8")
     self.Label12_8.configure(text='''COMMAND''')
 
-    self.iaCommandIS3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandIS3.place(relx=0.652, rely=0.37, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandIS3.configure(background="black")
-    self.iaCommandIS3.configure(borderwidth="2")
-    self.iaCommandIS3.configure(relief="ridge")
-    self.iaCommandIS3.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS3.configure(takefocus="0")
-
-    self.iaComputerIS2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerIS2.place(relx=0.744, rely=0.222, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerIS2.configure(background="black")
-    self.iaComputerIS2.configure(borderwidth="2")
-    self.iaComputerIS2.configure(relief="ridge")
-    self.iaComputerIS2.configure(selectbackground="#c4c4c4")
-    self.iaComputerIS2.configure(takefocus="0")
-
-    self.iaCommandIS2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandIS2.place(relx=0.744, rely=0.37, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandIS2.configure(background="black")
-    self.iaCommandIS2.configure(borderwidth="2")
-    self.iaCommandIS2.configure(relief="ridge")
-    self.iaCommandIS2.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS2.configure(takefocus="0")
-
-    self.iaComputerIS1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerIS1.place(relx=0.835, rely=0.222, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaComputerIS1.configure(background="black")
-    self.iaComputerIS1.configure(borderwidth="2")
-    self.iaComputerIS1.configure(relief="ridge")
-    self.iaComputerIS1.configure(selectbackground="#c4c4c4")
-    self.iaComputerIS1.configure(takefocus="0")
-
-    self.iaCommandIS1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandIS1.place(relx=0.835, rely=0.37, relheight=0.156
-        , relwidth=0.092, bordermode='ignore')
-    self.iaCommandIS1.configure(background="black")
-    self.iaCommandIS1.configure(borderwidth="2")
-    self.iaCommandIS1.configure(relief="ridge")
-    self.iaCommandIS1.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS1.configure(takefocus="0")
-
-    self.iaComputerSYL1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerSYL1.place(relx=0.481, rely=0.222, relheight=0.156
-        , relwidth=0.08, bordermode='ignore')
-    self.iaComputerSYL1.configure(background="black")
-    self.iaComputerSYL1.configure(borderwidth="2")
-    self.iaComputerSYL1.configure(relief="ridge")
-    self.iaComputerSYL1.configure(selectbackground="#c4c4c4")
-    self.iaComputerSYL1.configure(takefocus="0")
-
-    self.iaCommandSYL1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandSYL1.place(relx=0.481, rely=0.37, relheight=0.156
-        , relwidth=0.08, bordermode='ignore')
-    self.iaCommandSYL1.configure(background="black")
-    self.iaCommandSYL1.configure(borderwidth="2")
-    self.iaCommandSYL1.configure(relief="ridge")
-    self.iaCommandSYL1.configure(selectbackground="#c4c4c4")
-    self.iaCommandSYL1.configure(takefocus="0")
-
-    self.iaComputerSYL0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerSYL0.place(relx=0.4, rely=0.222, relheight=0.156
-        , relwidth=0.08, bordermode='ignore')
-    self.iaComputerSYL0.configure(background="black")
-    self.iaComputerSYL0.configure(borderwidth="2")
-    self.iaComputerSYL0.configure(relief="ridge")
-    self.iaComputerSYL0.configure(selectbackground="#c4c4c4")
-    self.iaComputerSYL0.configure(takefocus="0")
-
-    self.iaCommandSYL0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandSYL0.place(relx=0.4, rely=0.37, relheight=0.156, relwidth=0.08
-        , bordermode='ignore')
-    self.iaCommandSYL0.configure(background="black")
-    self.iaCommandSYL0.configure(borderwidth="2")
-    self.iaCommandSYL0.configure(relief="ridge")
-    self.iaCommandSYL0.configure(selectbackground="#c4c4c4")
-    self.iaCommandSYL0.configure(takefocus="0")
-
-    self.mlREPEAT_13 = tk.Canvas(self.iaCommandSYL0)
-    self.mlREPEAT_13.place(relx=7.8, rely=2.143, relheight=1.0, relwidth=1.0)
-    self.mlREPEAT_13.configure(background="black")
-    self.mlREPEAT_13.configure(borderwidth="2")
-    self.mlREPEAT_13.configure(relief="ridge")
-    self.mlREPEAT_13.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_13.configure(takefocus="0")
-
     self.Label12_6 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p2)
     self.Label12_6.place(relx=0.217, rely=0.222, height=23, width=77
         , bordermode='ignore')
@@ -2192,74 +980,6 @@ class topProcessorDisplayPanel:
     self.Label12_10.configure(font="-family {DejaVu Sans} -size 8")
     self.Label12_10.configure(text='''—COMMAND—''')
 
-    self.iaCommandM0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandM0.place(relx=0.046, rely=0.37, relheight=0.156, relwidth=0.08
-        , bordermode='ignore')
-    self.iaCommandM0.configure(background="black")
-    self.iaCommandM0.configure(borderwidth="2")
-    self.iaCommandM0.configure(relief="ridge")
-    self.iaCommandM0.configure(selectbackground="#c4c4c4")
-    self.iaCommandM0.configure(takefocus="0")
-
-    self.mlREPEAT_8 = tk.Canvas(self.iaCommandM0)
-    self.mlREPEAT_8.place(relx=7.8, rely=2.143, relheight=1.0, relwidth=1.0)
-    self.mlREPEAT_8.configure(background="black")
-    self.mlREPEAT_8.configure(borderwidth="2")
-    self.mlREPEAT_8.configure(relief="ridge")
-    self.mlREPEAT_8.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_8.configure(takefocus="0")
-
-    self.iaComputerM0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerM0.place(relx=0.046, rely=0.222, relheight=0.156
-        , relwidth=0.08, bordermode='ignore')
-    self.iaComputerM0.configure(background="black")
-    self.iaComputerM0.configure(borderwidth="2")
-    self.iaComputerM0.configure(relief="ridge")
-    self.iaComputerM0.configure(selectbackground="#c4c4c4")
-    self.iaComputerM0.configure(takefocus="0")
-
-    self.mlREPEAT_10 = tk.Canvas(self.iaComputerM0)
-    self.mlREPEAT_10.place(relx=7.8, rely=2.143, relheight=1.0, relwidth=1.0)
-    self.mlREPEAT_10.configure(background="black")
-    self.mlREPEAT_10.configure(borderwidth="2")
-    self.mlREPEAT_10.configure(relief="ridge")
-    self.mlREPEAT_10.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_10.configure(takefocus="0")
-
-    self.iaCommandM1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaCommandM1.place(relx=0.126, rely=0.37, relheight=0.156, relwidth=0.08
-        , bordermode='ignore')
-    self.iaCommandM1.configure(background="black")
-    self.iaCommandM1.configure(borderwidth="2")
-    self.iaCommandM1.configure(relief="ridge")
-    self.iaCommandM1.configure(selectbackground="#c4c4c4")
-    self.iaCommandM1.configure(takefocus="0")
-
-    self.mlREPEAT_12 = tk.Canvas(self.iaCommandM1)
-    self.mlREPEAT_12.place(relx=7.8, rely=2.143, relheight=1.0, relwidth=1.0)
-    self.mlREPEAT_12.configure(background="black")
-    self.mlREPEAT_12.configure(borderwidth="2")
-    self.mlREPEAT_12.configure(relief="ridge")
-    self.mlREPEAT_12.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_12.configure(takefocus="0")
-
-    self.iaComputerM1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p2)
-    self.iaComputerM1.place(relx=0.126, rely=0.222, relheight=0.156
-        , relwidth=0.08, bordermode='ignore')
-    self.iaComputerM1.configure(background="black")
-    self.iaComputerM1.configure(borderwidth="2")
-    self.iaComputerM1.configure(relief="ridge")
-    self.iaComputerM1.configure(selectbackground="#c4c4c4")
-    self.iaComputerM1.configure(takefocus="0")
-
-    self.mlREPEAT_14 = tk.Canvas(self.iaComputerM1)
-    self.mlREPEAT_14.place(relx=7.8, rely=2.143, relheight=1.0, relwidth=1.0)
-    self.mlREPEAT_14.configure(background="black")
-    self.mlREPEAT_14.configure(borderwidth="2")
-    self.mlREPEAT_14.configure(relief="ridge")
-    self.mlREPEAT_14.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_14.configure(takefocus="0")
-
     self.Label13_8 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p2)
     self.Label13_8.place(relx=0.4, rely=0.111, height=16, width=70
         , bordermode='ignore')
@@ -2288,121 +1008,6 @@ class topProcessorDisplayPanel:
     self.Label13_1.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_1.configure(text='''----MODULE----''')
 
-    self.daComputerDS4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerDS4.place(relx=0.24, rely=0.226, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daComputerDS4.configure(background="black")
-    self.daComputerDS4.configure(borderwidth="2")
-    self.daComputerDS4.configure(relief="ridge")
-    self.daComputerDS4.configure(selectbackground="#c4c4c4")
-    self.daComputerDS4.configure(takefocus="0")
-
-    self.daPARITY_BIT = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daPARITY_BIT.place(relx=0.057, rely=0.226, relheight=0.308
-        , relwidth=0.092, bordermode='ignore')
-    self.daPARITY_BIT.configure(background="black")
-    self.daPARITY_BIT.configure(borderwidth="2")
-    self.daPARITY_BIT.configure(relief="ridge")
-    self.daPARITY_BIT.configure(selectbackground="#c4c4c4")
-    self.daPARITY_BIT.configure(takefocus="0")
-
-    self.daCommandDS4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandDS4.place(relx=0.24, rely=0.376, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daCommandDS4.configure(background="black")
-    self.daCommandDS4.configure(borderwidth="2")
-    self.daCommandDS4.configure(relief="ridge")
-    self.daCommandDS4.configure(selectbackground="#c4c4c4")
-    self.daCommandDS4.configure(takefocus="0")
-
-    self.daComputerDS3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerDS3.place(relx=0.332, rely=0.226, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daComputerDS3.configure(background="black")
-    self.daComputerDS3.configure(borderwidth="2")
-    self.daComputerDS3.configure(relief="ridge")
-    self.daComputerDS3.configure(selectbackground="#c4c4c4")
-    self.daComputerDS3.configure(takefocus="0")
-
-    self.iaCommandIS4_11 = tk.Canvas(self.daComputerDS3)
-    self.iaCommandIS4_11.place(relx=4.75, rely=0.81, relheight=1.0, relwidth=1.0)
-
-    self.iaCommandIS4_11.configure(background="black")
-    self.iaCommandIS4_11.configure(borderwidth="2")
-    self.iaCommandIS4_11.configure(relief="ridge")
-    self.iaCommandIS4_11.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS4_11.configure(takefocus="0")
-
-    self.daCommandDS3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandDS3.place(relx=0.332, rely=0.376, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daCommandDS3.configure(background="black")
-    self.daCommandDS3.configure(borderwidth="2")
-    self.daCommandDS3.configure(relief="ridge")
-    self.daCommandDS3.configure(selectbackground="#c4c4c4")
-    self.daCommandDS3.configure(takefocus="0")
-
-    self.daComputerDS2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerDS2.place(relx=0.423, rely=0.226, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daComputerDS2.configure(background="black")
-    self.daComputerDS2.configure(borderwidth="2")
-    self.daComputerDS2.configure(relief="ridge")
-    self.daComputerDS2.configure(selectbackground="#c4c4c4")
-    self.daComputerDS2.configure(takefocus="0")
-
-    self.daCommandDS2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandDS2.place(relx=0.423, rely=0.376, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daCommandDS2.configure(background="black")
-    self.daCommandDS2.configure(borderwidth="2")
-    self.daCommandDS2.configure(relief="ridge")
-    self.daCommandDS2.configure(selectbackground="#c4c4c4")
-    self.daCommandDS2.configure(takefocus="0")
-
-    self.iaCommandIS4_2 = tk.Canvas(self.daCommandDS2)
-    self.iaCommandIS4_2.place(relx=5.65, rely=3.714, relheight=1.0, relwidth=1.0)
-
-    self.iaCommandIS4_2.configure(background="black")
-    self.iaCommandIS4_2.configure(borderwidth="2")
-    self.iaCommandIS4_2.configure(relief="ridge")
-    self.iaCommandIS4_2.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS4_2.configure(takefocus="0")
-
-    self.daComputerDS1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerDS1.place(relx=0.515, rely=0.226, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daComputerDS1.configure(background="black")
-    self.daComputerDS1.configure(borderwidth="2")
-    self.daComputerDS1.configure(relief="ridge")
-    self.daComputerDS1.configure(selectbackground="#c4c4c4")
-    self.daComputerDS1.configure(takefocus="0")
-
-    self.iaCommandIS4_3 = tk.Canvas(self.daComputerDS1)
-    self.iaCommandIS4_3.place(relx=6.0, rely=1.667, relheight=1.0, relwidth=1.0)
-    self.iaCommandIS4_3.configure(background="black")
-    self.iaCommandIS4_3.configure(borderwidth="2")
-    self.iaCommandIS4_3.configure(relief="ridge")
-    self.iaCommandIS4_3.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS4_3.configure(takefocus="0")
-
-    self.daCommandDS1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandDS1.place(relx=0.515, rely=0.376, relheight=0.158
-        , relwidth=0.092, bordermode='ignore')
-    self.daCommandDS1.configure(background="black")
-    self.daCommandDS1.configure(borderwidth="2")
-    self.daCommandDS1.configure(relief="ridge")
-    self.daCommandDS1.configure(selectbackground="#c4c4c4")
-    self.daCommandDS1.configure(takefocus="0")
-
-    self.iaCommandIS4_4 = tk.Canvas(self.daCommandDS1)
-    self.iaCommandIS4_4.place(relx=6.0, rely=3.333, relheight=1.0, relwidth=1.0)
-    self.iaCommandIS4_4.configure(background="black")
-    self.iaCommandIS4_4.configure(borderwidth="2")
-    self.iaCommandIS4_4.configure(relief="ridge")
-    self.iaCommandIS4_4.configure(selectbackground="#c4c4c4")
-    self.iaCommandIS4_4.configure(takefocus="0")
-
     self.Label12_5 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p3)
     self.Label12_5.place(relx=0.611, rely=0.226, height=23, width=77
         , bordermode='ignore')
@@ -2417,42 +1022,6 @@ class topProcessorDisplayPanel:
     self.Label12_11.configure(font="-family {DejaVu Sans} -size 8")
     self.Label12_11.configure(text='''—COMMAND—''')
 
-    self.daComputerM0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerM0.place(relx=0.789, rely=0.226, relheight=0.158
-        , relwidth=0.08, bordermode='ignore')
-    self.daComputerM0.configure(background="black")
-    self.daComputerM0.configure(borderwidth="2")
-    self.daComputerM0.configure(relief="ridge")
-    self.daComputerM0.configure(selectbackground="#c4c4c4")
-    self.daComputerM0.configure(takefocus="0")
-
-    self.daComputerM1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerM1.place(relx=0.87, rely=0.226, relheight=0.158, relwidth=0.08
-        , bordermode='ignore')
-    self.daComputerM1.configure(background="black")
-    self.daComputerM1.configure(borderwidth="2")
-    self.daComputerM1.configure(relief="ridge")
-    self.daComputerM1.configure(selectbackground="#c4c4c4")
-    self.daComputerM1.configure(takefocus="0")
-
-    self.daCommandM0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandM0.place(relx=0.789, rely=0.376, relheight=0.158, relwidth=0.08
-        , bordermode='ignore')
-    self.daCommandM0.configure(background="black")
-    self.daCommandM0.configure(borderwidth="2")
-    self.daCommandM0.configure(relief="ridge")
-    self.daCommandM0.configure(selectbackground="#c4c4c4")
-    self.daCommandM0.configure(takefocus="0")
-
-    self.daCommandM1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandM1.place(relx=0.87, rely=0.376, relheight=0.158, relwidth=0.08
-        , bordermode='ignore')
-    self.daCommandM1.configure(background="black")
-    self.daCommandM1.configure(borderwidth="2")
-    self.daCommandM1.configure(relief="ridge")
-    self.daCommandM1.configure(selectbackground="#c4c4c4")
-    self.daCommandM1.configure(takefocus="0")
-
     self.Label13_13 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p3)
     self.Label13_13.place(relx=0.023, rely=0.15, height=9, width=70
         , bordermode='ignore')
@@ -2460,240 +1029,6 @@ class topProcessorDisplayPanel:
     self.Label13_13.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_13.configure(text='''PARITY BIT''')
 
-    self.daCommandOP3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOP3.place(relx=0.16, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOP3.configure(background="black")
-    self.daCommandOP3.configure(borderwidth="2")
-    self.daCommandOP3.configure(relief="ridge")
-    self.daCommandOP3.configure(selectbackground="#c4c4c4")
-    self.daCommandOP3.configure(takefocus="0")
-
-    self.daCommandOP2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOP2.place(relx=0.229, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOP2.configure(background="black")
-    self.daCommandOP2.configure(borderwidth="2")
-    self.daCommandOP2.configure(relief="ridge")
-    self.daCommandOP2.configure(selectbackground="#c4c4c4")
-    self.daCommandOP2.configure(takefocus="0")
-
-    self.daCommandOP1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOP1.place(relx=0.297, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOP1.configure(background="black")
-    self.daCommandOP1.configure(borderwidth="2")
-    self.daCommandOP1.configure(relief="ridge")
-    self.daCommandOP1.configure(selectbackground="#c4c4c4")
-    self.daCommandOP1.configure(takefocus="0")
-
-    self.daCommandOA9 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA9.place(relx=0.366, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA9.configure(background="black")
-    self.daCommandOA9.configure(borderwidth="2")
-    self.daCommandOA9.configure(relief="ridge")
-    self.daCommandOA9.configure(selectbackground="#c4c4c4")
-    self.daCommandOA9.configure(takefocus="0")
-
-    self.daCommandOA8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA8.place(relx=0.435, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA8.configure(background="black")
-    self.daCommandOA8.configure(borderwidth="2")
-    self.daCommandOA8.configure(relief="ridge")
-    self.daCommandOA8.configure(selectbackground="#c4c4c4")
-    self.daCommandOA8.configure(takefocus="0")
-
-    self.daCommandOA7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA7.place(relx=0.503, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA7.configure(background="black")
-    self.daCommandOA7.configure(borderwidth="2")
-    self.daCommandOA7.configure(relief="ridge")
-    self.daCommandOA7.configure(selectbackground="#c4c4c4")
-    self.daCommandOA7.configure(takefocus="0")
-
-    self.daCommandOA6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA6.place(relx=0.572, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA6.configure(background="black")
-    self.daCommandOA6.configure(borderwidth="2")
-    self.daCommandOA6.configure(relief="ridge")
-    self.daCommandOA6.configure(selectbackground="#c4c4c4")
-    self.daCommandOA6.configure(takefocus="0")
-
-    self.daCommandOA5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA5.place(relx=0.641, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA5.configure(background="black")
-    self.daCommandOA5.configure(borderwidth="2")
-    self.daCommandOA5.configure(relief="ridge")
-    self.daCommandOA5.configure(selectbackground="#c4c4c4")
-    self.daCommandOA5.configure(takefocus="0")
-
-    self.daCommandOA4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA4.place(relx=0.709, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA4.configure(background="black")
-    self.daCommandOA4.configure(borderwidth="2")
-    self.daCommandOA4.configure(relief="ridge")
-    self.daCommandOA4.configure(selectbackground="#c4c4c4")
-    self.daCommandOA4.configure(takefocus="0")
-
-    self.daCommandOP4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOP4.place(relx=0.092, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOP4.configure(background="black")
-    self.daCommandOP4.configure(borderwidth="2")
-    self.daCommandOP4.configure(relief="ridge")
-    self.daCommandOP4.configure(selectbackground="#c4c4c4")
-    self.daCommandOP4.configure(takefocus="0")
-
-    self.daCommandOA3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA3.place(relx=0.778, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA3.configure(background="black")
-    self.daCommandOA3.configure(borderwidth="2")
-    self.daCommandOA3.configure(relief="ridge")
-    self.daCommandOA3.configure(selectbackground="#c4c4c4")
-    self.daCommandOA3.configure(takefocus="0")
-
-    self.daCommandOA2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA2.place(relx=0.847, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA2.configure(background="black")
-    self.daCommandOA2.configure(borderwidth="2")
-    self.daCommandOA2.configure(relief="ridge")
-    self.daCommandOA2.configure(selectbackground="#c4c4c4")
-    self.daCommandOA2.configure(takefocus="0")
-
-    self.daCommandOA1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daCommandOA1.place(relx=0.915, rely=0.789, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daCommandOA1.configure(background="black")
-    self.daCommandOA1.configure(borderwidth="2")
-    self.daCommandOA1.configure(relief="ridge")
-    self.daCommandOA1.configure(selectbackground="#c4c4c4")
-    self.daCommandOA1.configure(takefocus="0")
-
-    self.daComputerOP4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOP4.place(relx=0.092, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOP4.configure(background="black")
-    self.daComputerOP4.configure(borderwidth="2")
-    self.daComputerOP4.configure(relief="ridge")
-    self.daComputerOP4.configure(selectbackground="#c4c4c4")
-    self.daComputerOP4.configure(takefocus="0")
-
-    self.daComputerOP3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOP3.place(relx=0.16, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOP3.configure(background="black")
-    self.daComputerOP3.configure(borderwidth="2")
-    self.daComputerOP3.configure(relief="ridge")
-    self.daComputerOP3.configure(selectbackground="#c4c4c4")
-    self.daComputerOP3.configure(takefocus="0")
-
-    self.daComputerOP2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOP2.place(relx=0.229, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOP2.configure(background="black")
-    self.daComputerOP2.configure(borderwidth="2")
-    self.daComputerOP2.configure(relief="ridge")
-    self.daComputerOP2.configure(selectbackground="#c4c4c4")
-    self.daComputerOP2.configure(takefocus="0")
-
-    self.daComputerOP1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOP1.place(relx=0.297, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOP1.configure(background="black")
-    self.daComputerOP1.configure(borderwidth="2")
-    self.daComputerOP1.configure(relief="ridge")
-    self.daComputerOP1.configure(selectbackground="#c4c4c4")
-    self.daComputerOP1.configure(takefocus="0")
-
-    self.daComputerOA9 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA9.place(relx=0.366, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA9.configure(background="black")
-    self.daComputerOA9.configure(borderwidth="2")
-    self.daComputerOA9.configure(relief="ridge")
-    self.daComputerOA9.configure(selectbackground="#c4c4c4")
-    self.daComputerOA9.configure(takefocus="0")
-
-    self.daComputerOA8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA8.place(relx=0.435, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA8.configure(background="black")
-    self.daComputerOA8.configure(borderwidth="2")
-    self.daComputerOA8.configure(relief="ridge")
-    self.daComputerOA8.configure(selectbackground="#c4c4c4")
-    self.daComputerOA8.configure(takefocus="0")
-
-    self.daComputerOA7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA7.place(relx=0.503, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA7.configure(background="black")
-    self.daComputerOA7.configure(borderwidth="2")
-    self.daComputerOA7.configure(relief="ridge")
-    self.daComputerOA7.configure(selectbackground="#c4c4c4")
-    self.daComputerOA7.configure(takefocus="0")
-
-    self.daComputerOA6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA6.place(relx=0.572, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA6.configure(background="black")
-    self.daComputerOA6.configure(borderwidth="2")
-    self.daComputerOA6.configure(relief="ridge")
-    self.daComputerOA6.configure(selectbackground="#c4c4c4")
-    self.daComputerOA6.configure(takefocus="0")
-
-    self.daComputerOA5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA5.place(relx=0.641, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA5.configure(background="black")
-    self.daComputerOA5.configure(borderwidth="2")
-    self.daComputerOA5.configure(relief="ridge")
-    self.daComputerOA5.configure(selectbackground="#c4c4c4")
-    self.daComputerOA5.configure(takefocus="0")
-
-    self.daComputerOA4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA4.place(relx=0.709, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA4.configure(background="black")
-    self.daComputerOA4.configure(borderwidth="2")
-    self.daComputerOA4.configure(relief="ridge")
-    self.daComputerOA4.configure(selectbackground="#c4c4c4")
-    self.daComputerOA4.configure(takefocus="0")
-
-    self.daComputerOA3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA3.place(relx=0.778, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA3.configure(background="black")
-    self.daComputerOA3.configure(borderwidth="2")
-    self.daComputerOA3.configure(relief="ridge")
-    self.daComputerOA3.configure(selectbackground="#c4c4c4")
-    self.daComputerOA3.configure(takefocus="0")
-
-    self.daComputerOA2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA2.place(relx=0.847, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA2.configure(background="black")
-    self.daComputerOA2.configure(borderwidth="2")
-    self.daComputerOA2.configure(relief="ridge")
-    self.daComputerOA2.configure(selectbackground="#c4c4c4")
-    self.daComputerOA2.configure(takefocus="0")
-
-    self.daComputerOA1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p3)
-    self.daComputerOA1.place(relx=0.915, rely=0.639, relheight=0.158
-        , relwidth=0.069, bordermode='ignore')
-    self.daComputerOA1.configure(background="black")
-    self.daComputerOA1.configure(borderwidth="2")
-    self.daComputerOA1.configure(relief="ridge")
-    self.daComputerOA1.configure(selectbackground="#c4c4c4")
-    self.daComputerOA1.configure(takefocus="0")
-
     self.Label13_6 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p3)
     self.Label13_6.place(relx=0.103, rely=0.564, height=9, width=110
         , bordermode='ignore')
@@ -2724,177 +1059,6 @@ class topProcessorDisplayPanel:
     self.Label12_11.configure(font="-family {DejaVu Sans} -size 8")
     self.Label12_11.configure(text='''CMD''')
 
-    self.mlddCommand14 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand14.place(relx=0.503, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand14.configure(background="black")
-    self.mlddCommand14.configure(borderwidth="2")
-    self.mlddCommand14.configure(relief="ridge")
-    self.mlddCommand14.configure(selectbackground="#c4c4c4")
-    self.mlddCommand14.configure(takefocus="0")
-
-    self.mlddComputer17 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer17.place(relx=0.561, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer17.configure(background="black")
-    self.mlddComputer17.configure(borderwidth="2")
-    self.mlddComputer17.configure(relief="ridge")
-    self.mlddComputer17.configure(selectbackground="#c4c4c4")
-    self.mlddComputer17.configure(takefocus="0")
-
-    self.mlddCommand17 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand17.place(relx=0.606, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand17.configure(background="black")
-    self.mlddCommand17.configure(borderwidth="2")
-    self.mlddCommand17.configure(relief="ridge")
-    self.mlddCommand17.configure(selectbackground="#c4c4c4")
-    self.mlddCommand17.configure(takefocus="0")
-
-    self.mlddComputer20 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer20.place(relx=0.664, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer20.configure(background="black")
-    self.mlddComputer20.configure(borderwidth="2")
-    self.mlddComputer20.configure(relief="ridge")
-    self.mlddComputer20.configure(selectbackground="#c4c4c4")
-    self.mlddComputer20.configure(takefocus="0")
-
-    self.mlddCommand20 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand20.place(relx=0.709, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand20.configure(background="black")
-    self.mlddCommand20.configure(borderwidth="2")
-    self.mlddCommand20.configure(relief="ridge")
-    self.mlddCommand20.configure(selectbackground="#c4c4c4")
-    self.mlddCommand20.configure(takefocus="0")
-
-    self.mlddComputer23 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer23.place(relx=0.767, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer23.configure(background="black")
-    self.mlddComputer23.configure(borderwidth="2")
-    self.mlddComputer23.configure(relief="ridge")
-    self.mlddComputer23.configure(selectbackground="#c4c4c4")
-    self.mlddComputer23.configure(takefocus="0")
-
-    self.mlddCommand23 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand23.place(relx=0.812, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand23.configure(background="black")
-    self.mlddCommand23.configure(borderwidth="2")
-    self.mlddCommand23.configure(relief="ridge")
-    self.mlddCommand23.configure(selectbackground="#c4c4c4")
-    self.mlddCommand23.configure(takefocus="0")
-
-    self.mlddComputer14 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer14.place(relx=0.458, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer14.configure(background="black")
-    self.mlddComputer14.configure(borderwidth="2")
-    self.mlddComputer14.configure(relief="ridge")
-    self.mlddComputer14.configure(selectbackground="#c4c4c4")
-    self.mlddComputer14.configure(takefocus="0")
-
-    self.mlddCommand11 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand11.place(relx=0.4, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand11.configure(background="black")
-    self.mlddCommand11.configure(borderwidth="2")
-    self.mlddCommand11.configure(relief="ridge")
-    self.mlddCommand11.configure(selectbackground="#c4c4c4")
-    self.mlddCommand11.configure(takefocus="0")
-
-    self.mlddComputer11 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer11.place(relx=0.355, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer11.configure(background="black")
-    self.mlddComputer11.configure(borderwidth="2")
-    self.mlddComputer11.configure(relief="ridge")
-    self.mlddComputer11.configure(selectbackground="#c4c4c4")
-    self.mlddComputer11.configure(takefocus="0")
-
-    self.mlddCommand8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand8.place(relx=0.297, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand8.configure(background="black")
-    self.mlddCommand8.configure(borderwidth="2")
-    self.mlddCommand8.configure(relief="ridge")
-    self.mlddCommand8.configure(selectbackground="#c4c4c4")
-    self.mlddCommand8.configure(takefocus="0")
-
-    self.mlddComputer8 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer8.place(relx=0.252, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer8.configure(background="black")
-    self.mlddComputer8.configure(borderwidth="2")
-    self.mlddComputer8.configure(relief="ridge")
-    self.mlddComputer8.configure(selectbackground="#c4c4c4")
-    self.mlddComputer8.configure(takefocus="0")
-
-    self.mlddCommand5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand5.place(relx=0.195, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand5.configure(background="black")
-    self.mlddCommand5.configure(borderwidth="2")
-    self.mlddCommand5.configure(relief="ridge")
-    self.mlddCommand5.configure(selectbackground="#c4c4c4")
-    self.mlddCommand5.configure(takefocus="0")
-
-    self.mlddComputer5 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer5.place(relx=0.149, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer5.configure(background="black")
-    self.mlddComputer5.configure(borderwidth="2")
-    self.mlddComputer5.configure(relief="ridge")
-    self.mlddComputer5.configure(selectbackground="#c4c4c4")
-    self.mlddComputer5.configure(takefocus="0")
-
-    self.mlddCommand2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand2.place(relx=0.092, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand2.configure(background="black")
-    self.mlddCommand2.configure(borderwidth="2")
-    self.mlddCommand2.configure(relief="ridge")
-    self.mlddCommand2.configure(selectbackground="#c4c4c4")
-    self.mlddCommand2.configure(takefocus="0")
-
-    self.mlddComputer2 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer2.place(relx=0.046, rely=0.844, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer2.configure(background="black")
-    self.mlddComputer2.configure(borderwidth="2")
-    self.mlddComputer2.configure(relief="ridge")
-    self.mlddComputer2.configure(selectbackground="#c4c4c4")
-    self.mlddComputer2.configure(takefocus="0")
-
-    self.mlddComputer13 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer13.place(relx=0.458, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer13.configure(background="black")
-    self.mlddComputer13.configure(borderwidth="2")
-    self.mlddComputer13.configure(relief="ridge")
-    self.mlddComputer13.configure(selectbackground="#c4c4c4")
-    self.mlddComputer13.configure(takefocus="0")
-
-    self.mlddComputer12 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer12.place(relx=0.458, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer12.configure(background="black")
-    self.mlddComputer12.configure(borderwidth="2")
-    self.mlddComputer12.configure(relief="ridge")
-    self.mlddComputer12.configure(selectbackground="#c4c4c4")
-    self.mlddComputer12.configure(takefocus="0")
-
-    self.mlddCommandSYL0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommandSYL0.place(relx=0.458, rely=0.227, relheight=0.26
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommandSYL0.configure(background="black")
-    self.mlddCommandSYL0.configure(borderwidth="2")
-    self.mlddCommandSYL0.configure(relief="ridge")
-    self.mlddCommandSYL0.configure(selectbackground="#c4c4c4")
-    self.mlddCommandSYL0.configure(takefocus="0")
-
     self.Label13_9 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p4)
     self.Label13_9.place(relx=0.412, rely=0.097, height=9, width=80
         , bordermode='ignore')
@@ -2902,51 +1066,6 @@ class topProcessorDisplayPanel:
     self.Label13_9.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_9.configure(text='''-----PARITY BIT-----''')
 
-    self.mlddComputerBR1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputerBR1.place(relx=0.503, rely=0.227, relheight=0.26
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputerBR1.configure(background="black")
-    self.mlddComputerBR1.configure(borderwidth="2")
-    self.mlddComputerBR1.configure(relief="ridge")
-    self.mlddComputerBR1.configure(selectbackground="#c4c4c4")
-    self.mlddComputerBR1.configure(takefocus="0")
-
-    self.mlddCommandSYL1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommandSYL1.place(relx=0.549, rely=0.227, relheight=0.26
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommandSYL1.configure(background="black")
-    self.mlddCommandSYL1.configure(borderwidth="2")
-    self.mlddCommandSYL1.configure(relief="ridge")
-    self.mlddCommandSYL1.configure(selectbackground="#c4c4c4")
-    self.mlddCommandSYL1.configure(takefocus="0")
-
-    self.mlddComputerBR0 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputerBR0.place(relx=0.412, rely=0.227, relheight=0.26
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputerBR0.configure(background="black")
-    self.mlddComputerBR0.configure(borderwidth="2")
-    self.mlddComputerBR0.configure(relief="ridge")
-    self.mlddComputerBR0.configure(selectbackground="#c4c4c4")
-    self.mlddComputerBR0.configure(takefocus="0")
-
-    self.mlddLAMP_TEST = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddLAMP_TEST.place(relx=0.149, rely=0.227, relheight=0.266
-        , relwidth=0.092, bordermode='ignore')
-    self.mlddLAMP_TEST.configure(background="black")
-    self.mlddLAMP_TEST.configure(borderwidth="2")
-    self.mlddLAMP_TEST.configure(relief="ridge")
-    self.mlddLAMP_TEST.configure(selectbackground="#c4c4c4")
-    self.mlddLAMP_TEST.configure(takefocus="0")
-
-    self.mlddPARITY_BIT = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddPARITY_BIT.place(relx=0.767, rely=0.227, relheight=0.266
-        , relwidth=0.092, bordermode='ignore')
-    self.mlddPARITY_BIT.configure(background="black")
-    self.mlddPARITY_BIT.configure(borderwidth="2")
-    self.mlddPARITY_BIT.configure(relief="ridge")
-    self.mlddPARITY_BIT.configure(selectbackground="#c4c4c4")
-    self.mlddPARITY_BIT.configure(takefocus="0")
-
     self.Label13_13 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p4)
     self.Label13_13.place(relx=0.732, rely=0.162, height=9, width=70
         , bordermode='ignore')
@@ -2954,312 +1073,6 @@ class topProcessorDisplayPanel:
     self.Label13_13.configure(font="-family {DejaVu Sans} -size 8")
     self.Label13_13.configure(text='''SERIALIZER''')
 
-    self.mlddCommand25 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand25.place(relx=0.915, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand25.configure(background="black")
-    self.mlddCommand25.configure(borderwidth="2")
-    self.mlddCommand25.configure(relief="ridge")
-    self.mlddCommand25.configure(selectbackground="#c4c4c4")
-    self.mlddCommand25.configure(takefocus="0")
-
-    self.mlddCommand24 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand24.place(relx=0.915, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand24.configure(background="black")
-    self.mlddCommand24.configure(borderwidth="2")
-    self.mlddCommand24.configure(relief="ridge")
-    self.mlddCommand24.configure(selectbackground="#c4c4c4")
-    self.mlddCommand24.configure(takefocus="0")
-
-    self.mlddComputer25 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer25.place(relx=0.87, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer25.configure(background="black")
-    self.mlddComputer25.configure(borderwidth="2")
-    self.mlddComputer25.configure(relief="ridge")
-    self.mlddComputer25.configure(selectbackground="#c4c4c4")
-    self.mlddComputer25.configure(takefocus="0")
-
-    self.mlddComputer24 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer24.place(relx=0.87, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer24.configure(background="black")
-    self.mlddComputer24.configure(borderwidth="2")
-    self.mlddComputer24.configure(relief="ridge")
-    self.mlddComputer24.configure(selectbackground="#c4c4c4")
-    self.mlddComputer24.configure(takefocus="0")
-
-    self.mlddComputer1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer1.place(relx=0.046, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer1.configure(background="black")
-    self.mlddComputer1.configure(borderwidth="2")
-    self.mlddComputer1.configure(relief="ridge")
-    self.mlddComputer1.configure(selectbackground="#c4c4c4")
-    self.mlddComputer1.configure(takefocus="0")
-
-    self.mlddComputerSIGN = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputerSIGN.place(relx=0.046, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputerSIGN.configure(background="black")
-    self.mlddComputerSIGN.configure(borderwidth="2")
-    self.mlddComputerSIGN.configure(relief="ridge")
-    self.mlddComputerSIGN.configure(selectbackground="#c4c4c4")
-    self.mlddComputerSIGN.configure(takefocus="0")
-
-    self.mlddCommand1 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand1.place(relx=0.092, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand1.configure(background="black")
-    self.mlddCommand1.configure(borderwidth="2")
-    self.mlddCommand1.configure(relief="ridge")
-    self.mlddCommand1.configure(selectbackground="#c4c4c4")
-    self.mlddCommand1.configure(takefocus="0")
-
-    self.mlddCommandSIGN = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommandSIGN.place(relx=0.092, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommandSIGN.configure(background="black")
-    self.mlddCommandSIGN.configure(borderwidth="2")
-    self.mlddCommandSIGN.configure(relief="ridge")
-    self.mlddCommandSIGN.configure(selectbackground="#c4c4c4")
-    self.mlddCommandSIGN.configure(takefocus="0")
-
-    self.mlddComputer4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer4.place(relx=0.149, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer4.configure(background="black")
-    self.mlddComputer4.configure(borderwidth="2")
-    self.mlddComputer4.configure(relief="ridge")
-    self.mlddComputer4.configure(selectbackground="#c4c4c4")
-    self.mlddComputer4.configure(takefocus="0")
-
-    self.mlddComputer3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer3.place(relx=0.149, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer3.configure(background="black")
-    self.mlddComputer3.configure(borderwidth="2")
-    self.mlddComputer3.configure(relief="ridge")
-    self.mlddComputer3.configure(selectbackground="#c4c4c4")
-    self.mlddComputer3.configure(takefocus="0")
-
-    self.mlddCommand4 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand4.place(relx=0.195, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand4.configure(background="black")
-    self.mlddCommand4.configure(borderwidth="2")
-    self.mlddCommand4.configure(relief="ridge")
-    self.mlddCommand4.configure(selectbackground="#c4c4c4")
-    self.mlddCommand4.configure(takefocus="0")
-
-    self.mlddCommand3 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand3.place(relx=0.195, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand3.configure(background="black")
-    self.mlddCommand3.configure(borderwidth="2")
-    self.mlddCommand3.configure(relief="ridge")
-    self.mlddCommand3.configure(selectbackground="#c4c4c4")
-    self.mlddCommand3.configure(takefocus="0")
-
-    self.mlddComputer7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer7.place(relx=0.252, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer7.configure(background="black")
-    self.mlddComputer7.configure(borderwidth="2")
-    self.mlddComputer7.configure(relief="ridge")
-    self.mlddComputer7.configure(selectbackground="#c4c4c4")
-    self.mlddComputer7.configure(takefocus="0")
-
-    self.mlddComputer6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer6.place(relx=0.252, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer6.configure(background="black")
-    self.mlddComputer6.configure(borderwidth="2")
-    self.mlddComputer6.configure(relief="ridge")
-    self.mlddComputer6.configure(selectbackground="#c4c4c4")
-    self.mlddComputer6.configure(takefocus="0")
-
-    self.mlddCommand7 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand7.place(relx=0.297, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand7.configure(background="black")
-    self.mlddCommand7.configure(borderwidth="2")
-    self.mlddCommand7.configure(relief="ridge")
-    self.mlddCommand7.configure(selectbackground="#c4c4c4")
-    self.mlddCommand7.configure(takefocus="0")
-
-    self.mlddCommand6 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand6.place(relx=0.297, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand6.configure(background="black")
-    self.mlddCommand6.configure(borderwidth="2")
-    self.mlddCommand6.configure(relief="ridge")
-    self.mlddCommand6.configure(selectbackground="#c4c4c4")
-    self.mlddCommand6.configure(takefocus="0")
-
-    self.mlddComputer10 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer10.place(relx=0.355, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer10.configure(background="black")
-    self.mlddComputer10.configure(borderwidth="2")
-    self.mlddComputer10.configure(relief="ridge")
-    self.mlddComputer10.configure(selectbackground="#c4c4c4")
-    self.mlddComputer10.configure(takefocus="0")
-
-    self.mlddComputer9 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer9.place(relx=0.355, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer9.configure(background="black")
-    self.mlddComputer9.configure(borderwidth="2")
-    self.mlddComputer9.configure(relief="ridge")
-    self.mlddComputer9.configure(selectbackground="#c4c4c4")
-    self.mlddComputer9.configure(takefocus="0")
-
-    self.mlddCommand10 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand10.place(relx=0.4, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand10.configure(background="black")
-    self.mlddCommand10.configure(borderwidth="2")
-    self.mlddCommand10.configure(relief="ridge")
-    self.mlddCommand10.configure(selectbackground="#c4c4c4")
-    self.mlddCommand10.configure(takefocus="0")
-
-    self.mlddCommand9 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand9.place(relx=0.4, rely=0.584, relheight=0.136, relwidth=0.048
-        , bordermode='ignore')
-    self.mlddCommand9.configure(background="black")
-    self.mlddCommand9.configure(borderwidth="2")
-    self.mlddCommand9.configure(relief="ridge")
-    self.mlddCommand9.configure(selectbackground="#c4c4c4")
-    self.mlddCommand9.configure(takefocus="0")
-
-    self.mlddCommand13 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand13.place(relx=0.503, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand13.configure(background="black")
-    self.mlddCommand13.configure(borderwidth="2")
-    self.mlddCommand13.configure(relief="ridge")
-    self.mlddCommand13.configure(selectbackground="#c4c4c4")
-    self.mlddCommand13.configure(takefocus="0")
-
-    self.mlddCommand12 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand12.place(relx=0.503, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand12.configure(background="black")
-    self.mlddCommand12.configure(borderwidth="2")
-    self.mlddCommand12.configure(relief="ridge")
-    self.mlddCommand12.configure(selectbackground="#c4c4c4")
-    self.mlddCommand12.configure(takefocus="0")
-
-    self.mlddComputer16 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer16.place(relx=0.561, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer16.configure(background="black")
-    self.mlddComputer16.configure(borderwidth="2")
-    self.mlddComputer16.configure(relief="ridge")
-    self.mlddComputer16.configure(selectbackground="#c4c4c4")
-    self.mlddComputer16.configure(takefocus="0")
-
-    self.mlddComputer15 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer15.place(relx=0.561, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer15.configure(background="black")
-    self.mlddComputer15.configure(borderwidth="2")
-    self.mlddComputer15.configure(relief="ridge")
-    self.mlddComputer15.configure(selectbackground="#c4c4c4")
-    self.mlddComputer15.configure(takefocus="0")
-
-    self.mlddCommand16 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand16.place(relx=0.606, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand16.configure(background="black")
-    self.mlddCommand16.configure(borderwidth="2")
-    self.mlddCommand16.configure(relief="ridge")
-    self.mlddCommand16.configure(selectbackground="#c4c4c4")
-    self.mlddCommand16.configure(takefocus="0")
-
-    self.mlddCommand15 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand15.place(relx=0.606, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand15.configure(background="black")
-    self.mlddCommand15.configure(borderwidth="2")
-    self.mlddCommand15.configure(relief="ridge")
-    self.mlddCommand15.configure(selectbackground="#c4c4c4")
-    self.mlddCommand15.configure(takefocus="0")
-
-    self.mlddComputer19 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer19.place(relx=0.664, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer19.configure(background="black")
-    self.mlddComputer19.configure(borderwidth="2")
-    self.mlddComputer19.configure(relief="ridge")
-    self.mlddComputer19.configure(selectbackground="#c4c4c4")
-    self.mlddComputer19.configure(takefocus="0")
-
-    self.mlddComputer18 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer18.place(relx=0.664, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer18.configure(background="black")
-    self.mlddComputer18.configure(borderwidth="2")
-    self.mlddComputer18.configure(relief="ridge")
-    self.mlddComputer18.configure(selectbackground="#c4c4c4")
-    self.mlddComputer18.configure(takefocus="0")
-
-    self.mlddCommand19 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand19.place(relx=0.709, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand19.configure(background="black")
-    self.mlddCommand19.configure(borderwidth="2")
-    self.mlddCommand19.configure(relief="ridge")
-    self.mlddCommand19.configure(selectbackground="#c4c4c4")
-    self.mlddCommand19.configure(takefocus="0")
-
-    self.mlddCommand18 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand18.place(relx=0.709, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand18.configure(background="black")
-    self.mlddCommand18.configure(borderwidth="2")
-    self.mlddCommand18.configure(relief="ridge")
-    self.mlddCommand18.configure(selectbackground="#c4c4c4")
-    self.mlddCommand18.configure(takefocus="0")
-
-    self.mlddComputer22 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer22.place(relx=0.767, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer22.configure(background="black")
-    self.mlddComputer22.configure(borderwidth="2")
-    self.mlddComputer22.configure(relief="ridge")
-    self.mlddComputer22.configure(selectbackground="#c4c4c4")
-    self.mlddComputer22.configure(takefocus="0")
-
-    self.mlddComputer21 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddComputer21.place(relx=0.767, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddComputer21.configure(background="black")
-    self.mlddComputer21.configure(borderwidth="2")
-    self.mlddComputer21.configure(relief="ridge")
-    self.mlddComputer21.configure(selectbackground="#c4c4c4")
-    self.mlddComputer21.configure(takefocus="0")
-
-    self.mlddCommand22 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand22.place(relx=0.812, rely=0.714, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand22.configure(background="black")
-    self.mlddCommand22.configure(borderwidth="2")
-    self.mlddCommand22.configure(relief="ridge")
-    self.mlddCommand22.configure(selectbackground="#c4c4c4")
-    self.mlddCommand22.configure(takefocus="0")
-
-    self.mlddCommand21 = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p4)
-    self.mlddCommand21.place(relx=0.812, rely=0.584, relheight=0.136
-        , relwidth=0.048, bordermode='ignore')
-    self.mlddCommand21.configure(background="black")
-    self.mlddCommand21.configure(borderwidth="2")
-    self.mlddCommand21.configure(relief="ridge")
-    self.mlddCommand21.configure(selectbackground="#c4c4c4")
-    self.mlddCommand21.configure(takefocus="0")
-
     self.Label12_9 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p4)
     self.Label12_9.place(relx=0.023, rely=0.519, height=11, width=32
         , bordermode='ignore')
@@ -3355,96 +1168,6 @@ class topProcessorDisplayPanel:
     self.TPanedwindow2.add(self.TPanedwindow2_p2, weight=2)
     self.__funcid3 = self.TPanedwindow2.bind('<Map>', self.__adjust_sash3)
 
-    self.ERROR_RESET = tk.Canvas(self.TPanedwindow2_p1)
-    self.ERROR_RESET.place(relx=0.671, rely=0.39, relheight=0.532, relwidth=0.152
-        , bordermode='ignore')
-    self.ERROR_RESET.configure(background="black")
-    self.ERROR_RESET.configure(borderwidth="2")
-    self.ERROR_RESET.configure(relief="ridge")
-    self.ERROR_RESET.configure(selectbackground="#c4c4c4")
-    self.ERROR_RESET.configure(takefocus="0")
-
-    self.INVERT_ERROR = tk.Canvas(self.TPanedwindow2_p1)
-    self.INVERT_ERROR.place(relx=0.823, rely=0.39, relheight=0.532
-        , relwidth=0.152, bordermode='ignore')
-    self.INVERT_ERROR.configure(background="black")
-    self.INVERT_ERROR.configure(borderwidth="2")
-    self.INVERT_ERROR.configure(relief="ridge")
-    self.INVERT_ERROR.configure(selectbackground="#c4c4c4")
-    self.INVERT_ERROR.configure(takefocus="0")
-
-    self.BR14 = tk.Canvas(self.TPanedwindow2_p1)
-    self.BR14.place(relx=0.541, rely=0.649, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.BR14.configure(background="black")
-    self.BR14.configure(borderwidth="2")
-    self.BR14.configure(relief="ridge")
-    self.BR14.configure(selectbackground="#c4c4c4")
-    self.BR14.configure(takefocus="0")
-
-    self.SSMBR = tk.Canvas(self.TPanedwindow2_p1)
-    self.SSMBR.place(relx=0.411, rely=0.649, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.SSMBR.configure(background="black")
-    self.SSMBR.configure(borderwidth="2")
-    self.SSMBR.configure(relief="ridge")
-    self.SSMBR.configure(selectbackground="#c4c4c4")
-    self.SSMBR.configure(takefocus="0")
-
-    self.HOPC1 = tk.Canvas(self.TPanedwindow2_p1)
-    self.HOPC1.place(relx=0.281, rely=0.649, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.HOPC1.configure(background="black")
-    self.HOPC1.configure(borderwidth="2")
-    self.HOPC1.configure(relief="ridge")
-    self.HOPC1.configure(selectbackground="#c4c4c4")
-    self.HOPC1.configure(takefocus="0")
-
-    self.PARITY_SERIAL = tk.Canvas(self.TPanedwindow2_p1)
-    self.PARITY_SERIAL.place(relx=0.022, rely=0.649, relheight=0.273
-        , relwidth=0.13, bordermode='ignore')
-    self.PARITY_SERIAL.configure(background="black")
-    self.PARITY_SERIAL.configure(borderwidth="2")
-    self.PARITY_SERIAL.configure(relief="ridge")
-    self.PARITY_SERIAL.configure(selectbackground="#c4c4c4")
-    self.PARITY_SERIAL.configure(takefocus="0")
-
-    self.OAC = tk.Canvas(self.TPanedwindow2_p1)
-    self.OAC.place(relx=0.541, rely=0.39, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.OAC.configure(background="black")
-    self.OAC.configure(borderwidth="2")
-    self.OAC.configure(relief="ridge")
-    self.OAC.configure(selectbackground="#c4c4c4")
-    self.OAC.configure(takefocus="0")
-
-    self.SSMSC = tk.Canvas(self.TPanedwindow2_p1)
-    self.SSMSC.place(relx=0.411, rely=0.39, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.SSMSC.configure(background="black")
-    self.SSMSC.configure(borderwidth="2")
-    self.SSMSC.configure(relief="ridge")
-    self.SSMSC.configure(selectbackground="#c4c4c4")
-    self.SSMSC.configure(takefocus="0")
-
-    self.SERIAL = tk.Canvas(self.TPanedwindow2_p1)
-    self.SERIAL.place(relx=0.281, rely=0.39, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.SERIAL.configure(background="black")
-    self.SERIAL.configure(borderwidth="2")
-    self.SERIAL.configure(relief="ridge")
-    self.SERIAL.configure(selectbackground="#c4c4c4")
-    self.SERIAL.configure(takefocus="0")
-
-    self.TRS = tk.Canvas(self.TPanedwindow2_p1)
-    self.TRS.place(relx=0.152, rely=0.39, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.TRS.configure(background="black")
-    self.TRS.configure(borderwidth="2")
-    self.TRS.configure(relief="ridge")
-    self.TRS.configure(selectbackground="#c4c4c4")
-    self.TRS.configure(takefocus="0")
-
     self.Label12_14 = tk.Label(self.TPanedwindow2_p1)
     self.Label12_14.place(relx=0.009, rely=0.26, height=11, width=37
         , bordermode='ignore')
@@ -3459,69 +1182,6 @@ class topProcessorDisplayPanel:
     self.Label12_14.configure(font="-family {DejaVu Sans} -size 8")
     self.Label12_14.configure(text='''----------COMPARE----------''')
 
-    self.A13 = tk.Canvas(self.TPanedwindow2_p1)
-    self.A13.place(relx=0.152, rely=0.649, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.A13.configure(background="black")
-    self.A13.configure(borderwidth="2")
-    self.A13.configure(relief="ridge")
-    self.A13.configure(selectbackground="#c4c4c4")
-    self.A13.configure(takefocus="0")
-
-    self.PARITY_TAPE = tk.Canvas(self.TPanedwindow2_p1)
-    self.PARITY_TAPE.place(relx=0.022, rely=0.39, relheight=0.273, relwidth=0.13
-        , bordermode='ignore')
-    self.PARITY_TAPE.configure(background="black")
-    self.PARITY_TAPE.configure(borderwidth="2")
-    self.PARITY_TAPE.configure(relief="ridge")
-    self.PARITY_TAPE.configure(selectbackground="#c4c4c4")
-    self.PARITY_TAPE.configure(takefocus="0")
-
-    self.mlREPEAT = tk.Canvas(self.TPanedwindow2_p2)
-    self.mlREPEAT.place(relx=0.025, rely=0.39, relheight=0.273, relwidth=0.199
-        , bordermode='ignore')
-    self.mlREPEAT.configure(background="black")
-    self.mlREPEAT.configure(borderwidth="2")
-    self.mlREPEAT.configure(relief="ridge")
-    self.mlREPEAT.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT.configure(takefocus="0")
-
-    self.mlREPEAT_INVERSE = tk.Canvas(self.TPanedwindow2_p2)
-    self.mlREPEAT_INVERSE.place(relx=0.025, rely=0.649, relheight=0.273
-        , relwidth=0.199, bordermode='ignore')
-    self.mlREPEAT_INVERSE.configure(background="black")
-    self.mlREPEAT_INVERSE.configure(borderwidth="2")
-    self.mlREPEAT_INVERSE.configure(relief="ridge")
-    self.mlREPEAT_INVERSE.configure(selectbackground="#c4c4c4")
-    self.mlREPEAT_INVERSE.configure(takefocus="0")
-
-    self.mlADDRESS_CMPTR = tk.Canvas(self.TPanedwindow2_p2)
-    self.mlADDRESS_CMPTR.place(relx=0.224, rely=0.39, relheight=0.532
-        , relwidth=0.249, bordermode='ignore')
-    self.mlADDRESS_CMPTR.configure(background="black")
-    self.mlADDRESS_CMPTR.configure(borderwidth="2")
-    self.mlADDRESS_CMPTR.configure(relief="ridge")
-    self.mlADDRESS_CMPTR.configure(selectbackground="#c4c4c4")
-    self.mlADDRESS_CMPTR.configure(takefocus="0")
-
-    self.mlCOMPTR_DISPLAY_RESET = tk.Canvas(self.TPanedwindow2_p2)
-    self.mlCOMPTR_DISPLAY_RESET.place(relx=0.473, rely=0.39, relheight=0.532
-        , relwidth=0.249, bordermode='ignore')
-    self.mlCOMPTR_DISPLAY_RESET.configure(background="black")
-    self.mlCOMPTR_DISPLAY_RESET.configure(borderwidth="2")
-    self.mlCOMPTR_DISPLAY_RESET.configure(relief="ridge")
-    self.mlCOMPTR_DISPLAY_RESET.configure(selectbackground="#c4c4c4")
-    self.mlCOMPTR_DISPLAY_RESET.configure(takefocus="0")
-
-    self.mlCOMMAND_DISPLAY_RESET = tk.Canvas(self.TPanedwindow2_p2)
-    self.mlCOMMAND_DISPLAY_RESET.place(relx=0.721, rely=0.39, relheight=0.532
-        , relwidth=0.249, bordermode='ignore')
-    self.mlCOMMAND_DISPLAY_RESET.configure(background="black")
-    self.mlCOMMAND_DISPLAY_RESET.configure(borderwidth="2")
-    self.mlCOMMAND_DISPLAY_RESET.configure(relief="ridge")
-    self.mlCOMMAND_DISPLAY_RESET.configure(selectbackground="#c4c4c4")
-    self.mlCOMMAND_DISPLAY_RESET.configure(takefocus="0")
-
     self.frameDisplaySelect = tk.LabelFrame(self.paneMemoryLoadAndDataDisplayPanel_p7)
     self.frameDisplaySelect.place(relx=0.023, rely=0.112, relheight=0.859
         , relwidth=0.343, bordermode='ignore')
@@ -3685,24 +1345,6 @@ class topProcessorDisplayPanel:
     self.Label18_28.configure(font="-family {DejaVu Sans} -size -12")
     self.Label18_28.configure(text='''CYCLE''')
 
-    self.acDATA = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p7)
-    self.acDATA.place(relx=0.423, rely=0.588, relheight=0.124, relwidth=0.069
-        , bordermode='ignore')
-    self.acDATA.configure(background="black")
-    self.acDATA.configure(borderwidth="2")
-    self.acDATA.configure(relief="ridge")
-    self.acDATA.configure(selectbackground="#c4c4c4")
-    self.acDATA.configure(takefocus="0")
-
-    self.acINS = tk.Canvas(self.paneMemoryLoadAndDataDisplayPanel_p7)
-    self.acINS.place(relx=0.423, rely=0.706, relheight=0.124, relwidth=0.069
-        , bordermode='ignore')
-    self.acINS.configure(background="black")
-    self.acINS.configure(borderwidth="2")
-    self.acINS.configure(relief="ridge")
-    self.acINS.configure(selectbackground="#c4c4c4")
-    self.acINS.configure(takefocus="0")
-
     self.Label12 = tk.Label(self.paneMemoryLoadAndDataDisplayPanel_p7)
     self.Label12.place(relx=0.389, rely=0.5, height=12, width=62
         , bordermode='ignore')
@@ -3741,807 +1383,6 @@ class topProcessorDisplayPanel:
     self.Label11.configure(font="-family {DejaVu Sans} -size 12")
     self.Label11.configure(text='''C. E. PANEL''')
 
-    self.A_S = tk.Canvas(self.paneCEPanel_p2)
-    self.A_S.place(relx=0.047, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.A_S.configure(background="black")
-    self.A_S.configure(borderwidth="2")
-    self.A_S.configure(relief="ridge")
-    self.A_S.configure(selectbackground="#c4c4c4")
-    self.A_S.configure(takefocus="0")
-
-    self.DLA14 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA14.place(relx=0.047, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA14.configure(background="black")
-    self.DLA14.configure(borderwidth="2")
-    self.DLA14.configure(relief="ridge")
-    self.DLA14.configure(selectbackground="#c4c4c4")
-    self.DLA14.configure(takefocus="0")
-
-    self.DLA27 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA27.place(relx=0.047, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA27.configure(background="black")
-    self.DLA27.configure(borderwidth="2")
-    self.DLA27.configure(relief="ridge")
-    self.DLA27.configure(selectbackground="#c4c4c4")
-    self.DLA27.configure(takefocus="0")
-
-    self.DLB8 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB8.place(relx=0.047, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB8.configure(background="black")
-    self.DLB8.configure(borderwidth="2")
-    self.DLB8.configure(relief="ridge")
-    self.DLB8.configure(selectbackground="#c4c4c4")
-    self.DLB8.configure(takefocus="0")
-
-    self.DLB21 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB21.place(relx=0.047, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB21.configure(background="black")
-    self.DLB21.configure(borderwidth="2")
-    self.DLB21.configure(relief="ridge")
-    self.DLB21.configure(selectbackground="#c4c4c4")
-    self.DLB21.configure(takefocus="0")
-
-    self.DLA2 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA2.place(relx=0.116, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA2.configure(background="black")
-    self.DLA2.configure(borderwidth="2")
-    self.DLA2.configure(relief="ridge")
-    self.DLA2.configure(selectbackground="#c4c4c4")
-    self.DLA2.configure(takefocus="0")
-
-    self.DLA3 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA3.place(relx=0.186, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA3.configure(background="black")
-    self.DLA3.configure(borderwidth="2")
-    self.DLA3.configure(relief="ridge")
-    self.DLA3.configure(selectbackground="#c4c4c4")
-    self.DLA3.configure(takefocus="0")
-
-    self.DLA4 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA4.place(relx=0.256, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA4.configure(background="black")
-    self.DLA4.configure(borderwidth="2")
-    self.DLA4.configure(relief="ridge")
-    self.DLA4.configure(selectbackground="#c4c4c4")
-    self.DLA4.configure(takefocus="0")
-
-    self.DLA5 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA5.place(relx=0.326, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA5.configure(background="black")
-    self.DLA5.configure(borderwidth="2")
-    self.DLA5.configure(relief="ridge")
-    self.DLA5.configure(selectbackground="#c4c4c4")
-    self.DLA5.configure(takefocus="0")
-
-    self.DLA6 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA6.place(relx=0.395, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA6.configure(background="black")
-    self.DLA6.configure(borderwidth="2")
-    self.DLA6.configure(relief="ridge")
-    self.DLA6.configure(selectbackground="#c4c4c4")
-    self.DLA6.configure(takefocus="0")
-
-    self.DLA7 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA7.place(relx=0.465, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA7.configure(background="black")
-    self.DLA7.configure(borderwidth="2")
-    self.DLA7.configure(relief="ridge")
-    self.DLA7.configure(selectbackground="#c4c4c4")
-    self.DLA7.configure(takefocus="0")
-
-    self.DLA8 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA8.place(relx=0.535, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA8.configure(background="black")
-    self.DLA8.configure(borderwidth="2")
-    self.DLA8.configure(relief="ridge")
-    self.DLA8.configure(selectbackground="#c4c4c4")
-    self.DLA8.configure(takefocus="0")
-
-    self.DLA9 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA9.place(relx=0.605, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA9.configure(background="black")
-    self.DLA9.configure(borderwidth="2")
-    self.DLA9.configure(relief="ridge")
-    self.DLA9.configure(selectbackground="#c4c4c4")
-    self.DLA9.configure(takefocus="0")
-
-    self.DLA10 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA10.place(relx=0.674, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA10.configure(background="black")
-    self.DLA10.configure(borderwidth="2")
-    self.DLA10.configure(relief="ridge")
-    self.DLA10.configure(selectbackground="#c4c4c4")
-    self.DLA10.configure(takefocus="0")
-
-    self.DLA11 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA11.place(relx=0.744, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA11.configure(background="black")
-    self.DLA11.configure(borderwidth="2")
-    self.DLA11.configure(relief="ridge")
-    self.DLA11.configure(selectbackground="#c4c4c4")
-    self.DLA11.configure(takefocus="0")
-
-    self.DLA12 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA12.place(relx=0.814, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA12.configure(background="black")
-    self.DLA12.configure(borderwidth="2")
-    self.DLA12.configure(relief="ridge")
-    self.DLA12.configure(selectbackground="#c4c4c4")
-    self.DLA12.configure(takefocus="0")
-
-    self.DLA13 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA13.place(relx=0.884, rely=0.1, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA13.configure(background="black")
-    self.DLA13.configure(borderwidth="2")
-    self.DLA13.configure(relief="ridge")
-    self.DLA13.configure(selectbackground="#c4c4c4")
-    self.DLA13.configure(takefocus="0")
-
-    self.DLA15 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA15.place(relx=0.116, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA15.configure(background="black")
-    self.DLA15.configure(borderwidth="2")
-    self.DLA15.configure(relief="ridge")
-    self.DLA15.configure(selectbackground="#c4c4c4")
-    self.DLA15.configure(takefocus="0")
-
-    self.DLA16 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA16.place(relx=0.186, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA16.configure(background="black")
-    self.DLA16.configure(borderwidth="2")
-    self.DLA16.configure(relief="ridge")
-    self.DLA16.configure(selectbackground="#c4c4c4")
-    self.DLA16.configure(takefocus="0")
-
-    self.DLA17 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA17.place(relx=0.256, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA17.configure(background="black")
-    self.DLA17.configure(borderwidth="2")
-    self.DLA17.configure(relief="ridge")
-    self.DLA17.configure(selectbackground="#c4c4c4")
-    self.DLA17.configure(takefocus="0")
-
-    self.DLA18 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA18.place(relx=0.326, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA18.configure(background="black")
-    self.DLA18.configure(borderwidth="2")
-    self.DLA18.configure(relief="ridge")
-    self.DLA18.configure(selectbackground="#c4c4c4")
-    self.DLA18.configure(takefocus="0")
-
-    self.DLA19 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA19.place(relx=0.395, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA19.configure(background="black")
-    self.DLA19.configure(borderwidth="2")
-    self.DLA19.configure(relief="ridge")
-    self.DLA19.configure(selectbackground="#c4c4c4")
-    self.DLA19.configure(takefocus="0")
-
-    self.DLA20 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA20.place(relx=0.465, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA20.configure(background="black")
-    self.DLA20.configure(borderwidth="2")
-    self.DLA20.configure(relief="ridge")
-    self.DLA20.configure(selectbackground="#c4c4c4")
-    self.DLA20.configure(takefocus="0")
-
-    self.DLA21 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA21.place(relx=0.535, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA21.configure(background="black")
-    self.DLA21.configure(borderwidth="2")
-    self.DLA21.configure(relief="ridge")
-    self.DLA21.configure(selectbackground="#c4c4c4")
-    self.DLA21.configure(takefocus="0")
-
-    self.DLA22 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA22.place(relx=0.605, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA22.configure(background="black")
-    self.DLA22.configure(borderwidth="2")
-    self.DLA22.configure(relief="ridge")
-    self.DLA22.configure(selectbackground="#c4c4c4")
-    self.DLA22.configure(takefocus="0")
-
-    self.DLA23 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA23.place(relx=0.674, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA23.configure(background="black")
-    self.DLA23.configure(borderwidth="2")
-    self.DLA23.configure(relief="ridge")
-    self.DLA23.configure(selectbackground="#c4c4c4")
-    self.DLA23.configure(takefocus="0")
-
-    self.DLA24 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA24.place(relx=0.744, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA24.configure(background="black")
-    self.DLA24.configure(borderwidth="2")
-    self.DLA24.configure(relief="ridge")
-    self.DLA24.configure(selectbackground="#c4c4c4")
-    self.DLA24.configure(takefocus="0")
-
-    self.DLA25 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA25.place(relx=0.814, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA25.configure(background="black")
-    self.DLA25.configure(borderwidth="2")
-    self.DLA25.configure(relief="ridge")
-    self.DLA25.configure(selectbackground="#c4c4c4")
-    self.DLA25.configure(takefocus="0")
-
-    self.DLA26 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA26.place(relx=0.884, rely=0.233, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA26.configure(background="black")
-    self.DLA26.configure(borderwidth="2")
-    self.DLA26.configure(relief="ridge")
-    self.DLA26.configure(selectbackground="#c4c4c4")
-    self.DLA26.configure(takefocus="0")
-
-    self.DLA28 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA28.place(relx=0.116, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA28.configure(background="black")
-    self.DLA28.configure(borderwidth="2")
-    self.DLA28.configure(relief="ridge")
-    self.DLA28.configure(selectbackground="#c4c4c4")
-    self.DLA28.configure(takefocus="0")
-
-    self.DLA29 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA29.place(relx=0.186, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA29.configure(background="black")
-    self.DLA29.configure(borderwidth="2")
-    self.DLA29.configure(relief="ridge")
-    self.DLA29.configure(selectbackground="#c4c4c4")
-    self.DLA29.configure(takefocus="0")
-
-    self.DLA30 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLA30.place(relx=0.256, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLA30.configure(background="black")
-    self.DLA30.configure(borderwidth="2")
-    self.DLA30.configure(relief="ridge")
-    self.DLA30.configure(selectbackground="#c4c4c4")
-    self.DLA30.configure(takefocus="0")
-
-    self.ACC0 = tk.Canvas(self.paneCEPanel_p2)
-    self.ACC0.place(relx=0.326, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.ACC0.configure(background="black")
-    self.ACC0.configure(borderwidth="2")
-    self.ACC0.configure(relief="ridge")
-    self.ACC0.configure(selectbackground="#c4c4c4")
-    self.ACC0.configure(takefocus="0")
-
-    self.ACC1 = tk.Canvas(self.paneCEPanel_p2)
-    self.ACC1.place(relx=0.395, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.ACC1.configure(background="black")
-    self.ACC1.configure(borderwidth="2")
-    self.ACC1.configure(relief="ridge")
-    self.ACC1.configure(selectbackground="#c4c4c4")
-    self.ACC1.configure(takefocus="0")
-
-    self.DLB1 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB1.place(relx=0.465, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB1.configure(background="black")
-    self.DLB1.configure(borderwidth="2")
-    self.DLB1.configure(relief="ridge")
-    self.DLB1.configure(selectbackground="#c4c4c4")
-    self.DLB1.configure(takefocus="0")
-
-    self.DLB2 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB2.place(relx=0.535, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB2.configure(background="black")
-    self.DLB2.configure(borderwidth="2")
-    self.DLB2.configure(relief="ridge")
-    self.DLB2.configure(selectbackground="#c4c4c4")
-    self.DLB2.configure(takefocus="0")
-
-    self.DLB3 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB3.place(relx=0.605, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB3.configure(background="black")
-    self.DLB3.configure(borderwidth="2")
-    self.DLB3.configure(relief="ridge")
-    self.DLB3.configure(selectbackground="#c4c4c4")
-    self.DLB3.configure(takefocus="0")
-
-    self.DLB4 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB4.place(relx=0.674, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB4.configure(background="black")
-    self.DLB4.configure(borderwidth="2")
-    self.DLB4.configure(relief="ridge")
-    self.DLB4.configure(selectbackground="#c4c4c4")
-    self.DLB4.configure(takefocus="0")
-
-    self.DLB5 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB5.place(relx=0.744, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB5.configure(background="black")
-    self.DLB5.configure(borderwidth="2")
-    self.DLB5.configure(relief="ridge")
-    self.DLB5.configure(selectbackground="#c4c4c4")
-    self.DLB5.configure(takefocus="0")
-
-    self.DLB7 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB7.place(relx=0.884, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB7.configure(background="black")
-    self.DLB7.configure(borderwidth="2")
-    self.DLB7.configure(relief="ridge")
-    self.DLB7.configure(selectbackground="#c4c4c4")
-    self.DLB7.configure(takefocus="0")
-
-    self.DLB6 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB6.place(relx=0.814, rely=0.4, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB6.configure(background="black")
-    self.DLB6.configure(borderwidth="2")
-    self.DLB6.configure(relief="ridge")
-    self.DLB6.configure(selectbackground="#c4c4c4")
-    self.DLB6.configure(takefocus="0")
-
-    self.DLB9 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB9.place(relx=0.116, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB9.configure(background="black")
-    self.DLB9.configure(borderwidth="2")
-    self.DLB9.configure(relief="ridge")
-    self.DLB9.configure(selectbackground="#c4c4c4")
-    self.DLB9.configure(takefocus="0")
-
-    self.DLB10 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB10.place(relx=0.186, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB10.configure(background="black")
-    self.DLB10.configure(borderwidth="2")
-    self.DLB10.configure(relief="ridge")
-    self.DLB10.configure(selectbackground="#c4c4c4")
-    self.DLB10.configure(takefocus="0")
-
-    self.DLB11 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB11.place(relx=0.256, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB11.configure(background="black")
-    self.DLB11.configure(borderwidth="2")
-    self.DLB11.configure(relief="ridge")
-    self.DLB11.configure(selectbackground="#c4c4c4")
-    self.DLB11.configure(takefocus="0")
-
-    self.DLB12 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB12.place(relx=0.326, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB12.configure(background="black")
-    self.DLB12.configure(borderwidth="2")
-    self.DLB12.configure(relief="ridge")
-    self.DLB12.configure(selectbackground="#c4c4c4")
-    self.DLB12.configure(takefocus="0")
-
-    self.DLB13 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB13.place(relx=0.395, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB13.configure(background="black")
-    self.DLB13.configure(borderwidth="2")
-    self.DLB13.configure(relief="ridge")
-    self.DLB13.configure(selectbackground="#c4c4c4")
-    self.DLB13.configure(takefocus="0")
-
-    self.DLB14 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB14.place(relx=0.465, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB14.configure(background="black")
-    self.DLB14.configure(borderwidth="2")
-    self.DLB14.configure(relief="ridge")
-    self.DLB14.configure(selectbackground="#c4c4c4")
-    self.DLB14.configure(takefocus="0")
-
-    self.DLB15 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB15.place(relx=0.535, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB15.configure(background="black")
-    self.DLB15.configure(borderwidth="2")
-    self.DLB15.configure(relief="ridge")
-    self.DLB15.configure(selectbackground="#c4c4c4")
-    self.DLB15.configure(takefocus="0")
-
-    self.DLB16 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB16.place(relx=0.605, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB16.configure(background="black")
-    self.DLB16.configure(borderwidth="2")
-    self.DLB16.configure(relief="ridge")
-    self.DLB16.configure(selectbackground="#c4c4c4")
-    self.DLB16.configure(takefocus="0")
-
-    self.DLB17 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB17.place(relx=0.674, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB17.configure(background="black")
-    self.DLB17.configure(borderwidth="2")
-    self.DLB17.configure(relief="ridge")
-    self.DLB17.configure(selectbackground="#c4c4c4")
-    self.DLB17.configure(takefocus="0")
-
-    self.DLB18 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB18.place(relx=0.744, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB18.configure(background="black")
-    self.DLB18.configure(borderwidth="2")
-    self.DLB18.configure(relief="ridge")
-    self.DLB18.configure(selectbackground="#c4c4c4")
-    self.DLB18.configure(takefocus="0")
-
-    self.DLB19 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB19.place(relx=0.814, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB19.configure(background="black")
-    self.DLB19.configure(borderwidth="2")
-    self.DLB19.configure(relief="ridge")
-    self.DLB19.configure(selectbackground="#c4c4c4")
-    self.DLB19.configure(takefocus="0")
-
-    self.DLB20 = tk.Canvas(self.paneCEPanel_p2)
-    self.DLB20.place(relx=0.884, rely=0.533, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.DLB20.configure(background="black")
-    self.DLB20.configure(borderwidth="2")
-    self.DLB20.configure(relief="ridge")
-    self.DLB20.configure(selectbackground="#c4c4c4")
-    self.DLB20.configure(takefocus="0")
-
-    self.AI0 = tk.Canvas(self.paneCEPanel_p2)
-    self.AI0.place(relx=0.116, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.AI0.configure(background="black")
-    self.AI0.configure(borderwidth="2")
-    self.AI0.configure(relief="ridge")
-    self.AI0.configure(selectbackground="#c4c4c4")
-    self.AI0.configure(takefocus="0")
-
-    self.AI1 = tk.Canvas(self.paneCEPanel_p2)
-    self.AI1.place(relx=0.186, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.AI1.configure(background="black")
-    self.AI1.configure(borderwidth="2")
-    self.AI1.configure(relief="ridge")
-    self.AI1.configure(selectbackground="#c4c4c4")
-    self.AI1.configure(takefocus="0")
-
-    self.AI2 = tk.Canvas(self.paneCEPanel_p2)
-    self.AI2.place(relx=0.256, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.AI2.configure(background="black")
-    self.AI2.configure(borderwidth="2")
-    self.AI2.configure(relief="ridge")
-    self.AI2.configure(selectbackground="#c4c4c4")
-    self.AI2.configure(takefocus="0")
-
-    self.AI3 = tk.Canvas(self.paneCEPanel_p2)
-    self.AI3.place(relx=0.326, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.AI3.configure(background="black")
-    self.AI3.configure(borderwidth="2")
-    self.AI3.configure(relief="ridge")
-    self.AI3.configure(selectbackground="#c4c4c4")
-    self.AI3.configure(takefocus="0")
-
-    self.AI4 = tk.Canvas(self.paneCEPanel_p2)
-    self.AI4.place(relx=0.395, rely=0.7, relheight=0.14, relwidth=0.07
-        , bordermode='ignore')
-    self.AI4.configure(background="black")
-    self.AI4.configure(borderwidth="2")
-    self.AI4.configure(relief="ridge")
-    self.AI4.configure(selectbackground="#c4c4c4")
-    self.AI4.configure(takefocus="0")
-
-    self.ACC_DISPLAY_ENABLE = tk.Canvas(self.paneCEPanel_p2)
-    self.ACC_DISPLAY_ENABLE.place(relx=0.791, rely=0.7, relheight=0.273
-        , relwidth=0.116, bordermode='ignore')
-    self.ACC_DISPLAY_ENABLE.configure(background="black")
-    self.ACC_DISPLAY_ENABLE.configure(borderwidth="2")
-    self.ACC_DISPLAY_ENABLE.configure(relief="ridge")
-    self.ACC_DISPLAY_ENABLE.configure(selectbackground="#c4c4c4")
-    self.ACC_DISPLAY_ENABLE.configure(takefocus="0")
-
-    self.mbrBIT1 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT1.place(relx=0.047, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT1.configure(background="black")
-    self.mbrBIT1.configure(borderwidth="2")
-    self.mbrBIT1.configure(relief="ridge")
-    self.mbrBIT1.configure(selectbackground="#c4c4c4")
-    self.mbrBIT1.configure(takefocus="0")
-
-    self.mbrBIT2 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT2.place(relx=0.116, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT2.configure(background="black")
-    self.mbrBIT2.configure(borderwidth="2")
-    self.mbrBIT2.configure(relief="ridge")
-    self.mbrBIT2.configure(selectbackground="#c4c4c4")
-    self.mbrBIT2.configure(takefocus="0")
-
-    self.mbrBIT3 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT3.place(relx=0.186, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT3.configure(background="black")
-    self.mbrBIT3.configure(borderwidth="2")
-    self.mbrBIT3.configure(relief="ridge")
-    self.mbrBIT3.configure(selectbackground="#c4c4c4")
-    self.mbrBIT3.configure(takefocus="0")
-
-    self.mbrBIT4 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT4.place(relx=0.256, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT4.configure(background="black")
-    self.mbrBIT4.configure(borderwidth="2")
-    self.mbrBIT4.configure(relief="ridge")
-    self.mbrBIT4.configure(selectbackground="#c4c4c4")
-    self.mbrBIT4.configure(takefocus="0")
-
-    self.mbrBIT5 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT5.place(relx=0.326, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT5.configure(background="black")
-    self.mbrBIT5.configure(borderwidth="2")
-    self.mbrBIT5.configure(relief="ridge")
-    self.mbrBIT5.configure(selectbackground="#c4c4c4")
-    self.mbrBIT5.configure(takefocus="0")
-
-    self.mbrBIT6 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT6.place(relx=0.395, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT6.configure(background="black")
-    self.mbrBIT6.configure(borderwidth="2")
-    self.mbrBIT6.configure(relief="ridge")
-    self.mbrBIT6.configure(selectbackground="#c4c4c4")
-    self.mbrBIT6.configure(takefocus="0")
-
-    self.mbrBIT7 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT7.place(relx=0.465, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT7.configure(background="black")
-    self.mbrBIT7.configure(borderwidth="2")
-    self.mbrBIT7.configure(relief="ridge")
-    self.mbrBIT7.configure(selectbackground="#c4c4c4")
-    self.mbrBIT7.configure(takefocus="0")
-
-    self.mbrBIT8 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT8.place(relx=0.535, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT8.configure(background="black")
-    self.mbrBIT8.configure(borderwidth="2")
-    self.mbrBIT8.configure(relief="ridge")
-    self.mbrBIT8.configure(selectbackground="#c4c4c4")
-    self.mbrBIT8.configure(takefocus="0")
-
-    self.mbrBIT9 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT9.place(relx=0.605, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT9.configure(background="black")
-    self.mbrBIT9.configure(borderwidth="2")
-    self.mbrBIT9.configure(relief="ridge")
-    self.mbrBIT9.configure(selectbackground="#c4c4c4")
-    self.mbrBIT9.configure(takefocus="0")
-
-    self.mbrBIT10 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT10.place(relx=0.674, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT10.configure(background="black")
-    self.mbrBIT10.configure(borderwidth="2")
-    self.mbrBIT10.configure(relief="ridge")
-    self.mbrBIT10.configure(selectbackground="#c4c4c4")
-    self.mbrBIT10.configure(takefocus="0")
-
-    self.mbrBIT11 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT11.place(relx=0.744, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT11.configure(background="black")
-    self.mbrBIT11.configure(borderwidth="2")
-    self.mbrBIT11.configure(relief="ridge")
-    self.mbrBIT11.configure(selectbackground="#c4c4c4")
-    self.mbrBIT11.configure(takefocus="0")
-
-    self.mbrBIT12 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT12.place(relx=0.814, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT12.configure(background="black")
-    self.mbrBIT12.configure(borderwidth="2")
-    self.mbrBIT12.configure(relief="ridge")
-    self.mbrBIT12.configure(selectbackground="#c4c4c4")
-    self.mbrBIT12.configure(takefocus="0")
-
-    self.mbrBIT13 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT13.place(relx=0.884, rely=0.238, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrBIT13.configure(background="black")
-    self.mbrBIT13.configure(borderwidth="2")
-    self.mbrBIT13.configure(relief="ridge")
-    self.mbrBIT13.configure(selectbackground="#c4c4c4")
-    self.mbrBIT13.configure(takefocus="0")
-
-    self.mbrMBR1 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR1.place(relx=0.047, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR1.configure(background="black")
-    self.mbrMBR1.configure(borderwidth="2")
-    self.mbrMBR1.configure(relief="ridge")
-    self.mbrMBR1.configure(selectbackground="#c4c4c4")
-    self.mbrMBR1.configure(takefocus="0")
-
-    self.mbrMBR2 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR2.place(relx=0.116, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR2.configure(background="black")
-    self.mbrMBR2.configure(borderwidth="2")
-    self.mbrMBR2.configure(relief="ridge")
-    self.mbrMBR2.configure(selectbackground="#c4c4c4")
-    self.mbrMBR2.configure(takefocus="0")
-
-    self.mbrMBR3 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR3.place(relx=0.186, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR3.configure(background="black")
-    self.mbrMBR3.configure(borderwidth="2")
-    self.mbrMBR3.configure(relief="ridge")
-    self.mbrMBR3.configure(selectbackground="#c4c4c4")
-    self.mbrMBR3.configure(takefocus="0")
-
-    self.mbrMBR4 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR4.place(relx=0.256, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR4.configure(background="black")
-    self.mbrMBR4.configure(borderwidth="2")
-    self.mbrMBR4.configure(relief="ridge")
-    self.mbrMBR4.configure(selectbackground="#c4c4c4")
-    self.mbrMBR4.configure(takefocus="0")
-
-    self.mbrMBR5 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR5.place(relx=0.326, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR5.configure(background="black")
-    self.mbrMBR5.configure(borderwidth="2")
-    self.mbrMBR5.configure(relief="ridge")
-    self.mbrMBR5.configure(selectbackground="#c4c4c4")
-    self.mbrMBR5.configure(takefocus="0")
-
-    self.mbrMBR6 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR6.place(relx=0.395, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR6.configure(background="black")
-    self.mbrMBR6.configure(borderwidth="2")
-    self.mbrMBR6.configure(relief="ridge")
-    self.mbrMBR6.configure(selectbackground="#c4c4c4")
-    self.mbrMBR6.configure(takefocus="0")
-
-    self.mbrMBR7 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR7.place(relx=0.465, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR7.configure(background="black")
-    self.mbrMBR7.configure(borderwidth="2")
-    self.mbrMBR7.configure(relief="ridge")
-    self.mbrMBR7.configure(selectbackground="#c4c4c4")
-    self.mbrMBR7.configure(takefocus="0")
-
-    self.mbrMBR8 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR8.place(relx=0.535, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR8.configure(background="black")
-    self.mbrMBR8.configure(borderwidth="2")
-    self.mbrMBR8.configure(relief="ridge")
-    self.mbrMBR8.configure(selectbackground="#c4c4c4")
-    self.mbrMBR8.configure(takefocus="0")
-
-    self.mbrMBR9 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR9.place(relx=0.605, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR9.configure(background="black")
-    self.mbrMBR9.configure(borderwidth="2")
-    self.mbrMBR9.configure(relief="ridge")
-    self.mbrMBR9.configure(selectbackground="#c4c4c4")
-    self.mbrMBR9.configure(takefocus="0")
-
-    self.mbrMBR10 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR10.place(relx=0.674, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR10.configure(background="black")
-    self.mbrMBR10.configure(borderwidth="2")
-    self.mbrMBR10.configure(relief="ridge")
-    self.mbrMBR10.configure(selectbackground="#c4c4c4")
-    self.mbrMBR10.configure(takefocus="0")
-
-    self.mbrMBR11 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR11.place(relx=0.744, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR11.configure(background="black")
-    self.mbrMBR11.configure(borderwidth="2")
-    self.mbrMBR11.configure(relief="ridge")
-    self.mbrMBR11.configure(selectbackground="#c4c4c4")
-    self.mbrMBR11.configure(takefocus="0")
-
-    self.mbrMBR12 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR12.place(relx=0.814, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR12.configure(background="black")
-    self.mbrMBR12.configure(borderwidth="2")
-    self.mbrMBR12.configure(relief="ridge")
-    self.mbrMBR12.configure(selectbackground="#c4c4c4")
-    self.mbrMBR12.configure(takefocus="0")
-
-    self.mbrMBR13 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrMBR13.place(relx=0.884, rely=0.397, relheight=0.167, relwidth=0.07
-        , bordermode='ignore')
-    self.mbrMBR13.configure(background="black")
-    self.mbrMBR13.configure(borderwidth="2")
-    self.mbrMBR13.configure(relief="ridge")
-    self.mbrMBR13.configure(selectbackground="#c4c4c4")
-    self.mbrMBR13.configure(takefocus="0")
-
-    self.mbrODD_PARITY = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrODD_PARITY.place(relx=0.372, rely=0.794, relheight=0.167
-        , relwidth=0.119, bordermode='ignore')
-    self.mbrODD_PARITY.configure(background="black")
-    self.mbrODD_PARITY.configure(borderwidth="2")
-    self.mbrODD_PARITY.configure(relief="ridge")
-    self.mbrODD_PARITY.configure(selectbackground="#c4c4c4")
-    self.mbrODD_PARITY.configure(takefocus="0")
-
-    self.mbrBIT14 = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrBIT14.place(relx=0.372, rely=0.635, relheight=0.167, relwidth=0.119
-        , bordermode='ignore')
-    self.mbrBIT14.configure(background="black")
-    self.mbrBIT14.configure(borderwidth="2")
-    self.mbrBIT14.configure(relief="ridge")
-    self.mbrBIT14.configure(selectbackground="#c4c4c4")
-    self.mbrBIT14.configure(takefocus="0")
-
-    self.mbrLOAD = tk.Canvas(self.paneCEPanel_p3)
-    self.mbrLOAD.place(relx=0.547, rely=0.635, relheight=0.325, relwidth=0.093
-        , bordermode='ignore')
-    self.mbrLOAD.configure(background="black")
-    self.mbrLOAD.configure(borderwidth="2")
-    self.mbrLOAD.configure(relief="ridge")
-    self.mbrLOAD.configure(selectbackground="#c4c4c4")
-    self.mbrLOAD.configure(takefocus="0")
-
-    self.ceLAMP_TEST = tk.Canvas(self.paneCEPanel_p3)
-    self.ceLAMP_TEST.place(relx=0.802, rely=0.635, relheight=0.325
-        , relwidth=0.093, bordermode='ignore')
-    self.ceLAMP_TEST.configure(background="black")
-    self.ceLAMP_TEST.configure(borderwidth="2")
-    self.ceLAMP_TEST.configure(relief="ridge")
-    self.ceLAMP_TEST.configure(selectbackground="#c4c4c4")
-    self.ceLAMP_TEST.configure(takefocus="0")
-
   def __adjust_sash0(self, event):
     paned = event.widget
     pos = [35, 281, 396, 618, ]
@@ -0,0 +1,227 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	lvdcLoadGenerator.py
+# Purpose:	A stand-in for yaLVDC, for load-testing yaPTC.py (or other
+#		peripherals written in Python) without the CPU emulator.  It
+#		listens for a peripheral just as yaLVDC does, sends it
+#		synthetic traffic (CPU status, typewriter, printer, and PRS)
+#		at chosen rates, and measures how far behind the peripheral
+#		falls.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#
+# Usage is something like
+#	lvdcLoadGenerator.py --status=5000 --printer=100 --ramp=2 --step=5
+#	yaPTC.py --headless --echo=0
+# The rates are in packets per second.  Every --step seconds, a line of
+# tab-delimited statistics is printed for the step just completed, and all of
+# the rates are then multiplied by --ramp, so that a single run can be used to
+# chart the peripheral's behavior against the packet rate.
+#
+# The lag is measured by sending "probes" (I/O type 5, channel 777, with a
+# sequence number as the value), interspersed with the rest of the traffic,
+# which yaPTC.py answers by returning the sequence number (I/O type 4, channel
+# 777) when it gets around to processing the probe, along with its count
+# of illegal packets (I/O type 4, channel 776).  The lag is thus the time
+# from sending the probe to receiving the answer, including all of the time
+# the probe spends in socket buffers and in the peripheral's queues.  Probes
+# still unanswered at the end of a step are reported as outstanding, along
+# with the age of the oldest of them.
+#
+# Like yaLVDC, sending is non-blocking and whatever the socket won't accept
+# is discarded (which the peripheral will see as corrupted packets at which
+# it has to realign), unless --block is used.
+
+import sys
+import time
+import socket
+import select
+import random
+import argparse
+import virtualWire
+
+cli = argparse.ArgumentParser()
+cli.add_argument("--port", help="Port on which to listen, defaulting to 19653.", type=int, default=19653)
+cli.add_argument("--status", help="Rate of CPU-status packets (default 1000).", type=float, default=1000.0)
+cli.add_argument("--typewriter", help="Rate of typewriter characters (default 0).", type=float, default=0.0)
+cli.add_argument("--printer", help="Rate of printer packets (default 0).", type=float, default=0.0)
+cli.add_argument("--prs", help="Rate of PRS packets (default 0).", type=float, default=0.0)
+cli.add_argument("--probes", help="Rate of probe packets (default 10).", type=float, default=10.0)
+cli.add_argument("--step", help="Seconds per step (default 5).", type=float, default=5.0)
+cli.add_argument("--ramp", help="Factor by which rates are multiplied after each step (default 1).", type=float, default=1.0)
+cli.add_argument("--duration", help="Seconds to run, or 0 (default) to run until the peripheral disconnects.", type=float, default=0.0)
+cli.add_argument("--tick", help="Milliseconds between bursts of packets (default 10).", type=float, default=10.0)
+cli.add_argument("--block", help="Block when the peripheral isn't keeping up, rather than discarding data.", action="store_true")
+cli.add_argument("--seed", help="Seed for the random-number generator.", type=int)
+args = cli.parse_args()
+if args.seed != None:
+	random.seed(args.seed)
+
+# The BA8421 character codes (see yaPTC.py) for the characters of the text
+# sent to the typewriter, printer, and PRS.
+BA8421 = " 1234567890#@????/STUVWXYZ‡,(???-JKLMNOPQR?$*???+ABCDEFGHI?.)???"
+text = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG 0123456789, $12.34 (*) + - / @ # "
+codes = [BA8421.index(c) for c in text]
+lineLength = 60
+
+# Generators of the synthetic traffic.  Each returns a single packet as an
+# (ioType,channel,value) tuple.
+statusChannel = 0
+def generateStatus():
+	global statusChannel
+	statusChannel = statusChannel % 3 + 2
+	return (5, statusChannel, random.getrandbits(26))
+typewriterIndex = 0
+def generateTypewriter():
+	global typewriterIndex
+	typewriterIndex += 1
+	if typewriterIndex % (lineLength + 1) == 0:
+		return (1, 0o134, 0o010000000)
+	return (1, 0o120, codes[typewriterIndex % len(codes)] << 20)
+printerIndex = 0
+def generatePrinter():
+	global printerIndex
+	c = [codes[(printerIndex + i) % len(codes)] for i in range(4)]
+	printerIndex += 4
+	return (1, 0o160, (c[0] << 20) | (c[1] << 14) | (c[2] << 8) | (c[3] << 2))
+prsIndex = 0
+def generatePRS():
+	global prsIndex
+	c = [codes[(prsIndex + i) % len(codes)] for i in range(4)]
+	prsIndex += 4
+	return (2, 0, (c[0] << 18) | (c[1] << 12) | (c[2] << 6) | c[3])
+probeSequence = 0
+probeTimes = {}
+def generateProbe():
+	global probeSequence
+	probeSequence = (probeSequence + 1) & 0o377777777
+	probeTimes[probeSequence] = time.monotonic()
+	return (5, 0o777, probeSequence)
+
+# Each source is [name, rate, generator, credit], where credit accumulates
+# the fractional number of packets due but not yet sent.
+sources = [
+	["status", args.status, generateStatus, 0.0],
+	["typewriter", args.typewriter, generateTypewriter, 0.0],
+	["printer", args.printer, generatePrinter, 0.0],
+	["prs", args.prs, generatePRS, 0.0],
+	["probes", args.probes, generateProbe, 0.0]
+]
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+server.bind(("", args.port))
+server.listen(1)
+sys.stderr.write("Waiting for peripheral on port %d\n" % args.port)
+peripheral, address = server.accept()
+sys.stderr.write("Connected to peripheral at %s:%d\n" % address)
+peripheral.setblocking(args.block)
+
+# Statistics for the current step.
+stepSent = 0
+stepDropped = 0
+stepLags = []
+illegalReported = 0
+def report(elapsed, stepTime):
+	global stepSent, stepDropped, stepLags
+	now = time.monotonic()
+	target = sum([source[1] for source in sources])
+	if len(stepLags) > 0:
+		lagAverage = sum(stepLags) / len(stepLags)
+		lagMax = max(stepLags)
+	else:
+		lagAverage = 0.0
+		lagMax = 0.0
+	if len(probeTimes) > 0:
+		oldest = now - min(probeTimes.values())
+	else:
+		oldest = 0.0
+	print("%.1f\t%.0f\t%.0f\t%d\t%.4f\t%.4f\t%d\t%.3f\t%d" % (elapsed, target,
+		stepSent / stepTime, stepDropped, lagAverage, lagMax, len(probeTimes),
+		oldest, illegalReported))
+	sys.stdout.flush()
+	stepSent = 0
+	stepDropped = 0
+	stepLags = []
+
+print("# time\ttarget/s\tsent/s\tdropped\tlagAvg\tlagMax\toutstanding\toldest\tillegal")
+outputBuffer = bytearray(virtualWire.packetSize * 1024)
+inputBuffer = bytearray(65536)
+inputLength = 0
+tick = args.tick / 1000.0
+startTime = time.monotonic()
+lastTime = startTime
+stepStart = startTime
+connected = True
+while connected:
+	now = time.monotonic()
+	if args.duration > 0 and now - startTime >= args.duration:
+		break
+	if now - stepStart >= args.step:
+		report(now - startTime, now - stepStart)
+		stepStart = now
+		for source in sources:
+			source[1] *= args.ramp
+
+	# Send the packets due since the last burst.
+	dt = now - lastTime
+	lastTime = now
+	offset = 0
+	for source in sources:
+		source[3] += source[1] * dt
+		count = int(source[3])
+		source[3] -= count
+		needed = offset + count * virtualWire.packetSize
+		if needed > len(outputBuffer):
+			outputBuffer += bytearray(needed - len(outputBuffer))
+		for i in range(count):
+			packet = source[2]()
+			offset = virtualWire.encodePacket(outputBuffer, offset, packet[0], packet[1], packet[2])
+	if offset > 0:
+		with memoryview(outputBuffer) as view:
+			if args.block:
+				peripheral.sendall(view[:offset])
+				sent = offset
+			else:
+				try:
+					sent = peripheral.send(view[:offset])
+				except BlockingIOError:
+					sent = 0
+		stepSent += sent // virtualWire.packetSize
+		stepDropped += (offset - sent + virtualWire.packetSize - 1) // virtualWire.packetSize
+
+	# Collect the answers to probes until it's time for the next burst.
+	while True:
+		timeout = lastTime + tick - time.monotonic()
+		if timeout <= 0:
+			break
+		readable, writable, exceptional = select.select([peripheral], [], [], timeout)
+		if len(readable) == 0:
+			break
+		try:
+			numNewBytes = peripheral.recv_into(memoryview(inputBuffer)[inputLength:])
+		except BlockingIOError:
+			continue
+		except socket.error:
+			numNewBytes = 0
+		if numNewBytes == 0:
+			sys.stderr.write("Peripheral disconnected.\n")
+			connected = False
+			break
+		received = time.monotonic()
+		end = inputLength + numNewBytes
+		packets = []
+		used = virtualWire.parsePackets(inputBuffer, 0, end, packets)
+		inputLength = end - used
+		inputBuffer[:inputLength] = inputBuffer[used:end]
+		for ioType, channel, value in packets:
+			if ioType == 4 and channel == 0o777 and value in probeTimes:
+				stepLags.append(received - probeTimes.pop(value))
+			elif ioType == 4 and channel == 0o776:
+				illegalReported = value
+
+now = time.monotonic()
+if now > stepStart:
+	report(now - startTime, now - stepStart)
+peripheral.close()
+server.close()
@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	ptcHeadless.py
+# Purpose:	Stand-ins for tkinter and for the PAGE-generated modules
+#		ProcessorDisplayPanel.py and ProcessorDisplayPanel_support.py,
+#		used by yaPTC.py when run with --headless, so that it can
+#		be run without a display (say, for automated testing of the
+#		PTC ADAPT self-test program) and without importing tkinter
+#		at all.  Also, a player for scripts of panel inputs, which
+#		take the place of the user's mouse clicks.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#		2026-10-19	Variable now supports write traces.
+#
+# yaPTC.py uses this module in place of ProcessorDisplayPanel_support, and so
+# the functions set_Tk_var() and init(), and the variables created by
+# set_Tk_var(), mimic those of ProcessorDisplayPanel_support.py.  Similarly,
+# Panel is used in place of topProcessorDisplayPanel and Root in place of
+# tk.Tk.  Only the little bit of those interfaces actually used by yaPTC.py
+# is provided.
+
+import sys
+import time
+import heapq
+
+# Stand-in for a tkinter IntVar, including write traces.
+class Variable:
+	def __init__(self, value = 0):
+		self.value = value
+		self.traces = []
+	def get(self):
+		return self.value
+	def set(self, value):
+		self.value = value
+		for callback in self.traces:
+			callback(self, "", "write")
+	def trace_add(self, mode, callback):
+		if mode == "write":
+			self.traces.append(callback)
+
+# The names of the variables that ProcessorDisplayPanel_support.set_Tk_var()
+# creates, which are those for the PRA/PRB toggle switches and the two
+# rotary switches.  In the GUI, changing one of them calls the function
+# named by variableCommands[] (which yaPTC.py replaces).
+variableNames = ["bPRAS", "bPRBS", "displaySelect", "modeControl"]
+variableCommands = { "bPRAS": "cPRA", "bPRBS": "cPRB",
+	"displaySelect": "eventDisplaySelect", "modeControl": "eventModeControl" }
+for n in range(1, 26):
+	variableNames += ["bPRA%d" % n, "bPRB%d" % n]
+	variableCommands["bPRA%d" % n] = "cPRA"
+	variableCommands["bPRB%d" % n] = "cPRB"
+
+def set_Tk_var():
+	for name in variableNames:
+		globals()[name] = Variable()
+
+def init(top, gui, *args, **kwargs):
+	global w, top_level, root
+	w = gui
+	top_level = top
+	root = top
+
+def cPRA():
+	pass
+
+def cPRB():
+	pass
+
+def eventDisplaySelect():
+	pass
+
+def eventModeControl():
+	pass
+
+# Stand-in for one of the canvas widgets used as indicators.  All that's
+# needed is to remember the event bindings, so that scripts can "click" it.
+class Indicator:
+	def __init__(self, name):
+		self.name = name
+		self.bindings = {}
+	def bind(self, sequence, func):
+		self.bindings[sequence] = func
+	def __repr__(self):
+		return self.name
+
+# Stand-in for an event passed to a callback.
+class Event:
+	def __init__(self, widget):
+		self.widget = widget
+
+# Stand-in for topProcessorDisplayPanel.  Rather than listing all of the
+# indicators, they're simply created the first time they're referenced,
+# as top.PROG_ERR or whatever.
+class Panel:
+	def __init__(self, top = None):
+		self.indicatorsByName = {}
+	def __getattr__(self, name):
+		if name.startswith("__"):
+			raise AttributeError(name)
+		indicator = Indicator(name)
+		self.indicatorsByName[name] = indicator
+		setattr(self, name, indicator)
+		return indicator
+	def event(self, name, sequence):
+		if name not in self.indicatorsByName:
+			return False
+		indicator = self.indicatorsByName[name]
+		if sequence in indicator.bindings:
+			indicator.bindings[sequence](Event(indicator))
+		return True
+	def press(self, name):
+		return self.event(name, "<Button-1>")
+	def release(self, name):
+		return self.event(name, "<ButtonRelease-1>")
+
+# Stand-in for tk.Tk, providing just a timer-driven event loop.  Timers set
+# with after() are run in order of their due times (and for equal times, in
+# the order they were set), sleeping in between if nothing is due.
+class Root:
+	def __init__(self):
+		self.timers = []
+		self.count = 0
+		self.running = False
+	def after(self, ms, func):
+		self.count += 1
+		heapq.heappush(self.timers, (time.monotonic() + ms / 1000.0, self.count, func))
+	def mainloop(self):
+		self.running = True
+		while self.running and len(self.timers) > 0:
+			due, count, func = heapq.heappop(self.timers)
+			delay = due - time.monotonic()
+			if delay > 0:
+				time.sleep(delay)
+			func()
+	def quit(self):
+		self.running = False
+	def resizable(self, width, height):
+		pass
+	def title(self, string):
+		pass
+
+# A script is a text file of panel inputs, one per line, each of the form
+#	DELAY ACTION [NAME [VALUE]]
+# where DELAY is the time in milliseconds since the preceding line (or since
+# startup), much like the .canned scripts of piDSKY2.py, and ACTION is one of:
+#	press NAME	Press (and hold) the indicator/pushbutton NAME,
+#			such as HALT or daCommandOA1.
+#	release NAME	Release the indicator/pushbutton NAME.
+#	click NAME	Press and immediately release NAME.
+#	set NAME VALUE	Set the switch variable NAME (such as bPRA5 or
+#			displaySelect) to the integer VALUE.
+#	dump		Print the names of all indicators which are lit.
+#	quit		Exit from yaPTC.
+# Blank lines and anything following '#' are ignored.  NAMEs are those used
+# for the attributes of topProcessorDisplayPanel.
+class Script:
+	def __init__(self, filename, root, top, support, dump):
+		self.root = root
+		self.top = top
+		self.support = support
+		self.dump = dump
+		self.lines = []
+		f = open(filename, "r")
+		for lineNumber, line in enumerate(f, 1):
+			fields = line.split("#")[0].split()
+			if len(fields) == 0:
+				continue
+			try:
+				delay = int(fields[0])
+			except ValueError:
+				sys.stderr.write("Script line %d: bad delay %s\n" % (lineNumber, fields[0]))
+				continue
+			self.lines.append((lineNumber, delay, fields[1:]))
+		f.close()
+		self.index = 0
+
+	def start(self):
+		if self.index < len(self.lines):
+			self.root.after(self.lines[self.index][1], self.step)
+
+	def step(self):
+		lineNumber, delay, fields = self.lines[self.index]
+		self.index += 1
+		self.perform(lineNumber, fields)
+		self.start()
+
+	def perform(self, lineNumber, fields):
+		if len(fields) == 0:
+			return
+		action = fields[0]
+		if action in ["press", "release", "click"] and len(fields) == 2:
+			name = fields[1]
+			if action in ["press", "click"]:
+				found = self.top.press(name)
+			if action in ["release", "click"]:
+				found = self.top.release(name)
+			if not found:
+				sys.stderr.write("Script line %d: unknown indicator %s\n" % (lineNumber, name))
+		elif action == "set" and len(fields) == 3 and fields[1] in variableCommands:
+			getattr(self.support, fields[1]).set(int(fields[2]))
+			getattr(self.support, variableCommands[fields[1]])()
+		elif action == "dump" and len(fields) == 1:
+			self.dump()
+		elif action == "quit" and len(fields) == 1:
+			self.root.quit()
+		else:
+			sys.stderr.write("Script line %d: cannot perform %s\n" % (lineNumber, " ".join(fields)))
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	ptcLampPanel.py
+# Purpose:	Draws the PTC's indicator lamps, as described by the table
+#		in ptcPanelLayout.py, for yaPTC.py.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#		2026-10-19	Lamps changing together are now recolored
+#				with a single itemconfig per pane, and panes
+#				are resized with a single scale.
+#
+# Rather than each lamp being a canvas widget of its own, all of the lamps in
+# a given pane of the GUI are drawn on a single canvas which fills the pane,
+# each lamp being just a rectangle and a caption on that canvas.  The canvas
+# is stacked below the pane's other widgets (labels, switches, etc.), so they
+# still appear on top of it.  The lamps of a pane aren't drawn at all until
+# the pane's canvas is first given a usable size, so panes which are never
+# shown (for example, if their sashes have been dragged shut) cost nothing
+# more than an empty canvas.
+#
+# The Lamp objects take the place of the old canvas widgets, as far as
+# yaPTC.py is concerned:  build() makes each of them an attribute of the
+# PAGE-generated top-level object, with the name the canvas used to have,
+# and they have a bind() method for mouse events.
+
+import tkinter as tk
+
+lampColors = { False: ("black", "white"), True: ("white", "black") }
+
+# Passed to the callback functions for mouse events on lamps, in place of a
+# tkinter event.  The only thing yaPTC.py uses is the widget (i.e., the lamp).
+class LampEvent:
+	def __init__(self, lamp, event):
+		self.widget = lamp
+		self.x = event.x
+		self.y = event.y
+
+class Lamp:
+	def __init__(self, pane, name, relx, rely, relheight, relwidth, caption):
+		self.pane = pane
+		self.name = name
+		self.geometry = (relx, rely, relheight, relwidth)
+		self.caption = caption
+		self.lit = False
+		self.rectangle = None
+		self.text = None
+	def __repr__(self):
+		return self.name
+	# The callback is called with a LampEvent.  The binding is made for the
+	# tag of the lamp's canvas items, so it doesn't matter whether those
+	# items have been created yet.
+	def bind(self, sequence, func):
+		self.pane.canvas.tag_bind(self.name, sequence, lambda event: func(LampEvent(self, event)))
+	def setLit(self, lit):
+		self.pane.setLit([self], lit)
+
+# All of the lamps in one pane (a ttk.Labelframe).  The geometry of the lamps
+# is relative to the whole pane (as with place(bordermode='ignore')), while
+# the canvas covers only the inside of the pane, so as not to hide its label;
+# the canvas's position within the pane is therefore subtracted.  Once the 
+# lamps have been drawn, the size of the pane and the position of the canvas
+# within it are remembered in self.drawnAt, so that on a resize everything can
+# be moved to the new geometry with one scale() (and, rarely, one move()),
+# rather than moving the lamps one by one.
+class LampPane:
+	def __init__(self, frame):
+		self.frame = frame
+		self.lamps = []
+		self.drawn = False
+		self.drawnAt = None
+		self.canvas = tk.Canvas(frame, background = "#d9d9d9", borderwidth = 0,
+			highlightthickness = 0, takefocus = "0")
+		self.canvas.place(relx = 0, rely = 0, relwidth = 1, relheight = 1)
+		# (Not self.canvas.lower(), which Canvas redefines as tag_lower().)
+		tk.Misc.lower(self.canvas)
+		self.canvas.bind("<Configure>", self.configure)
+	def configure(self, event):
+		if event.width <= 1 or event.height <= 1:
+			return
+		width = self.frame.winfo_width()
+		height = self.frame.winfo_height()
+		if self.drawn:
+			oldWidth, oldHeight, oldX, oldY = self.drawnAt
+			if (width, height, event.x, event.y) == self.drawnAt or oldWidth <= 0 or oldHeight <= 0:
+				return
+			self.canvas.scale("all", -oldX, -oldY, width / oldWidth, height / oldHeight)
+			if oldX != event.x or oldY != event.y:
+				self.canvas.move("all", oldX - event.x, oldY - event.y)
+			self.drawnAt = (width, height, event.x, event.y)
+			return
+		for lamp in self.lamps:
+			relx, rely, relheight, relwidth = lamp.geometry
+			x0 = relx * width - event.x
+			y0 = rely * height - event.y
+			x1 = x0 + relwidth * width
+			y1 = y0 + relheight * height
+			background, foreground = lampColors[lamp.lit]
+			lamp.rectangle = self.canvas.create_rectangle(x0 + 1, y0 + 1,
+				x1 - 1, y1 - 1, fill = background, outline = "#808080",
+				width = 2, tags = (lamp.name, "lamp"))
+			lamp.text = self.canvas.create_text((x0 + x1) / 2.0, (y0 + y1) / 2.0,
+				fill = foreground, text = lamp.caption, font = ("Sans", 6),
+				justify = tk.CENTER, tags = (lamp.name, "caption"))
+		self.drawn = True
+		self.drawnAt = (width, height, event.x, event.y)
+
+	# Lights (or extinguishes) all of the lamps in a list, which must all be
+	# in this pane.  All of the rectangles are recolored by a single
+	# itemconfig(), using a tag expression which selects just those lamps, 
+	# and similarly for the captions.
+	def setLit(self, lamps, lit):
+		for lamp in lamps:
+			lamp.lit = lit
+		if not self.drawn or len(lamps) == 0:
+			return
+		background, foreground = lampColors[lit]
+		names = "||".join([lamp.name for lamp in lamps])
+		self.canvas.itemconfig("lamp&&(" + names + ")", fill = background)
+		self.canvas.itemconfig("caption&&(" + names + ")", fill = foreground)
+
+# Creates the Lamp objects for all of the entries in a table like
+# ptcPanelLayout.lamps, as attributes of top, returning the list of panes.
+def build(top, table):
+	panes = {}
+	for name, pane, relx, rely, relheight, relwidth, caption, panel, cc in table:
+		if pane not in panes:
+			panes[pane] = LampPane(getattr(top, pane))
+		lamp = Lamp(panes[pane], name, relx, rely, relheight, relwidth, caption)
+		panes[pane].lamps.append(lamp)
+		setattr(top, name, lamp)
+	return list(panes.values())
@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	ptcOutput.py
+# Purpose:	Models of the PTC's typewriter, printer, and X/Y/Z plotter,
+#		as output "sinks" for yaPTC.py.  Each keeps what has been
+#		output so far in memory, can log it to a file, and can
+#		optionally render it into a tkinter widget supplied by the
+#		caller.  There's no import of tkinter here, so this module
+#		can be used by yaPTC.py without a GUI.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#		2026-10-19	The plot is now rendered incrementally.
+#
+# Writing to the sinks is cheap:  characters or plot points are just added to
+# the in-memory model, to a buffered log file, and to a list of changes not yet
+# rendered.  It's the caller's job to call render() periodically (say, a few
+# times per second) if there's a widget to render into, so that the cost of the
+# GUI is independent of how fast the PTC is producing output.
+
+# Typewriter or printer paper.  The model is a list of lines, each of which is
+# a list of (text, color) runs, where the color is that of the ribbon in use
+# when the text was typed.  Line spacing is done either by "return" (carriage
+# return plus line feed) or "index" (line feed only, so that the next line
+# starts in the same column).  If width is not None, a return is done
+# automatically upon reaching that column.  Tab stops are every tabWidth
+# columns.  Only the last maxLines lines are kept in memory.
+class Paper:
+	def __init__(self, name, logFilename = None, width = None, tabWidth = 10, maxLines = 10000):
+		self.name = name
+		self.width = width
+		self.tabWidth = tabWidth
+		self.maxLines = maxLines
+		self.lines = [[]]
+		self.column = 0
+		self.color = "black"
+		self.pending = []
+		self.widget = None
+		self.log = None
+		if logFilename != None:
+			self.log = open(logFilename, "w", buffering = 65536)
+
+	# Type a string of characters.
+	def write(self, string):
+		while len(string) > 0:
+			if self.width != None:
+				if self.column >= self.width:
+					self.carriageReturn()
+				count = self.width - self.column
+			else:
+				count = len(string)
+			text = string[:count]
+			string = string[count:]
+			line = self.lines[-1]
+			if len(line) > 0 and line[-1][1] == self.color:
+				line[-1] = (line[-1][0] + text, self.color)
+			else:
+				line.append((text, self.color))
+			self.column += len(text)
+			self.pending.append((text, self.color))
+			if self.log != None:
+				self.log.write(text)
+
+	def _newLine(self, column):
+		self.lines.append([])
+		if len(self.lines) > self.maxLines:
+			del self.lines[:len(self.lines) - self.maxLines]
+		self.column = 0
+		self.pending.append(("\n", None))
+		if self.log != None:
+			self.log.write("\n")
+		if column > 0:
+			self.write(" " * column)
+
+	def carriageReturn(self):
+		self._newLine(0)
+
+	def index(self):
+		self._newLine(self.column)
+
+	def space(self):
+		self.write(" ")
+
+	def tab(self):
+		self.write(" " * (self.tabWidth - self.column % self.tabWidth))
+
+	def setRibbon(self, color):
+		self.color = color
+
+	# Perform one of the typewriter-control functions by name, returning
+	# False if the name isn't recognized.
+	def control(self, name):
+		if name == "space":
+			self.space()
+		elif name == "black ribbon":
+			self.setRibbon("black")
+		elif name == "red ribbon":
+			self.setRibbon("red")
+		elif name == "index":
+			self.index()
+		elif name == "return":
+			self.carriageReturn()
+		elif name == "tab":
+			self.tab()
+		else:
+			return False
+		return True
+
+	# The text of the paper, without colors.
+	def text(self):
+		return "\n".join(["".join([run[0] for run in line]) for line in self.lines])
+
+	# Use a tkinter Text widget for rendering.  Tags named "black" and "red"
+	# are configured for the two ribbon colors.
+	def attach(self, widget):
+		self.widget = widget
+		widget.tag_configure("black", foreground = "black")
+		widget.tag_configure("red", foreground = "red")
+		self.pending = []
+		for i in range(len(self.lines)):
+			if i > 0:
+				self.pending.append(("\n", None))
+			self.pending += self.lines[i]
+		self.render()
+
+	# Apply everything written since the last call to the widget, if any.
+	def render(self):
+		if self.widget == None or len(self.pending) == 0:
+			self.pending = []
+			return
+		pending = self.pending
+		self.pending = []
+		args = []
+		for text, color in pending:
+			args.append(text)
+			if color == None:
+				args.append(())
+			else:
+				args.append(color)
+		self.widget.configure(state = "normal")
+		self.widget.insert("end", *args)
+		lines = int(self.widget.index("end-1c").split(".")[0])
+		if lines > self.maxLines:
+			self.widget.delete("1.0", "%d.0" % (lines - self.maxLines + 1))
+		self.widget.see("end")
+		self.widget.configure(state = "disabled")
+
+	def close(self):
+		if self.log != None:
+			self.log.close()
+			self.log = None
+
+# The X/Y/Z plotter.  The X, Y, and Z values are output separately by the CPU,
+# as 26-bit 2's-complement numbers.  I take Z as the pen control (down if
+# nonzero).  The path is a list of strokes, each of which is a list of (x,y)
+# points visited with the pen down.  The log file, if any, gets one line per
+# value output, with the resulting X, Y, and Z.
+class Plot:
+	def __init__(self, logFilename = None, maxPoints = 1000000):
+		self.x = 0
+		self.y = 0
+		self.z = 0
+		self.maxPoints = maxPoints
+		self.numPoints = 0
+		self.strokes = []
+		self.bounds = None
+		self.changed = False
+		self.widget = None
+		self.log = None
+		if logFilename != None:
+			self.log = open(logFilename, "w", buffering = 65536)
+
+	def _signed(self, value):
+		if value & 0o200000000:
+			return value - 0o400000000
+		return value
+
+	def _moved(self):
+		if self.log != None:
+			self.log.write("%d\t%d\t%d\n" % (self.x, self.y, self.z))
+		if self.z != 0 and self.numPoints < self.maxPoints:
+			self.strokes[-1].append((self.x, self.y))
+			self.numPoints += 1
+			if self.bounds == None:
+				self.bounds = [self.x, self.x, self.y, self.y]
+			else:
+				bounds = self.bounds
+				if self.x < bounds[0]:
+					bounds[0] = self.x
+				elif self.x > bounds[1]:
+					bounds[1] = self.x
+				if self.y < bounds[2]:
+					bounds[2] = self.y
+				elif self.y > bounds[3]:
+					bounds[3] = self.y
+			self.changed = True
+
+	def setX(self, value):
+		self.x = self._signed(value)
+		self._moved()
+
+	def setY(self, value):
+		self.y = self._signed(value)
+		self._moved()
+
+	def setZ(self, value):
+		z = self._signed(value)
+		if z != 0 and self.z == 0:
+			self.strokes.append([])
+		self.z = z
+		self._moved()
+
+	# Use a tkinter Canvas widget for rendering.  The plot is scaled to fit.
+	# Attaching the same widget again (as on a resize) just rescales it.
+	def attach(self, widget):
+		if widget is not self.widget:
+			self.widget = widget
+			widget.delete("all")
+			self.drawnStroke = 0
+			self.drawnPoints = 0
+			self.drawnTransform = None
+		self.changed = True
+		self.render()
+
+	# Only the points added since the last render() are drawn, as new line
+	# items continuing from the last point drawn.  If the bounds of the plot or
+	# the size of the widget have changed, what's already on the canvas is
+	# transformed to match with scale() and move(), rather than redrawn.
+	def render(self):
+		if self.widget == None or not self.changed:
+			return
+		self.changed = False
+		if self.bounds == None:
+			return
+		xMin, xMax, yMin, yMax = self.bounds
+		width = max(self.widget.winfo_width(), 2) - 2
+		height = max(self.widget.winfo_height(), 2) - 2
+		scale = min(width / max(xMax - xMin, 1), height / max(yMax - yMin, 1))
+		if scale <= 0:
+			# Not laid out yet.
+			self.changed = True
+			return
+		transform = (xMin, yMin, scale, height)
+		if self.drawnTransform != None and self.drawnTransform != transform:
+			oldXMin, oldYMin, oldScale, oldHeight = self.drawnTransform
+			factor = scale / oldScale
+			self.widget.scale("all", 1, 1 + oldHeight, factor, factor)
+			self.widget.move("all", (oldXMin - xMin) * scale,
+				height - oldHeight + (yMin - oldYMin) * scale)
+		self.drawnTransform = transform
+		for i in range(self.drawnStroke, len(self.strokes)):
+			stroke = self.strokes[i]
+			first = 0
+			if i == self.drawnStroke and self.drawnPoints > 0:
+				if self.drawnPoints == len(stroke):
+					continue
+				first = self.drawnPoints - 1
+			coords = []
+			for x, y in stroke[first:]:
+				coords.append(1 + (x - xMin) * scale)
+				coords.append(1 + height - (y - yMin) * scale)
+			if len(coords) == 2:
+				coords += coords
+			if len(coords) > 0:
+				self.widget.create_line(*coords)
+		if len(self.strokes) > 0:
+			self.drawnStroke = len(self.strokes) - 1
+			self.drawnPoints = len(self.strokes[-1])
+
+	def close(self):
+		if self.log != None:
+			self.log.close()
+			self.log = None
@@ -0,0 +1,470 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	ptcPanelLayout.py
+# Purpose:	The layout of the PTC's indicator lamps, as data, for use
+#		by yaPTC.py.  Also a tool for keeping this data in sync with
+#		the GUI designed with PAGE.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began.
+#
+# The PAGE-generated ProcessorDisplayPanel.py in the guiDesign/ folder creates
+# every indicator lamp (about 350 of them) as a separate tkinter canvas, which
+# yaPTC.py then had to decorate with a caption, one by one, at startup.  That
+# took a long time and lots of memory, and made every update or resize of the
+# panel slow.  Instead, the lamps are described here, with the same geometry
+# PAGE gave them, and ptcLampPanel.py draws all of the lamps of each pane of
+# the GUI on a single canvas.  The copy of ProcessorDisplayPanel.py in the
+# yaLVDC/ folder (which is the one imported by yaPTC.py) has the lamp canvases
+# removed; everything else in it is still just as PAGE generated it.
+#
+# Therefore, after changing the GUI design in PAGE and regenerating
+# guiDesign/ProcessorDisplayPanel.py, do this (in the yaLVDC/ folder):
+#	ptcPanelLayout.py guiDesign/ProcessorDisplayPanel.py >new.py
+#	ptcPanelLayout.py --strip guiDesign/ProcessorDisplayPanel.py ProcessorDisplayPanel.py
+# new.py has the updated lamps[] table to paste in below.  Captions, etc.,
+# for lamps already in the table are retained, while those for any new lamps
+# have to be filled in by hand.
+#
+# Each entry of lamps[] is a tuple:
+#	(name, pane, relx, rely, relheight, relwidth, caption, panel, cc)
+# where name is the attribute name PAGE gave the lamp's canvas (and is still
+# used to refer to it, as top.name), pane is the attribute name of the
+# ttk.Labelframe containing it, relx through relwidth are the arguments PAGE
+# gave to place() (with bordermode='ignore'), caption is the lamp's text,
+# panel is which of the physical panels (PDP, MLDD, or CE) it's on, and cc
+# tells whether it's a "computer" or "command" indicator or neither.
+
+PANEL_PDP = 0	# PANEL_XXX is just a constant we use to ID specific panels.
+PANEL_MLDD = 1
+PANEL_CE = 2
+CC_NONE = 0 # CC_XXX is a constant we use to tell if an indicator is "computer" or "command" or neither.
+CC_COMPUTER = 1
+CC_COMMAND = 2
+
+lamps = [
+	# PDP DATA area:
+	("pdp1", "paneProcessorDisplayPanel_p1", 0.046, 0.062, 0.129, 0.069, "1", PANEL_PDP, CC_NONE),
+	("pdp2", "paneProcessorDisplayPanel_p1", 0.114, 0.062, 0.129, 0.069, "2", PANEL_PDP, CC_NONE),
+	("pdp3", "paneProcessorDisplayPanel_p1", 0.183, 0.062, 0.129, 0.069, "3", PANEL_PDP, CC_NONE),
+	("pdp4", "paneProcessorDisplayPanel_p1", 0.252, 0.062, 0.129, 0.069, "4", PANEL_PDP, CC_NONE),
+	("pdp5", "paneProcessorDisplayPanel_p1", 0.32, 0.062, 0.129, 0.069, "5", PANEL_PDP, CC_NONE),
+	("pdp6", "paneProcessorDisplayPanel_p1", 0.389, 0.062, 0.129, 0.069, "6", PANEL_PDP, CC_NONE),
+	("pdp7", "paneProcessorDisplayPanel_p1", 0.458, 0.062, 0.129, 0.069, "7", PANEL_PDP, CC_NONE),
+	("pdp8", "paneProcessorDisplayPanel_p1", 0.526, 0.062, 0.129, 0.069, "8", PANEL_PDP, CC_NONE),
+	("pdp9", "paneProcessorDisplayPanel_p1", 0.595, 0.062, 0.129, 0.069, "9", PANEL_PDP, CC_NONE),
+	("pdp10", "paneProcessorDisplayPanel_p1", 0.664, 0.062, 0.129, 0.069, "10", PANEL_PDP, CC_NONE),
+	("pdp11", "paneProcessorDisplayPanel_p1", 0.732, 0.062, 0.129, 0.069, "11", PANEL_PDP, CC_NONE),
+	("pdp12", "paneProcessorDisplayPanel_p1", 0.801, 0.062, 0.129, 0.069, "12", PANEL_PDP, CC_NONE),
+	("pdp13", "paneProcessorDisplayPanel_p1", 0.87, 0.062, 0.129, 0.069, "13", PANEL_PDP, CC_NONE),
+	("pdpERROR_RESET", "paneProcessorDisplayPanel_p1", 0.034, 0.29, 0.17, 0.092, "ERROR\nRESET", PANEL_PDP, CC_NONE),
+	("pdpPARITY_ERROR", "paneProcessorDisplayPanel_p1", 0.16, 0.29, 0.087, 0.092, "PAR ERR", PANEL_PDP, CC_NONE),
+	("pdpERROR_HOLD", "paneProcessorDisplayPanel_p1", 0.16, 0.373, 0.087, 0.092, "E HOLD", PANEL_PDP, CC_NONE),
+	("pdpMEM_BUFFER_PARITY", "paneProcessorDisplayPanel_p1", 0.286, 0.29, 0.17, 0.092, "MEM\nBUFFER\nPARITY", PANEL_PDP, CC_NONE),
+	("pdpMEM_BUFFER_REG", "paneProcessorDisplayPanel_p1", 0.412, 0.29, 0.17, 0.092, "MEM\nBUFFER\nREG", PANEL_PDP, CC_NONE),
+	("pdpTRANS_REG", "paneProcessorDisplayPanel_p1", 0.538, 0.29, 0.17, 0.092, "TRANS\nREG", PANEL_PDP, CC_NONE),
+	("pdpOP4", "paneProcessorDisplayPanel_p1", 0.664, 0.29, 0.129, 0.069, "OP4", PANEL_PDP, CC_NONE),
+	("pdpOP3", "paneProcessorDisplayPanel_p1", 0.732, 0.29, 0.129, 0.069, "OP3", PANEL_PDP, CC_NONE),
+	("pdpOP2", "paneProcessorDisplayPanel_p1", 0.801, 0.29, 0.129, 0.069, "OP2", PANEL_PDP, CC_NONE),
+	("pdpOP1", "paneProcessorDisplayPanel_p1", 0.87, 0.29, 0.129, 0.069, "OP1", PANEL_PDP, CC_NONE),
+	("pdpA1", "paneProcessorDisplayPanel_p1", 0.595, 0.581, 0.129, 0.069, "A1", PANEL_PDP, CC_NONE),
+	("pdpA2", "paneProcessorDisplayPanel_p1", 0.526, 0.581, 0.129, 0.069, "A2", PANEL_PDP, CC_NONE),
+	("pdpA3", "paneProcessorDisplayPanel_p1", 0.458, 0.581, 0.129, 0.069, "A3", PANEL_PDP, CC_NONE),
+	("pdpA4", "paneProcessorDisplayPanel_p1", 0.389, 0.581, 0.129, 0.069, "A4", PANEL_PDP, CC_NONE),
+	("pdpA5", "paneProcessorDisplayPanel_p1", 0.32, 0.581, 0.129, 0.069, "A5", PANEL_PDP, CC_NONE),
+	("pdpA6", "paneProcessorDisplayPanel_p1", 0.252, 0.581, 0.129, 0.069, "A6", PANEL_PDP, CC_NONE),
+	("pdpA7", "paneProcessorDisplayPanel_p1", 0.183, 0.581, 0.129, 0.069, "A7", PANEL_PDP, CC_NONE),
+	("pdpA8", "paneProcessorDisplayPanel_p1", 0.114, 0.581, 0.129, 0.069, "A8", PANEL_PDP, CC_NONE),
+	("pdpA9", "paneProcessorDisplayPanel_p1", 0.046, 0.581, 0.129, 0.069, "A9", PANEL_PDP, CC_NONE),
+	("pdpMEM_ADD_REG", "paneProcessorDisplayPanel_p1", 0.847, 0.436, 0.17, 0.092, "MEM\nADD\nREG", PANEL_PDP, CC_NONE),
+	("pdpHOPSAVE_REG", "paneProcessorDisplayPanel_p1", 0.847, 0.602, 0.17, 0.092, "HOP\nSAVE\nREG", PANEL_PDP, CC_NONE),
+	("pdpSYL0", "paneProcessorDisplayPanel_p1", 0.046, 0.747, 0.17, 0.092, "0", PANEL_PDP, CC_NONE),
+	("pdpSYL1", "paneProcessorDisplayPanel_p1", 0.137, 0.747, 0.17, 0.092, "1", PANEL_PDP, CC_NONE),
+	("pdpIS4", "paneProcessorDisplayPanel_p1", 0.263, 0.747, 0.087, 0.094, "IS4", PANEL_PDP, CC_NONE),
+	("pdpIS3", "paneProcessorDisplayPanel_p1", 0.389, 0.747, 0.087, 0.094, "IS3", PANEL_PDP, CC_NONE),
+	("pdpIS2", "paneProcessorDisplayPanel_p1", 0.481, 0.747, 0.087, 0.094, "IS2", PANEL_PDP, CC_NONE),
+	("pdpIS1", "paneProcessorDisplayPanel_p1", 0.572, 0.747, 0.087, 0.094, "IS1", PANEL_PDP, CC_NONE),
+	("pdpDS4", "paneProcessorDisplayPanel_p1", 0.263, 0.83, 0.087, 0.094, "DS4", PANEL_PDP, CC_NONE),
+	("pdpDS3", "paneProcessorDisplayPanel_p1", 0.389, 0.83, 0.087, 0.094, "DS3", PANEL_PDP, CC_NONE),
+	("pdpDS2", "paneProcessorDisplayPanel_p1", 0.481, 0.83, 0.087, 0.094, "DS2", PANEL_PDP, CC_NONE),
+	("pdpDS1", "paneProcessorDisplayPanel_p1", 0.572, 0.83, 0.087, 0.094, "DS1", PANEL_PDP, CC_NONE),
+	("pdpIM0", "paneProcessorDisplayPanel_p1", 0.709, 0.643, 0.087, 0.094, "IM0", PANEL_PDP, CC_NONE),
+	("pdpIM1", "paneProcessorDisplayPanel_p1", 0.709, 0.726, 0.087, 0.094, "IM1", PANEL_PDP, CC_NONE),
+	("pdpDM0", "paneProcessorDisplayPanel_p1", 0.709, 0.809, 0.087, 0.094, "DM0", PANEL_PDP, CC_NONE),
+	("pdpDM1", "paneProcessorDisplayPanel_p1", 0.709, 0.892, 0.087, 0.094, "DM1", PANEL_PDP, CC_NONE),
+	# PDP INTERRUPTS area:
+	("iI1", "paneProcessorDisplayPanel_p2", 0.046, 0.136, 0.191, 0.094, "I1", PANEL_PDP, CC_NONE),
+	("iI2", "paneProcessorDisplayPanel_p2", 0.137, 0.136, 0.191, 0.094, "I2", PANEL_PDP, CC_NONE),
+	("iI3", "paneProcessorDisplayPanel_p2", 0.229, 0.136, 0.191, 0.094, "I3", PANEL_PDP, CC_NONE),
+	("iI4", "paneProcessorDisplayPanel_p2", 0.32, 0.136, 0.191, 0.094, "I4", PANEL_PDP, CC_NONE),
+	("iI5", "paneProcessorDisplayPanel_p2", 0.412, 0.136, 0.191, 0.094, "I5", PANEL_PDP, CC_NONE),
+	("iI6", "paneProcessorDisplayPanel_p2", 0.503, 0.136, 0.191, 0.094, "I6", PANEL_PDP, CC_NONE),
+	("iI7", "paneProcessorDisplayPanel_p2", 0.595, 0.136, 0.191, 0.094, "I7", PANEL_PDP, CC_NONE),
+	("iI8", "paneProcessorDisplayPanel_p2", 0.686, 0.136, 0.191, 0.094, "I8", PANEL_PDP, CC_NONE),
+	("iI9", "paneProcessorDisplayPanel_p2", 0.046, 0.591, 0.191, 0.094, "I9", PANEL_PDP, CC_NONE),
+	("iI10", "paneProcessorDisplayPanel_p2", 0.137, 0.591, 0.191, 0.094, "I10", PANEL_PDP, CC_NONE),
+	("iI11", "paneProcessorDisplayPanel_p2", 0.229, 0.591, 0.191, 0.094, "I11", PANEL_PDP, CC_NONE),
+	("iI12", "paneProcessorDisplayPanel_p2", 0.32, 0.591, 0.191, 0.094, "I12", PANEL_PDP, CC_NONE),
+	("iI13", "paneProcessorDisplayPanel_p2", 0.412, 0.591, 0.191, 0.094, "I13", PANEL_PDP, CC_NONE),
+	("iI14", "paneProcessorDisplayPanel_p2", 0.503, 0.591, 0.191, 0.094, "I14", PANEL_PDP, CC_NONE),
+	("iI15", "paneProcessorDisplayPanel_p2", 0.595, 0.591, 0.191, 0.094, "I15", PANEL_PDP, CC_NONE),
+	("iI16", "paneProcessorDisplayPanel_p2", 0.686, 0.591, 0.191, 0.094, "I16", PANEL_PDP, CC_NONE),
+	("iB1", "paneProcessorDisplayPanel_p2", 0.046, 0.318, 0.191, 0.094, "B1", PANEL_PDP, CC_NONE),
+	("iB2", "paneProcessorDisplayPanel_p2", 0.137, 0.318, 0.191, 0.094, "B2", PANEL_PDP, CC_NONE),
+	("iB3", "paneProcessorDisplayPanel_p2", 0.229, 0.318, 0.191, 0.094, "B3", PANEL_PDP, CC_NONE),
+	("iB4", "paneProcessorDisplayPanel_p2", 0.32, 0.318, 0.191, 0.094, "B4", PANEL_PDP, CC_NONE),
+	("iB5", "paneProcessorDisplayPanel_p2", 0.412, 0.318, 0.191, 0.094, "B5", PANEL_PDP, CC_NONE),
+	("iB6", "paneProcessorDisplayPanel_p2", 0.503, 0.318, 0.191, 0.094, "B6", PANEL_PDP, CC_NONE),
+	("iB7", "paneProcessorDisplayPanel_p2", 0.595, 0.318, 0.191, 0.094, "B7", PANEL_PDP, CC_NONE),
+	("iB8", "paneProcessorDisplayPanel_p2", 0.686, 0.318, 0.191, 0.094, "B8", PANEL_PDP, CC_NONE),
+	("iB9", "paneProcessorDisplayPanel_p2", 0.046, 0.773, 0.191, 0.094, "B9", PANEL_PDP, CC_NONE),
+	("iB10", "paneProcessorDisplayPanel_p2", 0.137, 0.773, 0.191, 0.094, "B10", PANEL_PDP, CC_NONE),
+	("iB11", "paneProcessorDisplayPanel_p2", 0.229, 0.773, 0.191, 0.094, "B11", PANEL_PDP, CC_NONE),
+	("iB12", "paneProcessorDisplayPanel_p2", 0.32, 0.773, 0.191, 0.094, "B12", PANEL_PDP, CC_NONE),
+	("iB13", "paneProcessorDisplayPanel_p2", 0.412, 0.773, 0.191, 0.094, "B13", PANEL_PDP, CC_NONE),
+	("iB14", "paneProcessorDisplayPanel_p2", 0.503, 0.773, 0.191, 0.094, "B14", PANEL_PDP, CC_NONE),
+	("iB15", "paneProcessorDisplayPanel_p2", 0.595, 0.773, 0.191, 0.094, "B15", PANEL_PDP, CC_NONE),
+	("iB16", "paneProcessorDisplayPanel_p2", 0.686, 0.773, 0.191, 0.094, "B16", PANEL_PDP, CC_NONE),
+	("INHIBIT_CTRL", "paneProcessorDisplayPanel_p2", 0.847, 0.136, 0.373, 0.117, "INHIBIT\nCTRL", PANEL_PDP, CC_NONE),
+	("PROG_ERR", "paneProcessorDisplayPanel_p2", 0.847, 0.591, 0.191, 0.117, "PROG ERR", PANEL_PDP, CC_NONE),
+	("SYNC_ERR", "paneProcessorDisplayPanel_p2", 0.847, 0.773, 0.191, 0.117, "SYNC ERR", PANEL_PDP, CC_NONE),
+	# PDP PROGRAM CONTROL area:
+	("CST", "TPanedwindow1_p1", 0.012, 0.25, 0.35, 0.122, "CST", PANEL_PDP, CC_NONE),
+	("MAN_CST", "TPanedwindow1_p1", 0.012, 0.583, 0.35, 0.122, "MAN CST", PANEL_PDP, CC_NONE),
+	("ADVANCE", "TPanedwindow1_p1", 0.132, 0.25, 0.683, 0.11, "ADVANCE", PANEL_PDP, CC_NONE),
+	("P1", "TPanedwindow1_p1", 0.635, 0.25, 0.35, 0.072, "P1", PANEL_PDP, CC_NONE),
+	("P2", "TPanedwindow1_p1", 0.564, 0.25, 0.35, 0.072, "P2", PANEL_PDP, CC_NONE),
+	("P4", "TPanedwindow1_p1", 0.492, 0.25, 0.35, 0.072, "P4", PANEL_PDP, CC_NONE),
+	("P10", "TPanedwindow1_p1", 0.42, 0.25, 0.35, 0.072, "P10", PANEL_PDP, CC_NONE),
+	("P20", "TPanedwindow1_p1", 0.348, 0.25, 0.35, 0.072, "P20", PANEL_PDP, CC_NONE),
+	("P40", "TPanedwindow1_p1", 0.276, 0.25, 0.35, 0.074, "P40", PANEL_PDP, CC_NONE),
+	("D1", "TPanedwindow1_p1", 0.635, 0.583, 0.35, 0.072, "D1", PANEL_PDP, CC_NONE),
+	("D2", "TPanedwindow1_p1", 0.564, 0.583, 0.35, 0.074, "D2", PANEL_PDP, CC_NONE),
+	("D3", "TPanedwindow1_p1", 0.492, 0.583, 0.35, 0.072, "D3", PANEL_PDP, CC_NONE),
+	("D4", "TPanedwindow1_p1", 0.42, 0.583, 0.35, 0.072, "D4", PANEL_PDP, CC_NONE),
+	("D5", "TPanedwindow1_p1", 0.348, 0.583, 0.35, 0.072, "D5", PANEL_PDP, CC_NONE),
+	("D6", "TPanedwindow1_p1", 0.276, 0.583, 0.35, 0.072, "D6", PANEL_PDP, CC_NONE),
+	("RESET_MACHINE", "TPanedwindow1_p1", 0.755, 0.25, 0.683, 0.11, "RESET\nMACHINE", PANEL_PDP, CC_NONE),
+	("HALT", "TPanedwindow1_p1", 0.863, 0.25, 0.683, 0.122, "HALT", PANEL_PDP, CC_NONE),
+	# MISCELLANEOUS area (PDP POWER CONTROL and TRMC MODE):
+	("pdpLAMP_TEST", "paneProcessorDisplayPanel_p4", 0.126, 0.472, 0.387, 0.092, "LAMP\nTEST", PANEL_PDP, CC_NONE),
+	("trmcAUTO", "paneProcessorDisplayPanel_p4", 0.538, 0.472, 0.198, 0.117, "AUTO", PANEL_PDP, CC_NONE),
+	("trmcMANUAL", "paneProcessorDisplayPanel_p4", 0.538, 0.66, 0.198, 0.117, "MANUAL", PANEL_PDP, CC_NONE),
+	("trmcML", "paneProcessorDisplayPanel_p4", 0.652, 0.472, 0.198, 0.117, "ML", PANEL_PDP, CC_NONE),
+	("trmcDD", "paneProcessorDisplayPanel_p4", 0.652, 0.66, 0.198, 0.117, "DD", PANEL_PDP, CC_NONE),
+	("trmcERROR_DEVICES_TEST", "paneProcessorDisplayPanel_p4", 0.767, 0.472, 0.387, 0.117, "ERROR\nDEVICES\nTEST", PANEL_PDP, CC_NONE),
+	# MLDD INSTRUCTION ADDRESS area:
+	("iaComputerM0", "paneMemoryLoadAndDataDisplayPanel_p2", 0.046, 0.222, 0.156, 0.08, "0", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerM1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.126, 0.222, 0.156, 0.08, "1", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerSYL0", "paneMemoryLoadAndDataDisplayPanel_p2", 0.4, 0.222, 0.156, 0.08, "0", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerSYL1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.481, 0.222, 0.156, 0.08, "1", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerIS4", "paneMemoryLoadAndDataDisplayPanel_p2", 0.561, 0.222, 0.156, 0.092, "IS4", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerIS3", "paneMemoryLoadAndDataDisplayPanel_p2", 0.652, 0.222, 0.156, 0.092, "IS3", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerIS2", "paneMemoryLoadAndDataDisplayPanel_p2", 0.744, 0.222, 0.156, 0.092, "IS2", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerIS1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.835, 0.222, 0.156, 0.092, "IS1", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA8", "paneMemoryLoadAndDataDisplayPanel_p2", 0.195, 0.667, 0.156, 0.092, "A8", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA7", "paneMemoryLoadAndDataDisplayPanel_p2", 0.286, 0.667, 0.156, 0.092, "A7", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA6", "paneMemoryLoadAndDataDisplayPanel_p2", 0.378, 0.667, 0.156, 0.092, "A6", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA5", "paneMemoryLoadAndDataDisplayPanel_p2", 0.469, 0.667, 0.156, 0.092, "A5", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA4", "paneMemoryLoadAndDataDisplayPanel_p2", 0.561, 0.667, 0.156, 0.092, "A4", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA3", "paneMemoryLoadAndDataDisplayPanel_p2", 0.652, 0.667, 0.156, 0.092, "A3", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA2", "paneMemoryLoadAndDataDisplayPanel_p2", 0.744, 0.667, 0.156, 0.092, "A2", PANEL_MLDD, CC_COMPUTER),
+	("iaComputerA1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.835, 0.667, 0.156, 0.092, "A1", PANEL_MLDD, CC_COMPUTER),
+	("iaCommandM0", "paneMemoryLoadAndDataDisplayPanel_p2", 0.046, 0.37, 0.156, 0.08, "0", PANEL_MLDD, CC_COMMAND),
+	("iaCommandM1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.126, 0.37, 0.156, 0.08, "1", PANEL_MLDD, CC_COMMAND),
+	("iaCommandSYL0", "paneMemoryLoadAndDataDisplayPanel_p2", 0.4, 0.37, 0.156, 0.08, "0", PANEL_MLDD, CC_COMMAND),
+	("iaCommandSYL1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.481, 0.37, 0.156, 0.08, "1", PANEL_MLDD, CC_COMMAND),
+	("iaCommandIS4", "paneMemoryLoadAndDataDisplayPanel_p2", 0.561, 0.37, 0.156, 0.092, "IS4", PANEL_MLDD, CC_COMMAND),
+	("iaCommandIS3", "paneMemoryLoadAndDataDisplayPanel_p2", 0.652, 0.37, 0.156, 0.092, "IS3", PANEL_MLDD, CC_COMMAND),
+	("iaCommandIS2", "paneMemoryLoadAndDataDisplayPanel_p2", 0.744, 0.37, 0.156, 0.092, "IS2", PANEL_MLDD, CC_COMMAND),
+	("iaCommandIS1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.835, 0.37, 0.156, 0.092, "IS1", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA8", "paneMemoryLoadAndDataDisplayPanel_p2", 0.195, 0.815, 0.156, 0.092, "A8", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA7", "paneMemoryLoadAndDataDisplayPanel_p2", 0.286, 0.815, 0.156, 0.092, "A7", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA6", "paneMemoryLoadAndDataDisplayPanel_p2", 0.378, 0.815, 0.156, 0.092, "A6", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA5", "paneMemoryLoadAndDataDisplayPanel_p2", 0.469, 0.815, 0.156, 0.092, "A5", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA4", "paneMemoryLoadAndDataDisplayPanel_p2", 0.561, 0.815, 0.156, 0.092, "A4", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA3", "paneMemoryLoadAndDataDisplayPanel_p2", 0.652, 0.815, 0.156, 0.092, "A3", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA2", "paneMemoryLoadAndDataDisplayPanel_p2", 0.744, 0.815, 0.156, 0.092, "A2", PANEL_MLDD, CC_COMMAND),
+	("iaCommandA1", "paneMemoryLoadAndDataDisplayPanel_p2", 0.835, 0.815, 0.156, 0.092, "A1", PANEL_MLDD, CC_COMMAND),
+	# MLDD DATA ADDRESS area:
+	("daPARITY_BIT", "paneMemoryLoadAndDataDisplayPanel_p3", 0.057, 0.226, 0.308, 0.092, "BR", PANEL_MLDD, CC_COMPUTER),
+	("daComputerDS4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.24, 0.226, 0.158, 0.092, "DS4", PANEL_MLDD, CC_COMPUTER),
+	("daComputerDS3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.332, 0.226, 0.158, 0.092, "DS3", PANEL_MLDD, CC_COMPUTER),
+	("daComputerDS2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.423, 0.226, 0.158, 0.092, "DS2", PANEL_MLDD, CC_COMPUTER),
+	("daComputerDS1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.515, 0.226, 0.158, 0.092, "DS1", PANEL_MLDD, CC_COMPUTER),
+	("daComputerM0", "paneMemoryLoadAndDataDisplayPanel_p3", 0.789, 0.226, 0.158, 0.08, "0", PANEL_MLDD, CC_COMPUTER),
+	("daComputerM1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.87, 0.226, 0.158, 0.08, "1", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOP4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.092, 0.639, 0.158, 0.069, "OP4", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOP3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.16, 0.639, 0.158, 0.069, "OP3", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOP2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.229, 0.639, 0.158, 0.069, "OP2", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOP1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.297, 0.639, 0.158, 0.069, "OP1", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA9", "paneMemoryLoadAndDataDisplayPanel_p3", 0.366, 0.639, 0.158, 0.069, "OA9", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA8", "paneMemoryLoadAndDataDisplayPanel_p3", 0.435, 0.639, 0.158, 0.069, "OA8", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA7", "paneMemoryLoadAndDataDisplayPanel_p3", 0.503, 0.639, 0.158, 0.069, "OA7", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA6", "paneMemoryLoadAndDataDisplayPanel_p3", 0.572, 0.639, 0.158, 0.069, "OA6", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA5", "paneMemoryLoadAndDataDisplayPanel_p3", 0.641, 0.639, 0.158, 0.069, "OA5", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.709, 0.639, 0.158, 0.069, "OA4", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.778, 0.639, 0.158, 0.069, "OA3", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.847, 0.639, 0.158, 0.069, "OA2", PANEL_MLDD, CC_COMPUTER),
+	("daComputerOA1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.915, 0.639, 0.158, 0.069, "OA1", PANEL_MLDD, CC_COMPUTER),
+	("daCommandDS4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.24, 0.376, 0.158, 0.092, "DS4", PANEL_MLDD, CC_COMMAND),
+	("daCommandDS3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.332, 0.376, 0.158, 0.092, "DS3", PANEL_MLDD, CC_COMMAND),
+	("daCommandDS2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.423, 0.376, 0.158, 0.092, "DS2", PANEL_MLDD, CC_COMMAND),
+	("daCommandDS1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.515, 0.376, 0.158, 0.092, "DS1", PANEL_MLDD, CC_COMMAND),
+	("daCommandM0", "paneMemoryLoadAndDataDisplayPanel_p3", 0.789, 0.376, 0.158, 0.08, "0", PANEL_MLDD, CC_COMMAND),
+	("daCommandM1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.87, 0.376, 0.158, 0.08, "1", PANEL_MLDD, CC_COMMAND),
+	("daCommandOP4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.092, 0.789, 0.158, 0.069, "OP4", PANEL_MLDD, CC_COMMAND),
+	("daCommandOP3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.16, 0.789, 0.158, 0.069, "OP3", PANEL_MLDD, CC_COMMAND),
+	("daCommandOP2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.229, 0.789, 0.158, 0.069, "OP2", PANEL_MLDD, CC_COMMAND),
+	("daCommandOP1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.297, 0.789, 0.158, 0.069, "OP1", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA9", "paneMemoryLoadAndDataDisplayPanel_p3", 0.366, 0.789, 0.158, 0.069, "OA9", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA8", "paneMemoryLoadAndDataDisplayPanel_p3", 0.435, 0.789, 0.158, 0.069, "OA8", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA7", "paneMemoryLoadAndDataDisplayPanel_p3", 0.503, 0.789, 0.158, 0.069, "OA7", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA6", "paneMemoryLoadAndDataDisplayPanel_p3", 0.572, 0.789, 0.158, 0.069, "OA6", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA5", "paneMemoryLoadAndDataDisplayPanel_p3", 0.641, 0.789, 0.158, 0.069, "OA5", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA4", "paneMemoryLoadAndDataDisplayPanel_p3", 0.709, 0.789, 0.158, 0.069, "OA4", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA3", "paneMemoryLoadAndDataDisplayPanel_p3", 0.778, 0.789, 0.158, 0.069, "OA3", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA2", "paneMemoryLoadAndDataDisplayPanel_p3", 0.847, 0.789, 0.158, 0.069, "OA2", PANEL_MLDD, CC_COMMAND),
+	("daCommandOA1", "paneMemoryLoadAndDataDisplayPanel_p3", 0.915, 0.789, 0.158, 0.069, "OA1", PANEL_MLDD, CC_COMMAND),
+	# MLDD DATA area:
+	("mlddLAMP_TEST", "paneMemoryLoadAndDataDisplayPanel_p4", 0.149, 0.227, 0.266, 0.092, "LAMP\nTEST", PANEL_MLDD, CC_NONE),
+	("mlddPARITY_BIT", "paneMemoryLoadAndDataDisplayPanel_p4", 0.767, 0.227, 0.266, 0.092, "PARITY\nBIT", PANEL_MLDD, CC_NONE),
+	("mlddComputerBR0", "paneMemoryLoadAndDataDisplayPanel_p4", 0.412, 0.227, 0.26, 0.048, "B\nR", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputerBR1", "paneMemoryLoadAndDataDisplayPanel_p4", 0.503, 0.227, 0.26, 0.048, "B\nR", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputerSIGN", "paneMemoryLoadAndDataDisplayPanel_p4", 0.046, 0.584, 0.136, 0.048, "S", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer1", "paneMemoryLoadAndDataDisplayPanel_p4", 0.046, 0.714, 0.136, 0.048, "1", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer2", "paneMemoryLoadAndDataDisplayPanel_p4", 0.046, 0.844, 0.136, 0.048, "2", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer3", "paneMemoryLoadAndDataDisplayPanel_p4", 0.149, 0.584, 0.136, 0.048, "3", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer4", "paneMemoryLoadAndDataDisplayPanel_p4", 0.149, 0.714, 0.136, 0.048, "4", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer5", "paneMemoryLoadAndDataDisplayPanel_p4", 0.149, 0.844, 0.136, 0.048, "5", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer6", "paneMemoryLoadAndDataDisplayPanel_p4", 0.252, 0.584, 0.136, 0.048, "6", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer7", "paneMemoryLoadAndDataDisplayPanel_p4", 0.252, 0.714, 0.136, 0.048, "7", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer8", "paneMemoryLoadAndDataDisplayPanel_p4", 0.252, 0.844, 0.136, 0.048, "8", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer9", "paneMemoryLoadAndDataDisplayPanel_p4", 0.355, 0.584, 0.136, 0.048, "9", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer10", "paneMemoryLoadAndDataDisplayPanel_p4", 0.355, 0.714, 0.136, 0.048, "10", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer11", "paneMemoryLoadAndDataDisplayPanel_p4", 0.355, 0.844, 0.136, 0.048, "11", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer12", "paneMemoryLoadAndDataDisplayPanel_p4", 0.458, 0.584, 0.136, 0.048, "12", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer13", "paneMemoryLoadAndDataDisplayPanel_p4", 0.458, 0.714, 0.136, 0.048, "13", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer14", "paneMemoryLoadAndDataDisplayPanel_p4", 0.458, 0.844, 0.136, 0.048, "14", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer15", "paneMemoryLoadAndDataDisplayPanel_p4", 0.561, 0.584, 0.136, 0.048, "15", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer16", "paneMemoryLoadAndDataDisplayPanel_p4", 0.561, 0.714, 0.136, 0.048, "16", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer17", "paneMemoryLoadAndDataDisplayPanel_p4", 0.561, 0.844, 0.136, 0.048, "17", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer18", "paneMemoryLoadAndDataDisplayPanel_p4", 0.664, 0.584, 0.136, 0.048, "18", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer19", "paneMemoryLoadAndDataDisplayPanel_p4", 0.664, 0.714, 0.136, 0.048, "19", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer20", "paneMemoryLoadAndDataDisplayPanel_p4", 0.664, 0.844, 0.136, 0.048, "20", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer21", "paneMemoryLoadAndDataDisplayPanel_p4", 0.767, 0.584, 0.136, 0.048, "21", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer22", "paneMemoryLoadAndDataDisplayPanel_p4", 0.767, 0.714, 0.136, 0.048, "22", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer23", "paneMemoryLoadAndDataDisplayPanel_p4", 0.767, 0.844, 0.136, 0.048, "23", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer24", "paneMemoryLoadAndDataDisplayPanel_p4", 0.87, 0.584, 0.136, 0.048, "24", PANEL_MLDD, CC_COMPUTER),
+	("mlddComputer25", "paneMemoryLoadAndDataDisplayPanel_p4", 0.87, 0.714, 0.136, 0.048, "25", PANEL_MLDD, CC_COMPUTER),
+	("mlddCommandSYL0", "paneMemoryLoadAndDataDisplayPanel_p4", 0.458, 0.227, 0.26, 0.048, "S\nY\n0", PANEL_MLDD, CC_COMMAND),
+	("mlddCommandSYL1", "paneMemoryLoadAndDataDisplayPanel_p4", 0.549, 0.227, 0.26, 0.048, "S\nY\n1", PANEL_MLDD, CC_COMMAND),
+	("mlddCommandSIGN", "paneMemoryLoadAndDataDisplayPanel_p4", 0.092, 0.584, 0.136, 0.048, "S", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand1", "paneMemoryLoadAndDataDisplayPanel_p4", 0.092, 0.714, 0.136, 0.048, "1", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand2", "paneMemoryLoadAndDataDisplayPanel_p4", 0.092, 0.844, 0.136, 0.048, "2", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand3", "paneMemoryLoadAndDataDisplayPanel_p4", 0.195, 0.584, 0.136, 0.048, "3", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand4", "paneMemoryLoadAndDataDisplayPanel_p4", 0.195, 0.714, 0.136, 0.048, "4", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand5", "paneMemoryLoadAndDataDisplayPanel_p4", 0.195, 0.844, 0.136, 0.048, "5", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand6", "paneMemoryLoadAndDataDisplayPanel_p4", 0.297, 0.584, 0.136, 0.048, "6", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand7", "paneMemoryLoadAndDataDisplayPanel_p4", 0.297, 0.714, 0.136, 0.048, "7", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand8", "paneMemoryLoadAndDataDisplayPanel_p4", 0.297, 0.844, 0.136, 0.048, "8", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand9", "paneMemoryLoadAndDataDisplayPanel_p4", 0.4, 0.584, 0.136, 0.048, "9", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand10", "paneMemoryLoadAndDataDisplayPanel_p4", 0.4, 0.714, 0.136, 0.048, "10", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand11", "paneMemoryLoadAndDataDisplayPanel_p4", 0.4, 0.844, 0.136, 0.048, "11", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand12", "paneMemoryLoadAndDataDisplayPanel_p4", 0.503, 0.584, 0.136, 0.048, "12", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand13", "paneMemoryLoadAndDataDisplayPanel_p4", 0.503, 0.714, 0.136, 0.048, "13", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand14", "paneMemoryLoadAndDataDisplayPanel_p4", 0.503, 0.844, 0.136, 0.048, "14", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand15", "paneMemoryLoadAndDataDisplayPanel_p4", 0.606, 0.584, 0.136, 0.048, "15", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand16", "paneMemoryLoadAndDataDisplayPanel_p4", 0.606, 0.714, 0.136, 0.048, "16", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand17", "paneMemoryLoadAndDataDisplayPanel_p4", 0.606, 0.844, 0.136, 0.048, "17", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand18", "paneMemoryLoadAndDataDisplayPanel_p4", 0.709, 0.584, 0.136, 0.048, "18", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand19", "paneMemoryLoadAndDataDisplayPanel_p4", 0.709, 0.714, 0.136, 0.048, "19", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand20", "paneMemoryLoadAndDataDisplayPanel_p4", 0.709, 0.844, 0.136, 0.048, "20", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand21", "paneMemoryLoadAndDataDisplayPanel_p4", 0.812, 0.584, 0.136, 0.048, "21", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand22", "paneMemoryLoadAndDataDisplayPanel_p4", 0.812, 0.714, 0.136, 0.048, "22", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand23", "paneMemoryLoadAndDataDisplayPanel_p4", 0.812, 0.844, 0.136, 0.048, "23", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand24", "paneMemoryLoadAndDataDisplayPanel_p4", 0.915, 0.584, 0.136, 0.048, "24", PANEL_MLDD, CC_COMMAND),
+	("mlddCommand25", "paneMemoryLoadAndDataDisplayPanel_p4", 0.915, 0.714, 0.136, 0.048, "25", PANEL_MLDD, CC_COMMAND),
+	# MLDD DISPLAY MODE area:
+	("acDATA", "paneMemoryLoadAndDataDisplayPanel_p7", 0.423, 0.588, 0.124, 0.069, "DATA", PANEL_MLDD, CC_NONE),
+	("acINS", "paneMemoryLoadAndDataDisplayPanel_p7", 0.423, 0.706, 0.124, 0.069, "INS", PANEL_MLDD, CC_NONE),
+	# MLDD ERRORS area:
+	("PARITY_TAPE", "TPanedwindow2_p1", 0.022, 0.39, 0.273, 0.13, "TAPE", PANEL_MLDD, CC_NONE),
+	("PARITY_SERIAL", "TPanedwindow2_p1", 0.022, 0.649, 0.273, 0.13, "SER", PANEL_MLDD, CC_NONE),
+	("TRS", "TPanedwindow2_p1", 0.152, 0.39, 0.273, 0.13, "TRS", PANEL_MLDD, CC_NONE),
+	("A13", "TPanedwindow2_p1", 0.152, 0.649, 0.273, 0.13, "A13", PANEL_MLDD, CC_NONE),
+	("SERIAL", "TPanedwindow2_p1", 0.281, 0.39, 0.273, 0.13, "SER", PANEL_MLDD, CC_NONE),
+	("HOPC1", "TPanedwindow2_p1", 0.281, 0.649, 0.273, 0.13, "HOPC", PANEL_MLDD, CC_NONE),
+	("SSMSC", "TPanedwindow2_p1", 0.411, 0.39, 0.273, 0.13, "SMSC", PANEL_MLDD, CC_NONE),
+	("SSMBR", "TPanedwindow2_p1", 0.411, 0.649, 0.273, 0.13, "SMBR", PANEL_MLDD, CC_NONE),
+	("OAC", "TPanedwindow2_p1", 0.541, 0.39, 0.273, 0.13, "OAC", PANEL_MLDD, CC_NONE),
+	("BR14", "TPanedwindow2_p1", 0.541, 0.649, 0.273, 0.13, "BR14", PANEL_MLDD, CC_NONE),
+	("ERROR_RESET", "TPanedwindow2_p1", 0.671, 0.39, 0.532, 0.152, "ERROR\nRESET", PANEL_MLDD, CC_NONE),
+	("INVERT_ERROR", "TPanedwindow2_p1", 0.823, 0.39, 0.532, 0.152, "INVERT\nERROR", PANEL_MLDD, CC_NONE),
+	# MLDD MEMORY LOADER area:
+	("mlREPEAT", "TPanedwindow2_p2", 0.025, 0.39, 0.273, 0.199, "REPEAT", PANEL_MLDD, CC_NONE),
+	("mlREPEAT_INVERSE", "TPanedwindow2_p2", 0.025, 0.649, 0.273, 0.199, "/REPEAT", PANEL_MLDD, CC_NONE),
+	("mlADDRESS_CMPTR", "TPanedwindow2_p2", 0.224, 0.39, 0.532, 0.249, "ADDRESS\nCOMPTR", PANEL_MLDD, CC_NONE),
+	("mlCOMPTR_DISPLAY_RESET", "TPanedwindow2_p2", 0.473, 0.39, 0.532, 0.249, "COMPTR\nDISPLAY\nRESET", PANEL_MLDD, CC_NONE),
+	("mlCOMMAND_DISPLAY_RESET", "TPanedwindow2_p2", 0.721, 0.39, 0.532, 0.249, "COMMAND\nDISPLAY\nRESET", PANEL_MLDD, CC_NONE),
+	# CE ACCUMULATOR area:
+	("A_S", "paneCEPanel_p2", 0.047, 0.1, 0.14, 0.07, "A/S", PANEL_CE, CC_NONE),
+	("DLA2", "paneCEPanel_p2", 0.116, 0.1, 0.14, 0.07, "DLA2", PANEL_CE, CC_NONE),
+	("DLA3", "paneCEPanel_p2", 0.186, 0.1, 0.14, 0.07, "DLA3", PANEL_CE, CC_NONE),
+	("DLA4", "paneCEPanel_p2", 0.256, 0.1, 0.14, 0.07, "DLA4", PANEL_CE, CC_NONE),
+	("DLA5", "paneCEPanel_p2", 0.326, 0.1, 0.14, 0.07, "DLA5", PANEL_CE, CC_NONE),
+	("DLA6", "paneCEPanel_p2", 0.395, 0.1, 0.14, 0.07, "DLA6", PANEL_CE, CC_NONE),
+	("DLA7", "paneCEPanel_p2", 0.465, 0.1, 0.14, 0.07, "DLA7", PANEL_CE, CC_NONE),
+	("DLA8", "paneCEPanel_p2", 0.535, 0.1, 0.14, 0.07, "DLA8", PANEL_CE, CC_NONE),
+	("DLA9", "paneCEPanel_p2", 0.605, 0.1, 0.14, 0.07, "DLA9", PANEL_CE, CC_NONE),
+	("DLA10", "paneCEPanel_p2", 0.674, 0.1, 0.14, 0.07, "DLA10", PANEL_CE, CC_NONE),
+	("DLA11", "paneCEPanel_p2", 0.744, 0.1, 0.14, 0.07, "DLA11", PANEL_CE, CC_NONE),
+	("DLA12", "paneCEPanel_p2", 0.814, 0.1, 0.14, 0.07, "DLA12", PANEL_CE, CC_NONE),
+	("DLA13", "paneCEPanel_p2", 0.884, 0.1, 0.14, 0.07, "DLA13", PANEL_CE, CC_NONE),
+	("DLA14", "paneCEPanel_p2", 0.047, 0.233, 0.14, 0.07, "DLA14", PANEL_CE, CC_NONE),
+	("DLA15", "paneCEPanel_p2", 0.116, 0.233, 0.14, 0.07, "DLA15", PANEL_CE, CC_NONE),
+	("DLA16", "paneCEPanel_p2", 0.186, 0.233, 0.14, 0.07, "DLA16", PANEL_CE, CC_NONE),
+	("DLA17", "paneCEPanel_p2", 0.256, 0.233, 0.14, 0.07, "DLA17", PANEL_CE, CC_NONE),
+	("DLA18", "paneCEPanel_p2", 0.326, 0.233, 0.14, 0.07, "DLA18", PANEL_CE, CC_NONE),
+	("DLA19", "paneCEPanel_p2", 0.395, 0.233, 0.14, 0.07, "DLA19", PANEL_CE, CC_NONE),
+	("DLA20", "paneCEPanel_p2", 0.465, 0.233, 0.14, 0.07, "DLA20", PANEL_CE, CC_NONE),
+	("DLA21", "paneCEPanel_p2", 0.535, 0.233, 0.14, 0.07, "DLA21", PANEL_CE, CC_NONE),
+	("DLA22", "paneCEPanel_p2", 0.605, 0.233, 0.14, 0.07, "DLA22", PANEL_CE, CC_NONE),
+	("DLA23", "paneCEPanel_p2", 0.674, 0.233, 0.14, 0.07, "DLA23", PANEL_CE, CC_NONE),
+	("DLA24", "paneCEPanel_p2", 0.744, 0.233, 0.14, 0.07, "DLA24", PANEL_CE, CC_NONE),
+	("DLA25", "paneCEPanel_p2", 0.814, 0.233, 0.14, 0.07, "DLA25", PANEL_CE, CC_NONE),
+	("DLA26", "paneCEPanel_p2", 0.884, 0.233, 0.14, 0.07, "DLA26", PANEL_CE, CC_NONE),
+	("DLA27", "paneCEPanel_p2", 0.047, 0.4, 0.14, 0.07, "DLA27", PANEL_CE, CC_NONE),
+	("DLA28", "paneCEPanel_p2", 0.116, 0.4, 0.14, 0.07, "DLA28", PANEL_CE, CC_NONE),
+	("DLA29", "paneCEPanel_p2", 0.186, 0.4, 0.14, 0.07, "DLA29", PANEL_CE, CC_NONE),
+	("DLA30", "paneCEPanel_p2", 0.256, 0.4, 0.14, 0.07, "DLA30", PANEL_CE, CC_NONE),
+	("ACC0", "paneCEPanel_p2", 0.326, 0.4, 0.14, 0.07, "ACC0", PANEL_CE, CC_NONE),
+	("ACC1", "paneCEPanel_p2", 0.395, 0.4, 0.14, 0.07, "ACC1", PANEL_CE, CC_NONE),
+	("DLB1", "paneCEPanel_p2", 0.465, 0.4, 0.14, 0.07, "DLB1", PANEL_CE, CC_NONE),
+	("DLB2", "paneCEPanel_p2", 0.535, 0.4, 0.14, 0.07, "DLB2", PANEL_CE, CC_NONE),
+	("DLB3", "paneCEPanel_p2", 0.605, 0.4, 0.14, 0.07, "DLB3", PANEL_CE, CC_NONE),
+	("DLB4", "paneCEPanel_p2", 0.674, 0.4, 0.14, 0.07, "DLB4", PANEL_CE, CC_NONE),
+	("DLB5", "paneCEPanel_p2", 0.744, 0.4, 0.14, 0.07, "DLB5", PANEL_CE, CC_NONE),
+	("DLB6", "paneCEPanel_p2", 0.814, 0.4, 0.14, 0.07, "DLB6", PANEL_CE, CC_NONE),
+	("DLB7", "paneCEPanel_p2", 0.884, 0.4, 0.14, 0.07, "DLB7", PANEL_CE, CC_NONE),
+	("DLB8", "paneCEPanel_p2", 0.047, 0.533, 0.14, 0.07, "DLB8", PANEL_CE, CC_NONE),
+	("DLB9", "paneCEPanel_p2", 0.116, 0.533, 0.14, 0.07, "DLB9", PANEL_CE, CC_NONE),
+	("DLB10", "paneCEPanel_p2", 0.186, 0.533, 0.14, 0.07, "DLB10", PANEL_CE, CC_NONE),
+	("DLB11", "paneCEPanel_p2", 0.256, 0.533, 0.14, 0.07, "DLB11", PANEL_CE, CC_NONE),
+	("DLB12", "paneCEPanel_p2", 0.326, 0.533, 0.14, 0.07, "DLB12", PANEL_CE, CC_NONE),
+	("DLB13", "paneCEPanel_p2", 0.395, 0.533, 0.14, 0.07, "DLB13", PANEL_CE, CC_NONE),
+	("DLB14", "paneCEPanel_p2", 0.465, 0.533, 0.14, 0.07, "DLB14", PANEL_CE, CC_NONE),
+	("DLB15", "paneCEPanel_p2", 0.535, 0.533, 0.14, 0.07, "DLB15", PANEL_CE, CC_NONE),
+	("DLB16", "paneCEPanel_p2", 0.605, 0.533, 0.14, 0.07, "DLB16", PANEL_CE, CC_NONE),
+	("DLB17", "paneCEPanel_p2", 0.674, 0.533, 0.14, 0.07, "DLB17", PANEL_CE, CC_NONE),
+	("DLB18", "paneCEPanel_p2", 0.744, 0.533, 0.14, 0.07, "DLB18", PANEL_CE, CC_NONE),
+	("DLB19", "paneCEPanel_p2", 0.814, 0.533, 0.14, 0.07, "DLB19", PANEL_CE, CC_NONE),
+	("DLB20", "paneCEPanel_p2", 0.884, 0.533, 0.14, 0.07, "DLB20", PANEL_CE, CC_NONE),
+	("DLB21", "paneCEPanel_p2", 0.047, 0.7, 0.14, 0.07, "DLB21", PANEL_CE, CC_NONE),
+	("AI0", "paneCEPanel_p2", 0.116, 0.7, 0.14, 0.07, "AI0", PANEL_CE, CC_NONE),
+	("AI1", "paneCEPanel_p2", 0.186, 0.7, 0.14, 0.07, "AI1", PANEL_CE, CC_NONE),
+	("AI2", "paneCEPanel_p2", 0.256, 0.7, 0.14, 0.07, "AI2", PANEL_CE, CC_NONE),
+	("AI3", "paneCEPanel_p2", 0.326, 0.7, 0.14, 0.07, "AI3", PANEL_CE, CC_NONE),
+	("AI4", "paneCEPanel_p2", 0.395, 0.7, 0.14, 0.07, "AI4", PANEL_CE, CC_NONE),
+	("ACC_DISPLAY_ENABLE", "paneCEPanel_p2", 0.791, 0.7, 0.273, 0.116, "ACC\nDISPLAY\nENABLE", PANEL_CE, CC_NONE),
+	# CE MEMORY BUFFER REGISTER area:
+	("mbrBIT1", "paneCEPanel_p3", 0.047, 0.238, 0.167, 0.07, "BIT1", PANEL_CE, CC_NONE),
+	("mbrBIT2", "paneCEPanel_p3", 0.116, 0.238, 0.167, 0.07, "BIT2", PANEL_CE, CC_NONE),
+	("mbrBIT3", "paneCEPanel_p3", 0.186, 0.238, 0.167, 0.07, "BIT3", PANEL_CE, CC_NONE),
+	("mbrBIT4", "paneCEPanel_p3", 0.256, 0.238, 0.167, 0.07, "BIT4", PANEL_CE, CC_NONE),
+	("mbrBIT5", "paneCEPanel_p3", 0.326, 0.238, 0.167, 0.07, "BIT5", PANEL_CE, CC_NONE),
+	("mbrBIT6", "paneCEPanel_p3", 0.395, 0.238, 0.167, 0.07, "BIT6", PANEL_CE, CC_NONE),
+	("mbrBIT7", "paneCEPanel_p3", 0.465, 0.238, 0.167, 0.07, "BIT7", PANEL_CE, CC_NONE),
+	("mbrBIT8", "paneCEPanel_p3", 0.535, 0.238, 0.167, 0.07, "BIT8", PANEL_CE, CC_NONE),
+	("mbrBIT9", "paneCEPanel_p3", 0.605, 0.238, 0.167, 0.07, "BIT9", PANEL_CE, CC_NONE),
+	("mbrBIT10", "paneCEPanel_p3", 0.674, 0.238, 0.167, 0.07, "BIT10", PANEL_CE, CC_NONE),
+	("mbrBIT11", "paneCEPanel_p3", 0.744, 0.238, 0.167, 0.07, "BIT11", PANEL_CE, CC_NONE),
+	("mbrBIT12", "paneCEPanel_p3", 0.814, 0.238, 0.167, 0.07, "BIT12", PANEL_CE, CC_NONE),
+	("mbrBIT13", "paneCEPanel_p3", 0.884, 0.238, 0.167, 0.07, "BIT13", PANEL_CE, CC_NONE),
+	("mbrBIT14", "paneCEPanel_p3", 0.372, 0.635, 0.167, 0.119, "BIT14", PANEL_CE, CC_NONE),
+	("mbrMBR1", "paneCEPanel_p3", 0.047, 0.397, 0.167, 0.07, "MB1", PANEL_CE, CC_NONE),
+	("mbrMBR2", "paneCEPanel_p3", 0.116, 0.397, 0.167, 0.07, "MB2", PANEL_CE, CC_NONE),
+	("mbrMBR3", "paneCEPanel_p3", 0.186, 0.397, 0.167, 0.07, "MB3", PANEL_CE, CC_NONE),
+	("mbrMBR4", "paneCEPanel_p3", 0.256, 0.397, 0.167, 0.07, "MB4", PANEL_CE, CC_NONE),
+	("mbrMBR5", "paneCEPanel_p3", 0.326, 0.397, 0.167, 0.07, "MB5", PANEL_CE, CC_NONE),
+	("mbrMBR6", "paneCEPanel_p3", 0.395, 0.397, 0.167, 0.07, "MB6", PANEL_CE, CC_NONE),
+	("mbrMBR7", "paneCEPanel_p3", 0.465, 0.397, 0.167, 0.07, "MB7", PANEL_CE, CC_NONE),
+	("mbrMBR8", "paneCEPanel_p3", 0.535, 0.397, 0.167, 0.07, "MB8", PANEL_CE, CC_NONE),
+	("mbrMBR9", "paneCEPanel_p3", 0.605, 0.397, 0.167, 0.07, "MB9", PANEL_CE, CC_NONE),
+	("mbrMBR10", "paneCEPanel_p3", 0.674, 0.397, 0.167, 0.07, "MB10", PANEL_CE, CC_NONE),
+	("mbrMBR11", "paneCEPanel_p3", 0.744, 0.397, 0.167, 0.07, "MB11", PANEL_CE, CC_NONE),
+	("mbrMBR12", "paneCEPanel_p3", 0.814, 0.397, 0.167, 0.07, "MB12", PANEL_CE, CC_NONE),
+	("mbrMBR13", "paneCEPanel_p3", 0.884, 0.397, 0.167, 0.07, "MB13", PANEL_CE, CC_NONE),
+	("mbrODD_PARITY", "paneCEPanel_p3", 0.372, 0.794, 0.167, 0.119, "ODD PAR", PANEL_CE, CC_NONE),
+	("mbrLOAD", "paneCEPanel_p3", 0.547, 0.635, 0.325, 0.093, "LOAD", PANEL_CE, CC_NONE),
+	("ceLAMP_TEST", "paneCEPanel_p3", 0.802, 0.635, 0.325, 0.093, "LAMP\nTEST", PANEL_CE, CC_NONE),
+]
+
+###################################################################################
+# The tool for updating the above from PAGE output.
+
+import re
+
+canvasPattern = re.compile(r"^    self\.(\w+) = tk\.Canvas\(self\.(\w+)\)\n(?:    .*\n|\n(?=    self\.\1\.))*\n", re.M)
+placePattern = re.compile(r"place\(relx=([-\d.]+), rely=([-\d.]+), relheight=([-\d.]+)\s*,?\s*relwidth=([-\d.]+)")
+
+# Returns a list of (name, pane, relx, rely, relheight, relwidth) for all of
+# the canvases in the PAGE-generated source whose parents are panes, along
+# with the regular-expression matches for all of the canvases (including the
+# few PAGE has placed within other canvases, which are never visible anyway).
+def extract(source):
+	found = []
+	matches = []
+	for match in canvasPattern.finditer(source):
+		matches.append(match)
+		name = match.group(1)
+		pane = match.group(2)
+		if not pane.startswith("pane") and not pane.startswith("TPanedwindow"):
+			continue
+		place = placePattern.search(match.group(0).replace("\n", "").replace("        ", " "))
+		if place == None:
+			continue
+		found.append((name, pane) + tuple([float(x) for x in place.groups()]))
+	return found, matches
+
+def formatLamp(lamp):
+	panels = ["PANEL_PDP", "PANEL_MLDD", "PANEL_CE"]
+	ccs = ["CC_NONE", "CC_COMPUTER", "CC_COMMAND"]
+	name, pane, relx, rely, relheight, relwidth, caption, panel, cc = lamp
+	if panel == None:
+		panel = "None"
+	else:
+		panel = panels[panel]
+	return '\t("%s", "%s", %s, %s, %s, %s, %s, %s, %s),' % (name, pane, repr(relx),
+		repr(rely), repr(relheight), repr(relwidth), '"' + caption.replace("\n", "\\n") + '"',
+		panel, ccs[cc])
+
+if __name__ == "__main__":
+	import sys
+	if len(sys.argv) == 4 and sys.argv[1] == "--strip":
+		source = open(sys.argv[2], "r").read()
+		found, matches = extract(source)
+		for match in reversed(matches):
+			source = source[:match.start()] + source[match.end():]
+		lines = source.split("\n")
+		lines.insert(3, "# The lamp canvases have been removed by ptcPanelLayout.py --strip.\n#")
+		f = open(sys.argv[3], "w")
+		f.write("\n".join(lines))
+		f.close()
+	elif len(sys.argv) == 2:
+		source = open(sys.argv[1], "r").read()
+		found, matches = extract(source)
+		old = {}
+		for lamp in lamps:
+			old[lamp[0]] = lamp
+		print("lamps = [")
+		for lamp in found:
+			if lamp[0] in old:
+				lamp = lamp + old[lamp[0]][6:]
+			else:
+				lamp = lamp + ("", None, CC_NONE)
+			print(formatLamp(lamp))
+		print("]")
+	else:
+		print("Usage:")
+		print("\tptcPanelLayout.py PAGEFILE >LAMPTABLE")
+		print("\tptcPanelLayout.py --strip PAGEFILE STRIPPEDFILE")
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+# Copyright:	None, placed in the PUBLIC DOMAIN.
+# Filename: 	virtualWire.py
+# Purpose:	Encoding and parsing of yaLVDC "virtual wire" packets, for
+#		Python programs on either end of the connection:  peripherals
+#		like yaPTC.py, or stand-ins for yaLVDC like lvdcLoadGenerator.py.
+#		The packet format is described at the top of virtualWire.c.
+# Reference:	http://www.ibiblio.org/apollo/developer.html
+# Mod history:	2026-10-19	Began, by moving encodePacket() and
+#				parsePackets() from yaPTC.py.
+#
+# Briefly, each packet is 6 bytes.  The first byte has bit 7 set, bit 6 set
+# for a mask packet rather than a data packet, bits 5-3 the I/O type, and
+# bits 2-0 the ID of the source (0 for yaLVDC itself).  The remaining 5 bytes
+# have bit 7 clear, and hold the 9-bit channel number and the 26-bit value.
+# A single byte of 0xFF is a ping, and can be ignored.
+
+packetSize = 6
+
+# Encodes a single packet into buffer[offset:offset+6], returning offset+6.
+# If isMask is True, it's a mask packet and value is the mask.  source is the
+# ID of the sender.
+def encodePacket(buffer, offset, ioType, channel, value, isMask = False, source = 0):
+	b0 = 0x80 | ((ioType & 7) << 3) | (source & 7)
+	if isMask:
+		b0 |= 0x40
+	buffer[offset] = b0
+	buffer[offset + 1] = channel & 0x7F
+	buffer[offset + 2] = ((channel & 0x180) >> 2) | ((value >> 21) & 0x1F)
+	buffer[offset + 3] = (value >> 14) & 0x7F
+	buffer[offset + 4] = (value >> 7) & 0x7F
+	buffer[offset + 5] = value & 0x7F
+	return offset + 6
+
+# Parse all of the complete packets in buffer[start:end], appending them to
+# the list packets as (ioType,channel,value) tuples.  Returns the index of the
+# first byte not yet processed, which is the start of an incomplete packet
+# (if any).  Pings are skipped.  For other corrupted packets, the 6 bytes
+# are printed, or are appended to the list illegal if there is one; in either
+# case, we realign at the next byte which could be the start of a packet.
+# Mask packets aren't distinguished from data packets, since yaLVDC never
+# sends them.
+def parsePackets(buffer, start, end, packets, illegal = None):
+	i = start
+	while end - i >= packetSize:
+		b0 = buffer[i]
+		b1 = buffer[i + 1]
+		b2 = buffer[i + 2]
+		b3 = buffer[i + 3]
+		b4 = buffer[i + 4]
+		b5 = buffer[i + 5]
+		if (b0 & 0x80) == 0x80 and b0 != 0xFF and ((b1 | b2 | b3 | b4 | b5) & 0x80) == 0:
+			# Packet has the various signatures we expect.
+			channel = ((b2 << 2) & 0x180) | b1
+			value = ((b2 & 0x1F) << 21) | (b3 << 14) | (b4 << 7) | b5
+			packets.append(((b0 >> 3) & 7, channel, value))
+			i += packetSize
+			continue
+		if b0 != 0xFF:
+			if illegal == None:
+				print("Illegal packet: %03o %03o %03o %03o %03o %03o" % (b0, b1, b2, b3, b4, b5))
+			else:
+				illegal.append((b0, b1, b2, b3, b4, b5))
+		i += 1
+		while i < end and ((buffer[i] & 0x80) == 0 or buffer[i] == 0xFF):
+			i += 1
+	return i
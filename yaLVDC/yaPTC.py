@@ -36,6 +36,62 @@
 #				to the interrupt latch within one instruction
 #				cycle.  I expect this will help with the
 #				speed problem I complained about above as well.
+#		2026-10-19	Each iteration of the event loop now reads 
+#				everything yaLVDC has sent so far, and parses
+#				all of the complete packets in it, rather than
+#				reading at most one packet per iteration.
+#		2026-10-19	Moved socket reception and packet parsing into
+#				a separate thread, which blocks in select()
+#				rather than being polled, and hands the parsed
+#				packets to the GUI thread through a queue.
+#		2026-10-19	Indicator changes are now just recorded, and
+#				are applied to the display at most 30 times
+#				per second, and only for indicators whose 
+#				displayed state actually needs to change.
+#		2026-10-19	All packets generated in an iteration of the
+#				event loop are now encoded into one buffer
+#				and sent together, and whatever the 
+#				(non-blocking) socket doesn't accept is 
+#				kept and sent later rather than being lost.
+#		2026-10-19	outputFromCPU() now dispatches through a table
+#				of handlers, and the typewriter/printer/PRS
+#				characters are decoded with lookup tables.
+#		2026-10-19	Typewriter, printer, and plotter output now
+#				goes to the models in ptcOutput.py, which can
+#				log to files and are displayed in their own
+#				windows, rather than being printed to the
+#				console packet by packet (unless --echo=1).
+#		2026-10-19	Added --headless and --script, to run without
+#				tkinter or a display, using the stand-ins in
+#				ptcHeadless.py for the GUI.
+#		2026-10-19	Added --record, for logging everything received
+#				from yaLVDC, and --replay and --speed for 
+#				playing such a log back in place of yaLVDC.
+#		2026-10-19	Moved the packet encoding and parsing to 
+#				virtualWire.py, and added replies to the
+#				probes sent by lvdcLoadGenerator.py.
+#		2026-10-19	Added --stats, for per-channel statistics of
+#				the traffic from yaLVDC and of the time spent
+#				processing it, in a window and at exit.
+#		2026-10-19	Added --policy, for what to do about status
+#				packets when we're falling behind yaLVDC.  By
+#				default, superseded ones are now discarded.
+#		2026-10-19	The indicator lamps are now described by the
+#				table in ptcPanelLayout.py, and are drawn by 
+#				ptcLampPanel.py, all of the lamps in each pane
+#				on a single canvas, rather than each being a
+#				canvas created by the PAGE-generated code.
+#		2026-10-19	flushIndicators() now changes all of the lamps
+#				in a pane which are lit (or extinguished)
+#				together, with a single call.
+#		2026-10-19	The PRA/PRB switches and the commanded DATA,
+#				DA, and IA rows of the MLDD are now tracked as
+#				integer shadow registers, updated as individual
+#				bits change, rather than being read back a bit
+#				at a time.
+#		2026-10-19	The LAMP TESTs in progress are now a bitset,
+#				and starting or ending one redraws only the 
+#				indicators which are affected.
 #
 # The parts which need to be modified from the skeleton form of the program 
 # to make it peripheral-specific are the outputFromCPU() and inputsForCPU() 
@@ -46,7 +102,10 @@
 # you can simply run yaLVDC and yaPTC.py from different consoles on that same 
 # computer. 
 
-from ProcessorDisplayPanel import *
+import ptcOutput
+import ptcPanelLayout
+import virtualWire
+import atexit
 
 ioTypes = ["PIO", "CIO", "PRS", "INT" ]
 # BA8421 character set in its native encoding.  All of the unprintable
@@ -62,7 +121,7 @@ BA8421 = [
 	'+', 'A', 'B', 'C', 'D', 'E', 'F', 'G',
 	'H', 'I', '?', '.', ')', '?', '?', '?'
 ]
-refreshRate = 1 # Milliseconds
+refreshRate = 10 # Milliseconds
 resizable = 0
 
 # Parse command-line arguments.
@@ -72,7 +131,21 @@ cli.add_argument("--host", help="Host address of yaAGC/yaAGS, defaulting to loca
 cli.add_argument("--port", help="Port for yaLVDC, defaulting to 19653.", type=int)
 cli.add_argument("--id", help="Unique ID of this peripheral (1-7), default=1.", type=int)
 cli.add_argument("--resize", help="If 1 (default 0), make the window resizable.", type=int)
+cli.add_argument("--typewriter", help="Name of a file in which to log typewriter output.")
+cli.add_argument("--printer", help="Name of a file in which to log printer output.")
+cli.add_argument("--plotter", help="Name of a file in which to log plotter output.")
+cli.add_argument("--windows", help="If 1 (default), show typewriter, printer, and plotter output in windows.", type=int)
+cli.add_argument("--echo", help="If 1 (default 0, or 1 if --headless), print typewriter, printer, and plotter output to the console too.", type=int)
+cli.add_argument("--headless", help="Run without a GUI (and without tkinter).", action="store_true")
+cli.add_argument("--script", help="Name of a file of scripted panel inputs, for use with --headless; see ptcHeadless.py.")
+cli.add_argument("--record", help="Name of a file in which to record all data received from yaLVDC.")
+cli.add_argument("--replay", help="Name of a file made by --record, to be played back instead of connecting to yaLVDC.")
+cli.add_argument("--speed", help="Speed factor for --replay (default 1), or 0 for as fast as possible.", type=float)
+cli.add_argument("--policy", help="What to do with status packets when falling behind:  coalesce (default), drop, or full.", choices=["coalesce", "drop", "full"], default="coalesce")
+cli.add_argument("--stats", help="Keep statistics for each channel, shown in a window and printed at exit.", action="store_true")
 args = cli.parse_args()
+if args.script and not args.headless:
+	cli.error("--script can only be used with --headless")
 
 # Characteristics of the host and port being used for yaLVDC communications.  
 if args.host:
@@ -97,6 +170,30 @@ if args.resize:
 else:
 	resize = 0
 
+# In --headless mode, everything works the same as usual, including the
+# bookkeeping for all of the indicator lamps, except that there's no display.
+# The GUI modules (and tkinter) aren't imported at all, and stand-ins from 
+# ptcHeadless.py take their places.  Without a display, the only way to 
+# operate the panel is with a --script, and the decoded output goes to the 
+# console by default.
+headless = args.headless
+if headless:
+	import ptcHeadless
+	ProcessorDisplayPanel_support = ptcHeadless
+	topProcessorDisplayPanel = ptcHeadless.Panel
+else:
+	from ProcessorDisplayPanel import *
+	import ptcLampPanel
+
+if args.windows == None:
+	outputWindows = not headless
+else:
+	outputWindows = (args.windows != 0) and not headless
+if args.echo == None:
+	echo = headless
+else:
+	echo = (args.echo != 0)
+
 ###################################################################################
 # Hardware abstraction / User-defined functions.  Also, any other platform-specific
 # initialization.  This is the section to customize for specific applications.
@@ -118,122 +215,39 @@ def eventHalt(event):
 	halt = True
 	indicatorOn(event.widget)
 
+# The PRA and PRB toggle switches.  Rather than reading all 26 of a register's
+# switch variables whenever one of them is flipped, an integer shadow of each
+# register is kept in switchRegisters[], and each variable has a trace which
+# updates just its own bit of the shadow whenever the variable is written.
+# cPRA() and cPRB(), which the GUI calls after one of the switches has been
+# flipped, then merely pick up the shadow register for sending to the CPU.
+switchRegisters = { "PRA": 0, "PRB": 0 }
+def traceSwitch(register, variable, bit):
+	def update(*args):
+		if variable.get():
+			switchRegisters[register] |= bit
+		else:
+			switchRegisters[register] &= ~bit
+	variable.trace_add("write", update)
+	update()
+def traceSwitches():
+	for register in switchRegisters:
+		traceSwitch(register, getattr(ProcessorDisplayPanel_support, 
+			"b" + register + "S"), 0o200000000)
+		for n in range(1, 26):
+			traceSwitch(register, getattr(ProcessorDisplayPanel_support,
+				"b" + register + str(n)), 0o200000000 >> n)
+
 ProgRegA = -1
 def cPRA():
 	global ProgRegA
-	n = 0
-	if ProcessorDisplayPanel_support.bPRAS.get():
-		n |= 0o200000000
-	if ProcessorDisplayPanel_support.bPRA1.get():
-		n |= 0o100000000
-	if ProcessorDisplayPanel_support.bPRA2.get():
-		n |= 0o040000000
-	if ProcessorDisplayPanel_support.bPRA3.get():
-		n |= 0o020000000
-	if ProcessorDisplayPanel_support.bPRA4.get():
-		n |= 0o010000000
-	if ProcessorDisplayPanel_support.bPRA5.get():
-		n |= 0o004000000
-	if ProcessorDisplayPanel_support.bPRA6.get():
-		n |= 0o002000000
-	if ProcessorDisplayPanel_support.bPRA7.get():
-		n |= 0o001000000
-	if ProcessorDisplayPanel_support.bPRA8.get():
-		n |= 0o000400000
-	if ProcessorDisplayPanel_support.bPRA9.get():
-		n |= 0o000200000
-	if ProcessorDisplayPanel_support.bPRA10.get():
-		n |= 0o000100000
-	if ProcessorDisplayPanel_support.bPRA11.get():
-		n |= 0o000040000
-	if ProcessorDisplayPanel_support.bPRA12.get():
-		n |= 0o000020000
-	if ProcessorDisplayPanel_support.bPRA13.get():
-		n |= 0o000010000
-	if ProcessorDisplayPanel_support.bPRA14.get():
-		n |= 0o000004000
-	if ProcessorDisplayPanel_support.bPRA15.get():
-		n |= 0o000002000
-	if ProcessorDisplayPanel_support.bPRA16.get():
-		n |= 0o000001000
-	if ProcessorDisplayPanel_support.bPRA17.get():
-		n |= 0o000000400
-	if ProcessorDisplayPanel_support.bPRA18.get():
-		n |= 0o000000200
-	if ProcessorDisplayPanel_support.bPRA19.get():
-		n |= 0o000000100
-	if ProcessorDisplayPanel_support.bPRA20.get():
-		n |= 0o000000040
-	if ProcessorDisplayPanel_support.bPRA21.get():
-		n |= 0o000000020
-	if ProcessorDisplayPanel_support.bPRA22.get():
-		n |= 0o000000010
-	if ProcessorDisplayPanel_support.bPRA23.get():
-		n |= 0o000000004
-	if ProcessorDisplayPanel_support.bPRA24.get():
-		n |= 0o000000002
-	if ProcessorDisplayPanel_support.bPRA25.get():
-		n |= 0o000000001
-	ProgRegA = n
+	ProgRegA = switchRegisters["PRA"]
 ProcessorDisplayPanel_support.cPRA = cPRA
 	
 ProgRegB = -1
 def cPRB():
 	global ProgRegB
-	n = 0
-	if ProcessorDisplayPanel_support.bPRBS.get():
-		n |= 0o200000000
-	if ProcessorDisplayPanel_support.bPRB1.get():
-		n |= 0o100000000
-	if ProcessorDisplayPanel_support.bPRB2.get():
-		n |= 0o040000000
-	if ProcessorDisplayPanel_support.bPRB3.get():
-		n |= 0o020000000
-	if ProcessorDisplayPanel_support.bPRB4.get():
-		n |= 0o010000000
-	if ProcessorDisplayPanel_support.bPRB5.get():
-		n |= 0o004000000
-	if ProcessorDisplayPanel_support.bPRB6.get():
-		n |= 0o002000000
-	if ProcessorDisplayPanel_support.bPRB7.get():
-		n |= 0o001000000
-	if ProcessorDisplayPanel_support.bPRB8.get():
-		n |= 0o000400000
-	if ProcessorDisplayPanel_support.bPRB9.get():
-		n |= 0o000200000
-	if ProcessorDisplayPanel_support.bPRB10.get():
-		n |= 0o000100000
-	if ProcessorDisplayPanel_support.bPRB11.get():
-		n |= 0o000040000
-	if ProcessorDisplayPanel_support.bPRB12.get():
-		n |= 0o000020000
-	if ProcessorDisplayPanel_support.bPRB13.get():
-		n |= 0o000010000
-	if ProcessorDisplayPanel_support.bPRB14.get():
-		n |= 0o000004000
-	if ProcessorDisplayPanel_support.bPRB15.get():
-		n |= 0o000002000
-	if ProcessorDisplayPanel_support.bPRB16.get():
-		n |= 0o000001000
-	if ProcessorDisplayPanel_support.bPRB17.get():
-		n |= 0o000000400
-	if ProcessorDisplayPanel_support.bPRB18.get():
-		n |= 0o000000200
-	if ProcessorDisplayPanel_support.bPRB19.get():
-		n |= 0o000000100
-	if ProcessorDisplayPanel_support.bPRB20.get():
-		n |= 0o000000040
-	if ProcessorDisplayPanel_support.bPRB21.get():
-		n |= 0o000000020
-	if ProcessorDisplayPanel_support.bPRB22.get():
-		n |= 0o000000010
-	if ProcessorDisplayPanel_support.bPRB23.get():
-		n |= 0o000000004
-	if ProcessorDisplayPanel_support.bPRB24.get():
-		n |= 0o000000002
-	if ProcessorDisplayPanel_support.bPRB25.get():
-		n |= 0o000000001
-	ProgRegB = n
+	ProgRegB = switchRegisters["PRB"]
 ProcessorDisplayPanel_support.cPRB = cPRB
 
 # This function is automatically called periodically by the event loop to check for 
@@ -290,248 +304,183 @@ def inputsForCPU():
 		needStatusFromCPU = False
 		returnValue.append((4, 0o605, 0, 0o377777777))
 	
+	if len(probeReplies) > 0:
+		returnValue += probeReplies
+		del probeReplies[:]
+	
 	return returnValue
 
-# GUI indicator functions.  These are implemented as canvas widgets,
-# sometimes with callback functions bound to them when they're supposed
-# to act like pushbuttons.  Each canvas just has two visible elements:
-# a filling white rectangle (ID=1) that can be either opaque or invisible,
-# and a textual caption (ID=5).
-# Adjust the size of an indicator lamp after a startup, window resize, etc.
-def indicatorReconfigure(event):
-	width = event.width
-	height = event.height
-	event.widget.coords(1, 0, 0, width, height)
-	event.widget.coords(2, width/2.0, height/2.0)
-# Set up an indicator lamp, at startup, before use.  As defined by the PAGE
-# tool, and our import of the modules it creates, an indicator lamp is simply
-# an empty rectangular canvas.  We add two elements to the canvas:  a 
-# rectangular block that fills it, and which we can use to adjust the color 
-# by either revealing it or hiding it, and above that, the textual caption.
-PANEL_PDP = 0	# PANEL_XXX is just a constant we use to ID specific panels.
-PANEL_MLDD = 1
-PANEL_CE = 2
-CC_NONE = 0 # CC_XXX is a constant we use to tell if an indicator is "computer" or "command" or neither.
-CC_COMPUTER = 1
-CC_COMMAND = 2
+# GUI indicator functions.  The indicator lamps are described by the table in
+# ptcPanelLayout.py, and (except with --headless) are drawn by ptcLampPanel.py,
+# which makes each lamp an attribute of top, as top.PROG_ERR or whatever.
+# Some of them have callback functions bound to them, when they're supposed
+# to act like pushbuttons.  Before use, each lamp has to be set up by 
+# indicatorInitialize(), which is just bookkeeping.
+from ptcPanelLayout import PANEL_PDP, PANEL_MLDD, PANEL_CE, CC_NONE, CC_COMPUTER, CC_COMMAND
 indicators = { PANEL_PDP : {}, PANEL_MLDD : {}, PANEL_CE : {} }
 computerIndicators = []
 commandIndicators = []
-def indicatorInitialize(canvas, text, panel, cc = CC_NONE):
+def indicatorInitialize(canvas, panel, cc = CC_NONE):
 	indicators[panel][canvas] = 0
+	indicatorPanels[canvas] = panel
+	indicatorPanelBits[canvas] = 1 << panel
+	indicatorStates[canvas] = False
+	displayedStates[canvas] = False
 	if cc == CC_COMPUTER:
 		computerIndicators.append(canvas)
 	elif cc == CC_COMMAND:
 		commandIndicators.append(canvas)
-	canvas.delete("all")
-	canvas.create_rectangle(0, 0, 1, 1, fill="white", state = "hidden")
-	canvas.create_text(1, 1, fill="white", text=text, font=("Sans", 6), justify=tk.CENTER)
-	canvas.bind("<Configure>", indicatorReconfigure)
 # indicatorOn() and indicatorOff() are used to either light up an indicator
-# or to unlight it.  That involves changing the color of the rectangular
-# fill and the text-color of the caption.  However, we have to intercept
-# that process if a LAMP TEST is in progress for the particular panel 
-# containing the indicator, because in that case we have to capture the
-# intended change of state but not change the actual colors, since when 
-# a lamp test is in progress the indicator stays lit regardless.  Similarly,
-# when a lamp test ends, the lamp must resume either the state it had before
-# the lamp test or else the desired state due to changes that have taken 
-# place while the lamp test was in progress.  The indicators[] dictionary
-# tracks those changes; it not only indicates which indicators are on which
-# of the 3 panels, but also tracks their intended states during LAMP TESTS;
-# it doesn't try to track their states whilst there is no LAMP TEST for the
-# corresponding panel, because the actual visual appearance already does that.
-inLampTests = []
+# or to unlight it.  They don't actually touch the display, though.  They just
+# record the intended state of the indicator in indicatorStates[], and if that
+# changes what ought to be displayed, mark the indicator as dirty.  It's 
+# flushIndicators(), running periodically (flushInterval milliseconds) in the
+# GUI event loop, which changes the displayed colors, and then only for 
+# indicators whose displayed state (as tracked by displayedStates[]) differs
+# from what it ought to be.  It does so a pane at a time, with one call for all
+# of the lamps in the pane being lit and one for all of those being extinguished
+# (see ptcLampPanel.py).  Thus a lamp which is toggled many times between
+# flushes costs nothing more than a lamp which is toggled once, and a lamp
+# which is set to the state it's already in costs nothing at all.  What ought
+# to be displayed is the intended state, except that during a LAMP TEST for
+# the panel containing the indicator, the indicator stays lit regardless;
+# when the lamp test ends, the intended state (including any changes which 
+# have taken place while the lamp test was in progress) is displayed again.
+# The indicators[] dictionary tells which indicators are on which of the 3 
+# panels, and indicatorPanels[] is the reverse lookup.  The LAMP TESTs in
+# progress are kept as a bitset, lampTests, with bit 1<<PANEL_XXX for each
+# panel, and indicatorPanelBits[] gives that bit for each indicator, so that
+# whether an indicator is in a lamp test is just a single AND.
+indicatorPanels = {}
+indicatorPanelBits = {}
+indicatorStates = {}
+displayedStates = {}
+dirtyIndicators = set()
+lampTests = 0
+flushInterval = 33 # Milliseconds
 def isIndicatorInLampTest(canvas):
-	for panel in inLampTests:
-		if canvas in indicators[panel]:
-			return panel
-	return False 
+	return (lampTests & indicatorPanelBits[canvas]) != 0
+def indicatorIsOn(canvas):
+	return indicatorStates.get(canvas, False)
+def indicatorSet(canvas, onOff):
+	onOff = bool(onOff)
+	indicatorStates[canvas] = onOff
+	if canvas in registerBits:
+		register, bit = registerBits[canvas]
+		if onOff:
+			commandRegisters[register] |= bit
+		else:
+			commandRegisters[register] &= ~bit
+	if onOff != displayedStates[canvas] and (lampTests & indicatorPanelBits[canvas]) == 0:
+		dirtyIndicators.add(canvas)
 def indicatorOff(canvas):
-	inTest = isIndicatorInLampTest(canvas)
-	if inTest == False:
-		canvas.itemconfig(1, state = "hidden")
-		canvas.itemconfig(2, fill = "white")
-	else:
-		indicators[inTest][canvas] = "hidden"
+	indicatorSet(canvas, False)
 def indicatorOn(canvas):
-	inTest = isIndicatorInLampTest(canvas)
-	if inTest == False:
-		canvas.itemconfig(1, state = "normal")
-		canvas.itemconfig(2, fill = "black")
-	else:
-		indicators[inTest][canvas] = "normal"
-def indicatorSet(canvas, onOff):
-	if onOff:
-		indicatorOn(canvas)
-	else:
-		indicatorOff(canvas)
+	indicatorSet(canvas, True)
 def indicatorToggle(canvas):
-	inTest = isIndicatorInLampTest(canvas)
-	if inTest == False:
-		indicatorSet(canvas, canvas.itemcget(1, "state") == "hidden")
-	else:
-		indicatorSet(canvas, indicators[inTest][canvas] == "hidden")
+	indicatorSet(canvas, not indicatorStates[canvas])
+# Starting or ending a lamp test changes what ought to be displayed only for
+# the panel's indicators whose intended state is off, so only those are
+# marked dirty, and then only if the lamp test wasn't already in the state
+# requested (as when the button is held down and autorepeats).
 def startPanelLampTest(panel):
-	for indicator in indicators[panel]:
-		indicators[panel][indicator] = indicator.itemcget(1, "state")
-		indicatorOn(indicator)
-	if panel not in inLampTests:
-		inLampTests.append(panel)
+	global lampTests
+	if (lampTests & (1 << panel)) != 0:
+		return
+	lampTests |= 1 << panel
+	dirtyIndicators.update([canvas for canvas in indicators[panel] if not indicatorStates[canvas]])
 def endPanelLampTest(panel):
-	if panel in inLampTests:
-		inLampTests.remove(panel)
-	for indicator in indicators[panel]:
-		if indicators[panel][indicator] == "normal":
-			indicatorOn(indicator)
-		else:
-			indicatorOff(indicator)
+	global lampTests
+	if (lampTests & (1 << panel)) == 0:
+		return
+	lampTests &= ~(1 << panel)
+	dirtyIndicators.update([canvas for canvas in indicators[panel] if not indicatorStates[canvas]])
+def flushIndicators():
+	global dirtyIndicators, guiTime, guiCount
+	if statsEnabled:
+		startTime = time.perf_counter()
+	dirty = dirtyIndicators
+	dirtyIndicators = set()
+	changes = {}
+	for canvas in dirty:
+		onOff = indicatorStates[canvas] or (lampTests & indicatorPanelBits[canvas]) != 0
+		if onOff == displayedStates[canvas]:
+			continue
+		displayedStates[canvas] = onOff
+		if not headless:
+			key = (canvas.pane, onOff)
+			if key in changes:
+				changes[key].append(canvas)
+			else:
+				changes[key] = [canvas]
+	for pane, onOff in changes:
+		pane.setLit(changes[(pane, onOff)], onOff)
+	if statsEnabled:
+		guiTime += time.perf_counter() - startTime
+		guiCount += len(dirty)
+	root.after(flushInterval, flushIndicators)
+
+# Prints the names of all of the indicators which are lit, as displayed.  
+# Used for --headless.
+def dumpIndicators():
+	lit = []
+	for canvas in indicatorPanels:
+		if indicatorStates[canvas] or isIndicatorInLampTest(canvas):
+			lit.append(str(canvas))
+	print("\nLit indicators: " + " ".join(sorted(lit)))
+
+# The commanded DATA, DATA ADDRESS, and INSTRUCTION ADDRESS areas of the MLDD
+# are rows of indicators which act as toggle switches.  Rather than checking
+# the indicators one by one whenever the value of one of the rows is needed,
+# an integer shadow of each row is kept in commandRegisters[], and 
+# indicatorSet() updates the corresponding bit of the shadow whenever the
+# intended state of one of the indicators in registerBits[] changes, however
+# that comes about (toggling, COMMAND DISPLAY RESET, and so on).  
+# registerBits[] is filled in by registerBitsInitialize() at startup, from
+# the names of the indicators in registerLayouts[].
+REGISTER_D = 0
+REGISTER_DA = 1
+REGISTER_IA = 2
+commandRegisters = [0, 0, 0]
+registerBits = {}
+registerLayouts = {
+	REGISTER_D : [("mlddCommandSIGN", 0o200000000)] + 
+		[("mlddCommand%d" % n, 0o200000000 >> n) for n in range(1, 26)],
+	REGISTER_DA : [("daCommandDS4", 0o040000000), ("daCommandDS3", 0o020000000),
+		("daCommandDS2", 0o010000000), ("daCommandDS1", 0o004000000),
+		("daCommandM1", 0o000400000)] + 
+		[("daCommandOA%d" % n, 0o000000040 << (n - 1)) for n in range(1, 9)] +
+		[("daCommandOA9", 0o000000020)] +
+		[("daCommandOP%d" % n, 0o000000001 << (n - 1)) for n in range(1, 5)],
+	REGISTER_IA : [("iaCommandM1", 0o200000000)] +
+		[("iaCommandA%d" % n, 0o000000200 << (n - 1)) for n in range(1, 9)] +
+		[("iaCommandSYL1", 0o000000100)] +
+		[("iaCommandIS%d" % n, 0o000000004 << (n - 1)) for n in range(1, 5)]
+}
+def registerBitsInitialize():
+	for register in registerLayouts:
+		for name, bit in registerLayouts[register]:
+			canvas = getattr(top, name)
+			registerBits[canvas] = (register, bit)
+			if indicatorStates[canvas]:
+				commandRegisters[register] |= bit
 
-# Turns the switch settings for the commanded DATA area
-# of MLDD into an integer.		
+# The commanded DATA area of MLDD as an integer.		
 def getDataCommand():
-	value = 0;			
-	if top.mlddCommandSIGN.itemcget(1, "state") == "normal":
-		value |= 0o200000000
-	if top.mlddCommand1.itemcget(1, "state") == "normal":
-		value |= 0o100000000
-	if top.mlddCommand2.itemcget(1, "state") == "normal":
-		value |= 0o040000000
-	if top.mlddCommand3.itemcget(1, "state") == "normal":
-		value |= 0o020000000
-	if top.mlddCommand4.itemcget(1, "state") == "normal":
-		value |= 0o010000000
-	if top.mlddCommand5.itemcget(1, "state") == "normal":
-		value |= 0o004000000
-	if top.mlddCommand6.itemcget(1, "state") == "normal":
-		value |= 0o002000000
-	if top.mlddCommand7.itemcget(1, "state") == "normal":
-		value |= 0o001000000
-	if top.mlddCommand8.itemcget(1, "state") == "normal":
-		value |= 0o000400000
-	if top.mlddCommand9.itemcget(1, "state") == "normal":
-		value |= 0o000200000
-	if top.mlddCommand10.itemcget(1, "state") == "normal":
-		value |= 0o000100000
-	if top.mlddCommand11.itemcget(1, "state") == "normal":
-		value |= 0o000040000
-	if top.mlddCommand12.itemcget(1, "state") == "normal":
-		value |= 0o000020000
-	if top.mlddCommand13.itemcget(1, "state") == "normal":
-		value |= 0o000010000
-	if top.mlddCommand14.itemcget(1, "state") == "normal":
-		value |= 0o000004000
-	if top.mlddCommand15.itemcget(1, "state") == "normal":
-		value |= 0o000002000
-	if top.mlddCommand16.itemcget(1, "state") == "normal":
-		value |= 0o000001000
-	if top.mlddCommand17.itemcget(1, "state") == "normal":
-		value |= 0o000000400
-	if top.mlddCommand18.itemcget(1, "state") == "normal":
-		value |= 0o000000200
-	if top.mlddCommand19.itemcget(1, "state") == "normal":
-		value |= 0o000000100
-	if top.mlddCommand20.itemcget(1, "state") == "normal":
-		value |= 0o000000040
-	if top.mlddCommand21.itemcget(1, "state") == "normal":
-		value |= 0o000000020
-	if top.mlddCommand22.itemcget(1, "state") == "normal":
-		value |= 0o000000010
-	if top.mlddCommand23.itemcget(1, "state") == "normal":
-		value |= 0o000000004
-	if top.mlddCommand24.itemcget(1, "state") == "normal":
-		value |= 0o000000002
-	if top.mlddCommand25.itemcget(1, "state") == "normal":
-		value |= 0o000000001
-	return value
+	return commandRegisters[REGISTER_D]
 			
 def indicatorDataCommandParity():
 	value = getDataCommand()
 	indicatorSet(top.mlddCommandSYL1, oddParity13(value >> 13))
 	indicatorSet(top.mlddCommandSYL0, oddParity13(value))
 
-# Turns the switch settings for the commanded DATA ADDRESS
-# of MLDD into an integer.		
+# The commanded DATA ADDRESS of MLDD as an integer.		
 def getDataAddressCommand():
-	value = 0;			
-	if top.daCommandDS4.itemcget(1, "state") == "normal":
-		value |= 0o040000000
-	if top.daCommandDS3.itemcget(1, "state") == "normal":
-		value |= 0o020000000
-	if top.daCommandDS2.itemcget(1, "state") == "normal":
-		value |= 0o010000000
-	if top.daCommandDS1.itemcget(1, "state") == "normal":
-		value |= 0o004000000
-
-	if top.daCommandM1.itemcget(1, "state") == "normal":
-		value |= 0o000400000
-
-	if top.daCommandOA8.itemcget(1, "state") == "normal":
-		value |= 0o000010000
-	if top.daCommandOA7.itemcget(1, "state") == "normal":
-		value |= 0o000004000
-	if top.daCommandOA6.itemcget(1, "state") == "normal":
-		value |= 0o000002000
-	if top.daCommandOA5.itemcget(1, "state") == "normal":
-		value |= 0o000001000
-	if top.daCommandOA4.itemcget(1, "state") == "normal":
-		value |= 0o000000400
-	if top.daCommandOA3.itemcget(1, "state") == "normal":
-		value |= 0o000000200
-	if top.daCommandOA2.itemcget(1, "state") == "normal":
-		value |= 0o000000100
-	if top.daCommandOA1.itemcget(1, "state") == "normal":
-		value |= 0o000000040
-		
-	if top.daCommandOA9.itemcget(1, "state") == "normal":
-		value |= 0o000000020
-		
-	if top.daCommandOP4.itemcget(1, "state") == "normal":
-		value |= 0o000000010
-	if top.daCommandOP3.itemcget(1, "state") == "normal":
-		value |= 0o000000004
-	if top.daCommandOP2.itemcget(1, "state") == "normal":
-		value |= 0o000000002
-	if top.daCommandOP1.itemcget(1, "state") == "normal":
-		value |= 0o000000001
-	return value
+	return commandRegisters[REGISTER_DA]
 			
-# Turns the switch settings for the commanded INSTRUCTION AREA
-# of MLDD into an integer.	
+# The commanded INSTRUCTION ADDRESS of MLDD as an integer.	
 def getInstructionAddressCommand():
-	value = 0;			
-	if top.iaCommandM1.itemcget(1, "state") == "normal":
-		value |= 0o200000000
-		
-	if top.iaCommandA8.itemcget(1, "state") == "normal":
-		value |= 0o000040000
-	if top.iaCommandA7.itemcget(1, "state") == "normal":
-		value |= 0o000020000
-	if top.iaCommandA6.itemcget(1, "state") == "normal":
-		value |= 0o000010000
-	if top.iaCommandA5.itemcget(1, "state") == "normal":
-		value |= 0o000004000
-	if top.iaCommandA4.itemcget(1, "state") == "normal":
-		value |= 0o000002000
-	if top.iaCommandA3.itemcget(1, "state") == "normal":
-		value |= 0o000001000
-	if top.iaCommandA2.itemcget(1, "state") == "normal":
-		value |= 0o000000400
-	if top.iaCommandA1.itemcget(1, "state") == "normal":
-		value |= 0o000000200
-		
-	if top.iaCommandSYL1.itemcget(1, "state") == "normal":
-		value |= 0o000000100
-		
-	if top.iaCommandIS4.itemcget(1, "state") == "normal":
-		value |= 0o000000040
-	if top.iaCommandIS3.itemcget(1, "state") == "normal":
-		value |= 0o000000020
-	if top.iaCommandIS2.itemcget(1, "state") == "normal":
-		value |= 0o000000010
-	if top.iaCommandIS1.itemcget(1, "state") == "normal":
-		value |= 0o000000004
-	return value
+	return commandRegisters[REGISTER_IA]
 			
 def eventToggleIndicator(event):
 	indicatorToggle(event.widget)
@@ -655,263 +604,292 @@ def oddParity13(value):
 	value = 3 & (value ^ (value >> 2)) # Now has 2 bits.
 	return 1 & (1 ^ value ^ (value >> 1)) # Just 1 bit left!
 
+# Translation tables for the characters output on the typewriter/printer and
+# PRS channels.  The typewriter gets one character per CIO, whereas the printer
+# and PRS get several packed into the 24 or 26 bits of the value, so for them
+# there are tables translating 12 bits at a time (i.e., 2 6-bit, 3 4-bit, or
+# 4 3-bit characters) into strings.  In octal, spaces print as "0".
+BA8421octal = ["0" if c == " " else c for c in BA8421[:8]]
+sixBitPairs = [BA8421[n >> 6] + BA8421[n & 0o77] for n in range(0o10000)]
+fourBitTriples = [BA8421[n >> 8] + BA8421[(n >> 4) & 0o17] + BA8421[n & 0o17] for n in range(0o10000)]
+threeBitQuads = [BA8421octal[n >> 9] + BA8421octal[(n >> 6) & 7] + BA8421octal[(n >> 3) & 7] + BA8421octal[n & 7] for n in range(0o10000)]
+typewriterControls = {
+	0o200000000: "space",
+	0o100000000: "black ribbon",
+	0o040000000: "red ribbon",
+	0o020000000: "index",
+	0o010000000: "return",
+	0o004000000: "tab"
+}
+
+# Models of the typewriter, printer, and plotter.  See ptcOutput.py.  (I don't
+# actually know how wide the printer's lines were, or how the typewriter's tabs
+# were set.)  The logs must be closed at exit to flush them.  renderOutputs() 
+# is called periodically by the GUI event loop, at a rate capped by 
+# renderInterval (milliseconds), to update the windows, if any.
+typewriter = ptcOutput.Paper("Typewriter", args.typewriter)
+printer = ptcOutput.Paper("Printer", args.printer, width = 120)
+plotter = ptcOutput.Plot(args.plotter)
+def closeOutputs():
+	typewriter.close()
+	printer.close()
+	plotter.close()
+atexit.register(closeOutputs)
+renderInterval = 200
+def renderOutputs():
+	global guiTime
+	if statsEnabled:
+		startTime = time.perf_counter()
+	typewriter.render()
+	printer.render()
+	plotter.render()
+	if statsEnabled:
+		guiTime += time.perf_counter() - startTime
+	root.after(renderInterval, renderOutputs)
+
+# Handlers for specific output channels, called by outputFromCPU() via the
+# outputHandlers[] table below.  All of them have the same arguments as 
+# outputFromCPU() itself.
+def outputPIO(ioType, channel, value):
+	print("\nChannel PIO-%03o = %09o" % (channel, value), end="  ")
+def outputCIO(ioType, channel, value):
+	print("\nChannel CIO-%03o = %09o" % (channel, value), end="  ")
+def outputSingleStep(ioType, channel, value):
+	print("\nSingle step")
+def outputTypewriterAlphanumeric(ioType, channel, value):
+	string = BA8421[(value >> 20) & 0o77]
+	typewriter.write(string)
+	if echo:
+		print("\nTypewriter alphanumeric = %09o (%s)" % (value, string), end="  ")
+def outputPrinterAlphanumeric(ioType, channel, value):
+	string = sixBitPairs[(value >> 14) & 0o7777] + sixBitPairs[(value >> 2) & 0o7777]
+	printer.write(string)
+	if echo:
+		print("\nPrinter alphanumeric = %09o (%s)" % (value, string), end="  ")
+def outputTypewriterDecimal(ioType, channel, value):
+	string = BA8421[(value >> 22) & 0o17]
+	typewriter.write(string)
+	if echo:
+		print("\nTypewriter decimal = %09o (%s)" % (value, string), end="  ")
+def outputPrinterDecimal(ioType, channel, value):
+	string = fourBitTriples[(value >> 14) & 0o7777] + fourBitTriples[(value >> 2) & 0o7777]
+	printer.write(string)
+	if echo:
+		print("\nPrinter decimal = %09o (%s)" % (value, string), end="  ")
+def outputTypewriterOctal(ioType, channel, value):
+	string = BA8421octal[(value >> 23) & 0o07]
+	typewriter.write(string)
+	if echo:
+		print("\nTypewriter octal = %09o (%s)" % (value, string), end="  ")
+def outputPrinterOctal(ioType, channel, value):
+	string = threeBitQuads[(value >> 14) & 0o7777] + threeBitQuads[(value >> 2) & 0o7777]
+	printer.write(string)
+	if echo:
+		print("\nPrinter octal = %09o (%s)" % (value, string), end="  ")
+def outputTypewriterControl(ioType, channel, value):
+	if value in typewriterControls:
+		string = typewriterControls[value]
+		typewriter.control(string)
+	else:
+		string = "illegal"
+	if echo or string == "illegal":
+		print("\nTypewriter control = %09o (%s)" % (value, string), end="  ")
+def outputPlotX(ioType, channel, value):
+	plotter.setX(value)
+	if echo:
+		print("\nX plot = %09o" % value, end="  ")
+def outputPlotY(ioType, channel, value):
+	plotter.setY(value)
+	if echo:
+		print("\nY plot = %09o" % value, end="  ")
+def outputPlotZ(ioType, channel, value):
+	plotter.setZ(value)
+	if echo:
+		print("\nZ plot = %09o" % value, end="  ")
+def outputPLamps(ioType, channel, value):
+	# Turn indicator lamps on or off.  I think this is actually
+	# the full functionality of CIO-204
+	indicatorSet(top.P1, value & 0o1)
+	indicatorSet(top.P2, value & 0o2)
+	indicatorSet(top.P4, value & 0o4)
+	indicatorSet(top.P10, value & 0o10)
+	indicatorSet(top.P20, value & 0o20)
+	indicatorSet(top.P40, value & 0o40)
+def outputDLamps(ioType, channel, value):
+	# All I'm doing here (CIO-210) is manipulating indicator lamps,
+	# but the discretes additionally have some other functionality
+	# in terms of latching signals or something which is
+	# TBD.  ***FIXME***
+	indicatorSet(top.D1, value & 0o1)
+	indicatorSet(top.D2, value & 0o2)
+	indicatorSet(top.D3, value & 0o4)
+	indicatorSet(top.D4, value & 0o10)
+	indicatorSet(top.D5, value & 0o20)
+	indicatorSet(top.D6, value & 0o40)
+def outputProgErr(ioType, channel, value):
+	indicatorOn(top.PROG_ERR)
+def outputPRS(ioType, channel, value):
+	if value == 0o77:
+		print("\nChannel PRS = %09o (group mark)" % value, end= "  ")
+	else:
+		string = sixBitPairs[(value >> 12) & 0o7777] + sixBitPairs[value & 0o7777]
+		print("\nChannel PRS = %09o (%s)" % (value, string), end="  ")
+def outputPaused(ioType, channel, value):
+	print("\nCPU is paused.")
+def outputRunning(ioType, channel, value):
+	print("\nCPU is running.")
+def outputDataAddress(ioType, channel, value):
+	opcode = value & 0o17
+	a9 = (value >> 4) & 1
+	a81 = (value >> 5) & 0o377
+	dm = (value >> 17) & 1
+	ds = (value >> 20) & 0o17
+	indicatorSet(top.daComputerM0, not dm)
+	indicatorSet(top.daComputerM1, dm)
+	indicatorSet(top.daComputerDS1, ds & 1)
+	indicatorSet(top.daComputerDS2, ds & 2)
+	indicatorSet(top.daComputerDS3, ds & 4)
+	indicatorSet(top.daComputerDS4, ds & 8)
+	indicatorSet(top.daComputerOP1, opcode & 1)
+	indicatorSet(top.daComputerOP2, opcode & 2)
+	indicatorSet(top.daComputerOP3, opcode & 4)
+	indicatorSet(top.daComputerOP4, opcode & 8)
+	indicatorSet(top.daComputerOA9, a9)
+	indicatorSet(top.daComputerOA1, a81 & 1)
+	indicatorSet(top.daComputerOA2, a81 & 2)
+	indicatorSet(top.daComputerOA3, a81 & 4)
+	indicatorSet(top.daComputerOA4, a81 & 8)
+	indicatorSet(top.daComputerOA5, a81 & 16)
+	indicatorSet(top.daComputerOA6, a81 & 32)
+	indicatorSet(top.daComputerOA7, a81 & 64)
+	indicatorSet(top.daComputerOA8, a81 & 128)
+	indicatorSet(top.daPARITY_BIT, oddParity13(value))
+def outputInstructionAddress(ioType, channel, value):
+	isect = (value >> 2) & 0o17
+	s = (value >> 6) & 1
+	loc = (value >> 7) & 0o377
+	dm = (value >> 17) & 1
+	ds = (value >> 20) & 0o17
+	im = (value >> 25) & 1
+	indicatorSet(top.iaComputerM0, not im)
+	indicatorSet(top.iaComputerM1, im)
+	indicatorSet(top.iaComputerSYL0, not s)
+	indicatorSet(top.iaComputerSYL1, s)
+	indicatorSet(top.iaComputerIS1, isect & 1)
+	indicatorSet(top.iaComputerIS2, isect & 2)
+	indicatorSet(top.iaComputerIS3, isect & 4)
+	indicatorSet(top.iaComputerIS4, isect & 8)
+	indicatorSet(top.iaComputerA1, loc & 1)
+	indicatorSet(top.iaComputerA2, loc & 2)
+	indicatorSet(top.iaComputerA3, loc & 4)
+	indicatorSet(top.iaComputerA4, loc & 8)
+	indicatorSet(top.iaComputerA5, loc & 16)
+	indicatorSet(top.iaComputerA6, loc & 32)
+	indicatorSet(top.iaComputerA7, loc & 64)
+	indicatorSet(top.iaComputerA8, loc & 128)
+def outputDataValue(ioType, channel, value):
+	parity0 = oddParity13(value)
+	parity1 = oddParity13(value >> 13)
+	indicatorSet(top.mlddComputerBR0, parity0)
+	indicatorSet(top.mlddComputerBR1, parity1)
+	indicatorSet(top.mlddPARITY_BIT, 1 ^ parity0 ^ parity1)
+	indicatorSet(top.mlddComputer25, value & 0o1)
+	indicatorSet(top.mlddComputer24, value & 0o2)
+	indicatorSet(top.mlddComputer23, value & 0o4)
+	indicatorSet(top.mlddComputer22, value & 0o10)
+	indicatorSet(top.mlddComputer21, value & 0o20)
+	indicatorSet(top.mlddComputer20, value & 0o40)
+	indicatorSet(top.mlddComputer19, value & 0o100)
+	indicatorSet(top.mlddComputer18, value & 0o200)
+	indicatorSet(top.mlddComputer17, value & 0o400)
+	indicatorSet(top.mlddComputer16, value & 0o1000)
+	indicatorSet(top.mlddComputer15, value & 0o2000)
+	indicatorSet(top.mlddComputer14, value & 0o4000)
+	indicatorSet(top.mlddComputer13, value & 0o10000)
+	indicatorSet(top.mlddComputer12, value & 0o20000)
+	indicatorSet(top.mlddComputer11, value & 0o40000)
+	indicatorSet(top.mlddComputer10, value & 0o100000)
+	indicatorSet(top.mlddComputer9, value & 0o200000)
+	indicatorSet(top.mlddComputer8, value & 0o400000)
+	indicatorSet(top.mlddComputer7, value & 0o1000000)
+	indicatorSet(top.mlddComputer6, value & 0o2000000)
+	indicatorSet(top.mlddComputer5, value & 0o4000000)
+	indicatorSet(top.mlddComputer4, value & 0o10000000)
+	indicatorSet(top.mlddComputer3, value & 0o20000000)
+	indicatorSet(top.mlddComputer2, value & 0o40000000)
+	indicatorSet(top.mlddComputer1, value & 0o100000000)
+	indicatorSet(top.mlddComputerSIGN, value & 0o200000000)
+def outputIgnore(ioType, channel, value):
+	pass
+# lvdcLoadGenerator.py, standing in for yaLVDC, sends numbered probes on
+# status channel 777, which we answer (on command channel 777) only when we
+# get around to processing them, so that it can measure how far behind we
+# are.  Along with each answer, we report on command channel 776 how many 
+# illegal packets we've seen.  yaLVDC itself never sends probes, so it never
+# sees the answers.
+probeReplies = []
+def outputProbe(ioType, channel, value):
+	probeReplies.append((4, 0o777, value, 0o377777777))
+	probeReplies.append((4, 0o776, illegalPackets & 0o377777777, 0o377777777))
+def outputCpuStatus(ioType, channel, value):
+	print("\nCPU status %03o %09o" % (channel, value))
+def outputUnimplemented(ioType, channel, value):
+	print("\nUnimplemented type %d, channel %03o, value %09o" % (ioType, channel, value), end="  ")
+
+# The handler for a given (ioType,channel) is outputHandlers[(ioType,channel)]
+# if there is one, and otherwise is defaultOutputHandlers[ioType].  (PRS has
+# no channel number to speak of, so it's handled entirely by the latter.)
+outputHandlers = {
+	(1, 0o114): outputSingleStep,
+	(1, 0o120): outputTypewriterAlphanumeric,
+	(1, 0o160): outputPrinterAlphanumeric,
+	(1, 0o124): outputTypewriterDecimal,
+	(1, 0o170): outputPrinterDecimal,
+	(1, 0o130): outputTypewriterOctal,
+	(1, 0o164): outputPrinterOctal,
+	(1, 0o134): outputTypewriterControl,
+	(1, 0o140): outputPlotX,
+	(1, 0o144): outputPlotY,
+	(1, 0o150): outputPlotZ,
+	(1, 0o204): outputPLamps,
+	(1, 0o210): outputDLamps,
+	(1, 0o240): outputProgErr,
+	(5, 0o000): outputPaused,
+	(5, 0o001): outputRunning,
+	(5, 0o002): outputDataAddress,
+	(5, 0o003): outputInstructionAddress,
+	(5, 0o004): outputDataValue,
+	(5, 0o600): outputIgnore,
+	(5, 0o777): outputProbe
+}
+defaultOutputHandlers = {
+	0: outputPIO,
+	1: outputCIO,
+	2: outputPRS,
+	5: outputCpuStatus
+}
+
 # This function is called by the event loop only when yaLVDC has written
 # to an output channel.  The function should do whatever it is that needs to be done
 # with this output data, which is not processed additionally in any way by the 
 # generic portion of the program.  The ioType argument is an index into the
 # ioTypes[] array (see the top of this file), giving the class of i/o ports
 # to which the channel belongs.  Only the PIO, CIO, and PRS channels are applicable
-# for output from the CPU to peripherals.
+# for output from the CPU to peripherals.  The actual work is done by the 
+# handler functions above.
 #
 # The function _could_ also be called directly, by panel events, though I'm not
 # aware of any reason at the moment why that would be needed.  But it does work.
 def outputFromCPU(ioType, channel, value):
-	print("*", end="")
-	
-	if ioType == 0:
-		# PIO
-		print("\nChannel PIO-%03o = %09o" % (channel, value), end="  ")
-		
-	elif ioType == 1:
-		# CIO
-		if channel == 0o114:
-			print("\nSingle step")
-		elif channel == 0o120 or channel == 0o160:
-			if channel == 0o120:
-				destination = "Typewriter"
-			else:
-				destination = "Printer"
-			string = ""
-			shift = 20
-			while shift >= 0:
-				string += BA8421[(value >> shift) & 0o77]
-				if channel == 0o120:
-					shift = -1
-				else:
-					shift -= 6
-			print("\n%s alphanumeric = %09o (%s)" % (destination, value, string), end="  ")
-		elif channel == 0o124 or channel == 0o170:
-			if channel == 0o124:
-				destination = "Typewriter"
-			else:
-				destination = "Printer"
-			string = ""
-			shift = 22
-			while shift >= 0:
-				string += BA8421[(value >> shift) & 0o17]
-				if channel == 0o124:
-					shift = -1
-				else:
-					shift -= 4
-			print("\n%s decimal = %09o (%s)" % (destination, value, string), end="  ")
-		elif channel == 0o130 or channel == 0o164:
-			if channel == 0o130:
-				destination = "Typewriter"
-			else:
-				destination = "Printer"
-			string = ""
-			shift = 23
-			while shift >= 0:
-				character = BA8421[(value >> shift) & 0o07]
-				if character == " ":
-					character = "0"
-				string += character
-				if channel == 0o130:
-					shift = -1
-				else:
-					shift -= 3
-			print("\n%s octal = %09o (%s)" % (destination, value, string), end="  ")
-		elif channel == 0o134:
-			if value == 0o200000000:
-				string = "space"
-			elif value == 0o100000000:
-				string = "black ribbon"
-			elif value == 0o040000000:
-				string = "red ribbon"
-			elif value == 0o020000000:
-				string = "index"
-			elif value == 0o010000000:
-				string = "return"
-			elif value == 0o004000000:
-				string = "tab"
-			else:
-				string = "illegal"
-			print("\nTypewriter control = %09o (%s)" % (value, string), end="  ")
-		elif channel == 0o140:
-			print("\nX plot = %09o" % value, end="  ")
-		elif channel == 0o144:
-			print("\nY plot = %09o" % value, end="  ")
-		elif channel == 0o150:
-			print("\nZ plot = %09o" % value, end="  ")
-		elif channel == 0o204:
-			# Turn indicator lamps on or off.  I think this is actually
-			# the full functionality of CIO-204
-			if value & 0o1:
-				indicatorOn(top.P1)
-			else:
-				indicatorOff(top.P1)
-			if value & 0o2:
-				indicatorOn(top.P2)
-			else:
-				indicatorOff(top.P2)
-			if value & 0o4:
-				indicatorOn(top.P4)
-			else:
-				indicatorOff(top.P4)
-			if value & 0o10:
-				indicatorOn(top.P10)
-			else:
-				indicatorOff(top.P10)
-			if value & 0o20:
-				indicatorOn(top.P20)
-			else:
-				indicatorOff(top.P20)
-			if value & 0o40:
-				indicatorOn(top.P40)
-			else:
-				indicatorOff(top.P40)
-			return
-		elif channel == 0o210:
-			# All I'm doing here (CIO-210) is manipulating indicator lamps,
-			# but the discretes additionally have some other functionality
-			# in terms of latching signals or something which is
-			# TBD.  ***FIXME***
-			if value & 0o1:
-				indicatorOn(top.D1)
-			else:
-				indicatorOff(top.D1)
-			if value & 0o2:
-				indicatorOn(top.D2)
-			else:
-				indicatorOff(top.D2)
-			if value & 0o4:
-				indicatorOn(top.D3)
-			else:
-				indicatorOff(top.D3)
-			if value & 0o10:
-				indicatorOn(top.D4)
-			else:
-				indicatorOff(top.D4)
-			if value & 0o20:
-				indicatorOn(top.D5)
-			else:
-				indicatorOff(top.D5)
-			if value & 0o40:
-				indicatorOn(top.D6)
-			else:
-				indicatorOff(top.D6)
-			return
-		elif channel == 0o240:
-			indicatorOn(top.PROG_ERR)
-		else:
-			print("\nChannel CIO-%03o = %09o" % (channel, value), end="  ")
-		
-	elif ioType == 2:
-		if value == 0o77:
-			print("\nChannel PRS = %09o (group mark)" % value, end= "  ")
-		else:
-			shift = 18
-			string = ""
-			while shift >= 0:
-				string += BA8421[(value >> shift) & 0o077]
-				shift -= 6
-			print("\nChannel PRS = %09o (%s)" % (value, string), end="  ")
-	elif ioType == 5:
-		if channel == 0o000:
-			print("\nCPU is paused.")
-		elif channel == 0o001:
-			print("\nCPU is running.")
-		elif channel == 0o002:
-			# Data address.
-			opcode = value & 0o17
-			a9 = (value >> 4) & 1
-			a81 = (value >> 5) & 0o377
-			dm = (value >> 17) & 1
-			ds = (value >> 20) & 0o17
-			indicatorSet(top.daComputerM0, not dm)
-			indicatorSet(top.daComputerM1, dm)
-			indicatorSet(top.daComputerDS1, ds & 1)
-			indicatorSet(top.daComputerDS2, ds & 2)
-			indicatorSet(top.daComputerDS3, ds & 4)
-			indicatorSet(top.daComputerDS4, ds & 8)
-			indicatorSet(top.daComputerOP1, opcode & 1)
-			indicatorSet(top.daComputerOP2, opcode & 2)
-			indicatorSet(top.daComputerOP3, opcode & 4)
-			indicatorSet(top.daComputerOP4, opcode & 8)
-			indicatorSet(top.daComputerOA9, a9)
-			indicatorSet(top.daComputerOA1, a81 & 1)
-			indicatorSet(top.daComputerOA2, a81 & 2)
-			indicatorSet(top.daComputerOA3, a81 & 4)
-			indicatorSet(top.daComputerOA4, a81 & 8)
-			indicatorSet(top.daComputerOA5, a81 & 16)
-			indicatorSet(top.daComputerOA6, a81 & 32)
-			indicatorSet(top.daComputerOA7, a81 & 64)
-			indicatorSet(top.daComputerOA8, a81 & 128)
-			indicatorSet(top.daPARITY_BIT, oddParity13(value))
-		elif channel == 0o003:
-			# Instruction address.
-			isect = (value >> 2) & 0o17
-			s = (value >> 6) & 1
-			loc = (value >> 7) & 0o377
-			dm = (value >> 17) & 1
-			ds = (value >> 20) & 0o17
-			im = (value >> 25) & 1
-			indicatorSet(top.iaComputerM0, not im)
-			indicatorSet(top.iaComputerM1, im)
-			indicatorSet(top.iaComputerSYL0, not s)
-			indicatorSet(top.iaComputerSYL1, s)
-			indicatorSet(top.iaComputerIS1, isect & 1)
-			indicatorSet(top.iaComputerIS2, isect & 2)
-			indicatorSet(top.iaComputerIS3, isect & 4)
-			indicatorSet(top.iaComputerIS4, isect & 8)
-			indicatorSet(top.iaComputerA1, loc & 1)
-			indicatorSet(top.iaComputerA2, loc & 2)
-			indicatorSet(top.iaComputerA3, loc & 4)
-			indicatorSet(top.iaComputerA4, loc & 8)
-			indicatorSet(top.iaComputerA5, loc & 16)
-			indicatorSet(top.iaComputerA6, loc & 32)
-			indicatorSet(top.iaComputerA7, loc & 64)
-			indicatorSet(top.iaComputerA8, loc & 128)
-		elif channel == 0o004:
-			parity0 = oddParity13(value)
-			parity1 = oddParity13(value >> 13)
-			indicatorSet(top.mlddComputerBR0, parity0)
-			indicatorSet(top.mlddComputerBR1, parity1)
-			indicatorSet(top.mlddPARITY_BIT, 1 ^ parity0 ^ parity1)
-			indicatorSet(top.mlddComputer25, value & 0o1)
-			indicatorSet(top.mlddComputer24, value & 0o2)
-			indicatorSet(top.mlddComputer23, value & 0o4)
-			indicatorSet(top.mlddComputer22, value & 0o10)
-			indicatorSet(top.mlddComputer21, value & 0o20)
-			indicatorSet(top.mlddComputer20, value & 0o40)
-			indicatorSet(top.mlddComputer19, value & 0o100)
-			indicatorSet(top.mlddComputer18, value & 0o200)
-			indicatorSet(top.mlddComputer17, value & 0o400)
-			indicatorSet(top.mlddComputer16, value & 0o1000)
-			indicatorSet(top.mlddComputer15, value & 0o2000)
-			indicatorSet(top.mlddComputer14, value & 0o4000)
-			indicatorSet(top.mlddComputer13, value & 0o10000)
-			indicatorSet(top.mlddComputer12, value & 0o20000)
-			indicatorSet(top.mlddComputer11, value & 0o40000)
-			indicatorSet(top.mlddComputer10, value & 0o100000)
-			indicatorSet(top.mlddComputer9, value & 0o200000)
-			indicatorSet(top.mlddComputer8, value & 0o400000)
-			indicatorSet(top.mlddComputer7, value & 0o1000000)
-			indicatorSet(top.mlddComputer6, value & 0o2000000)
-			indicatorSet(top.mlddComputer5, value & 0o4000000)
-			indicatorSet(top.mlddComputer4, value & 0o10000000)
-			indicatorSet(top.mlddComputer3, value & 0o20000000)
-			indicatorSet(top.mlddComputer2, value & 0o40000000)
-			indicatorSet(top.mlddComputer1, value & 0o100000000)
-			indicatorSet(top.mlddComputerSIGN, value & 0o200000000)
-		elif channel == 0o600:
-			pass
-		else:
-			print("\nCPU status %03o %09o" % (channel, value))
+	if echo:
+		print("*", end="")
+	key = (ioType, channel)
+	if key in outputHandlers:
+		outputHandlers[key](ioType, channel, value)
+	elif ioType in defaultOutputHandlers:
+		defaultOutputHandlers[ioType](ioType, channel, value)
 	else:
-		print("\nUnimplemented type %d, channel %03o, value %09o" % (ioType, channel, value), end="  ")
-	
-	return
+		outputUnimplemented(ioType, channel, value)
 
 def pressedPROG_ERR(event):
 	indicatorOn(top.PROG_ERR)
@@ -957,8 +935,13 @@ ProcessorDisplayPanel_support.eventModeControl = eventModeControl
 # Generic initialization (TCP socket setup).  Has no target-specific code, and 
 # shouldn't need to be modified unless there are bugs.
 
+import sys
 import time
 import socket
+import select
+import threading
+import collections
+import struct
 
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 s.setblocking(0)
@@ -981,7 +964,8 @@ def connectToAGC():
 				sys.exit(1)
 			time.sleep(1)
 
-connectToAGC()
+if not args.replay:
+	connectToAGC()
 
 ###################################################################################
 # Event loop.  Just check periodically for output from yaLVDC (in which case the
@@ -990,483 +974,397 @@ connectToAGC()
 # But this section has no target-specific code, and shouldn't need to be modified
 # unless there are bugs.
 
-# Given a 4-tuple (ioType,channel,value,mask), creates packet data and sends it to yaLVDC.
-def packetize(tuple):
-	outputBuffer = bytearray(6)
-	source = ID
-	ioType = tuple[0]
-	channel = tuple[1]
-	value = tuple[2]
-	mask = tuple[3]
-	if mask != 0o377777777:
-		outputBuffer[0] = 0x80 | 0x40 | ((ioType & 7) << 3) | (ID & 7)
-		outputBuffer[1] = channel & 0x7F
-		outputBuffer[2] = ((channel & 0x180) >> 2) | ((mask >> 21) & 0x1F)
-		outputBuffer[3] = (mask >> 14) & 0x7F
-		outputBuffer[4] = (mask >> 7) & 0x7F
-		outputBuffer[5] = mask & 0x7F
-		s.send(outputBuffer)
-	outputBuffer[0] = 0x80 | ((ioType & 7) << 3) | (ID & 7)
-	outputBuffer[1] = channel & 0x7F
-	outputBuffer[2] = ((channel & 0x180) >> 2) | ((value >> 21) & 0x1F)
-	outputBuffer[3] = (value >> 14) & 0x7F
-	outputBuffer[4] = (value >> 7) & 0x7F
-	outputBuffer[5] = value & 0x7F
-	s.send(outputBuffer)
-
-# Buffer for a packet received from yaLVDC.
-packetSize = 6
-inputBuffer = bytearray(packetSize)
-leftToRead = packetSize
-view = memoryview(inputBuffer)
+# Data for yaLVDC is encoded into outputBuffer, of which the first outputLength
+# bytes are still waiting to be sent.  Since the socket is non-blocking, it may
+# accept only part of what we try to send (or nothing at all), in which case the
+# remainder is simply kept for the next attempt by flushOutput(), which is 
+# called on every iteration of the event loop.  The buffer is only enlarged if
+# yaLVDC stops reading for a long time.  On any other error (yaLVDC having gone
+# away, say), what's waiting is discarded, and the error is reported only once.
+# Nothing is kept once the connection has been closed, or when replaying.
+outputBuffer = bytearray(4096)
+outputLength = 0
+sendErrorReported = False
+def flushOutput():
+	global outputLength, sendErrorReported
+	if outputLength == 0:
+		return
+	if args.replay or not connected:
+		# There's no yaLVDC to send anything to.
+		outputLength = 0
+		return
+	try:
+		with memoryview(outputBuffer) as view:
+			sent = s.send(view[:outputLength])
+	except (BlockingIOError, InterruptedError):
+		return
+	except socket.error as msg:
+		outputLength = 0
+		if not sendErrorReported:
+			sendErrorReported = True
+			sys.stderr.write("Cannot send to LVDC/PTC emulator: " + str(msg) + "\n")
+		return
+	outputBuffer[:outputLength - sent] = outputBuffer[sent:outputLength]
+	outputLength -= sent
+
+# Given a list of 4-tuples (ioType,channel,value,mask), creates packet data for 
+# all of them and sends it to yaLVDC.  A mask packet precedes the data packet
+# for any tuple whose mask isn't all ones.
+def packetize(tuples):
+	global outputLength, outputBuffer
+	if args.replay or not connected:
+		return
+	needed = outputLength + 12 * len(tuples)
+	if needed > len(outputBuffer):
+		outputBuffer += bytearray(needed - len(outputBuffer))
+	offset = outputLength
+	for tuple in tuples:
+		ioType = tuple[0]
+		channel = tuple[1]
+		value = tuple[2]
+		mask = tuple[3]
+		if mask != 0o377777777:
+			offset = virtualWire.encodePacket(outputBuffer, offset, ioType, channel, mask, True, ID)
+		offset = virtualWire.encodePacket(outputBuffer, offset, ioType, channel, value, False, ID)
+	outputLength = offset
+	flushOutput()
+
+# Reception from yaLVDC is done in its own thread, so that it neither depends
+# on nor is slowed by the tkinter event loop (i.e., GUI updates and printing).
+# It blocks in select() until there's data, reads everything available,
+# parses all of the complete packets, and appends them to the receivedPackets
+# queue, from which the GUI thread takes them in batches.  (A deque's append()
+# and popleft() are atomic, so no locking is needed.)  Since the packets are
+# queued rather than processed immediately, the GUI thread limits itself to 
+# maxProcessingTime seconds of processing per iteration, so as not to starve
+# the GUI, and then reschedules itself quickly if there's more to do.  When
+# the connection is closed, the thread clears connected and exits.
+receivedPackets = collections.deque()
+maxProcessingTime = 0.05
+connected = True
+
+# Since we can fall arbitrarily far behind yaLVDC, what's displayed could be
+# arbitrarily stale.  But most of the traffic consists of packets whose only
+# effect is to set a bank of indicator lamps to a new value, such as the 
+# instruction address, data address, or data value from the CPU, and for 
+# those only the latest value on each channel matters.  Those channels are the
+# coalescibleChannels, and what happens to their packets is controlled by the
+# --policy:
+#	full		Nothing special.  Everything is queued and processed
+#			in order, no matter how far behind we are.
+#	coalesce	Packets for the coalescible channels aren't queued at
+#			all.  Instead, the latest one for each channel is kept
+#			in latestPackets[(ioType,channel)], replacing any one
+#			not yet processed, and all of those are processed on
+#			every iteration of the event loop ahead of the queue.
+#			Thus the lamps are never more than an iteration or two
+#			behind the CPU.  Only the other packets (typewriter, 
+#			printer, etc.) are queued.
+#	drop		As long as the queue holds more than maxQueueLength
+#			packets, packets for coalescible channels are simply
+#			discarded.  That bounds the lag, but the lamps may be 
+#			left showing stale values until the next update.
+# Either way, coalescedPackets counts the packets not processed.
+policy = args.policy
+coalescibleChannels = set([(5, 0o002), (5, 0o003), (5, 0o004), (1, 0o204), (1, 0o210)])
+latestPackets = {}
+maxQueueLength = 10000
+coalescedPackets = 0
+def receiverThread():
+	global connected
+	inputBuffer = bytearray(65536)
+	inputView = memoryview(inputBuffer)
+	inputLength = 0
+	while True:
+		try:
+			readable, writable, exceptional = select.select([s], [], [], 1.0)
+		except:
+			break
+		if len(readable) == 0:
+			continue
+		try:
+			numNewBytes = s.recv_into(inputView[inputLength:])
+		except BlockingIOError:
+			continue
+		except:
+			break
+		if numNewBytes == 0:
+			sys.stderr.write("Connection to LVDC/PTC emulator closed.\n")
+			break
+		if recordFile != None:
+			recordChunk(inputView[inputLength:inputLength + numNewBytes])
+		inputLength = queuePackets(inputBuffer, inputLength + numNewBytes)
+	connected = False
+
+# Parses the complete packets in buffer[:end], adds them to receivedPackets,
+# and moves any leftover partial packet to the start of the buffer, returning
+# its length.  packetsReceived counts all of the packets ever queued, and
+# illegalPackets all of the corrupted ones (each of which means that we had
+# to realign).
+packetsReceived = 0
+illegalPackets = 0
+def queuePackets(buffer, end):
+	global packetsReceived, illegalPackets, coalescedPackets
+	packets = []
+	illegal = []
+	used = virtualWire.parsePackets(buffer, 0, end, packets, illegal)
+	for packet in illegal:
+		print("Illegal packet: %03o %03o %03o %03o %03o %03o" % packet)
+	illegalPackets += len(illegal)
+	packetsReceived += len(packets)
+	if statsEnabled:
+		now = time.perf_counter()
+		packets = [packet + (now,) for packet in packets]
+	if policy == "coalesce":
+		others = []
+		for packet in packets:
+			key = (packet[0], packet[1])
+			if key in coalescibleChannels:
+				if key in latestPackets:
+					coalescedPackets += 1
+				latestPackets[key] = packet
+			else:
+				others.append(packet)
+		packets = others
+	elif policy == "drop" and len(receivedPackets) > maxQueueLength:
+		count = len(packets)
+		packets = [packet for packet in packets if (packet[0], packet[1]) not in coalescibleChannels]
+		coalescedPackets += count - len(packets)
+	leftover = end - used
+	buffer[:leftover] = buffer[used:end]
+	receivedPackets.extend(packets)
+	return leftover
+
+# With --record, the data received from yaLVDC is recorded exactly as received
+# (i.e., including any pings, garbage, and packets split between reads), so 
+# that any problem in processing it can be reproduced with --replay.  The file
+# is a header, recordMagic, followed by one record per recv(), each of which
+# is an 8-byte time (in nanoseconds since the start of recording) and a 4-byte 
+# length (both little-endian), followed by the data itself.
+recordMagic = b"yaLVDCw1"
+recordHeader = struct.Struct("<QI")
+recordFile = None
+recordStart = 0
+def recordChunk(data):
+	try:
+		recordFile.write(recordHeader.pack(time.perf_counter_ns() - recordStart, len(data)))
+		recordFile.write(data)
+	except (ValueError, AttributeError):
+		# The file was closed at exit.
+		pass
+def closeRecording():
+	global recordFile
+	f = recordFile
+	recordFile = None
+	if f != None:
+		f.close()
+if args.record:
+	recordFile = open(args.record, "wb", buffering = 65536)
+	recordFile.write(recordMagic)
+	recordStart = time.perf_counter_ns()
+	atexit.register(closeRecording)
+
+# With --replay, this thread takes the place of receiverThread(), reading a
+# file made by --record and feeding its contents to the packet queue with the
+# same timing as it was originally received, or with the time scaled by 1 /
+# replaySpeed, or (with replaySpeed == 0) as fast as possible.  Since it's the
+# packet processing that's slow, the latter is a useful benchmark.  At the end,
+# connected is cleared just as if yaLVDC had closed the connection, and once
+# the main loop has caught up it reports the throughput.
+if args.speed == None:
+	replaySpeed = 1.0
+else:
+	replaySpeed = args.speed
+replayStart = 0
+replayDone = False
+def replayThread():
+	global connected, replayStart
+	f = open(args.replay, "rb")
+	if f.read(len(recordMagic)) != recordMagic:
+		sys.stderr.write("%s is not a recording made by --record.\n" % args.replay)
+		f.close()
+		connected = False
+		return
+	inputBuffer = bytearray()
+	inputLength = 0
+	replayStart = time.perf_counter()
+	while True:
+		header = f.read(recordHeader.size)
+		if len(header) < recordHeader.size:
+			break
+		timestamp, length = recordHeader.unpack(header)
+		data = f.read(length)
+		if replaySpeed > 0:
+			delay = replayStart + timestamp / 1e9 / replaySpeed - time.perf_counter()
+			if delay > 0:
+				time.sleep(delay)
+		inputBuffer[inputLength:] = data
+		inputLength = queuePackets(inputBuffer, inputLength + len(data))
+	f.close()
+	sys.stderr.write("End of replay.\n")
+	connected = False
+
+# With --stats, statistics are kept for each (ioType,channel) received, in
+# channelStats[(ioType,channel)] = [count, decodeTime, latency, maxLatency],
+# where the decode time is the total time spent in outputFromCPU(), and the
+# latency is the total time from receipt (when queuePackets() timestamps each
+# packet) to the end of processing; i.e., it includes the time spent waiting
+# in receivedPackets.  Bytes are just 6 per packet.  The time spent updating
+# the display (i.e., in flushIndicators() and renderOutputs()) can't sensibly
+# be broken down by channel, so it's just guiTime, with guiCount the number
+# of indicators flushed.  The queue depth is sampled on every iteration of the
+# event loop.  formatStats() makes a table of all that, which is shown in
+# a window updated every statsInterval milliseconds (with the packet rates 
+# over that interval), and is printed at exit (with the rates averaged over 
+# the whole run).
+statsEnabled = args.stats
+statsInterval = 1000
+channelStats = {}
+guiTime = 0.0
+guiCount = 0
+queueDepth = 0
+maxQueueDepth = 0
+statsStart = time.perf_counter()
+previousCounts = {}
+previousStatsTime = statsStart
+def processPacketWithStats(packet):
+	startTime = time.perf_counter()
+	outputFromCPU(packet[0], packet[1], packet[2])
+	endTime = time.perf_counter()
+	key = (packet[0], packet[1])
+	if key not in channelStats:
+		channelStats[key] = [0, 0.0, 0.0, 0.0]
+	stats = channelStats[key]
+	latency = endTime - packet[3]
+	stats[0] += 1
+	stats[1] += endTime - startTime
+	stats[2] += latency
+	if latency > stats[3]:
+		stats[3] = latency
+def formatStats(counts, interval):
+	lines = ["Type Channel    Packets   Packets/s       Bytes  Decode(us)  Latency(ms)    Max(ms)"]
+	for key in sorted(channelStats):
+		count, decodeTime, latency, maxLatency = channelStats[key]
+		if count == 0:
+			continue
+		if key in counts:
+			recent = count - counts[key]
+		else:
+			recent = count
+		lines.append("%-4s %7o %10d %11.1f %11d %11.2f %12.3f %10.3f" % (ioTypeName(key[0]), 
+			key[1], count, recent / interval, count * virtualWire.packetSize, 
+			1e6 * decodeTime / count, 1e3 * latency / count, 1e3 * maxLatency))
+	lines.append("Received %d packets (%d illegal, %d coalesced or dropped), queue depth %d (max %d)" % \
+		(packetsReceived, illegalPackets, coalescedPackets, queueDepth, maxQueueDepth))
+	lines.append("Display updates %.3f seconds, %d indicators flushed" % (guiTime, guiCount))
+	return "\n".join(lines)
+def ioTypeName(ioType):
+	if ioType < len(ioTypes):
+		return ioTypes[ioType]
+	if ioType == 4:
+		return "CMD"
+	if ioType == 5:
+		return "STAT"
+	return "%d" % ioType
+def updateStatsWindow():
+	global previousCounts, previousStatsTime
+	now = time.perf_counter()
+	table = formatStats(previousCounts, max(now - previousStatsTime, 1e-9))
+	previousCounts = dict([(key, channelStats[key][0]) for key in channelStats])
+	previousStatsTime = now
+	statsText.configure(state = "normal")
+	statsText.delete("1.0", "end")
+	statsText.insert("end", table)
+	statsText.configure(state = "disabled")
+	root.after(statsInterval, updateStatsWindow)
+def printStats():
+	print("\n" + formatStats({}, max(time.perf_counter() - statsStart, 1e-9)))
+if statsEnabled:
+	atexit.register(printStats)
 
 didSomething = False
 def mainLoopIteration():
-	global didSomething, inputBuffer, leftToRead, view
+	global didSomething, replayDone, queueDepth, maxQueueDepth
 
-	# Check for packet data received from yaLVDC and process it.
-	# While these packets are always exactly 5
-	# bytes long, since the socket is non-blocking, any individual read
-	# operation may yield less bytes than that, so the buffer may accumulate data
-	# over time until it fills.	
-	try:
-		numNewBytes = s.recv_into(view, leftToRead)
-	except:
-		numNewBytes = 0
-	if numNewBytes > 0:
-		view = view[numNewBytes:]
-		leftToRead -= numNewBytes 
-		if leftToRead == 0:
-			# Prepare for next read attempt.
-			view = memoryview(inputBuffer)
-			leftToRead = packetSize
-			# Parse the packet just read, and call outputFromAGx().
-			# Start with a sanity check.
-			ok = 1
-			if (inputBuffer[0] & 0x80) != 0x80:
-				ok = 0
-			elif (inputBuffer[1] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[2] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[3] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[4] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[5] & 0x80) != 0x00:
-				ok = 0
-			# Packet has the various signatures we expect.
-			if ok == 0:
-				# The protocol allows yaLVDC to send a byte that's 0xFF, 
-				# which is intended as a ping and can be ignored.  I don't
-				# know if there will actually be any such messages.  For 
-				# other corrupted packets we print a message.  In either 
-				# case, we try to realign past the corrupted/ping byte(s).
-				if inputBuffer[0] != 0xff:
-					print("Illegal packet: %03o %03o %03o %03o %03o %03o" % tuple(inputBuffer))
-				for i in range(1,packetSize):
-					if (inputBuffer[i] & 0x80) == 0x80 and inputBuffer[i] != 0xFF:
-						j = 0
-						for k in range(i,6):
-							inputBuffer[j] = inputBuffer[k]
-							j += 1
-						view = view[j:]
-						leftToRead = packetSize - j
+	# Process packets received from yaLVDC.
+	startTime = time.monotonic()
+	nextIteration = refreshRate
+	if statsEnabled:
+		queueDepth = len(receivedPackets)
+		if queueDepth > maxQueueDepth:
+			maxQueueDepth = queueDepth
+	while len(latestPackets) > 0:
+		try:
+			key, packet = latestPackets.popitem()
+		except KeyError:
+			break
+		if statsEnabled:
+			processPacketWithStats(packet)
+		else:
+			outputFromCPU(packet[0], packet[1], packet[2])
+		didSomething = True
+	while len(receivedPackets) > 0:
+		for i in range(min(len(receivedPackets), 100)):
+			packet = receivedPackets.popleft()
+			if statsEnabled:
+				processPacketWithStats(packet)
 			else:
-				ioType = (inputBuffer[0] >> 3) & 7
-				source = inputBuffer[0] & 7
-				channel = ((inputBuffer[2] << 2) & 0x180) | (inputBuffer[1] & 0x7F)
-				value = (inputBuffer[2] & 0x1F) << 21
-				value |= (inputBuffer[3] & 0x7F) << 14
-				value |= (inputBuffer[4] & 0x7F) << 7
-				value |= inputBuffer[5] & 0x7F
-				outputFromCPU(ioType, channel, value)
-			didSomething = True
+				outputFromCPU(packet[0], packet[1], packet[2])
+		didSomething = True
+		if time.monotonic() - startTime > maxProcessingTime:
+			nextIteration = 1
+			break
 	
 	# Check for locally-generated data for which we must generate messages
 	# to yaLVDC over the socket.  In theory, the externalData list could contain
 	# any number of channel operations, but in practice it will probably contain
 	# only 0 or 1 operations.
 	externalData = inputsForCPU()
-	for i in range(0, len(externalData)):
-		packetize(externalData[i])
+	if len(externalData) > 0:
+		packetize(externalData)
 		didSomething = True
+	else:
+		flushOutput()
 	
-	root.after(refreshRate, mainLoopIteration)		
+	if args.replay and not connected and len(receivedPackets) == 0 and len(latestPackets) == 0 and not replayDone:
+		replayDone = True
+		elapsed = time.perf_counter() - replayStart
+		sys.stderr.write("Replayed %d packets in %f seconds (%d packets/second).\n" \
+			% (packetsReceived, elapsed, packetsReceived / max(elapsed, 1e-9)))
+
+	# Without a GUI, there's nothing more to do once yaLVDC has gone away.
+	if headless and not connected and len(receivedPackets) == 0 and len(latestPackets) == 0:
+		root.quit()
+		return
+
+	root.after(nextIteration, mainLoopIteration)		
 	
 while False:
 	mainLoopIteration()
 
-root = tk.Tk()
+if headless:
+	root = ptcHeadless.Root()
+else:
+	root = tk.Tk()
 
 ProcessorDisplayPanel_support.set_Tk_var()
+traceSwitches()
 top = topProcessorDisplayPanel (root)
 ProcessorDisplayPanel_support.init(root, top)
-# Lots and lots of initializations that the PAGE tool wasn't
-# flexible enough to do for me.
-# Indicators for PDP DATA area:
-indicatorInitialize(top.pdp1, "1", PANEL_PDP)
-indicatorInitialize(top.pdp2, "2", PANEL_PDP)
-indicatorInitialize(top.pdp3, "3", PANEL_PDP)
-indicatorInitialize(top.pdp4, "4", PANEL_PDP)
-indicatorInitialize(top.pdp5, "5", PANEL_PDP)
-indicatorInitialize(top.pdp6, "6", PANEL_PDP)
-indicatorInitialize(top.pdp7, "7", PANEL_PDP)
-indicatorInitialize(top.pdp8, "8", PANEL_PDP)
-indicatorInitialize(top.pdp9, "9", PANEL_PDP)
-indicatorInitialize(top.pdp10, "10", PANEL_PDP)
-indicatorInitialize(top.pdp11, "11", PANEL_PDP)
-indicatorInitialize(top.pdp12, "12", PANEL_PDP)
-indicatorInitialize(top.pdp13, "13", PANEL_PDP)
-indicatorInitialize(top.pdpERROR_RESET, "ERROR\nRESET", PANEL_PDP)
-indicatorInitialize(top.pdpPARITY_ERROR, "PAR ERR", PANEL_PDP)
-indicatorInitialize(top.pdpERROR_HOLD, "E HOLD", PANEL_PDP)
-indicatorInitialize(top.pdpMEM_BUFFER_PARITY, "MEM\nBUFFER\nPARITY", PANEL_PDP)
-indicatorInitialize(top.pdpMEM_BUFFER_REG, "MEM\nBUFFER\nREG", PANEL_PDP)
-indicatorInitialize(top.pdpTRANS_REG, "TRANS\nREG", PANEL_PDP)
-indicatorInitialize(top.pdpOP4, "OP4", PANEL_PDP)
-indicatorInitialize(top.pdpOP3, "OP3", PANEL_PDP)
-indicatorInitialize(top.pdpOP2, "OP2", PANEL_PDP)
-indicatorInitialize(top.pdpOP1, "OP1", PANEL_PDP)
-indicatorInitialize(top.pdpA1, "A1", PANEL_PDP)
-indicatorInitialize(top.pdpA2, "A2", PANEL_PDP)
-indicatorInitialize(top.pdpA3, "A3", PANEL_PDP)
-indicatorInitialize(top.pdpA4, "A4", PANEL_PDP)
-indicatorInitialize(top.pdpA5, "A5", PANEL_PDP)
-indicatorInitialize(top.pdpA6, "A6", PANEL_PDP)
-indicatorInitialize(top.pdpA7, "A7", PANEL_PDP)
-indicatorInitialize(top.pdpA8, "A8", PANEL_PDP)
-indicatorInitialize(top.pdpA9, "A9", PANEL_PDP)
-indicatorInitialize(top.pdpMEM_ADD_REG, "MEM\nADD\nREG", PANEL_PDP)
-indicatorInitialize(top.pdpHOPSAVE_REG, "HOP\nSAVE\nREG", PANEL_PDP)
-indicatorInitialize(top.pdpSYL0, "0", PANEL_PDP)
-indicatorInitialize(top.pdpSYL1, "1", PANEL_PDP)
-indicatorInitialize(top.pdpIS4, "IS4", PANEL_PDP)
-indicatorInitialize(top.pdpIS3, "IS3", PANEL_PDP)
-indicatorInitialize(top.pdpIS2, "IS2", PANEL_PDP)
-indicatorInitialize(top.pdpIS1, "IS1", PANEL_PDP)
-indicatorInitialize(top.pdpDS4, "DS4", PANEL_PDP)
-indicatorInitialize(top.pdpDS3, "DS3", PANEL_PDP)
-indicatorInitialize(top.pdpDS2, "DS2", PANEL_PDP)
-indicatorInitialize(top.pdpDS1, "DS1", PANEL_PDP)
-indicatorInitialize(top.pdpIM0, "IM0", PANEL_PDP)
-indicatorInitialize(top.pdpIM1, "IM1", PANEL_PDP)
-indicatorInitialize(top.pdpDM0, "DM0", PANEL_PDP)
-indicatorInitialize(top.pdpDM1, "DM1", PANEL_PDP)
-# Indicators for PDP INTERRUPTS area:
-indicatorInitialize(top.iI1, "I1", PANEL_PDP)
-indicatorInitialize(top.iI2, "I2", PANEL_PDP)
-indicatorInitialize(top.iI3, "I3", PANEL_PDP)
-indicatorInitialize(top.iI4, "I4", PANEL_PDP)
-indicatorInitialize(top.iI5, "I5", PANEL_PDP)
-indicatorInitialize(top.iI6, "I6", PANEL_PDP)
-indicatorInitialize(top.iI7, "I7", PANEL_PDP)
-indicatorInitialize(top.iI8, "I8", PANEL_PDP)
-indicatorInitialize(top.iI9, "I9", PANEL_PDP)
-indicatorInitialize(top.iI10, "I10", PANEL_PDP)
-indicatorInitialize(top.iI11, "I11", PANEL_PDP)
-indicatorInitialize(top.iI12, "I12", PANEL_PDP)
-indicatorInitialize(top.iI13, "I13", PANEL_PDP)
-indicatorInitialize(top.iI14, "I14", PANEL_PDP)
-indicatorInitialize(top.iI15, "I15", PANEL_PDP)
-indicatorInitialize(top.iI16, "I16", PANEL_PDP)
-indicatorInitialize(top.iB1, "B1", PANEL_PDP)
-indicatorInitialize(top.iB2, "B2", PANEL_PDP)
-indicatorInitialize(top.iB3, "B3", PANEL_PDP)
-indicatorInitialize(top.iB4, "B4", PANEL_PDP)
-indicatorInitialize(top.iB5, "B5", PANEL_PDP)
-indicatorInitialize(top.iB6, "B6", PANEL_PDP)
-indicatorInitialize(top.iB7, "B7", PANEL_PDP)
-indicatorInitialize(top.iB8, "B8", PANEL_PDP)
-indicatorInitialize(top.iB9, "B9", PANEL_PDP)
-indicatorInitialize(top.iB10, "B10", PANEL_PDP)
-indicatorInitialize(top.iB11, "B11", PANEL_PDP)
-indicatorInitialize(top.iB12, "B12", PANEL_PDP)
-indicatorInitialize(top.iB13, "B13", PANEL_PDP)
-indicatorInitialize(top.iB14, "B14", PANEL_PDP)
-indicatorInitialize(top.iB15, "B15", PANEL_PDP)
-indicatorInitialize(top.iB16, "B16", PANEL_PDP)
-indicatorInitialize(top.INHIBIT_CTRL, "INHIBIT\nCTRL", PANEL_PDP)
-indicatorInitialize(top.PROG_ERR, "PROG ERR", PANEL_PDP)
-indicatorInitialize(top.SYNC_ERR, "SYNC ERR", PANEL_PDP)
-# Indicators for PDP PROGRAM CONTROL area:
-indicatorInitialize(top.CST, "CST", PANEL_PDP)
-indicatorInitialize(top.MAN_CST, "MAN CST", PANEL_PDP)
-indicatorInitialize(top.ADVANCE, "ADVANCE", PANEL_PDP)
-indicatorInitialize(top.P1, "P1", PANEL_PDP)
-indicatorInitialize(top.P2, "P2", PANEL_PDP)
-indicatorInitialize(top.P4, "P4", PANEL_PDP)
-indicatorInitialize(top.P10, "P10", PANEL_PDP)
-indicatorInitialize(top.P20, "P20", PANEL_PDP)
-indicatorInitialize(top.P40, "P40", PANEL_PDP)
-indicatorInitialize(top.D1, "D1", PANEL_PDP)
-indicatorInitialize(top.D2, "D2", PANEL_PDP)
-indicatorInitialize(top.D3, "D3", PANEL_PDP)
-indicatorInitialize(top.D4, "D4", PANEL_PDP)
-indicatorInitialize(top.D5, "D5", PANEL_PDP)
-indicatorInitialize(top.D6, "D6", PANEL_PDP)
-indicatorInitialize(top.RESET_MACHINE, "RESET\nMACHINE", PANEL_PDP)
-indicatorInitialize(top.HALT, "HALT", PANEL_PDP)
-# Indicators for MISCELLANEOUS area (PDP POWER CONTROL and TRMC MODE):
-indicatorInitialize(top.pdpLAMP_TEST, "LAMP\nTEST", PANEL_PDP)
-indicatorInitialize(top.trmcAUTO, "AUTO", PANEL_PDP)
-indicatorInitialize(top.trmcMANUAL, "MANUAL", PANEL_PDP)
+# Create the indicator lamps and set their initial states.
+if not headless:
+	ptcLampPanel.build(top, ptcPanelLayout.lamps)
+for lamp in ptcPanelLayout.lamps:
+	indicatorInitialize(getattr(top, lamp[0]), lamp[7], lamp[8])
+registerBitsInitialize()
 indicatorOn(top.trmcMANUAL)
-indicatorInitialize(top.trmcML, "ML", PANEL_PDP)
-indicatorInitialize(top.trmcDD, "DD", PANEL_PDP)
 indicatorOn(top.trmcML)
-indicatorInitialize(top.trmcERROR_DEVICES_TEST, "ERROR\nDEVICES\nTEST", PANEL_PDP)
-# Indicators for MLDD INSTRUCTION ADDRESS area:
-indicatorInitialize(top.iaComputerM0, "0", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerM1, "1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerSYL0, "0", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerSYL1, "1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerIS4, "IS4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerIS3, "IS3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerIS2, "IS2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerIS1, "IS1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA8, "A8", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA7, "A7", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA6, "A6", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA5, "A5", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA4, "A4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA3, "A3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA2, "A2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaComputerA1, "A1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.iaCommandM0, "0", PANEL_MLDD, cc=CC_COMMAND)
 indicatorOn(top.iaCommandM0)
-indicatorInitialize(top.iaCommandM1, "1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandSYL0, "0", PANEL_MLDD, cc=CC_COMMAND)
 indicatorOn(top.iaCommandSYL0)
-indicatorInitialize(top.iaCommandSYL1, "1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandIS4, "IS4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandIS3, "IS3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandIS2, "IS2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandIS1, "IS1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA8, "A8", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA7, "A7", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA6, "A6", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA5, "A5", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA4, "A4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA3, "A3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA2, "A2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.iaCommandA1, "A1", PANEL_MLDD, cc=CC_COMMAND)
-# Indicators for MLDD DATA ADDRESS area:
-indicatorInitialize(top.daPARITY_BIT, "BR", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerDS4, "DS4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerDS3, "DS3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerDS2, "DS2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerDS1, "DS1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerM0, "0", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerM1, "1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOP4, "OP4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOP3, "OP3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOP2, "OP2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOP1, "OP1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA9, "OA9", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA8, "OA8", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA7, "OA7", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA6, "OA6", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA5, "OA5", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA4, "OA4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA3, "OA3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA2, "OA2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daComputerOA1, "OA1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.daCommandDS4, "DS4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandDS3, "DS3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandDS2, "DS2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandDS1, "DS1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandM0, "0", PANEL_MLDD, cc=CC_COMMAND)
 indicatorOn(top.daCommandM0)
-indicatorInitialize(top.daCommandM1, "1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOP4, "OP4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOP3, "OP3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOP2, "OP2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOP1, "OP1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA9, "OA9", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA8, "OA8", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA7, "OA7", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA6, "OA6", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA5, "OA5", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA4, "OA4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA3, "OA3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA2, "OA2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.daCommandOA1, "OA1", PANEL_MLDD, cc=CC_COMMAND)
-# Indicators for MLDD DATA area:
-indicatorInitialize(top.mlddLAMP_TEST, "LAMP\nTEST", PANEL_MLDD)
-indicatorInitialize(top.mlddPARITY_BIT, "PARITY\nBIT", PANEL_MLDD)
-indicatorInitialize(top.mlddComputerBR0, "B\nR", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputerBR1, "B\nR", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputerSIGN, "S", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer1, "1", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer2, "2", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer3, "3", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer4, "4", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer5, "5", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer6, "6", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer7, "7", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer8, "8", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer9, "9", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer10, "10", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer11, "11", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer12, "12", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer13, "13", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer14, "14", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer15, "15", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer16, "16", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer17, "17", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer18, "18", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer19, "19", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer20, "20", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer21, "21", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer22, "22", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer23, "23", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer24, "24", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddComputer25, "25", PANEL_MLDD, cc=CC_COMPUTER)
-indicatorInitialize(top.mlddCommandSYL0, "S\nY\n0", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommandSYL1, "S\nY\n1", PANEL_MLDD, cc=CC_COMMAND)
 indicatorDataCommandParity()
-indicatorInitialize(top.mlddCommandSIGN, "S", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand1, "1", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand2, "2", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand3, "3", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand4, "4", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand5, "5", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand6, "6", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand7, "7", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand8, "8", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand9, "9", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand10, "10", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand11, "11", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand12, "12", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand13, "13", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand14, "14", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand15, "15", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand16, "16", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand17, "17", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand18, "18", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand19, "19", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand20, "20", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand21, "21", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand22, "22", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand23, "23", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand24, "24", PANEL_MLDD, cc=CC_COMMAND)
-indicatorInitialize(top.mlddCommand25, "25", PANEL_MLDD, cc=CC_COMMAND)
-# Indicators for MLDD DISPLAY MODE area:
-indicatorInitialize(top.acDATA, "DATA", PANEL_MLDD)
 indicatorOn(top.acDATA)
-indicatorInitialize(top.acINS, "INS", PANEL_MLDD)
-# Indicators for MLDD ERRORS area:
-indicatorInitialize(top.PARITY_TAPE, "TAPE", PANEL_MLDD)
-indicatorInitialize(top.PARITY_SERIAL, "SER", PANEL_MLDD)
-indicatorInitialize(top.TRS, "TRS", PANEL_MLDD)
-indicatorInitialize(top.A13, "A13", PANEL_MLDD)
-indicatorInitialize(top.SERIAL, "SER", PANEL_MLDD)
-indicatorInitialize(top.HOPC1, "HOPC", PANEL_MLDD)
-indicatorInitialize(top.SSMSC, "SMSC", PANEL_MLDD)
-indicatorInitialize(top.SSMBR, "SMBR", PANEL_MLDD)
-indicatorInitialize(top.OAC, "OAC", PANEL_MLDD)
-indicatorInitialize(top.BR14, "BR14", PANEL_MLDD)
-indicatorInitialize(top.ERROR_RESET, "ERROR\nRESET", PANEL_MLDD)
-indicatorInitialize(top.INVERT_ERROR, "INVERT\nERROR", PANEL_MLDD)
-# Indicators for MLDD MEMORY LOADER area:
-indicatorInitialize(top.mlREPEAT, "REPEAT", PANEL_MLDD)
-indicatorInitialize(top.mlREPEAT_INVERSE, "/REPEAT", PANEL_MLDD)
 indicatorOn(top.mlREPEAT_INVERSE)
-indicatorInitialize(top.mlADDRESS_CMPTR, "ADDRESS\nCOMPTR", PANEL_MLDD)
-indicatorInitialize(top.mlCOMPTR_DISPLAY_RESET, "COMPTR\nDISPLAY\nRESET", PANEL_MLDD)
-indicatorInitialize(top.mlCOMMAND_DISPLAY_RESET, "COMMAND\nDISPLAY\nRESET", PANEL_MLDD)
-# Indicators for CE ACCUMULATOR area:
-indicatorInitialize(top.A_S, "A/S", PANEL_CE)
-indicatorInitialize(top.DLA2, "DLA2", PANEL_CE)
-indicatorInitialize(top.DLA3, "DLA3", PANEL_CE)
-indicatorInitialize(top.DLA4, "DLA4", PANEL_CE)
-indicatorInitialize(top.DLA5, "DLA5", PANEL_CE)
-indicatorInitialize(top.DLA6, "DLA6", PANEL_CE)
-indicatorInitialize(top.DLA7, "DLA7", PANEL_CE)
-indicatorInitialize(top.DLA8, "DLA8", PANEL_CE)
-indicatorInitialize(top.DLA9, "DLA9", PANEL_CE)
-indicatorInitialize(top.DLA10, "DLA10", PANEL_CE)
-indicatorInitialize(top.DLA11, "DLA11", PANEL_CE)
-indicatorInitialize(top.DLA12, "DLA12", PANEL_CE)
-indicatorInitialize(top.DLA13, "DLA13", PANEL_CE)
-indicatorInitialize(top.DLA14, "DLA14", PANEL_CE)
-indicatorInitialize(top.DLA15, "DLA15", PANEL_CE)
-indicatorInitialize(top.DLA16, "DLA16", PANEL_CE)
-indicatorInitialize(top.DLA17, "DLA17", PANEL_CE)
-indicatorInitialize(top.DLA18, "DLA18", PANEL_CE)
-indicatorInitialize(top.DLA19, "DLA19", PANEL_CE)
-indicatorInitialize(top.DLA20, "DLA20", PANEL_CE)
-indicatorInitialize(top.DLA21, "DLA21", PANEL_CE)
-indicatorInitialize(top.DLA22, "DLA22", PANEL_CE)
-indicatorInitialize(top.DLA23, "DLA23", PANEL_CE)
-indicatorInitialize(top.DLA24, "DLA24", PANEL_CE)
-indicatorInitialize(top.DLA25, "DLA25", PANEL_CE)
-indicatorInitialize(top.DLA26, "DLA26", PANEL_CE)
-indicatorInitialize(top.DLA27, "DLA27", PANEL_CE)
-indicatorInitialize(top.DLA28, "DLA28", PANEL_CE)
-indicatorInitialize(top.DLA29, "DLA29", PANEL_CE)
-indicatorInitialize(top.DLA30, "DLA30", PANEL_CE)
-indicatorInitialize(top.ACC0, "ACC0", PANEL_CE)
-indicatorInitialize(top.ACC1, "ACC1", PANEL_CE)
-indicatorInitialize(top.DLB1, "DLB1", PANEL_CE)
-indicatorInitialize(top.DLB2, "DLB2", PANEL_CE)
-indicatorInitialize(top.DLB3, "DLB3", PANEL_CE)
-indicatorInitialize(top.DLB4, "DLB4", PANEL_CE)
-indicatorInitialize(top.DLB5, "DLB5", PANEL_CE)
-indicatorInitialize(top.DLB6, "DLB6", PANEL_CE)
-indicatorInitialize(top.DLB7, "DLB7", PANEL_CE)
-indicatorInitialize(top.DLB8, "DLB8", PANEL_CE)
-indicatorInitialize(top.DLB9, "DLB9", PANEL_CE)
-indicatorInitialize(top.DLB10, "DLB10", PANEL_CE)
-indicatorInitialize(top.DLB11, "DLB11", PANEL_CE)
-indicatorInitialize(top.DLB12, "DLB12", PANEL_CE)
-indicatorInitialize(top.DLB13, "DLB13", PANEL_CE)
-indicatorInitialize(top.DLB14, "DLB14", PANEL_CE)
-indicatorInitialize(top.DLB15, "DLB15", PANEL_CE)
-indicatorInitialize(top.DLB16, "DLB16", PANEL_CE)
-indicatorInitialize(top.DLB17, "DLB17", PANEL_CE)
-indicatorInitialize(top.DLB18, "DLB18", PANEL_CE)
-indicatorInitialize(top.DLB19, "DLB19", PANEL_CE)
-indicatorInitialize(top.DLB20, "DLB20", PANEL_CE)
-indicatorInitialize(top.DLB21, "DLB21", PANEL_CE)
-indicatorInitialize(top.AI0, "AI0", PANEL_CE)
-indicatorInitialize(top.AI1, "AI1", PANEL_CE)
-indicatorInitialize(top.AI2, "AI2", PANEL_CE)
-indicatorInitialize(top.AI3, "AI3", PANEL_CE)
-indicatorInitialize(top.AI4, "AI4", PANEL_CE)
-indicatorInitialize(top.ACC_DISPLAY_ENABLE, "ACC\nDISPLAY\nENABLE", PANEL_CE)
-# Indicators for CE MEMORY BUFFER REGISTER area:
-indicatorInitialize(top.mbrBIT1, "BIT1", PANEL_CE)
-indicatorInitialize(top.mbrBIT2, "BIT2", PANEL_CE)
-indicatorInitialize(top.mbrBIT3, "BIT3", PANEL_CE)
-indicatorInitialize(top.mbrBIT4, "BIT4", PANEL_CE)
-indicatorInitialize(top.mbrBIT5, "BIT5", PANEL_CE)
-indicatorInitialize(top.mbrBIT6, "BIT6", PANEL_CE)
-indicatorInitialize(top.mbrBIT7, "BIT7", PANEL_CE)
-indicatorInitialize(top.mbrBIT8, "BIT8", PANEL_CE)
-indicatorInitialize(top.mbrBIT9, "BIT9", PANEL_CE)
-indicatorInitialize(top.mbrBIT10, "BIT10", PANEL_CE)
-indicatorInitialize(top.mbrBIT11, "BIT11", PANEL_CE)
-indicatorInitialize(top.mbrBIT12, "BIT12", PANEL_CE)
-indicatorInitialize(top.mbrBIT13, "BIT13", PANEL_CE)
-indicatorInitialize(top.mbrBIT14, "BIT14", PANEL_CE)
-indicatorInitialize(top.mbrMBR1, "MB1", PANEL_CE)
-indicatorInitialize(top.mbrMBR2, "MB2", PANEL_CE)
-indicatorInitialize(top.mbrMBR3, "MB3", PANEL_CE)
-indicatorInitialize(top.mbrMBR4, "MB4", PANEL_CE)
-indicatorInitialize(top.mbrMBR5, "MB5", PANEL_CE)
-indicatorInitialize(top.mbrMBR6, "MB6", PANEL_CE)
-indicatorInitialize(top.mbrMBR7, "MB7", PANEL_CE)
-indicatorInitialize(top.mbrMBR8, "MB8", PANEL_CE)
-indicatorInitialize(top.mbrMBR9, "MB9", PANEL_CE)
-indicatorInitialize(top.mbrMBR10, "MB10", PANEL_CE)
-indicatorInitialize(top.mbrMBR11, "MB11", PANEL_CE)
-indicatorInitialize(top.mbrMBR12, "MB12", PANEL_CE)
-indicatorInitialize(top.mbrMBR13, "MB13", PANEL_CE)
-indicatorInitialize(top.mbrODD_PARITY, "ODD PAR", PANEL_CE)
-indicatorInitialize(top.mbrLOAD, "LOAD", PANEL_CE)
-indicatorInitialize(top.ceLAMP_TEST, "LAMP\nTEST", PANEL_CE)
 # Callback bindings for indicators which are also pushbuttons.
 top.PROG_ERR.bind("<Button-1>", pressedPROG_ERR)
 top.PROG_ERR.bind("<ButtonRelease-1>", eventIndicatorButtonRelease)
@@ -1556,6 +1454,44 @@ top.iaCommandM0.bind("<Button-1>", eventToggleIaCommandM0)
 top.trmcML.bind("<Button-1>", eventML)
 top.trmcDD.bind("<Button-1>", eventDD)
 
+# Windows for the typewriter, printer, and plotter output.
+if outputWindows:
+	for paper, title in [(typewriter, "PTC Typewriter"), (printer, "PTC Printer")]:
+		window = tk.Toplevel(root)
+		window.title(title)
+		scrollbar = tk.Scrollbar(window)
+		scrollbar.pack(side = tk.RIGHT, fill = tk.Y)
+		text = tk.Text(window, width = 132, height = 25, font = ("Courier", 9),
+			background = "white", yscrollcommand = scrollbar.set, state = "disabled")
+		text.pack(side = tk.LEFT, fill = tk.BOTH, expand = True)
+		scrollbar.configure(command = text.yview)
+		paper.attach(text)
+	window = tk.Toplevel(root)
+	window.title("PTC Plotter")
+	canvas = tk.Canvas(window, width = 400, height = 400, background = "white")
+	canvas.pack(fill = tk.BOTH, expand = True)
+	canvas.bind("<Configure>", lambda event: plotter.attach(event.widget))
+	plotter.attach(canvas)
+
+# Window for the statistics.
+if statsEnabled and not headless:
+	window = tk.Toplevel(root)
+	window.title("PTC Statistics")
+	statsText = tk.Text(window, width = 84, height = 20, font = ("Courier", 9),
+		background = "white", state = "disabled")
+	statsText.pack(fill = tk.BOTH, expand = True)
+	root.after(statsInterval, updateStatsWindow)
+
 root.resizable(resize, resize)
+if args.replay:
+	threading.Thread(target=replayThread, daemon=True).start()
+else:
+	threading.Thread(target=receiverThread, daemon=True).start()
 root.after(refreshRate, mainLoopIteration)
+root.after(flushInterval, flushIndicators)
+root.after(renderInterval, renderOutputs)
+if args.script:
+	ptcHeadless.Script(args.script, root, top, ProcessorDisplayPanel_support, dumpIndicators).start()
 root.mainloop()
+if headless:
+	dumpIndicators()